@@ -3,11 +3,7 @@
 
 import math
 
-print("=== Conjetura de Goldbach ===\n")
-print("Todo número par mayor que 2 se puede expresar como suma de dos números primos.\n")
 
-# Versión 1: Original
-print("=== Versión 1: Original ===")
 def es_primo_original(n):
     """
     Versión original de verificación de números primos.
@@ -40,10 +36,7 @@ def goldbach_original(num):
     else:
         print("No es un numero valido")
 
-print("Versión original definida.\n")
 
-# Versión 2: Optimizada (mejor eficiencia)
-print("=== Versión 2: Optimizada ===")
 def es_primo_optimizado(n):
     """
     Versión optimizada de verificación de números primos.
@@ -101,13 +94,7 @@ def goldbach_optimizado(num, mostrar_proceso=True):
     
     return parejas
 
-# Prueba con ejemplo
-print("Ejemplo: Número 14")
-goldbach_optimizado(14)
-print()
 
-# Versión 3: Con caché de primos (más eficiente para múltiples llamadas)
-print("=== Versión 3: Con Caché de Primos ===")
 class GoldbachCaché:
     """
     Clase que mantiene un caché de números primos para mayor eficiencia
@@ -161,16 +148,7 @@ class GoldbachCaché:
         
         return parejas
 
-# Ejemplo de uso con caché
-print("Ejemplo con caché: Números 14, 20, 28")
-cache_goldbach = GoldbachCaché()
-for num in [14, 20, 28]:
-    print(f"\nNúmero {num}:")
-    cache_goldbach.goldbach(num)
-print()
 
-# Versión 4: Con validación y entrada interactiva mejorada
-print("=== Versión 4: Interactiva Mejorada ===")
 def goldbach_interactivo():
     """
     Versión interactiva mejorada con validación y manejo de errores.
@@ -208,11 +186,6 @@ def goldbach_interactivo():
         except Exception as e:
             print(f"❌ Error: {e}")
 
-# Descomentar para probar:
-# goldbach_interactivo()
-
-# Versión 5: Analizar rango de números
-print("=== Versión 5: Analizar Rango de Números ===")
 def analizar_rango_goldbach(inicio, fin):
     """
     Analiza la conjetura de Goldbach para un rango de números pares.
@@ -239,13 +212,7 @@ def analizar_rango_goldbach(inicio, fin):
     
     return resultados
 
-# Ejemplo de análisis de rango
-print("Análisis de números del 4 al 30:")
-analizar_rango_goldbach(4, 30)
-print()
 
-# Versión 6: Verificación estadística
-print("=== Versión 6: Verificación Estadística ===")
 def verificar_conjetura_goldbach(limite_superior=1000):
     """
     Verifica la conjetura de Goldbach hasta un límite superior.
@@ -278,14 +245,8 @@ def verificar_conjetura_goldbach(limite_superior=1000):
     print("=" * 60)
     return len(numeros_sin_pareja) == 0
 
-# Verificar hasta 100 (para no tardar mucho)
-print("Verificación rápida (hasta 100):")
-verificar_conjetura_goldbach(100)
-print()
 
-# Versión 7: Comparación de eficiencia
-print("=== Versión 7: Comparación de Eficiencia ===")
-import time
+from algoritmos.benchmark import medir
 
 def comparar_eficiencia(num):
     """
@@ -293,15 +254,13 @@ def comparar_eficiencia(num):
     """
     print(f"\nComparando eficiencia para número {num}:")
     
-    # Versión original
-    inicio = time.time()
-    goldbach_original(num)
-    tiempo_original = time.time() - inicio
+    # Versión original (imprime las parejas, así que se ejecuta una sola vez)
+    resumen, _ = medir(goldbach_original, lambda: (num,), repeticiones=1, calentamiento=0)
+    tiempo_original = resumen["mediana_ns"] / 1e9
     
     # Versión optimizada
-    inicio = time.time()
-    goldbach_optimizado(num, mostrar_proceso=False)
-    tiempo_optimizado = time.time() - inicio
+    resumen, _ = medir(goldbach_optimizado, lambda: (num, False), repeticiones=5)
+    tiempo_optimizado = resumen["mediana_ns"] / 1e9
     
     print(f"\n⏱️  Tiempos:")
     print(f"  Original:  {tiempo_original*1000:.4f} ms")
@@ -310,33 +269,124 @@ def comparar_eficiencia(num):
         mejora = tiempo_original / tiempo_optimizado
         print(f"  Mejora: {mejora:.2f}x más rápido")
 
-comparar_eficiencia(100)
-print()
-
-# Resumen y mejoras
-print("=== Resumen de Análisis ===")
-print("Problemas en el código original:")
-print("1. ⚠️  Función es_primo es O(n) - puede ser O(√n)")
-print("2. ⚠️  Recorre todo el rango (2, num) - puede optimizarse a (2, num//2+1)")
-print("3. ⚠️  No hay manejo de errores para input")
-print("4. ⚠️  La variable 'encontrado' no se usa correctamente (siempre será True si hay parejas)")
-print("5. ⚠️  No retorna resultados, solo imprime")
-print()
-print("Mejoras implementadas:")
-print("1. ✅ Función es_primo optimizada a O(√n)")
-print("2. ✅ Bucle optimizado (solo hasta num//2)")
-print("3. ✅ Manejo completo de errores")
-print("4. ✅ Retorna lista de parejas")
-print("5. ✅ Versión con caché para múltiples verificaciones")
-print("6. ✅ Análisis de rangos y estadísticas")
-print("7. ✅ Verificación de la conjetura")
-print("8. ✅ Comparación de eficiencia")
-print("9. ✅ Documentación completa")
-
-# Ejemplos prácticos
-print("\n=== Ejemplos Prácticos ===")
-ejemplos = [14, 20, 28, 50, 100]
-print("Ejemplos de números y sus parejas de Goldbach:")
-for num in ejemplos:
-    print(f"\nNúmero {num}:")
-    parejas = goldbach_optimizado(num, mostrar_proceso=True)
+
+def _goldbach_sin_salida(num):
+    """goldbach_optimizado sin imprimir el proceso."""
+    return goldbach_optimizado(num, mostrar_proceso=False)
+
+
+def _goldbach_cache_nuevo(num):
+    """Goldbach con caché, partiendo de un caché vacío en cada llamada."""
+    return GoldbachCaché().goldbach(num, mostrar_proceso=False)
+
+
+def _parejas_validas(parejas, num):
+    """Verifica que todas las parejas sean primos que suman num."""
+    return bool(parejas) and all(
+        a + b == num and es_primo_optimizado(a) and es_primo_optimizado(b)
+        for a, b in parejas
+    )
+
+
+# Familia para el sistema de benchmarks (python -m algoritmos.benchmark)
+BENCHMARKS = {
+    "goldbach": {
+        "implementaciones": {
+            "goldbach_optimizado": _goldbach_sin_salida,
+            "goldbach_cache": _goldbach_cache_nuevo,
+        },
+        "entrada": lambda n: (n,),
+        "tamanios": [1000, 10000, 100000],
+        "verificar": _parejas_validas,
+    },
+}
+
+
+def main():
+    """Ejecuta los ejemplos y comparaciones del módulo."""
+    print("=== Conjetura de Goldbach ===\n")
+    print("Todo número par mayor que 2 se puede expresar como suma de dos números primos.\n")
+
+    # Versión 1: Original
+    print("=== Versión 1: Original ===")
+
+    print("Versión original definida.\n")
+
+    # Versión 2: Optimizada (mejor eficiencia)
+    print("=== Versión 2: Optimizada ===")
+
+    # Prueba con ejemplo
+    print("Ejemplo: Número 14")
+    goldbach_optimizado(14)
+    print()
+
+    # Versión 3: Con caché de primos (más eficiente para múltiples llamadas)
+    print("=== Versión 3: Con Caché de Primos ===")
+
+    # Ejemplo de uso con caché
+    print("Ejemplo con caché: Números 14, 20, 28")
+    cache_goldbach = GoldbachCaché()
+    for num in [14, 20, 28]:
+        print(f"\nNúmero {num}:")
+        cache_goldbach.goldbach(num)
+    print()
+
+    # Versión 4: Con validación y entrada interactiva mejorada
+    print("=== Versión 4: Interactiva Mejorada ===")
+
+    # Descomentar para probar:
+    # goldbach_interactivo()
+
+    # Versión 5: Analizar rango de números
+    print("=== Versión 5: Analizar Rango de Números ===")
+
+    # Ejemplo de análisis de rango
+    print("Análisis de números del 4 al 30:")
+    analizar_rango_goldbach(4, 30)
+    print()
+
+    # Versión 6: Verificación estadística
+    print("=== Versión 6: Verificación Estadística ===")
+
+    # Verificar hasta 100 (para no tardar mucho)
+    print("Verificación rápida (hasta 100):")
+    verificar_conjetura_goldbach(100)
+    print()
+
+    # Versión 7: Comparación de eficiencia
+    print("=== Versión 7: Comparación de Eficiencia ===")
+
+    comparar_eficiencia(100)
+    print()
+
+    # Resumen y mejoras
+    print("=== Resumen de Análisis ===")
+    print("Problemas en el código original:")
+    print("1. ⚠️  Función es_primo es O(n) - puede ser O(√n)")
+    print("2. ⚠️  Recorre todo el rango (2, num) - puede optimizarse a (2, num//2+1)")
+    print("3. ⚠️  No hay manejo de errores para input")
+    print("4. ⚠️  La variable 'encontrado' no se usa correctamente (siempre será True si hay parejas)")
+    print("5. ⚠️  No retorna resultados, solo imprime")
+    print()
+    print("Mejoras implementadas:")
+    print("1. ✅ Función es_primo optimizada a O(√n)")
+    print("2. ✅ Bucle optimizado (solo hasta num//2)")
+    print("3. ✅ Manejo completo de errores")
+    print("4. ✅ Retorna lista de parejas")
+    print("5. ✅ Versión con caché para múltiples verificaciones")
+    print("6. ✅ Análisis de rangos y estadísticas")
+    print("7. ✅ Verificación de la conjetura")
+    print("8. ✅ Comparación de eficiencia")
+    print("9. ✅ Documentación completa")
+
+    # Ejemplos prácticos
+    print("\n=== Ejemplos Prácticos ===")
+    ejemplos = [14, 20, 28, 50, 100]
+    print("Ejemplos de números y sus parejas de Goldbach:")
+    for num in ejemplos:
+        print(f"\nNúmero {num}:")
+        goldbach_optimizado(num, mostrar_proceso=True)
+
+
+if __name__ == "__main__":
+    main()
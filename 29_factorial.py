@@ -4,12 +4,7 @@
 import math
 import sys
 
-print("=== Cálculo de Factorial ===\n")
-print("n! = n × (n-1) × (n-2) × ... × 2 × 1\n")
-print("Ejemplo: 5! = 5 × 4 × 3 × 2 × 1 = 120\n")
 
-# Versión 1: Recursiva básica
-print("=== Versión 1: Recursiva Básica ===")
 def factorial_recursivo(n):
     """
     Calcula el factorial usando recursión.
@@ -21,15 +16,7 @@ def factorial_recursivo(n):
         return 1
     return n * factorial_recursivo(n - 1)
 
-# Ejemplos
-print("Ejemplos recursivos:")
-for n in [0, 1, 5, 7, 10]:
-    resultado = factorial_recursivo(n)
-    print(f"  {n}! = {resultado}")
-print()
 
-# Versión 2: Iterativa
-print("=== Versión 2: Iterativa ===")
 def factorial_iterativo(n):
     """
     Calcula el factorial usando un bucle.
@@ -46,15 +33,7 @@ def factorial_iterativo(n):
         resultado *= i
     return resultado
 
-# Ejemplos
-print("Ejemplos iterativos:")
-for n in [0, 1, 5, 7, 10]:
-    resultado = factorial_iterativo(n)
-    print(f"  {n}! = {resultado}")
-print()
 
-# Versión 3: Usando math.factorial (más eficiente)
-print("=== Versión 3: Usando math.factorial ===")
 def factorial_math(n):
     """
     Calcula el factorial usando la biblioteca math.
@@ -67,15 +46,7 @@ def factorial_math(n):
     except ValueError:
         return None
 
-# Ejemplos
-print("Ejemplos con math.factorial:")
-for n in [0, 1, 5, 7, 10, 20]:
-    resultado = factorial_math(n)
-    print(f"  {n}! = {resultado}")
-print()
 
-# Versión 4: Con validación y límites
-print("=== Versión 4: Con Validación y Límites ===")
 def factorial_seguro(n, limite_recursion=1000):
     """
     Calcula factorial con validación y límite de recursión.
@@ -95,18 +66,7 @@ def factorial_seguro(n, limite_recursion=1000):
         # Si falla, usar método iterativo
         return factorial_iterativo(n)
 
-# Pruebas
-print("Ejemplos con validación:")
-for n in [-1, 0, 5, 100, 170]:
-    resultado = factorial_seguro(n)
-    if resultado is not None:
-        print(f"  {n}! = {resultado}")
-    else:
-        print(f"  {n}! = Error")
-print()
 
-# Versión 5: Con caché (memorización)
-print("=== Versión 5: Con Caché (Memorización) ===")
 cache_factorial = {}
 
 def factorial_con_cache(n):
@@ -127,16 +87,7 @@ def factorial_con_cache(n):
     cache_factorial[n] = resultado
     return resultado
 
-# Ejemplos con caché
-print("Ejemplos con caché:")
-for n in [5, 5, 7, 5, 10]:  # 5 se repite
-    resultado = factorial_con_cache(n)
-    print(f"  {n}! = {resultado}")
-print(f"  Caché: {cache_factorial}")
-print()
 
-# Versión 6: Gamma function para números no enteros
-print("=== Versión 6: Función Gamma (Extensión) ===")
 def factorial_gamma(n):
     """
     Calcula factorial usando la función gamma.
@@ -150,15 +101,7 @@ def factorial_gamma(n):
     except (ValueError, OverflowError):
         return None
 
-print("Ejemplos con función gamma:")
-for n in [5, 5.5, 10, 2.5]:
-    resultado = factorial_gamma(n)
-    if resultado is not None:
-        print(f"  {n}! ≈ {resultado:.4f}")
-print()
 
-# Versión 7: Comparación de eficiencia
-print("=== Versión 7: Comparación de Eficiencia ===")
 import time
 
 def comparar_metodos_factorial(n, veces=1000):
@@ -195,11 +138,7 @@ def comparar_metodos_factorial(n, veces=1000):
     r3 = math.factorial(n)
     print(f"  Todos dan el mismo resultado: {r1 == r2 == r3}")
 
-comparar_metodos_factorial(10, veces=1000)
-print()
 
-# Versión 8: Función interactiva
-print("=== Versión 8: Función Interactiva ===")
 def factorial_interactivo():
     """
     Función interactiva para calcular factoriales.
@@ -246,11 +185,6 @@ def factorial_interactivo():
         except Exception as e:
             print(f"❌ Error: {e}")
 
-# Descomentar para probar:
-# factorial_interactivo()
-
-# Versión 9: Tabla de factoriales
-print("=== Versión 9: Tabla de Factoriales ===")
 def tabla_factoriales(limite=20):
     """
     Genera una tabla de factoriales.
@@ -269,19 +203,109 @@ def tabla_factoriales(limite=20):
     
     print("=" * 40)
 
-tabla_factoriales(20)
-print()
-
-# Resumen
-print("=== Resumen ===")
-print("Métodos para calcular factorial:")
-print("  1. Recursivo: Fácil de entender, pero puede causar stack overflow")
-print("  2. Iterativo: Más eficiente en memoria")
-print("  3. math.factorial: Más eficiente (implementado en C)")
-print("  4. Con caché: Útil para múltiples cálculos")
-print("  5. Función Gamma: Extiende factorial a números no enteros")
-print()
-print("Límites:")
-print("  - Python puede manejar factoriales muy grandes (hasta ~170! sin overflow)")
-print("  - La recursión tiene límite (sys.getrecursionlimit())")
-print("  - math.factorial es la opción más eficiente para uso general")
+
+def main():
+    """Ejecuta los ejemplos y comparaciones del módulo."""
+    print("=== Cálculo de Factorial ===\n")
+    print("n! = n × (n-1) × (n-2) × ... × 2 × 1\n")
+    print("Ejemplo: 5! = 5 × 4 × 3 × 2 × 1 = 120\n")
+
+    # Versión 1: Recursiva básica
+    print("=== Versión 1: Recursiva Básica ===")
+
+    # Ejemplos
+    print("Ejemplos recursivos:")
+    for n in [0, 1, 5, 7, 10]:
+        resultado = factorial_recursivo(n)
+        print(f"  {n}! = {resultado}")
+    print()
+
+    # Versión 2: Iterativa
+    print("=== Versión 2: Iterativa ===")
+
+    # Ejemplos
+    print("Ejemplos iterativos:")
+    for n in [0, 1, 5, 7, 10]:
+        resultado = factorial_iterativo(n)
+        print(f"  {n}! = {resultado}")
+    print()
+
+    # Versión 3: Usando math.factorial (más eficiente)
+    print("=== Versión 3: Usando math.factorial ===")
+
+    # Ejemplos
+    print("Ejemplos con math.factorial:")
+    for n in [0, 1, 5, 7, 10, 20]:
+        resultado = factorial_math(n)
+        print(f"  {n}! = {resultado}")
+    print()
+
+    # Versión 4: Con validación y límites
+    print("=== Versión 4: Con Validación y Límites ===")
+
+    # Pruebas
+    print("Ejemplos con validación:")
+    for n in [-1, 0, 5, 100, 170]:
+        resultado = factorial_seguro(n)
+        if resultado is not None:
+            print(f"  {n}! = {resultado}")
+        else:
+            print(f"  {n}! = Error")
+    print()
+
+    # Versión 5: Con caché (memorización)
+    print("=== Versión 5: Con Caché (Memorización) ===")
+
+    # Ejemplos con caché
+    print("Ejemplos con caché:")
+    for n in [5, 5, 7, 5, 10]:  # 5 se repite
+        resultado = factorial_con_cache(n)
+        print(f"  {n}! = {resultado}")
+    print(f"  Caché: {cache_factorial}")
+    print()
+
+    # Versión 6: Gamma function para números no enteros
+    print("=== Versión 6: Función Gamma (Extensión) ===")
+
+    print("Ejemplos con función gamma:")
+    for n in [5, 5.5, 10, 2.5]:
+        resultado = factorial_gamma(n)
+        if resultado is not None:
+            print(f"  {n}! ≈ {resultado:.4f}")
+    print()
+
+    # Versión 7: Comparación de eficiencia
+    print("=== Versión 7: Comparación de Eficiencia ===")
+
+    comparar_metodos_factorial(10, veces=1000)
+    print()
+
+    # Versión 8: Función interactiva
+    print("=== Versión 8: Función Interactiva ===")
+
+    # Descomentar para probar:
+    # factorial_interactivo()
+
+    # Versión 9: Tabla de factoriales
+    print("=== Versión 9: Tabla de Factoriales ===")
+
+    tabla_factoriales(20)
+    print()
+
+    # Resumen
+    print("=== Resumen ===")
+    print("Métodos para calcular factorial:")
+    print("  1. Recursivo: Fácil de entender, pero puede causar stack overflow")
+    print("  2. Iterativo: Más eficiente en memoria")
+    print("  3. math.factorial: Más eficiente (implementado en C)")
+    print("  4. Con caché: Útil para múltiples cálculos")
+    print("  5. Función Gamma: Extiende factorial a números no enteros")
+    print()
+    print("Límites:")
+    print("  - Python puede manejar factoriales muy grandes (hasta ~170! sin overflow)")
+    print("  - La recursión tiene límite (sys.getrecursionlimit())")
+    print("  - math.factorial es la opción más eficiente para uso general")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,6 @@
 # Archivo: 30_fibonacci.py
 # Descripción: Secuencia de Fibonacci
 
-print("=== Secuencia de Fibonacci ===\n")
-print("F(0) = 0")
-print("F(1) = 1")
-print("F(n) = F(n-1) + F(n-2) para n > 1\n")
-print("Secuencia: 0, 1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, ...\n")
-
-# Versión 1: Recursiva básica (ineficiente)
-print("=== Versión 1: Recursiva Básica (Ineficiente) ===")
 def fibonacci_recursivo_naive(n):
     """
     Calcula el n-ésimo número de Fibonacci usando recursión simple.
@@ -23,15 +15,7 @@ def fibonacci_recursivo_naive(n):
         return 1
     return fibonacci_recursivo_naive(n - 1) + fibonacci_recursivo_naive(n - 2)
 
-# Ejemplos (solo números pequeños por eficiencia)
-print("Ejemplos recursivos (solo números pequeños):")
-for n in [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]:
-    resultado = fibonacci_recursivo_naive(n)
-    print(f"  F({n}) = {resultado}")
-print()
 
-# Versión 2: Recursiva con memorización (eficiente)
-print("=== Versión 2: Recursiva con Memorización (Eficiente) ===")
 cache_fibonacci = {0: 0, 1: 1}
 
 def fibonacci_recursivo_memo(n):
@@ -49,15 +33,7 @@ def fibonacci_recursivo_memo(n):
     cache_fibonacci[n] = resultado
     return resultado
 
-# Ejemplos
-print("Ejemplos recursivos con memorización:")
-for n in [0, 1, 5, 10, 20, 30, 40]:
-    resultado = fibonacci_recursivo_memo(n)
-    print(f"  F({n}) = {resultado}")
-print()
 
-# Versión 3: Iterativa (más eficiente)
-print("=== Versión 3: Iterativa (Más Eficiente) ===")
 def fibonacci_iterativo(n):
     """
     Calcula el n-ésimo número de Fibonacci usando iteración.
@@ -76,15 +52,7 @@ def fibonacci_iterativo(n):
         a, b = b, a + b
     return b
 
-# Ejemplos
-print("Ejemplos iterativos:")
-for n in [0, 1, 5, 10, 20, 30, 40, 50]:
-    resultado = fibonacci_iterativo(n)
-    print(f"  F({n}) = {resultado}")
-print()
 
-# Versión 4: Generador (eficiente en memoria)
-print("=== Versión 4: Generador (Eficiente en Memoria) ===")
 def fibonacci_generador(limite=None):
     """
     Genera números de Fibonacci uno a la vez.
@@ -98,15 +66,7 @@ def fibonacci_generador(limite=None):
         a, b = b, a + b
         contador += 1
 
-# Ejemplos con generador
-print("Primeros 15 números de Fibonacci (usando generador):")
-fib_gen = fibonacci_generador(15)
-secuencia = list(fib_gen)
-print(f"  {secuencia}")
-print()
 
-# Versión 5: Lista completa
-print("=== Versión 5: Lista Completa ===")
 def fibonacci_lista(n):
     """
     Genera una lista con los primeros n números de Fibonacci.
@@ -124,15 +84,7 @@ def fibonacci_lista(n):
     
     return fib_list
 
-# Ejemplos
-print("Listas de Fibonacci:")
-for n in [5, 10, 15]:
-    lista = fibonacci_lista(n)
-    print(f"  Primeros {n+1} números: {lista}")
-print()
 
-# Versión 6: Fórmula de Binet (aproximación)
-print("=== Versión 6: Fórmula de Binet (Aproximación) ===")
 import math
 
 def fibonacci_binet(n):
@@ -154,16 +106,7 @@ def fibonacci_binet(n):
     resultado = (phi**n - psi**n) / sqrt5
     return round(resultado)
 
-# Ejemplos
-print("Ejemplos con fórmula de Binet:")
-for n in [0, 1, 5, 10, 20, 30]:
-    resultado = fibonacci_binet(n)
-    resultado_exacto = fibonacci_iterativo(n)
-    print(f"  F({n}) = {resultado} (exacto: {resultado_exacto})")
-print()
 
-# Versión 7: Con validación y límites
-print("=== Versión 7: Con Validación y Límites ===")
 def fibonacci_seguro(n, limite=1000):
     """
     Calcula Fibonacci con validación y límites.
@@ -177,9 +120,13 @@ def fibonacci_seguro(n, limite=1000):
     
     return fibonacci_iterativo(n)
 
-# Versión 8: Comparación de eficiencia
-print("=== Versión 8: Comparación de Eficiencia ===")
-import time
+from algoritmos.benchmark import medir
+
+def _fibonacci_memo_sin_cache(n):
+    """Recursivo con memo partiendo de un caché limpio (mide el cálculo real)."""
+    cache_fibonacci.clear()
+    cache_fibonacci.update({0: 0, 1: 1})
+    return fibonacci_recursivo_memo(n)
 
 def comparar_metodos_fibonacci(n, veces=100):
     """
@@ -187,42 +134,26 @@ def comparar_metodos_fibonacci(n, veces=100):
     """
     print(f"\nComparando métodos para F({n}):")
     
-    # Limpiar caché
-    cache_fibonacci.clear()
-    cache_fibonacci.update({0: 0, 1: 1})
+    # El tiempo reportado es el total de `veces` llamadas (mediana de 3 repeticiones)
+    def tiempo_total(funcion):
+        resumen, resultado = medir(funcion, lambda: (n,), repeticiones=3, iteraciones=veces)
+        return resumen["mediana_ns"] * veces / 1e9, resultado
     
     # Método 1: Iterativo
-    inicio = time.time()
-    for _ in range(veces):
-        resultado_iterativo = fibonacci_iterativo(n)
-    tiempo_iterativo = time.time() - inicio
+    tiempo_iterativo, resultado_iterativo = tiempo_total(fibonacci_iterativo)
     
     # Método 2: Recursivo con memo
-    inicio = time.time()
-    for _ in range(veces):
-        cache_fibonacci.clear()
-        cache_fibonacci.update({0: 0, 1: 1})
-        resultado_memo = fibonacci_recursivo_memo(n)
-    tiempo_memo = time.time() - inicio
+    tiempo_memo, resultado_memo = tiempo_total(_fibonacci_memo_sin_cache)
     
     # Método 3: Binet
-    inicio = time.time()
-    for _ in range(veces):
-        resultado_binet = fibonacci_binet(n)
-    tiempo_binet = time.time() - inicio
+    tiempo_binet, resultado_binet = tiempo_total(fibonacci_binet)
     
     print(f"  Iterativo: {tiempo_iterativo*1000:.4f} ms ({veces} iteraciones)")
     print(f"  Recursivo con memo: {tiempo_memo*1000:.4f} ms ({veces} iteraciones)")
     print(f"  Binet: {tiempo_binet*1000:.4f} ms ({veces} iteraciones)")
     print(f"  Todos dan el mismo resultado: {resultado_iterativo == resultado_memo == resultado_binet}")
 
-# Comparar para diferentes valores
-for n in [10, 20, 30]:
-    comparar_metodos_fibonacci(n, veces=100)
-print()
 
-# Versión 9: Función interactiva
-print("=== Versión 9: Función Interactiva ===")
 def fibonacci_interactivo():
     """
     Función interactiva para calcular números de Fibonacci.
@@ -279,11 +210,6 @@ def fibonacci_interactivo():
         except Exception as e:
             print(f"❌ Error: {e}")
 
-# Descomentar para probar:
-# fibonacci_interactivo()
-
-# Versión 10: Propiedades matemáticas
-print("=== Versión 10: Propiedades de Fibonacci ===")
 def propiedades_fibonacci(n=20):
     """
     Muestra algunas propiedades interesantes de la secuencia de Fibonacci.
@@ -320,20 +246,132 @@ def propiedades_fibonacci(n=20):
     
     print("=" * 60)
 
-propiedades_fibonacci(20)
-print()
-
-# Resumen
-print("=== Resumen ===")
-print("Métodos para calcular Fibonacci:")
-print("  1. Recursivo naive: O(2^n) - MUY INEFICIENTE, solo para aprender")
-print("  2. Recursivo con memo: O(n) - Buena, pero usa más memoria")
-print("  3. Iterativo: O(n) - RECOMENDADO, eficiente y simple")
-print("  4. Generador: O(n) - Útil para generar secuencias grandes")
-print("  5. Fórmula de Binet: O(1) - Rápida pero aproximada")
-print()
-print("Aplicaciones:")
-print("  - Modelado de crecimiento de poblaciones")
-print("  - Algoritmos de optimización")
-print("  - Arte y diseño (proporción áurea)")
-print("  - Ciencias de la computación (estructuras de datos)")
+
+# Familia para el sistema de benchmarks (python -m algoritmos.benchmark)
+BENCHMARKS = {
+    "fibonacci": {
+        "implementaciones": {
+            "fibonacci_iterativo": fibonacci_iterativo,
+            "fibonacci_recursivo_memo": _fibonacci_memo_sin_cache,
+            "fibonacci_binet": fibonacci_binet,
+        },
+        "entrada": lambda n: (n,),
+        "tamanios": [10, 30, 70],
+        # Binet pierde precisión a partir de F(71) y la versión recursiva
+        # está limitada por la profundidad de recursión
+        "limites": {"fibonacci_binet": 70, "fibonacci_recursivo_memo": 500},
+        "verificar": lambda resultado, n: resultado == fibonacci_iterativo(n),
+    },
+}
+
+
+def main():
+    """Ejecuta los ejemplos y comparaciones del módulo."""
+    print("=== Secuencia de Fibonacci ===\n")
+    print("F(0) = 0")
+    print("F(1) = 1")
+    print("F(n) = F(n-1) + F(n-2) para n > 1\n")
+    print("Secuencia: 0, 1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, ...\n")
+
+    # Versión 1: Recursiva básica (ineficiente)
+    print("=== Versión 1: Recursiva Básica (Ineficiente) ===")
+
+    # Ejemplos (solo números pequeños por eficiencia)
+    print("Ejemplos recursivos (solo números pequeños):")
+    for n in [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]:
+        resultado = fibonacci_recursivo_naive(n)
+        print(f"  F({n}) = {resultado}")
+    print()
+
+    # Versión 2: Recursiva con memorización (eficiente)
+    print("=== Versión 2: Recursiva con Memorización (Eficiente) ===")
+
+    # Ejemplos
+    print("Ejemplos recursivos con memorización:")
+    for n in [0, 1, 5, 10, 20, 30, 40]:
+        resultado = fibonacci_recursivo_memo(n)
+        print(f"  F({n}) = {resultado}")
+    print()
+
+    # Versión 3: Iterativa (más eficiente)
+    print("=== Versión 3: Iterativa (Más Eficiente) ===")
+
+    # Ejemplos
+    print("Ejemplos iterativos:")
+    for n in [0, 1, 5, 10, 20, 30, 40, 50]:
+        resultado = fibonacci_iterativo(n)
+        print(f"  F({n}) = {resultado}")
+    print()
+
+    # Versión 4: Generador (eficiente en memoria)
+    print("=== Versión 4: Generador (Eficiente en Memoria) ===")
+
+    # Ejemplos con generador
+    print("Primeros 15 números de Fibonacci (usando generador):")
+    fib_gen = fibonacci_generador(15)
+    secuencia = list(fib_gen)
+    print(f"  {secuencia}")
+    print()
+
+    # Versión 5: Lista completa
+    print("=== Versión 5: Lista Completa ===")
+
+    # Ejemplos
+    print("Listas de Fibonacci:")
+    for n in [5, 10, 15]:
+        lista = fibonacci_lista(n)
+        print(f"  Primeros {n+1} números: {lista}")
+    print()
+
+    # Versión 6: Fórmula de Binet (aproximación)
+    print("=== Versión 6: Fórmula de Binet (Aproximación) ===")
+
+    # Ejemplos
+    print("Ejemplos con fórmula de Binet:")
+    for n in [0, 1, 5, 10, 20, 30]:
+        resultado = fibonacci_binet(n)
+        resultado_exacto = fibonacci_iterativo(n)
+        print(f"  F({n}) = {resultado} (exacto: {resultado_exacto})")
+    print()
+
+    # Versión 7: Con validación y límites
+    print("=== Versión 7: Con Validación y Límites ===")
+
+    # Versión 8: Comparación de eficiencia
+    print("=== Versión 8: Comparación de Eficiencia ===")
+
+    # Comparar para diferentes valores
+    for n in [10, 20, 30]:
+        comparar_metodos_fibonacci(n, veces=100)
+    print()
+
+    # Versión 9: Función interactiva
+    print("=== Versión 9: Función Interactiva ===")
+
+    # Descomentar para probar:
+    # fibonacci_interactivo()
+
+    # Versión 10: Propiedades matemáticas
+    print("=== Versión 10: Propiedades de Fibonacci ===")
+
+    propiedades_fibonacci(20)
+    print()
+
+    # Resumen
+    print("=== Resumen ===")
+    print("Métodos para calcular Fibonacci:")
+    print("  1. Recursivo naive: O(2^n) - MUY INEFICIENTE, solo para aprender")
+    print("  2. Recursivo con memo: O(n) - Buena, pero usa más memoria")
+    print("  3. Iterativo: O(n) - RECOMENDADO, eficiente y simple")
+    print("  4. Generador: O(n) - Útil para generar secuencias grandes")
+    print("  5. Fórmula de Binet: O(1) - Rápida pero aproximada")
+    print()
+    print("Aplicaciones:")
+    print("  - Modelado de crecimiento de poblaciones")
+    print("  - Algoritmos de optimización")
+    print("  - Arte y diseño (proporción áurea)")
+    print("  - Ciencias de la computación (estructuras de datos)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,6 @@
 # Archivo: 32_potenciacion.py
 # Descripción: Potenciación matemática - Calcular base^exponente
 
-print("=== Potenciación Matemática ===\n")
-print("Calcular base^exponente\n")
-
-# Versión 1: Original
-print("=== Versión 1: Original ===")
 def potenciacion_original(base, exponente):
     """
     Versión original del código para calcular potencias.
@@ -15,15 +10,7 @@ def potenciacion_original(base, exponente):
         acumular = acumular * base
     return acumular
 
-# Ejemplos
-print("Ejemplos versión original:")
-for base, exp in [(2, 3), (5, 2), (3, 4)]:
-    resultado = potenciacion_original(base, exp)
-    print(f"  {base}^{exp} = {resultado}")
-print()
 
-# Versión 2: Optimizada (usando operador **)
-print("=== Versión 2: Optimizada (operador **) ===")
 def potenciacion_operador(base, exponente):
     """
     Versión usando el operador ** de Python.
@@ -31,14 +18,7 @@ def potenciacion_operador(base, exponente):
     """
     return base ** exponente
 
-print("Ejemplos con operador **:")
-for base, exp in [(2, 3), (5, 2), (3, 4), (2, 10)]:
-    resultado = potenciacion_operador(base, exp)
-    print(f"  {base}^{exp} = {resultado}")
-print()
 
-# Versión 3: Con validación y manejo de casos especiales
-print("=== Versión 3: Con Validación ===")
 def potenciacion_segura(base, exponente):
     """
     Calcula potencia con validación y manejo de casos especiales.
@@ -58,14 +38,7 @@ def potenciacion_segura(base, exponente):
     # Caso general
     return base ** exponente
 
-print("Ejemplos con validación:")
-for base, exp in [(2, 0), (5, 1), (2, -3), (3, 4)]:
-    resultado = potenciacion_segura(base, exp)
-    print(f"  {base}^{exp} = {resultado}")
-print()
 
-# Versión 4: Exponenciación rápida (algoritmo eficiente)
-print("=== Versión 4: Exponenciación Rápida (Binary Exponentiation) ===")
 def potenciacion_rapida(base, exponente):
     """
     Algoritmo de exponenciación rápida usando divide y vencerás.
@@ -87,15 +60,7 @@ def potenciacion_rapida(base, exponente):
     else:
         return base * potenciacion_rapida(base, exponente - 1)
 
-print("Ejemplos exponenciación rápida:")
-for base, exp in [(2, 8), (3, 7), (5, 10), (2, 20)]:
-    resultado = potenciacion_rapida(base, exp)
-    resultado_operador = base ** exp
-    print(f"  {base}^{exp} = {resultado} (verificación: {resultado_operador})")
-print()
 
-# Versión 5: Exponenciación rápida iterativa
-print("=== Versión 5: Exponenciación Rápida Iterativa ===")
 def potenciacion_rapida_iterativa(base, exponente):
     """
     Versión iterativa de exponenciación rápida.
@@ -115,14 +80,7 @@ def potenciacion_rapida_iterativa(base, exponente):
     
     return resultado
 
-print("Ejemplos exponenciación rápida iterativa:")
-for base, exp in [(2, 8), (3, 7), (5, 10)]:
-    resultado = potenciacion_rapida_iterativa(base, exp)
-    print(f"  {base}^{exp} = {resultado}")
-print()
 
-# Versión 6: Usando math.pow y pow()
-print("=== Versión 6: Usando math.pow y pow() ===")
 import math
 
 def potenciacion_math(base, exponente):
@@ -133,16 +91,7 @@ def potenciacion_math(base, exponente):
     resultado_builtin = pow(base, exponente)
     return resultado_math, resultado_builtin
 
-print("Comparación math.pow vs pow():")
-for base, exp in [(2, 3), (5, 2), (3, 4)]:
-    resultado_math, resultado_builtin = potenciacion_math(base, exp)
-    print(f"  {base}^{exp}:")
-    print(f"    math.pow: {resultado_math}")
-    print(f"    pow(): {resultado_builtin}")
-print()
 
-# Versión 7: Con módulo (potenciación modular)
-print("=== Versión 7: Potenciación Modular ===")
 def potenciacion_modular(base, exponente, modulo):
     """
     Calcula (base^exponente) mod modulo de manera eficiente.
@@ -162,15 +111,7 @@ def potenciacion_modular(base, exponente, modulo):
     
     return resultado
 
-print("Ejemplos de potenciación modular:")
-for base, exp, mod in [(2, 10, 1000), (3, 7, 13), (5, 8, 17)]:
-    resultado = potenciacion_modular(base, exp, mod)
-    resultado_normal = (base ** exp) % mod
-    print(f"  {base}^{exp} mod {mod} = {resultado} (verificación: {resultado_normal})")
-print()
 
-# Versión 8: Comparación de eficiencia
-print("=== Versión 8: Comparación de Eficiencia ===")
 import time
 
 def comparar_metodos_potencia(base, exponente, veces=1000):
@@ -212,12 +153,7 @@ def comparar_metodos_potencia(base, exponente, veces=1000):
     todos_iguales = (resultado1 == resultado2 == resultado3 == resultado4)
     print(f"  Todos dan el mismo resultado: {todos_iguales}")
 
-comparar_metodos_potencia(2, 20, veces=1000)
-comparar_metodos_potencia(3, 15, veces=1000)
-print()
 
-# Versión 9: Función interactiva mejorada
-print("=== Versión 9: Función Interactiva Mejorada ===")
 def potenciacion_interactiva():
     """
     Función interactiva mejorada para calcular potencias.
@@ -258,11 +194,6 @@ def potenciacion_interactiva():
         except Exception as e:
             print(f"❌ Error: {e}")
 
-# Descomentar para probar:
-# potenciacion_interactiva()
-
-# Versión 10: Tabla de potencias
-print("=== Versión 10: Tabla de Potencias ===")
 def tabla_potencias(base, limite=10):
     """
     Genera una tabla de potencias de una base.
@@ -281,11 +212,7 @@ def tabla_potencias(base, limite=10):
     
     print("=" * 40)
 
-tabla_potencias(2, 10)
-print()
 
-# Versión 11: Propiedades de las potencias
-print("=== Versión 11: Propiedades de las Potencias ===")
 def demostrar_propiedades():
     """
     Demuestra propiedades importantes de las potencias.
@@ -328,33 +255,133 @@ def demostrar_propiedades():
     
     print("=" * 60)
 
-demostrar_propiedades()
-print()
-
-# Resumen
-print("=== Resumen de Análisis ===")
-print("Código original:")
-print("  ✓ Funciona correctamente para exponentes positivos")
-print("  ✓ Código claro y simple")
-print("  ⚠️  No maneja exponentes negativos")
-print("  ⚠️  No maneja exponente 0")
-print("  ⚠️  No es eficiente para exponentes grandes (O(n))")
-print("  ⚠️  No hay validación de entrada")
-print()
-print("Mejoras implementadas:")
-print("  1. ✅ Manejo de exponentes negativos")
-print("  2. ✅ Manejo de exponente 0")
-print("  3. ✅ Exponenciación rápida (O(log n))")
-print("  4. ✅ Validación de entrada")
-print("  5. ✅ Múltiples métodos (operador **, pow(), math.pow)")
-print("  6. ✅ Potenciación modular (útil en criptografía)")
-print("  7. ✅ Comparación de eficiencia")
-print("  8. ✅ Función interactiva mejorada")
-print("  9. ✅ Tabla de potencias")
-print("  10. ✅ Demostración de propiedades matemáticas")
-print("  11. ✅ Documentación completa")
-print()
-print("Métodos recomendados:")
-print("  - Operador ** o pow(): Para uso general (más eficiente)")
-print("  - Exponenciación rápida: Para exponentes muy grandes")
-print("  - Potenciación modular: Para operaciones con módulo")
+
+def main():
+    """Ejecuta los ejemplos y comparaciones del módulo."""
+    print("=== Potenciación Matemática ===\n")
+    print("Calcular base^exponente\n")
+
+    # Versión 1: Original
+    print("=== Versión 1: Original ===")
+
+    # Ejemplos
+    print("Ejemplos versión original:")
+    for base, exp in [(2, 3), (5, 2), (3, 4)]:
+        resultado = potenciacion_original(base, exp)
+        print(f"  {base}^{exp} = {resultado}")
+    print()
+
+    # Versión 2: Optimizada (usando operador **)
+    print("=== Versión 2: Optimizada (operador **) ===")
+
+    print("Ejemplos con operador **:")
+    for base, exp in [(2, 3), (5, 2), (3, 4), (2, 10)]:
+        resultado = potenciacion_operador(base, exp)
+        print(f"  {base}^{exp} = {resultado}")
+    print()
+
+    # Versión 3: Con validación y manejo de casos especiales
+    print("=== Versión 3: Con Validación ===")
+
+    print("Ejemplos con validación:")
+    for base, exp in [(2, 0), (5, 1), (2, -3), (3, 4)]:
+        resultado = potenciacion_segura(base, exp)
+        print(f"  {base}^{exp} = {resultado}")
+    print()
+
+    # Versión 4: Exponenciación rápida (algoritmo eficiente)
+    print("=== Versión 4: Exponenciación Rápida (Binary Exponentiation) ===")
+
+    print("Ejemplos exponenciación rápida:")
+    for base, exp in [(2, 8), (3, 7), (5, 10), (2, 20)]:
+        resultado = potenciacion_rapida(base, exp)
+        resultado_operador = base ** exp
+        print(f"  {base}^{exp} = {resultado} (verificación: {resultado_operador})")
+    print()
+
+    # Versión 5: Exponenciación rápida iterativa
+    print("=== Versión 5: Exponenciación Rápida Iterativa ===")
+
+    print("Ejemplos exponenciación rápida iterativa:")
+    for base, exp in [(2, 8), (3, 7), (5, 10)]:
+        resultado = potenciacion_rapida_iterativa(base, exp)
+        print(f"  {base}^{exp} = {resultado}")
+    print()
+
+    # Versión 6: Usando math.pow y pow()
+    print("=== Versión 6: Usando math.pow y pow() ===")
+
+    print("Comparación math.pow vs pow():")
+    for base, exp in [(2, 3), (5, 2), (3, 4)]:
+        resultado_math, resultado_builtin = potenciacion_math(base, exp)
+        print(f"  {base}^{exp}:")
+        print(f"    math.pow: {resultado_math}")
+        print(f"    pow(): {resultado_builtin}")
+    print()
+
+    # Versión 7: Con módulo (potenciación modular)
+    print("=== Versión 7: Potenciación Modular ===")
+
+    print("Ejemplos de potenciación modular:")
+    for base, exp, mod in [(2, 10, 1000), (3, 7, 13), (5, 8, 17)]:
+        resultado = potenciacion_modular(base, exp, mod)
+        resultado_normal = (base ** exp) % mod
+        print(f"  {base}^{exp} mod {mod} = {resultado} (verificación: {resultado_normal})")
+    print()
+
+    # Versión 8: Comparación de eficiencia
+    print("=== Versión 8: Comparación de Eficiencia ===")
+
+    comparar_metodos_potencia(2, 20, veces=1000)
+    comparar_metodos_potencia(3, 15, veces=1000)
+    print()
+
+    # Versión 9: Función interactiva mejorada
+    print("=== Versión 9: Función Interactiva Mejorada ===")
+
+    # Descomentar para probar:
+    # potenciacion_interactiva()
+
+    # Versión 10: Tabla de potencias
+    print("=== Versión 10: Tabla de Potencias ===")
+
+    tabla_potencias(2, 10)
+    print()
+
+    # Versión 11: Propiedades de las potencias
+    print("=== Versión 11: Propiedades de las Potencias ===")
+
+    demostrar_propiedades()
+    print()
+
+    # Resumen
+    print("=== Resumen de Análisis ===")
+    print("Código original:")
+    print("  ✓ Funciona correctamente para exponentes positivos")
+    print("  ✓ Código claro y simple")
+    print("  ⚠️  No maneja exponentes negativos")
+    print("  ⚠️  No maneja exponente 0")
+    print("  ⚠️  No es eficiente para exponentes grandes (O(n))")
+    print("  ⚠️  No hay validación de entrada")
+    print()
+    print("Mejoras implementadas:")
+    print("  1. ✅ Manejo de exponentes negativos")
+    print("  2. ✅ Manejo de exponente 0")
+    print("  3. ✅ Exponenciación rápida (O(log n))")
+    print("  4. ✅ Validación de entrada")
+    print("  5. ✅ Múltiples métodos (operador **, pow(), math.pow)")
+    print("  6. ✅ Potenciación modular (útil en criptografía)")
+    print("  7. ✅ Comparación de eficiencia")
+    print("  8. ✅ Función interactiva mejorada")
+    print("  9. ✅ Tabla de potencias")
+    print("  10. ✅ Demostración de propiedades matemáticas")
+    print("  11. ✅ Documentación completa")
+    print()
+    print("Métodos recomendados:")
+    print("  - Operador ** o pow(): Para uso general (más eficiente)")
+    print("  - Exponenciación rápida: Para exponentes muy grandes")
+    print("  - Potenciación modular: Para operaciones con módulo")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,17 @@
 # Archivo: 36_metodos_ordenamiento.py
 # Descripción: Métodos de ordenamiento - Algoritmos de clasificación
 
-import time
+import heapq
+import io
+import os
 import random
-import matplotlib.pyplot as plt
-import numpy as np
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+
+from algoritmos.benchmark import medir
 
-print("=== Métodos de Ordenamiento ===\n")
 
 # Función auxiliar para verificar si una lista está ordenada
 def esta_ordenada(lista):
@@ -18,10 +23,18 @@ def generar_lista_aleatoria(n, minimo=1, maximo=100):
     """Genera una lista aleatoria de n elementos."""
     return [random.randint(minimo, maximo) for _ in range(n)]
 
+# Función auxiliar para generar listas casi ordenadas
+def generar_lista_casi_ordenada(n, desorden=0.01):
+    """Genera range(n) con una fracción 'desorden' de pares intercambiados."""
+    lista = list(range(n))
+    for _ in range(int(n * desorden)):
+        i, j = random.randrange(n), random.randrange(n)
+        lista[i], lista[j] = lista[j], lista[i]
+    return lista
+
 # =============================================================================
 # 1. BUBBLE SORT (Ordenamiento de burbuja)
 # =============================================================================
-print("=== 1. BUBBLE SORT (Ordenamiento de Burbuja) ===")
 def bubble_sort(lista):
     """
     Ordenamiento de burbuja.
@@ -61,18 +74,10 @@ def bubble_sort_optimizado(lista):
     
     return lista
 
-# Ejemplo
-print("Ejemplo Bubble Sort:")
-lista_ejemplo = [64, 34, 25, 12, 22, 11, 90]
-print(f"Lista original: {lista_ejemplo}")
-print(f"Bubble Sort: {bubble_sort(lista_ejemplo)}")
-print(f"Bubble Sort Optimizado: {bubble_sort_optimizado(lista_ejemplo)}")
-print()
 
 # =============================================================================
 # 2. SELECTION SORT (Ordenamiento por selección)
 # =============================================================================
-print("=== 2. SELECTION SORT (Ordenamiento por Selección) ===")
 def selection_sort(lista):
     """
     Ordenamiento por selección.
@@ -95,17 +100,10 @@ def selection_sort(lista):
     
     return lista
 
-# Ejemplo
-print("Ejemplo Selection Sort:")
-lista_ejemplo = [64, 34, 25, 12, 22, 11, 90]
-print(f"Lista original: {lista_ejemplo}")
-print(f"Selection Sort: {selection_sort(lista_ejemplo)}")
-print()
 
 # =============================================================================
 # 3. INSERTION SORT (Ordenamiento por inserción)
 # =============================================================================
-print("=== 3. INSERTION SORT (Ordenamiento por Inserción) ===")
 def insertion_sort(lista):
     """
     Ordenamiento por inserción.
@@ -129,17 +127,10 @@ def insertion_sort(lista):
     
     return lista
 
-# Ejemplo
-print("Ejemplo Insertion Sort:")
-lista_ejemplo = [64, 34, 25, 12, 22, 11, 90]
-print(f"Lista original: {lista_ejemplo}")
-print(f"Insertion Sort: {insertion_sort(lista_ejemplo)}")
-print()
 
 # =============================================================================
 # 4. MERGE SORT (Ordenamiento por mezcla)
 # =============================================================================
-print("=== 4. MERGE SORT (Ordenamiento por Mezcla) ===")
 def merge_sort(lista):
     """
     Ordenamiento por mezcla (divide y vencerás).
@@ -177,17 +168,10 @@ def merge(izquierda, derecha):
     
     return resultado
 
-# Ejemplo
-print("Ejemplo Merge Sort:")
-lista_ejemplo = [64, 34, 25, 12, 22, 11, 90]
-print(f"Lista original: {lista_ejemplo}")
-print(f"Merge Sort: {merge_sort(lista_ejemplo)}")
-print()
 
 # =============================================================================
 # 5. QUICK SORT (Ordenamiento rápido)
 # =============================================================================
-print("=== 5. QUICK SORT (Ordenamiento Rápido) ===")
 def quick_sort(lista):
     """
     Ordenamiento rápido (divide y vencerás).
@@ -237,20 +221,10 @@ def particionar(lista, inicio, fin):
     lista[i + 1], lista[fin] = lista[fin], lista[i + 1]
     return i + 1
 
-# Ejemplo
-print("Ejemplo Quick Sort:")
-lista_ejemplo = [64, 34, 25, 12, 22, 11, 90]
-print(f"Lista original: {lista_ejemplo}")
-print(f"Quick Sort: {quick_sort(lista_ejemplo)}")
-lista_copy = lista_ejemplo.copy()
-quick_sort_inplace(lista_copy)
-print(f"Quick Sort In-place: {lista_copy}")
-print()
 
 # =============================================================================
 # 6. HEAP SORT (Ordenamiento por montículos)
 # =============================================================================
-print("=== 6. HEAP SORT (Ordenamiento por Montículos) ===")
 def heap_sort(lista):
     """
     Ordenamiento por montículos.
@@ -288,53 +262,665 @@ def heapify(lista, n, i):
         lista[i], lista[mayor] = lista[mayor], lista[i]
         heapify(lista, n, mayor)
 
-# Ejemplo
-print("Ejemplo Heap Sort:")
-lista_ejemplo = [64, 34, 25, 12, 22, 11, 90]
-print(f"Lista original: {lista_ejemplo}")
-print(f"Heap Sort: {heap_sort(lista_ejemplo)}")
-print()
 
 # =============================================================================
 # 7. COUNTING SORT (Ordenamiento por conteo)
 # =============================================================================
-print("=== 7. COUNTING SORT (Ordenamiento por Conteo) ===")
-def counting_sort(lista, maximo=None):
+def counting_sort(lista, maximo=None, minimo=None):
     """
     Ordenamiento por conteo.
-    Complejidad: O(n + k) donde k es el rango
+    Complejidad: O(n + k) donde k es el rango (maximo - minimo)
     Estable: Sí
     In-place: No
     Eficiente cuando el rango de valores es pequeño
+    Admite negativos: el conteo empieza en el mínimo, no en 0
     """
     if maximo is None:
         maximo = max(lista) if lista else 0
+    if minimo is None:
+        minimo = min(lista) if lista else 0
     
     # Crear array de conteo
-    count = [0] * (maximo + 1)
+    count = [0] * (maximo - minimo + 1)
     
     # Contar ocurrencias
     for num in lista:
-        count[num] += 1
+        count[num - minimo] += 1
     
     # Construir lista ordenada
     resultado = []
-    for i in range(maximo + 1):
-        resultado.extend([i] * count[i])
+    for i in range(maximo - minimo + 1):
+        resultado.extend([i + minimo] * count[i])
     
     return resultado
 
-# Ejemplo
-print("Ejemplo Counting Sort:")
-lista_ejemplo = [4, 2, 2, 8, 3, 3, 1]
-print(f"Lista original: {lista_ejemplo}")
-print(f"Counting Sort: {counting_sort(lista_ejemplo)}")
-print()
 
 # =============================================================================
-# 8. Comparación de Métodos
+# 8. ORDENAMIENTO HÍBRIDO ADAPTATIVO (corridas naturales + quick sort)
+# =============================================================================
+UMBRAL_INSERCION = 32   # Tamaño bajo el cual se usa insertion sort
+UMBRAL_NINTHER = 128    # Tamaño desde el cual el pivote es el "ninther"
+GALOPE = 7              # Victorias seguidas antes de copiar por bloques
+
+def ordenamiento_hibrido(lista, umbral=UMBRAL_INSERCION, estable=False):
+    """
+    Ordenamiento híbrido que aprovecha el orden previo de los datos.
+    
+    1. Detecta las corridas naturales (tramos ya ordenados; los tramos
+       estrictamente descendentes se invierten en el lugar).
+    2. Si hay pocas corridas (datos casi ordenados) o se pide estabilidad,
+       las mezcla con un único buffer auxiliar reservado al inicio.
+    3. Si no, usa quick sort en el lugar con pivote mediana de tres
+       (o ninther) y partición en tres vías.
+    En ambos casos los tramos menores que 'umbral' se ordenan con
+    insertion sort binario.
+    
+    Complejidad: O(n) con datos ordenados, O(n log n) en general
+    Estable: Sí con estable=True (o cuando se usan las corridas)
+    In-place: No (trabaja sobre una copia, como el resto del módulo)
+    """
+    if umbral < 1:
+        raise ValueError("umbral debe ser al menos 1")
+    lista = lista.copy()
+    n = len(lista)
+    if n <= umbral:
+        _insercion_binaria(lista, 0, n)
+        return lista
+    
+    corridas = _detectar_corridas(lista)
+    if estable or len(corridas) <= n // umbral:
+        _mezclar_corridas(lista, corridas, umbral)
+    else:
+        _quick_sort_hibrido(lista, 0, n, umbral)
+    return lista
+
+def _insercion_binaria(lista, inicio, fin, ordenados=1):
+    """
+    Insertion sort sobre lista[inicio:fin] en el lugar. Los primeros
+    'ordenados' elementos ya están en orden. La posición se busca con
+    búsqueda binaria y el desplazamiento se hace con asignación de slices.
+    """
+    for i in range(inicio + max(ordenados, 1), fin):
+        clave = lista[i]
+        pos = bisect_right(lista, clave, inicio, i)  # bisect_right: estable
+        if pos != i:
+            lista[pos + 1:i + 1] = lista[pos:i]
+            lista[pos] = clave
+
+def _detectar_corridas(lista):
+    """
+    Retorna los límites [inicio, fin) de las corridas naturales.
+    Las corridas estrictamente descendentes se invierten (estrictamente
+    para no alterar el orden de elementos iguales).
+    """
+    corridas = []
+    n = len(lista)
+    inicio = 0
+    while inicio < n:
+        fin = inicio + 1
+        if fin < n and lista[fin] < lista[inicio]:
+            while fin < n and lista[fin] < lista[fin - 1]:
+                fin += 1
+            lista[inicio:fin] = lista[inicio:fin][::-1]
+        else:
+            while fin < n and lista[fin] >= lista[fin - 1]:
+                fin += 1
+        corridas.append((inicio, fin))
+        inicio = fin
+    return corridas
+
+def _mezclar_corridas(lista, corridas, umbral):
+    """
+    Mezcla las corridas de dos en dos hasta que quede una sola.
+    Las corridas cortas se agrupan primero en bloques de al menos
+    'umbral' elementos ordenados con insertion sort.
+    """
+    # Agrupar corridas cortas para no mezclar muchos tramos diminutos
+    agrupadas = []
+    for inicio, fin in corridas:
+        if agrupadas and agrupadas[-1][1] - agrupadas[-1][0] < umbral:
+            inicio_previo, fin_previo = agrupadas.pop()
+            _insercion_binaria(lista, inicio_previo, fin, fin_previo - inicio_previo)
+            inicio = inicio_previo
+        agrupadas.append((inicio, fin))
+    corridas = agrupadas
+    
+    # Único buffer auxiliar: nunca se copia más que la corrida menor
+    buffer = [None] * (len(lista) // 2 + 1)
+    while len(corridas) > 1:
+        siguientes = []
+        for k in range(0, len(corridas) - 1, 2):
+            inicio, medio = corridas[k]
+            fin = corridas[k + 1][1]
+            _mezclar_en_lugar(lista, inicio, medio, fin, buffer)
+            siguientes.append((inicio, fin))
+        if len(corridas) % 2:
+            siguientes.append(corridas[-1])
+        corridas = siguientes
+
+def _mezclar_en_lugar(lista, inicio, medio, fin, buffer):
+    """
+    Mezcla lista[inicio:medio] y lista[medio:fin] (ambas ordenadas)
+    usando 'buffer' como espacio auxiliar. Estable.
+    Cuando un lado gana GALOPE veces seguidas se busca con bisect hasta
+    dónde sigue ganando y ese bloque se copia de una vez (como Timsort).
+    """
+    # Si ya están en orden no hay nada que hacer (caso casi ordenado)
+    if lista[medio - 1] <= lista[medio]:
+        return
+    
+    # Los elementos de los extremos que ya están en su sitio no se mueven
+    inicio = bisect_right(lista, lista[medio], inicio, medio)
+    fin = bisect_left(lista, lista[medio - 1], medio, fin)
+    
+    if medio - inicio <= fin - medio:
+        # Copiar la izquierda al buffer y mezclar de izquierda a derecha
+        n_izq = medio - inicio
+        buffer[:n_izq] = lista[inicio:medio]
+        i, j, k = 0, medio, inicio
+        racha_izq = racha_der = 0
+        while i < n_izq and j < fin:
+            if lista[j] < buffer[i]:
+                lista[k] = lista[j]
+                j += 1
+                k += 1
+                racha_der += 1
+                racha_izq = 0
+                if racha_der >= GALOPE:
+                    hasta = bisect_left(lista, buffer[i], j, fin)
+                    lista[k:k + hasta - j] = lista[j:hasta]
+                    k += hasta - j
+                    j = hasta
+                    racha_der = 0
+            else:
+                lista[k] = buffer[i]
+                i += 1
+                k += 1
+                racha_izq += 1
+                racha_der = 0
+                if racha_izq >= GALOPE:
+                    hasta = bisect_right(buffer, lista[j], i, n_izq)
+                    lista[k:k + hasta - i] = buffer[i:hasta]
+                    k += hasta - i
+                    i = hasta
+                    racha_izq = 0
+        lista[k:k + n_izq - i] = buffer[i:n_izq]
+    else:
+        # Copiar la derecha al buffer y mezclar de derecha a izquierda
+        n_der = fin - medio
+        buffer[:n_der] = lista[medio:fin]
+        i, j, k = medio - 1, n_der - 1, fin - 1
+        racha_izq = racha_der = 0
+        while i >= inicio and j >= 0:
+            if buffer[j] < lista[i]:
+                lista[k] = lista[i]
+                i -= 1
+                k -= 1
+                racha_izq += 1
+                racha_der = 0
+                if racha_izq >= GALOPE:
+                    desde = bisect_right(lista, buffer[j], inicio, i + 1)
+                    lista[k - (i - desde):k + 1] = lista[desde:i + 1]
+                    k -= i + 1 - desde
+                    i = desde - 1
+                    racha_izq = 0
+            else:
+                lista[k] = buffer[j]
+                j -= 1
+                k -= 1
+                racha_der += 1
+                racha_izq = 0
+                if racha_der >= GALOPE:
+                    desde = bisect_left(buffer, lista[i], 0, j + 1)
+                    lista[k - (j - desde):k + 1] = buffer[desde:j + 1]
+                    k -= j + 1 - desde
+                    j = desde - 1
+                    racha_der = 0
+        lista[inicio:inicio + j + 1] = buffer[:j + 1]
+
+def _mediana_de_tres(lista, a, b, c):
+    """Retorna el valor mediano entre lista[a], lista[b] y lista[c]."""
+    x, y, z = lista[a], lista[b], lista[c]
+    if x < y:
+        return y if y < z else (z if x < z else x)
+    return x if x < z else (z if y < z else y)
+
+def _elegir_pivote(lista, inicio, fin):
+    """
+    Mediana de tres (primero, centro, último) para tramos pequeños y
+    ninther (mediana de tres medianas de tres) para tramos grandes.
+    """
+    ultimo = fin - 1
+    medio = (inicio + ultimo) // 2
+    if fin - inicio < UMBRAL_NINTHER:
+        return _mediana_de_tres(lista, inicio, medio, ultimo)
+    
+    paso = (fin - inicio) // 8
+    m1 = _mediana_de_tres(lista, inicio, inicio + paso, inicio + 2 * paso)
+    m2 = _mediana_de_tres(lista, medio - paso, medio, medio + paso)
+    m3 = _mediana_de_tres(lista, ultimo - 2 * paso, ultimo - paso, ultimo)
+    return sorted((m1, m2, m3))[1]
+
+def _quick_sort_hibrido(lista, inicio, fin, umbral):
+    """
+    Quick sort en el lugar sobre lista[inicio:fin] con partición en tres
+    vías (<, ==, > pivote). Recursión sobre la parte menor e iteración
+    sobre la mayor para limitar la profundidad a O(log n).
+    """
+    while fin - inicio > umbral:
+        pivote = _elegir_pivote(lista, inicio, fin)
+        menores, i, mayores = inicio, inicio, fin
+        while i < mayores:
+            x = lista[i]
+            if x < pivote:
+                lista[i] = lista[menores]
+                lista[menores] = x
+                menores += 1
+                i += 1
+            elif pivote < x:
+                mayores -= 1
+                lista[i] = lista[mayores]
+                lista[mayores] = x
+            else:
+                i += 1
+        
+        if menores - inicio < fin - mayores:
+            _quick_sort_hibrido(lista, inicio, menores, umbral)
+            inicio = mayores
+        else:
+            _quick_sort_hibrido(lista, mayores, fin, umbral)
+            fin = menores
+    
+    _insercion_binaria(lista, inicio, fin)
+
+
+# =============================================================================
+# 9. ORDENAMIENTO EXTERNO (archivos más grandes que la memoria)
+# =============================================================================
+# Memoria aproximada de un registro además de la línea y su clave:
+# tupla (clave, línea) de 2 elementos + un puntero en el bloque y otro en
+# la copia ordenada que retornan los algoritmos del módulo
+_BYTES_POR_REGISTRO = 56 + 2 * 8
+MAX_CORRIDAS_POR_MEZCLA = 64   # Archivos abiertos a la vez en cada mezcla
+
+def ordenamiento_externo(ruta_entrada, ruta_salida, memoria_max=64 * 1024 * 1024,
+                         tipo=int, clave=None, algoritmo=None,
+                         directorio_temporal=None):
+    """
+    Ordena un archivo de texto (un registro por línea) que no cabe en memoria.
+    
+    1. Lee el archivo en bloques cuyo tamaño estimado no supera memoria_max,
+       ordena cada bloque con un algoritmo del módulo (por defecto
+       ordenamiento_hibrido estable) y lo escribe como corrida temporal.
+    2. Mezcla las corridas con un heap (k-way merge). Si hay más de
+       MAX_CORRIDAS_POR_MEZCLA se mezclan por grupos en varias pasadas.
+    
+    - tipo: conversión de la línea a clave (int, float, str...).
+    - clave: función línea -> clave para registros (por ejemplo, la fecha
+      de una línea de log); si se indica, reemplaza a tipo.
+    Las líneas se escriben tal cual; las líneas en blanco se omiten y a
+    igual clave el orden lo decide el texto de la línea.
+    
+    Retorna un diccionario con registros, corridas y pasadas de mezcla.
+    Complejidad: O(n log n) tiempo, O(memoria_max) memoria,
+    O(log_k(corridas)) lecturas completas del archivo
+    """
+    extraer = clave if clave is not None else tipo
+    if algoritmo is None:
+        algoritmo = lambda bloque: ordenamiento_hibrido(bloque, estable=True)
+    
+    with tempfile.TemporaryDirectory(prefix="orden_externo_", dir=directorio_temporal) as directorio:
+        corridas, registros = _generar_corridas(ruta_entrada, extraer, memoria_max,
+                                                algoritmo, directorio)
+        corridas_iniciales = len(corridas)
+        
+        # Mezclas intermedias hasta que las corridas quepan en una sola mezcla
+        pasadas = 1
+        while len(corridas) > MAX_CORRIDAS_POR_MEZCLA:
+            nuevas = []
+            for i in range(0, len(corridas), MAX_CORRIDAS_POR_MEZCLA):
+                grupo = corridas[i:i + MAX_CORRIDAS_POR_MEZCLA]
+                ruta = os.path.join(directorio, f"corrida_{pasadas}_{i}.txt")
+                _mezclar_archivos(grupo, ruta, extraer, memoria_max)
+                for ruta_grupo in grupo:
+                    os.remove(ruta_grupo)
+                nuevas.append(ruta)
+            corridas = nuevas
+            pasadas += 1
+        
+        _mezclar_archivos(corridas, ruta_salida, extraer, memoria_max)
+    
+    return {"registros": registros, "corridas": corridas_iniciales, "pasadas": pasadas}
+
+def _tamanio_buffer(memoria_max, archivos):
+    """
+    Reparte la mitad del presupuesto entre los archivos abiertos. Cada
+    archivo de texto guarda los bytes leídos y también el texto decodificado,
+    así que a cada uno le corresponde un buffer de la mitad de su parte.
+    """
+    return max(io.DEFAULT_BUFFER_SIZE, memoria_max // (4 * archivos))
+
+def _generar_corridas(ruta_entrada, extraer, memoria_max, algoritmo, directorio):
+    """
+    Lee el archivo en bloques acotados por memoria_max y escribe cada
+    bloque ordenado en una corrida temporal.
+    Retorna (lista de rutas de corridas, número de registros).
+    """
+    buffer = _tamanio_buffer(memoria_max, 2)
+    # La mitad del presupuesto queda para los buffers de lectura/escritura
+    limite = memoria_max // 2
+    corridas = []
+    registros = 0
+    bloque = []
+    usado = 0
+    
+    def volcar():
+        ruta = os.path.join(directorio, f"corrida_0_{len(corridas)}.txt")
+        with open(ruta, "w", encoding="utf-8", buffering=buffer) as salida:
+            salida.writelines(linea for _, linea in algoritmo(bloque))
+        corridas.append(ruta)
+    
+    with open(ruta_entrada, encoding="utf-8", buffering=buffer) as entrada:
+        for linea in entrada:
+            if not linea.strip():
+                continue
+            if not linea.endswith("\n"):
+                linea += "\n"  # Última línea del archivo sin salto
+            valor = extraer(linea)
+            bloque.append((valor, linea))
+            usado += _BYTES_POR_REGISTRO + sys.getsizeof(linea) + sys.getsizeof(valor)
+            
+            if usado >= limite:
+                volcar()
+                registros += len(bloque)
+                bloque = []
+                usado = 0
+    
+    if bloque or not corridas:
+        volcar()
+        registros += len(bloque)
+    return corridas, registros
+
+def _leer_corrida(ruta, extraer, buffer):
+    """Genera los registros (clave, línea) de una corrida ya ordenada."""
+    with open(ruta, encoding="utf-8", buffering=buffer) as archivo:
+        for linea in archivo:
+            yield extraer(linea), linea
+
+def _mezclar_archivos(rutas, ruta_salida, extraer, memoria_max):
+    """Mezcla (k-way) las corridas ordenadas de 'rutas' en ruta_salida."""
+    buffer = _tamanio_buffer(memoria_max, len(rutas) + 1)
+    lectores = [_leer_corrida(ruta, extraer, buffer) for ruta in rutas]
+    with open(ruta_salida, "w", encoding="utf-8", buffering=buffer) as salida:
+        salida.writelines(linea for _, linea in heapq.merge(*lectores))
+
+
+# =============================================================================
+# 10. ORDENAMIENTO PARALELO (varios procesos y memoria compartida)
+# =============================================================================
+MIN_ELEMENTOS_PARALELO = 10000  # Por debajo, crear procesos no compensa
+
+def ordenamiento_paralelo(lista, procesos=None, metodo="mezcla", algoritmo=None):
+    """
+    Ordena una lista de números repartiéndola entre varios procesos.
+    
+    Los datos viajan en un bloque de memoria compartida (array de int64
+    o float64) en lugar de listas serializadas con pickle: cada proceso
+    ordena su partición en el lugar y el padre solo lee el resultado.
+    
+    - metodo="mezcla": particiones de igual tamaño ordenadas con merge_sort
+      y mezcla final de k vías (heapq.merge) en el proceso padre.
+    - metodo="rapido": el padre reparte los valores en rangos separados
+      por pivotes tomados de una muestra (como la partición de quick sort
+      pero en k partes); cada proceso ordena su rango con quick_sort y el
+      resultado es la simple concatenación, sin mezcla.
+    - algoritmo: sustituye al algoritmo del módulo usado en los procesos.
+    
+    Si la lista no es toda de int (de 64 bits) o toda de float, se ordena
+    de forma secuencial con 'algoritmo' para devolver los mismos valores
+    que sorted(lista).
+    
+    Complejidad: O((n/p) log(n/p)) por proceso + O(n log p) en el padre
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+    
+    if metodo not in ("mezcla", "rapido"):
+        raise ValueError(f"Método desconocido: {metodo!r} (usa 'mezcla' o 'rapido')")
+    if algoritmo is None:
+        algoritmo = merge_sort if metodo == "mezcla" else quick_sort
+    
+    procesos = procesos or os.cpu_count() or 1
+    n = len(lista)
+    if procesos == 1 or n < MIN_ELEMENTOS_PARALELO:
+        return algoritmo(lista)
+    
+    tipo = _tipo_array(lista)
+    if tipo is None:
+        return algoritmo(lista)
+    if metodo == "mezcla":
+        datos = array(tipo, lista)
+        limites = [n * i // procesos for i in range(procesos + 1)]
+    else:
+        datos, limites = _particionar_por_muestras(lista, procesos, tipo)
+    
+    memoria = shared_memory.SharedMemory(create=True, size=n * datos.itemsize)
+    vista = memoria.buf[:n * datos.itemsize].cast(tipo)
+    try:
+        vista[:] = datos
+        del datos
+        
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            tareas = [ejecutor.submit(_ordenar_particion, memoria.name, tipo, inicio, fin, algoritmo)
+                      for inicio, fin in zip(limites, limites[1:]) if fin > inicio]
+            for tarea in tareas:
+                tarea.result()
+        
+        if metodo == "rapido":
+            return vista.tolist()
+        particiones = [vista[inicio:fin].tolist() for inicio, fin in zip(limites, limites[1:])]
+        return list(heapq.merge(*particiones))
+    finally:
+        vista.release()
+        memoria.close()
+        memoria.unlink()
+
+def _tipo_array(lista):
+    """
+    Código de tipo de array para la lista: 'q' (solo int de 64 bits) o
+    'd' (solo float). Retorna None si los tipos no son uniformes (int y
+    float mezclados, bool, enteros grandes, otros objetos): copiarlos a
+    un array cambiaría los valores devueltos.
+    """
+    tipos = set(map(type, lista))
+    if tipos == {int}:
+        if min(lista) < -2**63 or max(lista) >= 2**63:
+            return None
+        return 'q'
+    if tipos == {float}:
+        return 'd'
+    return None
+
+def _particionar_por_muestras(lista, procesos, tipo):
+    """
+    Reparte los valores en 'procesos' rangos delimitados por pivotes
+    elegidos de una muestra ordenada. Retorna (array con los rangos
+    contiguos, límites de cada rango).
+    """
+    muestra = sorted(random.sample(lista, min(len(lista), procesos * 32)))
+    pivotes = [muestra[len(muestra) * k // procesos] for k in range(1, procesos)]
+    
+    rangos = [[] for _ in range(procesos)]
+    for x in lista:
+        rangos[bisect_right(pivotes, x)].append(x)
+    
+    datos = array(tipo)
+    limites = [0]
+    for rango in rangos:
+        datos.extend(rango)
+        limites.append(len(datos))
+    return datos, limites
+
+def _ordenar_particion(nombre_memoria, tipo, inicio, fin, algoritmo):
+    """
+    Se ejecuta en un proceso hijo: ordena vista[inicio:fin] del bloque de
+    memoria compartida con el algoritmo indicado y lo escribe en su lugar.
+    """
+    from multiprocessing import shared_memory
+    
+    memoria = shared_memory.SharedMemory(name=nombre_memoria)
+    vista = memoria.buf.cast(tipo)
+    try:
+        vista[inicio:fin] = array(tipo, algoritmo(vista[inicio:fin].tolist()))
+    finally:
+        vista.release()
+        memoria.close()
+    return fin - inicio
+
+def comparar_ordenamiento_paralelo(n=1000000, procesos=None):
+    """
+    Mide la aceleración de ordenamiento_paralelo() frente a merge_sort
+    secuencial. Retorna {metodo: aceleración}.
+    """
+    procesos = procesos or os.cpu_count() or 1
+    lista = generar_lista_aleatoria(n, 1, n)
+    
+    print(f"\nOrdenando {n} elementos con {procesos} procesos "
+          f"({os.cpu_count()} núcleos disponibles):")
+    secuencial, esperado = medir(merge_sort, preparar=lambda: (lista,),
+                                 repeticiones=1, calentamiento=0)
+    print(f"  {'merge_sort secuencial':28s} {secuencial['mediana_ns'] / 1e6:10.1f} ms")
+    
+    aceleraciones = {}
+    for metodo in ("mezcla", "rapido"):
+        resumen, resultado = medir(ordenamiento_paralelo,
+                                   preparar=lambda: (lista, procesos, metodo),
+                                   repeticiones=1, calentamiento=0)
+        aceleraciones[metodo] = secuencial["mediana_ns"] / resumen["mediana_ns"]
+        estado = "✓" if resultado == esperado else "✗"
+        print(f"{estado} {'paralelo (' + metodo + ')':28s} {resumen['mediana_ns'] / 1e6:10.1f} ms  "
+              f"aceleración x{aceleraciones[metodo]:.2f}")
+    return aceleraciones
+
+
+# =============================================================================
+# 11. RADIX SORT Y COUNTING SORT CON NUMPY (columnas enteras grandes)
+# =============================================================================
+def radix_sort_numpy(arreglo, bits_digito=8, retornar_indices=False):
+    """
+    Radix sort LSD (dígito menos significativo primero) para arreglos de
+    enteros de NumPy, con o sin signo.
+    
+    - bits_digito: 8 o 16 bits por pasada. Cada pasada es un ordenamiento
+      estable por un dígito; NumPy usa radix sort internamente para
+      argsort estable sobre uint8/uint16, así que cada pasada es O(n).
+    - Enteros con signo: se invierte el bit de signo para que el orden de
+      las claves sin signo coincida con el de los valores.
+    - Las pasadas se limitan a los bits realmente usados y se omiten las
+      de dígito constante (detectado con bincount).
+    - retornar_indices=True: retorna la permutación (argsort estable) en
+      lugar de los valores, para ordenar registros por una clave.
+    
+    Complejidad: O(d * n), d = bits significativos / bits_digito
+    Estable: Sí
+    """
+    import numpy as np
+    
+    if bits_digito not in (8, 16):
+        raise ValueError("bits_digito debe ser 8 o 16")
+    arreglo = np.asarray(arreglo)
+    if arreglo.ndim != 1 or arreglo.dtype.kind not in "iu":
+        raise TypeError("radix_sort_numpy requiere un arreglo 1-D de enteros")
+    
+    claves = _claves_sin_signo(arreglo)
+    n = len(claves)
+    # Sin retornar_indices solo se reordenan las claves (una copia menos
+    # por pasada) y al final se deshace la conversión del bit de signo
+    indices = np.arange(n) if retornar_indices else None
+    tipo_digito = np.uint8 if bits_digito == 8 else np.uint16
+    mascara = (1 << bits_digito) - 1
+    # La máscara se recorta al tipo de las claves (uint8 con dígitos de 16 bits)
+    mascara_claves = claves.dtype.type(mascara & np.iinfo(claves.dtype).max)
+    bits = int(claves.max()).bit_length() if n else 0
+    
+    for desplazamiento in range(0, bits, bits_digito):
+        digito = ((claves >> desplazamiento) & mascara_claves).astype(tipo_digito)
+        if np.bincount(digito, minlength=mascara + 1).max() == n:
+            continue  # Todos los elementos comparten este dígito
+        orden = np.argsort(digito, kind="stable")
+        claves = claves[orden]
+        if retornar_indices:
+            indices = indices[orden]
+    
+    if retornar_indices:
+        return indices
+    if arreglo.dtype.kind == "i":
+        claves ^= claves.dtype.type(1 << (8 * claves.dtype.itemsize - 1))
+    return claves.view(arreglo.dtype)
+
+def _claves_sin_signo(arreglo):
+    """
+    Convierte enteros a claves sin signo del mismo ancho cuyo orden
+    coincide con el de los valores (invirtiendo el bit de signo).
+    """
+    import numpy as np
+    
+    sin_signo = np.dtype(f"u{arreglo.dtype.itemsize}")
+    if arreglo.dtype.kind == "u":
+        return arreglo.astype(sin_signo, copy=True)
+    bit_signo = sin_signo.type(1 << (8 * arreglo.dtype.itemsize - 1))
+    return arreglo.view(sin_signo) ^ bit_signo
+
+def counting_sort_numpy(arreglo, retornar_indices=False, rango_max=None):
+    """
+    Counting sort vectorizado para arreglos de enteros de NumPy.
+    
+    Cuenta las ocurrencias con bincount sobre (valor - mínimo) y
+    reconstruye el resultado con repeat, sin bucles de Python. Admite
+    negativos. Si el rango (máximo - mínimo) supera rango_max (por
+    defecto, 4 veces el tamaño del arreglo o 2¹⁶) el conteo no compensa y
+    se usa radix_sort_numpy.
+    
+    retornar_indices=True: retorna la permutación estable. Las claves
+    desplazadas caben en uint16, para el que el argsort estable de NumPy
+    es un ordenamiento por conteo de una sola pasada.
+    
+    Complejidad: O(n + k), k = rango de valores
+    Estable: Sí
+    """
+    import numpy as np
+    
+    arreglo = np.asarray(arreglo)
+    if arreglo.ndim != 1 or arreglo.dtype.kind not in "iu":
+        raise TypeError("counting_sort_numpy requiere un arreglo 1-D de enteros")
+    if len(arreglo) == 0:
+        return np.arange(0) if retornar_indices else arreglo.copy()
+    
+    minimo = int(arreglo.min())
+    rango = int(arreglo.max()) - minimo + 1
+    limite = rango_max or max(4 * len(arreglo), 1 << 16)
+    if rango > limite or (retornar_indices and rango > 1 << 16):
+        return radix_sort_numpy(arreglo, retornar_indices=retornar_indices)
+    
+    # Con signo se resta en int64 (127 - (-128) desborda int8); sin signo
+    # la resta no desborda y se hace en el propio tipo (uint64 > 2⁶³)
+    if arreglo.dtype.kind == "i":
+        desplazados = arreglo.astype(np.int64) - minimo
+    else:
+        desplazados = (arreglo - arreglo.dtype.type(minimo)).astype(np.int64)
+    if retornar_indices:
+        return np.argsort(desplazados.astype(np.uint16), kind="stable")
+    
+    conteo = np.bincount(desplazados, minlength=rango)
+    # Aritmética modular en el propio tipo: exacta porque todos los
+    # valores caben en él (np.arange con enteros > 2⁶³ daría float64)
+    valores = np.arange(rango).astype(arreglo.dtype) + arreglo.dtype.type(minimo)
+    return np.repeat(valores, conteo)
+
+
+# =============================================================================
+# 12. Comparación de Métodos
 # =============================================================================
-print("=== 8. Comparación de Métodos ===")
 def comparar_metodos_ordenamiento(lista, mostrar_resultados=True):
     """
     Compara diferentes métodos de ordenamiento.
@@ -347,6 +933,7 @@ def comparar_metodos_ordenamiento(lista, mostrar_resultados=True):
         'Merge Sort': merge_sort,
         'Quick Sort': quick_sort,
         'Heap Sort': heap_sort,
+        'Ordenamiento Híbrido': ordenamiento_hibrido,
         'Python sorted()': sorted  # Método nativo (Timsort)
     }
     
@@ -357,12 +944,10 @@ def comparar_metodos_ordenamiento(lista, mostrar_resultados=True):
     print("=" * 70)
     
     for nombre, metodo in metodos.items():
-        lista_copia = lista.copy()
-        
-        inicio = time.time()
         try:
-            resultado = metodo(lista_copia)
-            tiempo = time.time() - inicio
+            resumen, resultado = medir(metodo, preparar=lambda: (lista.copy(),),
+                                       repeticiones=3, calentamiento=0)
+            tiempo = resumen["mediana_ns"] / 1e9
             
             # Verificar que esté ordenada
             ordenada = esta_ordenada(resultado)
@@ -389,23 +974,92 @@ def comparar_metodos_ordenamiento(lista, mostrar_resultados=True):
     
     return tiempos, resultados
 
-# Comparar con lista pequeña
-print("Comparación con lista pequeña (10 elementos):")
-lista_pequena = generar_lista_aleatoria(10, 1, 50)
-print(f"Lista: {lista_pequena}")
-comparar_metodos_ordenamiento(lista_pequena, mostrar_resultados=True)
-print()
 
-# Comparar con lista mediana
-print("Comparación con lista mediana (100 elementos):")
-lista_mediana = generar_lista_aleatoria(100, 1, 100)
-comparar_metodos_ordenamiento(lista_mediana, mostrar_resultados=False)
-print()
+def _enteros_numpy(n):
+    """Arreglo int64 aleatorio con signo para la familia ordenamiento_enteros."""
+    import numpy as np
+    return (np.random.randint(-2**40, 2**40, size=n, dtype=np.int64),)
+
+def _ordenado_numpy(resultado, arreglo):
+    """Verifica un resultado de NumPy contra np.sort."""
+    import numpy as np
+    return bool(np.array_equal(resultado, np.sort(arreglo)))
+
+def _np_sort(arreglo):
+    """np.sort estable, referencia para los ordenamientos con NumPy."""
+    import numpy as np
+    return np.sort(arreglo, kind="stable")
+
+
+# Familia para el sistema de benchmarks (python -m algoritmos.benchmark)
+BENCHMARKS = {
+    "ordenamiento": {
+        "implementaciones": {
+            "bubble_sort": bubble_sort,
+            "bubble_sort_optimizado": bubble_sort_optimizado,
+            "selection_sort": selection_sort,
+            "insertion_sort": insertion_sort,
+            "merge_sort": merge_sort,
+            "quick_sort": quick_sort,
+            "quick_sort_inplace": quick_sort_inplace,
+            "heap_sort": heap_sort,
+            "counting_sort": counting_sort,
+            "ordenamiento_hibrido": ordenamiento_hibrido,
+            "sorted": sorted,
+        },
+        "entrada": lambda n: (generar_lista_aleatoria(n, 1, n),),
+        "tamanios": [100, 1000, 10000],
+        # Los métodos O(n²) solo se miden en tamaños pequeños
+        "limites": {
+            "bubble_sort": 1000,
+            "bubble_sort_optimizado": 1000,
+            "selection_sort": 1000,
+            "insertion_sort": 1000,
+        },
+        "verificar": lambda resultado, lista: resultado == sorted(lista),
+    },
+    "ordenamiento_casi": {
+        "implementaciones": {
+            "insertion_sort": insertion_sort,
+            "merge_sort": merge_sort,
+            "quick_sort": quick_sort,
+            "heap_sort": heap_sort,
+            "ordenamiento_hibrido": ordenamiento_hibrido,
+            "sorted": sorted,
+        },
+        "entrada": lambda n: (generar_lista_casi_ordenada(n),),
+        "tamanios": [1000, 10000, 100000],
+        "limites": {"insertion_sort": 10000},
+        "verificar": lambda resultado, lista: resultado == sorted(lista),
+    },
+    "ordenamiento_paralelo": {
+        "implementaciones": {
+            "merge_sort": merge_sort,
+            "quick_sort": quick_sort,
+            "paralelo_mezcla": ordenamiento_paralelo,
+            "paralelo_rapido": lambda lista: ordenamiento_paralelo(lista, metodo="rapido"),
+        },
+        "entrada": lambda n: (generar_lista_aleatoria(n, 1, n),),
+        "tamanios": [100000, 1000000],
+        "verificar": lambda resultado, lista: resultado == sorted(lista),
+    },
+    "ordenamiento_enteros": {
+        "implementaciones": {
+            "radix_sort_numpy_8": radix_sort_numpy,
+            "radix_sort_numpy_16": lambda arreglo: radix_sort_numpy(arreglo, 16),
+            "counting_sort_numpy": counting_sort_numpy,
+            "np.sort": _np_sort,
+        },
+        "entrada": _enteros_numpy,
+        "tamanios": [100000, 1000000, 10000000],
+        "verificar": _ordenado_numpy,
+    },
+}
+
 
 # =============================================================================
-# 9. Análisis de Complejidad
+# 13. Análisis de Complejidad
 # =============================================================================
-print("=== 9. Análisis de Complejidad ===")
 def analizar_complejidad():
     """
     Muestra la complejidad temporal de cada método.
@@ -424,6 +1078,8 @@ def analizar_complejidad():
         ("Quick Sort", "O(n log n)", "O(n log n)", "O(n²)"),
         ("Heap Sort", "O(n log n)", "O(n log n)", "O(n log n)"),
         ("Counting Sort", "O(n + k)", "O(n + k)", "O(n + k)"),
+        ("Radix Sort (NumPy)", "O(d * n)", "O(d * n)", "O(d * n)"),
+        ("Ordenamiento Híbrido", "O(n)", "O(n log n)", "O(n log n)"),
         ("Python sorted() (Timsort)", "O(n)", "O(n log n)", "O(n log n)"),
     ]
     
@@ -433,16 +1089,14 @@ def analizar_complejidad():
     print("=" * 70)
     print("\nNotas:")
     print("  - k: rango de valores (en Counting Sort)")
+    print("  - d: número de dígitos de la clave (en Radix Sort)")
     print("  - Estable: mantiene el orden relativo de elementos iguales")
     print("  - In-place: usa espacio O(1) adicional")
 
-analizar_complejidad()
-print()
 
 # =============================================================================
-# 10. Casos Especiales
+# 14. Casos Especiales
 # =============================================================================
-print("=== 10. Casos Especiales ===")
 def probar_casos_especiales():
     """
     Prueba los algoritmos con casos especiales.
@@ -467,45 +1121,225 @@ def probar_casos_especiales():
         else:
             print(f"  Lista vacía - no se puede ordenar")
 
-probar_casos_especiales()
-print()
 
 # =============================================================================
-# 11. Visualización del Proceso (opcional)
+# 15. Visualización del Proceso (opcional)
 # =============================================================================
-print("=== 11. Resumen y Recomendaciones ===")
-print("\nRecomendaciones de uso:")
-print("=" * 70)
-print("1. Para listas pequeñas (< 50 elementos):")
-print("   - Insertion Sort o incluso Bubble Sort son adecuados")
-print()
-print("2. Para listas medianas (50-1000 elementos):")
-print("   - Quick Sort o Merge Sort (mejor rendimiento general)")
-print()
-print("3. Para listas grandes (> 1000 elementos):")
-print("   - Quick Sort, Merge Sort, o Heap Sort")
-print("   - Python's sorted() (Timsort) es excelente")
-print()
-print("4. Para datos con rango pequeño conocido:")
-print("   - Counting Sort puede ser muy eficiente")
-print()
-print("5. Cuando se necesita estabilidad:")
-print("   - Merge Sort, Insertion Sort, Bubble Sort, Counting Sort")
-print("   - Evitar Quick Sort y Heap Sort")
-print()
-print("6. Cuando el espacio es limitado:")
-print("   - Usar algoritmos in-place: Quick Sort, Heap Sort, Insertion Sort")
-print("   - Evitar Merge Sort (requiere espacio O(n))")
-print("=" * 70)
-
-# Resumen final
-print("\n=== Resumen ===")
-print("Métodos de ordenamiento implementados:")
-print("  1. Bubble Sort - Simple pero lento O(n²)")
-print("  2. Selection Sort - Simple, siempre O(n²)")
-print("  3. Insertion Sort - Eficiente para listas pequeñas")
-print("  4. Merge Sort - Estable, O(n log n) garantizado")
-print("  5. Quick Sort - Rápido en la práctica")
-print("  6. Heap Sort - O(n log n) garantizado, in-place")
-print("  7. Counting Sort - O(n + k) para rangos pequeños")
-print("  8. Python sorted() - Timsort, híbrido optimizado")
+
+
+def main():
+    """Ejecuta los ejemplos y comparaciones del módulo."""
+    print("=== Métodos de Ordenamiento ===\n")
+
+    print("=== 1. BUBBLE SORT (Ordenamiento de Burbuja) ===")
+
+    # Ejemplo
+    print("Ejemplo Bubble Sort:")
+    lista_ejemplo = [64, 34, 25, 12, 22, 11, 90]
+    print(f"Lista original: {lista_ejemplo}")
+    print(f"Bubble Sort: {bubble_sort(lista_ejemplo)}")
+    print(f"Bubble Sort Optimizado: {bubble_sort_optimizado(lista_ejemplo)}")
+    print()
+
+    print("=== 2. SELECTION SORT (Ordenamiento por Selección) ===")
+
+    # Ejemplo
+    print("Ejemplo Selection Sort:")
+    lista_ejemplo = [64, 34, 25, 12, 22, 11, 90]
+    print(f"Lista original: {lista_ejemplo}")
+    print(f"Selection Sort: {selection_sort(lista_ejemplo)}")
+    print()
+
+    print("=== 3. INSERTION SORT (Ordenamiento por Inserción) ===")
+
+    # Ejemplo
+    print("Ejemplo Insertion Sort:")
+    lista_ejemplo = [64, 34, 25, 12, 22, 11, 90]
+    print(f"Lista original: {lista_ejemplo}")
+    print(f"Insertion Sort: {insertion_sort(lista_ejemplo)}")
+    print()
+
+    print("=== 4. MERGE SORT (Ordenamiento por Mezcla) ===")
+
+    # Ejemplo
+    print("Ejemplo Merge Sort:")
+    lista_ejemplo = [64, 34, 25, 12, 22, 11, 90]
+    print(f"Lista original: {lista_ejemplo}")
+    print(f"Merge Sort: {merge_sort(lista_ejemplo)}")
+    print()
+
+    print("=== 5. QUICK SORT (Ordenamiento Rápido) ===")
+
+    # Ejemplo
+    print("Ejemplo Quick Sort:")
+    lista_ejemplo = [64, 34, 25, 12, 22, 11, 90]
+    print(f"Lista original: {lista_ejemplo}")
+    print(f"Quick Sort: {quick_sort(lista_ejemplo)}")
+    lista_copy = lista_ejemplo.copy()
+    quick_sort_inplace(lista_copy)
+    print(f"Quick Sort In-place: {lista_copy}")
+    print()
+
+    print("=== 6. HEAP SORT (Ordenamiento por Montículos) ===")
+
+    # Ejemplo
+    print("Ejemplo Heap Sort:")
+    lista_ejemplo = [64, 34, 25, 12, 22, 11, 90]
+    print(f"Lista original: {lista_ejemplo}")
+    print(f"Heap Sort: {heap_sort(lista_ejemplo)}")
+    print()
+
+    print("=== 7. COUNTING SORT (Ordenamiento por Conteo) ===")
+
+    # Ejemplo
+    print("Ejemplo Counting Sort:")
+    lista_ejemplo = [4, 2, 2, 8, 3, 3, 1]
+    print(f"Lista original: {lista_ejemplo}")
+    print(f"Counting Sort: {counting_sort(lista_ejemplo)}")
+    print()
+
+    print("=== 8. ORDENAMIENTO HÍBRIDO ADAPTATIVO ===")
+
+    # Ejemplo
+    print("Ejemplo Ordenamiento Híbrido:")
+    lista_ejemplo = [64, 34, 25, 12, 22, 11, 90]
+    print(f"Lista original: {lista_ejemplo}")
+    print(f"Ordenamiento Híbrido: {ordenamiento_hibrido(lista_ejemplo, umbral=4)}")
+
+    # Con datos casi ordenados solo se mezclan unas pocas corridas
+    lista_casi = generar_lista_casi_ordenada(20000, desorden=0.001)
+    print(f"Corridas naturales en 20000 elementos casi ordenados: "
+          f"{len(_detectar_corridas(lista_casi.copy()))}")
+    for nombre, metodo in [("Merge Sort", merge_sort), ("Quick Sort", quick_sort),
+                           ("Ordenamiento Híbrido", ordenamiento_hibrido)]:
+        resumen, resultado = medir(metodo, preparar=lambda: (lista_casi,),
+                                   repeticiones=3, calentamiento=0)
+        print(f"  {nombre:22s} {resumen['mediana_ns'] / 1e6:8.2f} ms  "
+              f"{'✓' if esta_ordenada(resultado) else '✗'}")
+    print()
+
+    print("=== 9. ORDENAMIENTO EXTERNO ===")
+
+    # Ejemplo: archivo de 50000 números ordenado con solo 256 KB de memoria
+    with tempfile.TemporaryDirectory() as directorio:
+        entrada = os.path.join(directorio, "numeros.txt")
+        salida = os.path.join(directorio, "numeros_ordenados.txt")
+        numeros = generar_lista_aleatoria(50000, -10**6, 10**6)
+        with open(entrada, "w", encoding="utf-8") as archivo:
+            archivo.writelines(f"{x}\n" for x in numeros)
+        
+        estadisticas = ordenamiento_externo(entrada, salida, memoria_max=256 * 1024)
+        with open(salida, encoding="utf-8") as archivo:
+            resultado = [int(linea) for linea in archivo]
+        print(f"Registros: {estadisticas['registros']}, corridas: {estadisticas['corridas']}, "
+              f"pasadas de mezcla: {estadisticas['pasadas']}")
+        print(f"Verificación: {'✓ Correcto' if resultado == sorted(numeros) else '✗ Error'}")
+    print()
+
+    print("=== 10. ORDENAMIENTO PARALELO ===")
+
+    # La aceleración depende del número de núcleos (con 1 núcleo no hay ganancia)
+    comparar_ordenamiento_paralelo(200000)
+    print()
+
+    print("=== 11. RADIX SORT Y COUNTING SORT CON NUMPY ===")
+
+    try:
+        import numpy as np
+    except ImportError:
+        print("NumPy no está instalado: se omiten radix_sort_numpy y counting_sort_numpy")
+    else:
+        enteros = np.array([170, -45, 75, -90, 802, 24, 2, 66], dtype=np.int64)
+        print(f"Arreglo original: {enteros.tolist()}")
+        print(f"Radix Sort (8 bits): {radix_sort_numpy(enteros).tolist()}")
+        print(f"Counting Sort: {counting_sort_numpy(enteros).tolist()}")
+
+        # Modo argsort: ordenar registros (nombre, edad) por la clave edad
+        nombres = np.array(["Ana", "Luis", "Eva", "Juan", "Sara"])
+        edades = np.array([31, 25, 31, 19, 25])
+        orden = radix_sort_numpy(edades, retornar_indices=True)
+        print(f"Registros por edad (estable): {list(zip(nombres[orden].tolist(), edades[orden].tolist()))}")
+
+        grande = np.random.randint(-2**40, 2**40, size=1000000, dtype=np.int64)
+        for nombre, metodo in [("radix_sort_numpy (8 bits)", radix_sort_numpy),
+                               ("radix_sort_numpy (16 bits)", lambda a: radix_sort_numpy(a, 16)),
+                               ("np.sort", np.sort)]:
+            resumen, resultado = medir(metodo, preparar=lambda: (grande,),
+                                       repeticiones=3, calentamiento=1)
+            print(f"  {nombre:28s} {resumen['mediana_ns'] / 1e6:8.1f} ms (10⁶ enteros)")
+    print()
+
+    print("=== 12. Comparación de Métodos ===")
+
+    # Comparar con lista pequeña
+    print("Comparación con lista pequeña (10 elementos):")
+    lista_pequena = generar_lista_aleatoria(10, 1, 50)
+    print(f"Lista: {lista_pequena}")
+    comparar_metodos_ordenamiento(lista_pequena, mostrar_resultados=True)
+    print()
+
+    # Comparar con lista mediana
+    print("Comparación con lista mediana (100 elementos):")
+    lista_mediana = generar_lista_aleatoria(100, 1, 100)
+    comparar_metodos_ordenamiento(lista_mediana, mostrar_resultados=False)
+    print()
+
+    print("=== 13. Análisis de Complejidad ===")
+
+    analizar_complejidad()
+    print()
+
+    print("=== 14. Casos Especiales ===")
+
+    probar_casos_especiales()
+    print()
+
+    print("=== 15. Resumen y Recomendaciones ===")
+    print("\nRecomendaciones de uso:")
+    print("=" * 70)
+    print("1. Para listas pequeñas (< 50 elementos):")
+    print("   - Insertion Sort o incluso Bubble Sort son adecuados")
+    print()
+    print("2. Para listas medianas (50-1000 elementos):")
+    print("   - Quick Sort o Merge Sort (mejor rendimiento general)")
+    print()
+    print("3. Para listas grandes (> 1000 elementos):")
+    print("   - Quick Sort, Merge Sort, o Heap Sort")
+    print("   - Python's sorted() (Timsort) es excelente")
+    print()
+    print("4. Para listas muy grandes de números y varios núcleos:")
+    print("   - Ordenamiento paralelo con procesos y memoria compartida")
+    print()
+    print("5. Para archivos más grandes que la memoria:")
+    print("   - Ordenamiento externo: corridas ordenadas + mezcla con heap")
+    print()
+    print("6. Para datos con rango pequeño conocido:")
+    print("   - Counting Sort puede ser muy eficiente")
+    print("   - Para columnas enormes de enteros: Radix/Counting Sort con NumPy")
+    print()
+    print("7. Cuando se necesita estabilidad:")
+    print("   - Merge Sort, Insertion Sort, Bubble Sort, Counting Sort")
+    print("   - Evitar Quick Sort y Heap Sort")
+    print()
+    print("8. Cuando el espacio es limitado:")
+    print("   - Usar algoritmos in-place: Quick Sort, Heap Sort, Insertion Sort")
+    print("   - Evitar Merge Sort (requiere espacio O(n))")
+    print("=" * 70)
+
+    # Resumen final
+    print("\n=== Resumen ===")
+    print("Métodos de ordenamiento implementados:")
+    print("  1. Bubble Sort - Simple pero lento O(n²)")
+    print("  2. Selection Sort - Simple, siempre O(n²)")
+    print("  3. Insertion Sort - Eficiente para listas pequeñas")
+    print("  4. Merge Sort - Estable, O(n log n) garantizado")
+    print("  5. Quick Sort - Rápido en la práctica")
+    print("  6. Heap Sort - O(n log n) garantizado, in-place")
+    print("  7. Counting Sort - O(n + k) para rangos pequeños (también con NumPy)")
+    print("  8. Radix Sort (NumPy) - O(d * n) para enteros con o sin signo")
+    print("  9. Ordenamiento Híbrido - Corridas naturales, O(n) si ya está casi ordenada")
+    print("  10. Python sorted() - Timsort, híbrido optimizado")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,21 @@
 # Archivo: 37_arboles.py
 # Descripción: Estructuras de datos - Árboles
 
-from collections import deque
+import mmap
+import os
+import random
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict, deque
+
+from algoritmos.benchmark import medir
 
-print("=== Estructuras de Datos: Árboles ===\n")
 
 # =============================================================================
 # 1. ÁRBOL BINARIO BÁSICO
 # =============================================================================
-print("=== 1. Árbol Binario Básico ===")
 
 class NodoArbol:
     """Nodo de un árbol binario."""
@@ -21,7 +28,13 @@ class NodoArbol:
         return str(self.valor)
 
 class ArbolBinario:
-    """Árbol binario simple."""
+    """
+    Árbol binario simple.
+    
+    Todas las operaciones son iterativas (con un bucle o una pila
+    explícita), así que un árbol degenerado de millones de nodos no
+    provoca RecursionError.
+    """
     
     def __init__(self, valor_raiz=None):
         if valor_raiz is not None:
@@ -30,227 +43,296 @@ class ArbolBinario:
             self.raiz = None
     
     def insertar(self, valor):
-        """Inserta un valor en el árbol."""
+        """Inserta un valor en el árbol (menores a la izquierda)."""
+        nuevo = NodoArbol(valor)
         if self.raiz is None:
-            self.raiz = NodoArbol(valor)
-        else:
-            self._insertar_recursivo(self.raiz, valor)
-    
-    def _insertar_recursivo(self, nodo, valor):
-        """Inserta recursivamente en el árbol."""
-        if valor < nodo.valor:
-            if nodo.izquierda is None:
-                nodo.izquierda = NodoArbol(valor)
+            self.raiz = nuevo
+            return
+        nodo = self.raiz
+        while True:
+            if valor < nodo.valor:
+                if nodo.izquierda is None:
+                    nodo.izquierda = nuevo
+                    return
+                nodo = nodo.izquierda
             else:
-                self._insertar_recursivo(nodo.izquierda, valor)
-        else:
-            if nodo.derecha is None:
-                nodo.derecha = NodoArbol(valor)
-            else:
-                self._insertar_recursivo(nodo.derecha, valor)
+                if nodo.derecha is None:
+                    nodo.derecha = nuevo
+                    return
+                nodo = nodo.derecha
     
     def buscar(self, valor):
         """Busca un valor en el árbol."""
-        return self._buscar_recursivo(self.raiz, valor)
+        nodo = self.raiz
+        while nodo is not None:
+            if nodo.valor == valor:
+                return True
+            nodo = nodo.izquierda if valor < nodo.valor else nodo.derecha
+        return False
     
-    def _buscar_recursivo(self, nodo, valor):
-        """Busca recursivamente en el árbol."""
-        if nodo is None:
-            return False
-        if nodo.valor == valor:
-            return True
-        if valor < nodo.valor:
-            return self._buscar_recursivo(nodo.izquierda, valor)
-        return self._buscar_recursivo(nodo.derecha, valor)
+    def _nodos(self):
+        """Generador de los nodos en preorden con una pila explícita."""
+        pila = [self.raiz] if self.raiz is not None else []
+        while pila:
+            nodo = pila.pop()
+            yield nodo
+            if nodo.derecha is not None:
+                pila.append(nodo.derecha)
+            if nodo.izquierda is not None:
+                pila.append(nodo.izquierda)
     
     def altura(self):
-        """Calcula la altura del árbol."""
-        return self._altura_recursiva(self.raiz)
-    
-    def _altura_recursiva(self, nodo):
-        """Calcula la altura recursivamente."""
-        if nodo is None:
-            return -1
-        return 1 + max(self._altura_recursiva(nodo.izquierda), 
-                      self._altura_recursiva(nodo.derecha))
+        """Calcula la altura del árbol (-1 si está vacío) recorriendo por niveles."""
+        altura = -1
+        nivel = [self.raiz] if self.raiz is not None else []
+        while nivel:
+            altura += 1
+            nivel = [hijo for nodo in nivel
+                     for hijo in (nodo.izquierda, nodo.derecha) if hijo is not None]
+        return altura
     
     def tamaño(self):
         """Calcula el número de nodos."""
-        return self._tamaño_recursivo(self.raiz)
-    
-    def _tamaño_recursivo(self, nodo):
-        """Calcula el tamaño recursivamente."""
-        if nodo is None:
-            return 0
-        return 1 + self._tamaño_recursivo(nodo.izquierda) + \
-               self._tamaño_recursivo(nodo.derecha)
-
-# Ejemplo
-print("Creando árbol binario:")
-arbol = ArbolBinario()
-valores = [50, 30, 70, 20, 40, 60, 80]
-for valor in valores:
-    arbol.insertar(valor)
-
-print(f"Valores insertados: {valores}")
-print(f"Buscar 40: {arbol.buscar(40)}")
-print(f"Buscar 100: {arbol.buscar(100)}")
-print(f"Altura del árbol: {arbol.altura()}")
-print(f"Tamaño del árbol: {arbol.tamaño()}")
-print()
+        return sum(1 for _ in self._nodos())
+
 
 # =============================================================================
 # 2. RECORRIDOS DE ÁRBOL
 # =============================================================================
-print("=== 2. Recorridos de Árbol ===")
 
 class ArbolRecorridos(ArbolBinario):
-    """Árbol binario con métodos de recorrido."""
+    """
+    Árbol binario con métodos de recorrido.
     
-    def recorrido_preorden(self):
-        """Recorrido preorden: raíz, izquierda, derecha."""
-        resultado = []
-        self._preorden(self.raiz, resultado)
-        return resultado
+    Los métodos iter_* son generadores perezosos: entregan los valores de
+    a uno sin construir la lista completa. Los de pila usan O(altura) de
+    memoria; los Morris usan O(1) enhebrando temporalmente punteros
+    derechos vacíos hacia el sucesor (el árbol queda intacto al terminar,
+    incluso si el generador se abandona a mitad de camino).
+    Los métodos recorrido_* mantienen la interfaz original y retornan listas.
+    """
     
-    def _preorden(self, nodo, resultado):
-        if nodo:
-            resultado.append(nodo.valor)
-            self._preorden(nodo.izquierda, resultado)
-            self._preorden(nodo.derecha, resultado)
+    def iter_preorden(self):
+        """Generador preorden (raíz, izquierda, derecha) con pila explícita."""
+        for nodo in self._nodos():
+            yield nodo.valor
     
-    def recorrido_inorden(self):
-        """Recorrido inorden: izquierda, raíz, derecha."""
-        resultado = []
-        self._inorden(self.raiz, resultado)
-        return resultado
+    def iter_inorden(self):
+        """Generador inorden (izquierda, raíz, derecha) con pila explícita."""
+        pila = []
+        nodo = self.raiz
+        while pila or nodo is not None:
+            while nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.izquierda
+            nodo = pila.pop()
+            yield nodo.valor
+            nodo = nodo.derecha
     
-    def _inorden(self, nodo, resultado):
-        if nodo:
-            self._inorden(nodo.izquierda, resultado)
-            resultado.append(nodo.valor)
-            self._inorden(nodo.derecha, resultado)
-    
-    def recorrido_postorden(self):
-        """Recorrido postorden: izquierda, derecha, raíz."""
-        resultado = []
-        self._postorden(self.raiz, resultado)
-        return resultado
-    
-    def _postorden(self, nodo, resultado):
-        if nodo:
-            self._postorden(nodo.izquierda, resultado)
-            self._postorden(nodo.derecha, resultado)
-            resultado.append(nodo.valor)
+    def iter_postorden(self):
+        """
+        Generador postorden (izquierda, derecha, raíz) con una sola pila:
+        un nodo se visita cuando su subárbol derecho ya fue visitado.
+        """
+        pila = []
+        nodo = self.raiz
+        ultimo = None
+        while pila or nodo is not None:
+            while nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.izquierda
+            tope = pila[-1]
+            if tope.derecha is not None and tope.derecha is not ultimo:
+                nodo = tope.derecha
+            else:
+                pila.pop()
+                yield tope.valor
+                ultimo = tope
     
-    def recorrido_nivel_orden(self):
-        """Recorrido por niveles (BFS - Breadth First Search)."""
+    def iter_nivel_orden(self):
+        """Generador por niveles (BFS) con una cola."""
         if self.raiz is None:
-            return []
-        
-        resultado = []
+            return
         cola = deque([self.raiz])
-        
         while cola:
             nodo = cola.popleft()
-            resultado.append(nodo.valor)
-            
+            yield nodo.valor
             if nodo.izquierda:
                 cola.append(nodo.izquierda)
             if nodo.derecha:
                 cola.append(nodo.derecha)
-        
-        return resultado
-
-# Ejemplo
-print("Creando árbol para recorridos:")
-arbol_rec = ArbolRecorridos()
-valores = [50, 30, 70, 20, 40, 60, 80]
-for valor in valores:
-    arbol_rec.insertar(valor)
+    
+    def iter_inorden_morris(self):
+        """Generador inorden de Morris: O(1) de memoria adicional."""
+        return self._morris(preorden=False)
+    
+    def iter_preorden_morris(self):
+        """Generador preorden de Morris: O(1) de memoria adicional."""
+        return self._morris(preorden=True)
+    
+    def _morris(self, preorden):
+        """
+        Recorrido de Morris. Para cada nodo con subárbol izquierdo se busca
+        su predecesor inorden (el más a la derecha de ese subárbol): la
+        primera vez se enhebra predecesor.derecha -> nodo y se baja a la
+        izquierda; la segunda vez (al volver por el hilo) se deshace.
+        """
+        nodo = self.raiz
+        try:
+            while nodo is not None:
+                if nodo.izquierda is None:
+                    valor, nodo = nodo.valor, nodo.derecha
+                    yield valor
+                    continue
+                predecesor = nodo.izquierda
+                while predecesor.derecha is not None and predecesor.derecha is not nodo:
+                    predecesor = predecesor.derecha
+                if predecesor.derecha is None:
+                    predecesor.derecha = nodo
+                    siguiente = nodo.izquierda
+                    if preorden:
+                        valor, nodo = nodo.valor, siguiente
+                        yield valor
+                    else:
+                        nodo = siguiente
+                else:
+                    predecesor.derecha = None
+                    valor, nodo = nodo.valor, nodo.derecha
+                    if not preorden:
+                        yield valor
+        finally:
+            # Si el generador se cerró antes de terminar, completar el
+            # recorrido sin entregar valores para quitar los hilos pendientes
+            while nodo is not None:
+                if nodo.izquierda is None:
+                    nodo = nodo.derecha
+                    continue
+                predecesor = nodo.izquierda
+                while predecesor.derecha is not None and predecesor.derecha is not nodo:
+                    predecesor = predecesor.derecha
+                if predecesor.derecha is None:
+                    predecesor.derecha = nodo
+                    nodo = nodo.izquierda
+                else:
+                    predecesor.derecha = None
+                    nodo = nodo.derecha
+    
+    def __iter__(self):
+        """Iterar sobre el árbol recorre sus valores en inorden."""
+        return self.iter_inorden()
+    
+    def recorrido_preorden(self):
+        """Recorrido preorden: raíz, izquierda, derecha."""
+        return list(self.iter_preorden())
+    
+    def recorrido_inorden(self):
+        """Recorrido inorden: izquierda, raíz, derecha."""
+        return list(self.iter_inorden())
+    
+    def recorrido_postorden(self):
+        """Recorrido postorden: izquierda, derecha, raíz."""
+        return list(self.iter_postorden())
+    
+    def recorrido_nivel_orden(self):
+        """Recorrido por niveles (BFS - Breadth First Search)."""
+        return list(self.iter_nivel_orden())
 
-print(f"Preorden (raíz, izq, der):   {arbol_rec.recorrido_preorden()}")
-print(f"Inorden (izq, raíz, der):    {arbol_rec.recorrido_inorden()}")
-print(f"Postorden (izq, der, raíz):  {arbol_rec.recorrido_postorden()}")
-print(f"Nivel orden (BFS):           {arbol_rec.recorrido_nivel_orden()}")
-print()
 
 # =============================================================================
 # 3. ÁRBOL BINARIO DE BÚSQUEDA (BST)
 # =============================================================================
-print("=== 3. Árbol Binario de Búsqueda (BST) ===")
 
 class ArbolBST(ArbolRecorridos):
     """Árbol Binario de Búsqueda completo."""
     
     def es_bst(self):
-        """Verifica si el árbol es un BST válido."""
-        return self._es_bst_recursivo(self.raiz, float('-inf'), float('inf'))
-    
-    def _es_bst_recursivo(self, nodo, minimo, maximo):
-        """Verifica recursivamente si es BST."""
-        if nodo is None:
-            return True
-        if nodo.valor <= minimo or nodo.valor >= maximo:
-            return False
-        return (self._es_bst_recursivo(nodo.izquierda, minimo, nodo.valor) and
-                self._es_bst_recursivo(nodo.derecha, nodo.valor, maximo))
+        """
+        Verifica si el árbol es un BST válido: su recorrido inorden debe
+        ser estrictamente creciente (se corta en la primera inversión).
+        """
+        anterior = float('-inf')
+        for valor in self.iter_inorden():
+            if valor <= anterior:
+                return False
+            anterior = valor
+        return True
     
     def encontrar_minimo(self):
-        """Encuentra el valor mínimo en el árbol."""
+        """Encuentra el valor mínimo en el árbol (el nodo más a la izquierda)."""
         if self.raiz is None:
             return None
-        return self._encontrar_minimo_recursivo(self.raiz)
-    
-    def _encontrar_minimo_recursivo(self, nodo):
-        """Encuentra el mínimo recursivamente."""
-        if nodo.izquierda is None:
-            return nodo.valor
-        return self._encontrar_minimo_recursivo(nodo.izquierda)
+        nodo = self.raiz
+        while nodo.izquierda is not None:
+            nodo = nodo.izquierda
+        return nodo.valor
     
     def encontrar_maximo(self):
-        """Encuentra el valor máximo en el árbol."""
+        """Encuentra el valor máximo en el árbol (el nodo más a la derecha)."""
         if self.raiz is None:
             return None
-        return self._encontrar_maximo_recursivo(self.raiz)
-    
-    def _encontrar_maximo_recursivo(self, nodo):
-        """Encuentra el máximo recursivamente."""
-        if nodo.derecha is None:
-            return nodo.valor
-        return self._encontrar_maximo_recursivo(nodo.derecha)
-
-# Ejemplo
-print("Árbol Binario de Búsqueda:")
-arbol_bst = ArbolBST()
-valores = [50, 30, 70, 20, 40, 60, 80]
-for valor in valores:
-    arbol_bst.insertar(valor)
-
-print(f"¿Es BST válido? {arbol_bst.es_bst()}")
-print(f"Valor mínimo: {arbol_bst.encontrar_minimo()}")
-print(f"Valor máximo: {arbol_bst.encontrar_maximo()}")
-print()
+        nodo = self.raiz
+        while nodo.derecha is not None:
+            nodo = nodo.derecha
+        return nodo.valor
+
 
 # =============================================================================
 # 4. ÁRBOL AVL (ÁRBOL BALANCEADO)
 # =============================================================================
-print("=== 4. Árbol AVL (Auto-balanceado) ===")
 
 class NodoAVL:
-    """Nodo para árbol AVL."""
+    """
+    Nodo para árbol AVL. Guarda la altura y el tamaño de su subárbol
+    (para las consultas por posición). Usa __slots__: sin __dict__ por
+    nodo, cada uno ocupa bastante menos memoria.
+    """
+    __slots__ = ("valor", "izquierda", "derecha", "altura", "tamanio")
+    
     def __init__(self, valor):
         self.valor = valor
         self.izquierda = None
         self.derecha = None
         self.altura = 1
+        self.tamanio = 1
 
 class ArbolAVL:
-    """Árbol AVL (balanceado)."""
+    """
+    Árbol AVL (balanceado).
+    
+    Además de insertar/eliminar en O(log n), cada nodo conoce el tamaño
+    de su subárbol, lo que permite estadísticas de orden en O(log n):
+    k_esimo(k) (el k-ésimo menor) y rango(valor) (cuántos son menores).
+    Admite valores repetidos.
+    """
     
     def __init__(self):
         self.raiz = None
     
+    @classmethod
+    def desde_ordenados(cls, valores):
+        """
+        Construye el árbol en O(n) a partir de una secuencia ordenada:
+        el elemento central de cada tramo es la raíz de su subárbol, así
+        que el resultado queda perfectamente balanceado sin rotaciones.
+        """
+        valores = list(valores)
+        if any(valores[i] > valores[i + 1] for i in range(len(valores) - 1)):
+            raise ValueError("Los valores deben estar ordenados de menor a mayor")
+        
+        def construir(inicio, fin):
+            if inicio >= fin:
+                return None
+            medio = (inicio + fin) // 2
+            nodo = NodoAVL(valores[medio])
+            nodo.izquierda = construir(inicio, medio)
+            nodo.derecha = construir(medio + 1, fin)
+            cls._actualizar(nodo)
+            return nodo
+        
+        arbol = cls()
+        arbol.raiz = construir(0, len(valores))
+        return arbol
+    
     def obtener_altura(self, nodo):
         """Obtiene la altura de un nodo."""
         if nodo is None:
@@ -263,6 +345,16 @@ class ArbolAVL:
             return 0
         return self.obtener_altura(nodo.izquierda) - self.obtener_altura(nodo.derecha)
     
+    @staticmethod
+    def _actualizar(nodo):
+        """Recalcula altura y tamaño de un nodo a partir de sus hijos."""
+        izquierda, derecha = nodo.izquierda, nodo.derecha
+        altura_izq = izquierda.altura if izquierda else 0
+        altura_der = derecha.altura if derecha else 0
+        nodo.altura = 1 + (altura_izq if altura_izq > altura_der else altura_der)
+        nodo.tamanio = (1 + (izquierda.tamanio if izquierda else 0)
+                        + (derecha.tamanio if derecha else 0))
+    
     def rotar_derecha(self, y):
         """Rotación a la derecha."""
         x = y.izquierda
@@ -271,10 +363,8 @@ class ArbolAVL:
         x.derecha = y
         y.izquierda = T2
         
-        y.altura = 1 + max(self.obtener_altura(y.izquierda),
-                          self.obtener_altura(y.derecha))
-        x.altura = 1 + max(self.obtener_altura(x.izquierda),
-                          self.obtener_altura(x.derecha))
+        self._actualizar(y)
+        self._actualizar(x)
         
         return x
     
@@ -286,13 +376,33 @@ class ArbolAVL:
         y.izquierda = x
         x.derecha = T2
         
-        x.altura = 1 + max(self.obtener_altura(x.izquierda),
-                          self.obtener_altura(x.derecha))
-        y.altura = 1 + max(self.obtener_altura(y.izquierda),
-                          self.obtener_altura(y.derecha))
+        self._actualizar(x)
+        self._actualizar(y)
         
         return y
     
+    def _balancear(self, nodo):
+        """
+        Actualiza el nodo y aplica la rotación que corresponda según los
+        factores de balance (sirve tanto después de insertar como de eliminar).
+        """
+        self._actualizar(nodo)
+        balance = self.obtener_factor_balance(nodo)
+        
+        if balance > 1:
+            # Izquierda-derecha: primero rotar el hijo izquierdo
+            if self.obtener_factor_balance(nodo.izquierda) < 0:
+                nodo.izquierda = self.rotar_izquierda(nodo.izquierda)
+            return self.rotar_derecha(nodo)
+        
+        if balance < -1:
+            # Derecha-izquierda: primero rotar el hijo derecho
+            if self.obtener_factor_balance(nodo.derecha) > 0:
+                nodo.derecha = self.rotar_derecha(nodo.derecha)
+            return self.rotar_izquierda(nodo)
+        
+        return nodo
+    
     def insertar(self, valor):
         """Inserta un valor manteniendo el balance."""
         self.raiz = self._insertar_avl(self.raiz, valor)
@@ -307,53 +417,130 @@ class ArbolAVL:
         else:
             nodo.derecha = self._insertar_avl(nodo.derecha, valor)
         
-        nodo.altura = 1 + max(self.obtener_altura(nodo.izquierda),
-                             self.obtener_altura(nodo.derecha))
-        
-        balance = self.obtener_factor_balance(nodo)
-        
-        # Rotación izquierda-izquierda
-        if balance > 1 and valor < nodo.izquierda.valor:
-            return self.rotar_derecha(nodo)
-        
-        # Rotación derecha-derecha
-        if balance < -1 and valor > nodo.derecha.valor:
-            return self.rotar_izquierda(nodo)
-        
-        # Rotación izquierda-derecha
-        if balance > 1 and valor > nodo.izquierda.valor:
-            nodo.izquierda = self.rotar_izquierda(nodo.izquierda)
-            return self.rotar_derecha(nodo)
-        
-        # Rotación derecha-izquierda
-        if balance < -1 and valor < nodo.derecha.valor:
-            nodo.derecha = self.rotar_derecha(nodo.derecha)
-            return self.rotar_izquierda(nodo)
+        return self._balancear(nodo)
+    
+    def eliminar(self, valor):
+        """
+        Elimina una aparición del valor manteniendo el balance.
+        Retorna True si estaba en el árbol, False si no.
+        """
+        if not self.buscar(valor):
+            return False
+        self.raiz = self._eliminar_avl(self.raiz, valor)
+        return True
+    
+    def _eliminar_avl(self, nodo, valor):
+        """Elimina (el valor existe en el subárbol) y balancea el camino."""
+        if valor < nodo.valor:
+            nodo.izquierda = self._eliminar_avl(nodo.izquierda, valor)
+        elif nodo.valor < valor:
+            nodo.derecha = self._eliminar_avl(nodo.derecha, valor)
+        else:
+            if nodo.izquierda is None:
+                return nodo.derecha
+            if nodo.derecha is None:
+                return nodo.izquierda
+            # Dos hijos: lo reemplaza su sucesor (el mínimo del subárbol derecho)
+            sucesor = nodo.derecha
+            while sucesor.izquierda is not None:
+                sucesor = sucesor.izquierda
+            nodo.derecha = self._eliminar_minimo(nodo.derecha)
+            sucesor.izquierda = nodo.izquierda
+            sucesor.derecha = nodo.derecha
+            nodo = sucesor
         
-        return nodo
+        return self._balancear(nodo)
+    
+    def _eliminar_minimo(self, nodo):
+        """Desengancha el nodo mínimo del subárbol y balancea el camino."""
+        if nodo.izquierda is None:
+            return nodo.derecha
+        nodo.izquierda = self._eliminar_minimo(nodo.izquierda)
+        return self._balancear(nodo)
+    
+    def buscar(self, valor):
+        """Verifica si el valor está en el árbol. O(log n)."""
+        nodo = self.raiz
+        while nodo is not None:
+            if valor < nodo.valor:
+                nodo = nodo.izquierda
+            elif nodo.valor < valor:
+                nodo = nodo.derecha
+            else:
+                return True
+        return False
+    
+    def k_esimo(self, k):
+        """Retorna el k-ésimo menor valor (k=1 es el mínimo). O(log n)."""
+        if not 1 <= k <= len(self):
+            raise ValueError(f"k debe estar entre 1 y {len(self)}")
+        nodo = self.raiz
+        while True:
+            izquierda = nodo.izquierda.tamanio if nodo.izquierda else 0
+            if k <= izquierda:
+                nodo = nodo.izquierda
+            elif k == izquierda + 1:
+                return nodo.valor
+            else:
+                k -= izquierda + 1
+                nodo = nodo.derecha
+    
+    def rango(self, valor):
+        """
+        Cuenta los elementos estrictamente menores que 'valor' (su posición
+        si se insertara, como bisect_left). O(log n).
+        """
+        cantidad = 0
+        nodo = self.raiz
+        while nodo is not None:
+            if nodo.valor < valor:
+                cantidad += 1 + (nodo.izquierda.tamanio if nodo.izquierda else 0)
+                nodo = nodo.derecha
+            else:
+                nodo = nodo.izquierda
+        return cantidad
+    
+    def iter_rango(self, desde=None, hasta=None):
+        """
+        Generador de los valores entre 'desde' y 'hasta' (ambos inclusive,
+        None = sin límite) en orden. Solo visita los subárboles que pueden
+        contener valores del rango: O(log n + k).
+        """
+        pila = []
+        nodo = self.raiz
+        while pila or nodo is not None:
+            while nodo is not None:
+                if desde is not None and nodo.valor < desde:
+                    nodo = nodo.derecha
+                else:
+                    pila.append(nodo)
+                    nodo = nodo.izquierda
+            if not pila:
+                return
+            nodo = pila.pop()
+            if hasta is not None and hasta < nodo.valor:
+                return
+            yield nodo.valor
+            nodo = nodo.derecha
+    
+    def __len__(self):
+        return self.raiz.tamanio if self.raiz else 0
+    
+    def __contains__(self, valor):
+        return self.buscar(valor)
+    
+    def __iter__(self):
+        """Recorre los valores en orden."""
+        return self.iter_rango()
     
     def inorden(self):
         """Recorrido inorden."""
-        resultado = []
-        self._inorden_rec(self.raiz, resultado)
-        return resultado
-    
-    def _inorden_rec(self, nodo, resultado):
-        if nodo:
-            self._inorden_rec(nodo.izquierda, resultado)
-            resultado.append(nodo.valor)
-            self._inorden_rec(nodo.derecha, resultado)
+        return list(self.iter_rango())
 
-# Ejemplo (simplificado)
-print("Árbol AVL (implementación básica):")
-print("Nota: Árbol AVL mantiene balance automáticamente")
-print("      Evita árboles degenerados (que se convierten en listas)")
-print()
 
 # =============================================================================
 # 5. ÁRBOL N-ARIO (ÁRBOL GENERAL)
 # =============================================================================
-print("=== 5. Árbol N-ario (Árbol General) ===")
 
 class NodoNario:
     """Nodo de un árbol n-ario (múltiples hijos)."""
@@ -407,82 +594,797 @@ class ArbolNario:
         
         return resultado
 
-# Ejemplo
-print("Creando árbol n-ario:")
-arbol_nario = ArbolNario(1)
-nodo2 = NodoNario(2)
-nodo3 = NodoNario(3)
-nodo4 = NodoNario(4)
-nodo5 = NodoNario(5)
-nodo6 = NodoNario(6)
-
-arbol_nario.raiz.agregar_hijo(nodo2)
-arbol_nario.raiz.agregar_hijo(nodo3)
-nodo2.agregar_hijo(nodo4)
-nodo2.agregar_hijo(nodo5)
-nodo3.agregar_hijo(nodo6)
-
-print("Estructura: 1 -> [2, 3], 2 -> [4, 5], 3 -> [6]")
-print(f"Recorrido en profundidad (DFS): {arbol_nario.recorrido_profundidad()}")
-print(f"Recorrido en anchura (BFS): {arbol_nario.recorrido_anchura()}")
-print()
 
 # =============================================================================
 # 6. OPERACIONES COMUNES EN ÁRBOLES
 # =============================================================================
-print("=== 6. Operaciones Comunes ===")
 
 def contar_hojas(arbol):
     """Cuenta el número de hojas en un árbol binario."""
-    def _contar_hojas(nodo):
-        if nodo is None:
-            return 0
-        if nodo.izquierda is None and nodo.derecha is None:
-            return 1
-        return _contar_hojas(nodo.izquierda) + _contar_hojas(nodo.derecha)
-    
-    return _contar_hojas(arbol.raiz)
+    return sum(1 for nodo in arbol._nodos()
+               if nodo.izquierda is None and nodo.derecha is None)
 
 def sumar_valores(arbol):
     """Suma todos los valores del árbol."""
-    def _sumar(nodo):
-        if nodo is None:
-            return 0
-        return nodo.valor + _sumar(nodo.izquierda) + _sumar(nodo.derecha)
-    
-    return _sumar(arbol.raiz)
+    return sum(nodo.valor for nodo in arbol._nodos())
 
 def es_completo(arbol):
-    """Verifica si el árbol binario está completo."""
-    def _es_completo(nodo, indice, num_nodos):
+    """
+    Verifica si el árbol binario está completo: recorriendo por niveles,
+    después del primer hueco no puede aparecer ningún nodo.
+    """
+    cola = deque([arbol.raiz])
+    hueco = False
+    while cola:
+        nodo = cola.popleft()
         if nodo is None:
-            return True
-        if indice >= num_nodos:
+            hueco = True
+        elif hueco:
             return False
-        return (_es_completo(nodo.izquierda, 2*indice + 1, num_nodos) and
-                _es_completo(nodo.derecha, 2*indice + 2, num_nodos))
+        else:
+            cola.append(nodo.izquierda)
+            cola.append(nodo.derecha)
+    return True
+
+
+# =============================================================================
+# 7. ÁRBOL B+ EN DISCO
+# =============================================================================
+
+class _PaginaBMas:
+    """
+    Página de un ArbolBMas ya decodificada (vive en la caché LRU).
+    Claves, datos e hijos son array.array: decodificar una página es
+    copiar bytes, sin crear un objeto por clave.
+    """
+    __slots__ = ("numero", "hoja", "claves", "hijos", "datos", "siguiente", "sucia")
     
-    num_nodos = arbol.tamaño()
-    return _es_completo(arbol.raiz, 0, num_nodos)
+    def __init__(self, numero, hoja, claves, hijos, datos, siguiente=-1):
+        self.numero = numero
+        self.hoja = hoja
+        self.claves = claves
+        self.hijos = hijos
+        self.datos = datos
+        self.siguiente = siguiente
+        self.sucia = True
 
-# Ejemplo
-print("Operaciones comunes:")
-arbol_ops = ArbolBST()
-valores = [50, 30, 70, 20, 40, 60, 80]
-for valor in valores:
-    arbol_ops.insertar(valor)
+class ArbolBMas:
+    """
+    Árbol B+ guardado en un archivo de páginas de tamaño fijo (mmap).
+    
+    Cada página contiene muchas claves (cientos con páginas de 4 KB), así
+    que una búsqueda toca solo altura + 1 páginas y las claves de un nodo
+    quedan contiguas en memoria. Las claves viven solo en las hojas, que
+    están enlazadas en orden para recorrer rangos sin volver a subir.
+    Las páginas decodificadas se guardan en una caché LRU pequeña
+    ('paginas_cache'); al salir de ella (o al confirmar) se escriben en el
+    mapa si cambiaron, de modo que el índice puede ser mucho más grande
+    que la memoria.
+    
+    Misma semántica que ArbolBST: insertar admite repetidos (van después
+    de los iguales), buscar retorna True/False y el recorrido es en orden.
+    
+    - tipo_clave: código de array.array ('q' enteros de 64 bits, 'd'
+      reales, ...); las claves son de tamaño fijo.
+    - tipo_dato: opcional, otro código de array.array para guardar un
+      dato por clave (p. ej. la posición del registro en otro archivo).
+    
+    No es transaccional: el archivo queda consistente tras confirmar()
+    o cerrar().
+    """
+    
+    _META = struct.Struct("<4sHHIccxxqqqqq")
+    _CABECERA_PAGINA = struct.Struct("<BxHxxxxq")
+    _MAGICO = b"BMAS"
+    _VERSION = 1
+    _HOJA, _INTERNA = 0, 1
+    
+    def __init__(self, ruta, tamanio_pagina=4096, tipo_clave="q", tipo_dato=None, paginas_cache=64):
+        """
+        Abre el índice en 'ruta' o lo crea si no existe. Al abrir uno
+        existente se usan el tamaño de página y los tipos guardados.
+        """
+        if paginas_cache < 4:
+            raise ValueError("La caché debe tener al menos 4 páginas")
+        self.ruta = ruta
+        self.paginas_cache = paginas_cache
+        self._cache = OrderedDict()
+        
+        if os.path.exists(ruta) and os.path.getsize(ruta) > 0:
+            self._archivo = open(ruta, "r+b")
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0)
+            self._leer_meta()
+        else:
+            self.tamanio_pagina = tamanio_pagina
+            self.tipo_clave = tipo_clave
+            self.tipo_dato = tipo_dato
+            self._configurar()
+            self._archivo = open(ruta, "w+b")
+            self._archivo.truncate(4 * tamanio_pagina)
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0)
+            self._vaciar()
+    
+    def _vaciar(self):
+        """Deja el índice vacío: solo la página de metadatos y una hoja raíz."""
+        self._cache.clear()
+        self._num_paginas = 1  # La página 0 es la de metadatos
+        self._altura = 0
+        self._cantidad = 0
+        self._raiz = self._primera_hoja = self._nueva_pagina(hoja=True).numero
+        self.confirmar()
+    
+    # ---- Formato del archivo ----
+    
+    def _configurar(self):
+        """Calcula tamaños de elementos y capacidades de las páginas."""
+        self._tamanio_clave = array(self.tipo_clave).itemsize
+        self._tamanio_dato = array(self.tipo_dato).itemsize if self.tipo_dato else 0
+        libre = self.tamanio_pagina - self._CABECERA_PAGINA.size
+        self._capacidad_hoja = libre // (self._tamanio_clave + self._tamanio_dato)
+        self._capacidad_interna = (libre - 8) // (self._tamanio_clave + 8)
+        if min(self._capacidad_hoja, self._capacidad_interna) < 4:
+            raise ValueError(f"Página de {self.tamanio_pagina} bytes demasiado chica "
+                             "(debe caber al menos 4 claves por página)")
+    
+    def _leer_meta(self):
+        """Lee los metadatos de la página 0."""
+        (magico, version, _, self.tamanio_pagina, tipo_clave, tipo_dato, self._raiz,
+         self._num_paginas, self._altura, self._cantidad, self._primera_hoja) = self._META.unpack_from(self._mapa, 0)
+        if magico != self._MAGICO or version != self._VERSION:
+            self._mapa.close()
+            self._archivo.close()
+            raise ValueError(f"'{self.ruta}' no es un índice ArbolBMas válido")
+        self.tipo_clave = tipo_clave.decode()
+        self.tipo_dato = tipo_dato.decode() if tipo_dato != b"\0" else None
+        self._configurar()
+    
+    def _escribir_meta(self):
+        """Escribe los metadatos en la página 0."""
+        self._META.pack_into(self._mapa, 0, self._MAGICO, self._VERSION, 0, self.tamanio_pagina,
+                             self.tipo_clave.encode(), (self.tipo_dato or "\0").encode(), self._raiz,
+                             self._num_paginas, self._altura, self._cantidad, self._primera_hoja)
+    
+    def _leer_pagina(self, numero):
+        """Decodifica la página 'numero' del mapa."""
+        inicio = numero * self.tamanio_pagina
+        tipo, n, siguiente = self._CABECERA_PAGINA.unpack_from(self._mapa, inicio)
+        pagina = self._pagina_vacia(numero, tipo == self._HOJA, siguiente)
+        p = inicio + self._CABECERA_PAGINA.size
+        pagina.claves.frombytes(self._mapa[p:p + n * self._tamanio_clave])
+        if pagina.hoja:
+            if self.tipo_dato:
+                p += self._capacidad_hoja * self._tamanio_clave
+                pagina.datos.frombytes(self._mapa[p:p + n * self._tamanio_dato])
+        else:
+            p += self._capacidad_interna * self._tamanio_clave
+            pagina.hijos.frombytes(self._mapa[p:p + (n + 1) * 8])
+        pagina.sucia = False
+        return pagina
+    
+    def _pagina_vacia(self, numero, hoja, siguiente=-1):
+        """Crea una página sin claves con los arrays del tipo que corresponde."""
+        return _PaginaBMas(numero, hoja, array(self.tipo_clave), array("q"),
+                           array(self.tipo_dato or self.tipo_clave), siguiente)
+    
+    def _escribir_pagina(self, pagina):
+        """Codifica la página en su lugar del mapa."""
+        inicio = pagina.numero * self.tamanio_pagina
+        n = len(pagina.claves)
+        tipo = self._HOJA if pagina.hoja else self._INTERNA
+        self._CABECERA_PAGINA.pack_into(self._mapa, inicio, tipo, n, pagina.siguiente)
+        p = inicio + self._CABECERA_PAGINA.size
+        self._mapa[p:p + n * self._tamanio_clave] = pagina.claves.tobytes()
+        if pagina.hoja:
+            if self.tipo_dato:
+                p += self._capacidad_hoja * self._tamanio_clave
+                self._mapa[p:p + n * self._tamanio_dato] = pagina.datos.tobytes()
+        else:
+            p += self._capacidad_interna * self._tamanio_clave
+            self._mapa[p:p + (n + 1) * 8] = pagina.hijos.tobytes()
+        pagina.sucia = False
+    
+    def _reservar_pagina(self):
+        """Reserva el número de la próxima página, agrandando el archivo si hace falta."""
+        numero = self._num_paginas
+        self._num_paginas += 1
+        necesario = self._num_paginas * self.tamanio_pagina
+        if necesario > len(self._mapa):
+            nuevo_tamanio = max(necesario, 2 * len(self._mapa))
+            self._mapa.close()
+            self._archivo.truncate(nuevo_tamanio)
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0)
+        return numero
+    
+    # ---- Caché LRU de páginas ----
+    
+    def _pagina(self, numero):
+        """Retorna la página (de la caché o leyéndola del mapa)."""
+        pagina = self._cache.get(numero)
+        if pagina is not None:
+            self._cache.move_to_end(numero)
+            return pagina
+        pagina = self._leer_pagina(numero)
+        self._guardar_en_cache(pagina)
+        return pagina
+    
+    def _guardar_en_cache(self, pagina):
+        """Agrega la página a la caché, desalojando (y escribiendo) la menos usada."""
+        self._cache[pagina.numero] = pagina
+        if len(self._cache) > self.paginas_cache:
+            _, desalojada = self._cache.popitem(last=False)
+            if desalojada.sucia:
+                self._escribir_pagina(desalojada)
+    
+    def _nueva_pagina(self, hoja):
+        """Crea una página vacía (sucia) en la caché."""
+        pagina = self._pagina_vacia(self._reservar_pagina(), hoja)
+        self._guardar_en_cache(pagina)
+        return pagina
+    
+    # ---- Inserción ----
+    
+    def insertar(self, clave, dato=None):
+        """Inserta una clave (y su dato si el índice guarda datos). O(log n) páginas."""
+        if self.tipo_dato and dato is None:
+            raise ValueError("Este índice guarda un dato por clave: falta 'dato'")
+        division = self._insertar(self._raiz, clave, dato)
+        if division is not None:
+            # La raíz se dividió: el árbol crece un nivel
+            separador, derecha = division
+            raiz = self._nueva_pagina(hoja=False)
+            raiz.claves.append(separador)
+            raiz.hijos.extend((self._raiz, derecha))
+            self._raiz = raiz.numero
+            self._altura += 1
+        self._cantidad += 1
+    
+    def _insertar(self, numero, clave, dato):
+        """
+        Inserta en el subárbol de la página 'numero'. Si la página se
+        desborda se divide y retorna (separador, página nueva) al padre.
+        """
+        pagina = self._pagina(numero)
+        i = bisect_right(pagina.claves, clave)
+        if pagina.hoja:
+            pagina.claves.insert(i, clave)
+            if self.tipo_dato:
+                pagina.datos.insert(i, dato)
+            pagina.sucia = True
+            if len(pagina.claves) > self._capacidad_hoja:
+                return self._dividir(pagina)
+            return None
+        
+        division = self._insertar(pagina.hijos[i], clave, dato)
+        if division is None:
+            return None
+        # La página pudo salir de la caché durante el descenso: volver a pedirla
+        pagina = self._pagina(numero)
+        separador, derecha = division
+        pagina.claves.insert(i, separador)
+        pagina.hijos.insert(i + 1, derecha)
+        pagina.sucia = True
+        if len(pagina.claves) > self._capacidad_interna:
+            return self._dividir(pagina)
+        return None
+    
+    def _dividir(self, pagina):
+        """
+        Divide una página desbordada por la mitad. En una hoja el separador
+        se copia (es la primera clave de la derecha); en una interna sube.
+        """
+        nueva = self._nueva_pagina(pagina.hoja)
+        medio = len(pagina.claves) // 2
+        if pagina.hoja:
+            nueva.claves = pagina.claves[medio:]
+            nueva.datos = pagina.datos[medio:]
+            del pagina.claves[medio:], pagina.datos[medio:]
+            nueva.siguiente = pagina.siguiente
+            pagina.siguiente = nueva.numero
+            separador = nueva.claves[0]
+        else:
+            separador = pagina.claves[medio]
+            nueva.claves = pagina.claves[medio + 1:]
+            nueva.hijos = pagina.hijos[medio + 1:]
+            del pagina.claves[medio:], pagina.hijos[medio + 1:]
+        pagina.sucia = True
+        return separador, nueva.numero
+    
+    def cargar_ordenados(self, claves, datos=None, llenado=1.0):
+        """
+        Carga masiva en un índice vacío a partir de claves ordenadas:
+        escribe las hojas de izquierda a derecha (llenas en la proporción
+        'llenado') y después cada nivel interno, sin divisiones ni caché.
+        Lee 'claves' (y 'datos') como iteradores, así que pueden venir de
+        un archivo más grande que la memoria; solo se guarda la primera
+        clave de cada hoja para armar los niveles internos.
+        Si la carga falla (claves desordenadas, faltan datos, ...) el
+        índice queda vacío y válido, y se relanza la excepción.
+        """
+        if self._cantidad:
+            raise ValueError("La carga masiva requiere un índice vacío")
+        if not 0.5 <= llenado <= 1:
+            raise ValueError("'llenado' debe estar entre 0.5 y 1")
+        if self.tipo_dato and datos is None:
+            raise ValueError("Este índice guarda un dato por clave: falta 'datos'")
+        try:
+            self._cargar_ordenados(claves, datos, llenado)
+        except BaseException:
+            # Las páginas de la raíz vacía ya se reutilizaron: se arma otra
+            self._vaciar()
+            raise
+    
+    def _cargar_ordenados(self, claves, datos, llenado):
+        """Cuerpo de cargar_ordenados(), ya validados los argumentos."""
+        # Descartar la raíz vacía y reutilizar sus páginas
+        self._cache.clear()
+        self._num_paginas = 1
+        por_hoja = max(1, int(self._capacidad_hoja * llenado))
+        nivel = []  # (primera clave, número de página) de cada nodo del nivel
+        actual = None
+        anterior = None
+        datos = iter(datos) if datos is not None else None
+        for clave in claves:
+            if anterior is not None and clave < anterior:
+                raise ValueError("Las claves deben estar ordenadas de menor a mayor")
+            anterior = clave
+            if actual is None or len(actual.claves) == por_hoja:
+                numero = self._reservar_pagina()
+                if actual is not None:
+                    actual.siguiente = numero
+                    self._escribir_pagina(actual)
+                actual = self._pagina_vacia(numero, True)
+                nivel.append((clave, numero))
+            actual.claves.append(clave)
+            if datos is not None:
+                try:
+                    actual.datos.append(next(datos))
+                except StopIteration:
+                    raise ValueError("'datos' tiene menos elementos que 'claves'") from None
+            self._cantidad += 1
+        if actual is None:
+            actual = self._pagina_vacia(self._reservar_pagina(), True)
+            nivel.append((None, actual.numero))
+        self._escribir_pagina(actual)
+        self._primera_hoja = nivel[0][1]
+        
+        # Niveles internos: grupos de hijos consecutivos
+        self._altura = 0
+        por_nodo = min(self._capacidad_interna + 1, max(3, int((self._capacidad_interna + 1) * llenado)))
+        while len(nivel) > 1:
+            grupos = [nivel[i:i + por_nodo] for i in range(0, len(nivel), por_nodo)]
+            if len(grupos) > 1 and len(grupos[-1]) == 1:
+                grupos[-1].insert(0, grupos[-2].pop())
+            siguiente_nivel = []
+            for grupo in grupos:
+                pagina = self._pagina_vacia(self._reservar_pagina(), False)
+                pagina.claves.extend(clave for clave, _ in grupo[1:])
+                pagina.hijos.extend(numero for _, numero in grupo)
+                self._escribir_pagina(pagina)
+                siguiente_nivel.append((grupo[0][0], pagina.numero))
+            nivel = siguiente_nivel
+            self._altura += 1
+        self._raiz = nivel[0][1]
+        self.confirmar()
+    
+    @classmethod
+    def desde_ordenados(cls, ruta, claves, datos=None, llenado=1.0, **opciones):
+        """Crea un índice nuevo en 'ruta' con carga masiva (ver cargar_ordenados)."""
+        if os.path.exists(ruta):
+            os.remove(ruta)
+        arbol = cls(ruta, **opciones)
+        arbol.cargar_ordenados(claves, datos, llenado)
+        return arbol
+    
+    # ---- Consultas ----
+    
+    def _primera_posicion(self, clave):
+        """
+        Retorna (hoja, índice) de la primera clave >= 'clave' (None como
+        clave = la primera de todas), o (None, 0) si no hay ninguna.
+        """
+        if clave is None:
+            pagina = self._pagina(self._primera_hoja)
+            i = 0
+        else:
+            pagina = self._pagina(self._raiz)
+            while not pagina.hoja:
+                pagina = self._pagina(pagina.hijos[bisect_left(pagina.claves, clave)])
+            i = bisect_left(pagina.claves, clave)
+        while i == len(pagina.claves):
+            if pagina.siguiente < 0:
+                return None, 0
+            pagina = self._pagina(pagina.siguiente)
+            i = 0
+        return pagina, i
+    
+    def buscar(self, clave):
+        """Busca una clave en el índice."""
+        pagina, i = self._primera_posicion(clave)
+        return pagina is not None and pagina.claves[i] == clave
+    
+    def obtener(self, clave, defecto=None):
+        """Retorna el dato de la primera aparición de la clave (o 'defecto')."""
+        pagina, i = self._primera_posicion(clave)
+        if pagina is None or pagina.claves[i] != clave:
+            return defecto
+        return pagina.datos[i] if self.tipo_dato else clave
+    
+    def iter_rango(self, desde=None, hasta=None, con_datos=False):
+        """
+        Generador de las claves entre 'desde' y 'hasta' (ambos inclusive,
+        None = sin límite) siguiendo los enlaces entre hojas; con
+        con_datos=True entrega pares (clave, dato). No se debe modificar
+        el índice mientras se recorre.
+        """
+        pagina, i = self._primera_posicion(desde)
+        while pagina is not None:
+            claves = pagina.claves
+            fin = len(claves) if hasta is None else bisect_right(claves, hasta, i)
+            if con_datos:
+                yield from zip(claves[i:fin], pagina.datos[i:fin])
+            else:
+                yield from claves[i:fin]
+            if fin < len(claves) or pagina.siguiente < 0:
+                return
+            pagina, i = self._pagina(pagina.siguiente), 0
+    
+    def iter_inorden(self):
+        """Generador de todas las claves en orden."""
+        return self.iter_rango()
+    
+    def recorrido_inorden(self):
+        """Recorrido inorden (todas las claves en orden) como lista."""
+        return list(self.iter_rango())
+    
+    def encontrar_minimo(self):
+        """Retorna la clave mínima (None si está vacío)."""
+        pagina, i = self._primera_posicion(None)
+        return None if pagina is None else pagina.claves[i]
+    
+    def encontrar_maximo(self):
+        """Retorna la clave máxima (None si está vacío)."""
+        pagina = self._pagina(self._raiz)
+        while not pagina.hoja:
+            pagina = self._pagina(pagina.hijos[-1])
+        return pagina.claves[-1] if pagina.claves else None
+    
+    def altura(self):
+        """Niveles por debajo de la raíz (0 si la raíz es una hoja)."""
+        return self._altura
+    
+    def tamaño(self):
+        """Número de claves guardadas."""
+        return self._cantidad
+    
+    def paginas(self):
+        """Número de páginas del archivo (incluida la de metadatos)."""
+        return self._num_paginas
+    
+    def __len__(self):
+        return self._cantidad
+    
+    def __contains__(self, clave):
+        return self.buscar(clave)
+    
+    def __iter__(self):
+        return self.iter_rango()
+    
+    # ---- Persistencia ----
+    
+    def confirmar(self):
+        """Escribe las páginas modificadas y los metadatos y sincroniza el archivo."""
+        for pagina in self._cache.values():
+            if pagina.sucia:
+                self._escribir_pagina(pagina)
+        self._escribir_meta()
+        self._mapa.flush()
+    
+    def cerrar(self):
+        """Confirma los cambios y cierra el archivo."""
+        if self._mapa.closed:
+            return
+        self.confirmar()
+        self._cache.clear()
+        self._mapa.close()
+        self._archivo.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *excepcion):
+        self.cerrar()
+    
+    def __repr__(self):
+        return (f"ArbolBMas('{self.ruta}', claves={self._cantidad}, altura={self._altura}, "
+                f"paginas={self._num_paginas})")
 
-print(f"Número de hojas: {contar_hojas(arbol_ops)}")
-print(f"Suma de valores: {sumar_valores(arbol_ops)}")
-print(f"Altura: {arbol_ops.altura()}")
-print(f"Tamaño: {arbol_ops.tamaño()}")
-print()
 
 # =============================================================================
-# 7. COMPARACIÓN Y RESUMEN
+# 8. COMPARACIÓN Y RESUMEN
 # =============================================================================
-print("=== 7. Resumen de Tipos de Árboles ===")
-print("""
+
+def _arbol_aleatorio(n, semilla=42):
+    """ArbolBST con n valores distintos insertados en orden aleatorio."""
+    valores = list(range(n))
+    random.Random(semilla).shuffle(valores)
+    arbol = ArbolBST()
+    for valor in valores:
+        arbol.insertar(valor)
+    return arbol
+
+
+def _operaciones_mixtas(n, semilla=42):
+    """n operaciones al azar: 50% inserciones, 20% eliminaciones y 30% consultas."""
+    azar = random.Random(semilla)
+    operaciones = []
+    for _ in range(n):
+        r = azar.random()
+        if r < 0.5:
+            operacion = "insertar"
+        elif r < 0.7:
+            operacion = "eliminar"
+        else:
+            operacion = azar.choice(("buscar", "rango", "k_esimo"))
+        operaciones.append((operacion, azar.randrange(4 * n)))
+    return operaciones
+
+def _carga_avl(operaciones):
+    arbol = ArbolAVL()
+    respuestas = []
+    for operacion, valor in operaciones:
+        if operacion == "insertar":
+            arbol.insertar(valor)
+        elif operacion == "eliminar":
+            arbol.eliminar(valor)
+        elif operacion == "buscar":
+            respuestas.append(arbol.buscar(valor))
+        elif operacion == "rango":
+            respuestas.append(arbol.rango(valor))
+        elif len(arbol):
+            respuestas.append(arbol.k_esimo(valor % len(arbol) + 1))
+    return respuestas, list(arbol)
+
+def _carga_bisect(operaciones):
+    lista = []
+    respuestas = []
+    for operacion, valor in operaciones:
+        if operacion == "insertar":
+            insort(lista, valor)
+        elif operacion == "eliminar":
+            i = bisect_left(lista, valor)
+            if i < len(lista) and lista[i] == valor:
+                del lista[i]
+        elif operacion == "buscar":
+            i = bisect_left(lista, valor)
+            respuestas.append(i < len(lista) and lista[i] == valor)
+        elif operacion == "rango":
+            respuestas.append(bisect_left(lista, valor))
+        elif lista:
+            respuestas.append(lista[valor % len(lista)])
+    return respuestas, lista
+
+def _claves_aleatorias(n, semilla=42):
+    azar = random.Random(semilla)
+    return [azar.randrange(4 * n) for _ in range(n)]
+
+def _carga_b_mas_insertar(claves):
+    with tempfile.TemporaryDirectory() as directorio:
+        with ArbolBMas(os.path.join(directorio, "indice.bmas")) as arbol:
+            for clave in claves:
+                arbol.insertar(clave)
+            return list(arbol)
+
+def _carga_b_mas_ordenados(claves):
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "indice.bmas")
+        with ArbolBMas.desde_ordenados(ruta, sorted(claves)) as arbol:
+            return list(arbol)
+
+def _carga_avl_insertar(claves):
+    arbol = ArbolAVL()
+    for clave in claves:
+        arbol.insertar(clave)
+    return list(arbol)
+
+def comparar_avl_bisect(n=100000):
+    """
+    Compara ArbolAVL con una lista ordenada mantenida con bisect/insort
+    sobre n operaciones mixtas. Retorna {nombre: segundos}.
+    La lista gana mientras mover memoria (O(n) en C) sea más barato que
+    O(log n) nodos en Python; el árbol escala mejor con n grande.
+    """
+    operaciones = _operaciones_mixtas(n)
+    tiempos = {}
+    for nombre, carga in (("ArbolAVL", _carga_avl), ("bisect (lista)", _carga_bisect)):
+        resumen, _ = medir(carga, preparar=lambda: (operaciones,), repeticiones=3, calentamiento=0)
+        tiempos[nombre] = resumen["mediana_ns"] / 1e9
+        print(f"  {nombre:16s} {tiempos[nombre]:8.4f}s  ({n / tiempos[nombre] / 1e6:.2f} M ops/s)")
+    return tiempos
+
+
+# Familia para el sistema de benchmarks (python -m algoritmos.benchmark)
+BENCHMARKS = {
+    "recorridos_arbol": {
+        "implementaciones": {
+            "inorden_pila": lambda arbol: list(arbol.iter_inorden()),
+            "inorden_morris": lambda arbol: list(arbol.iter_inorden_morris()),
+            "preorden_pila": lambda arbol: list(arbol.iter_preorden()),
+            "preorden_morris": lambda arbol: list(arbol.iter_preorden_morris()),
+            "postorden_pila": lambda arbol: list(arbol.iter_postorden()),
+            "nivel_orden": lambda arbol: list(arbol.iter_nivel_orden()),
+        },
+        "entrada": lambda n: (_arbol_aleatorio(n),),
+        "tamanios": [1000, 100000, 1000000],
+        "verificar": lambda resultado, arbol: sorted(resultado) == list(range(len(resultado)))
+                                              and len(resultado) == arbol.tamaño(),
+    },
+    "avl_vs_bisect": {
+        "implementaciones": {
+            "ArbolAVL": _carga_avl,
+            "bisect": _carga_bisect,
+        },
+        "entrada": lambda n: (_operaciones_mixtas(n),),
+        "tamanios": [1000, 100000, 1000000],
+        "verificar": lambda resultado, operaciones: resultado == _carga_bisect(operaciones),
+    },
+    "arbol_b_mas": {
+        "implementaciones": {
+            "ArbolBMas_insertar": _carga_b_mas_insertar,
+            "ArbolBMas_carga_masiva": _carga_b_mas_ordenados,
+            "ArbolAVL (memoria)": _carga_avl_insertar,
+        },
+        "entrada": lambda n: (_claves_aleatorias(n),),
+        "tamanios": [1000, 100000, 1000000],
+        "verificar": lambda resultado, claves: resultado == sorted(claves),
+    },
+}
+
+
+def main():
+    """Ejecuta los ejemplos y comparaciones del módulo."""
+    print("=== Estructuras de Datos: Árboles ===\n")
+
+    print("=== 1. Árbol Binario Básico ===")
+
+    # Ejemplo
+    print("Creando árbol binario:")
+    arbol = ArbolBinario()
+    valores = [50, 30, 70, 20, 40, 60, 80]
+    for valor in valores:
+        arbol.insertar(valor)
+
+    print(f"Valores insertados: {valores}")
+    print(f"Buscar 40: {arbol.buscar(40)}")
+    print(f"Buscar 100: {arbol.buscar(100)}")
+    print(f"Altura del árbol: {arbol.altura()}")
+    print(f"Tamaño del árbol: {arbol.tamaño()}")
+    print()
+
+    print("=== 2. Recorridos de Árbol ===")
+
+    # Ejemplo
+    print("Creando árbol para recorridos:")
+    arbol_rec = ArbolRecorridos()
+    valores = [50, 30, 70, 20, 40, 60, 80]
+    for valor in valores:
+        arbol_rec.insertar(valor)
+
+    print(f"Preorden (raíz, izq, der):   {arbol_rec.recorrido_preorden()}")
+    print(f"Inorden (izq, raíz, der):    {arbol_rec.recorrido_inorden()}")
+    print(f"Postorden (izq, der, raíz):  {arbol_rec.recorrido_postorden()}")
+    print(f"Nivel orden (BFS):           {arbol_rec.recorrido_nivel_orden()}")
+    print(f"Inorden Morris (O(1) extra): {list(arbol_rec.iter_inorden_morris())}")
+    print(f"Preorden Morris:             {list(arbol_rec.iter_preorden_morris())}")
+    inorden = arbol_rec.iter_inorden()  # Generador: entrega valores bajo demanda
+    print(f"Primeros 3 del generador:    {[next(inorden) for _ in range(3)]}")
+
+    # Con datos ordenados el BST degenera en una lista de altura n - 1;
+    # las versiones iterativas no dependen del límite de recursión
+    degenerado = ArbolRecorridos()
+    for valor in range(3000):
+        degenerado.insertar(valor)
+    print(f"Árbol degenerado de 3000 nodos: altura {degenerado.altura()}, "
+          f"suma postorden {sum(degenerado.iter_postorden())}")
+    print()
+
+    print("=== 3. Árbol Binario de Búsqueda (BST) ===")
+
+    # Ejemplo
+    print("Árbol Binario de Búsqueda:")
+    arbol_bst = ArbolBST()
+    valores = [50, 30, 70, 20, 40, 60, 80]
+    for valor in valores:
+        arbol_bst.insertar(valor)
+
+    print(f"¿Es BST válido? {arbol_bst.es_bst()}")
+    print(f"Valor mínimo: {arbol_bst.encontrar_minimo()}")
+    print(f"Valor máximo: {arbol_bst.encontrar_maximo()}")
+    print()
+
+    print("=== 4. Árbol AVL (Auto-balanceado) ===")
+
+    # Ejemplo
+    print("Árbol AVL:")
+    print("Nota: Árbol AVL mantiene balance automáticamente")
+    print("      Evita árboles degenerados (que se convierten en listas)")
+    arbol_avl = ArbolAVL()
+    for valor in range(1, 16):  # Datos ordenados: un BST degeneraría
+        arbol_avl.insertar(valor)
+    print(f"Insertados 1..15 en orden -> altura {arbol_avl.obtener_altura(arbol_avl.raiz)}")
+    arbol_avl.eliminar(8)
+    arbol_avl.eliminar(1)
+    print(f"Tras eliminar 8 y 1: {arbol_avl.inorden()}")
+    print(f"3er menor (k_esimo(3)): {arbol_avl.k_esimo(3)}")
+    print(f"Menores que 10 (rango(10)): {arbol_avl.rango(10)}")
+    print(f"Valores entre 5 y 11: {list(arbol_avl.iter_rango(5, 11))}")
+    grande = ArbolAVL.desde_ordenados(range(1000000))  # O(n), sin rotaciones
+    print(f"desde_ordenados(1M): tamaño {len(grande)}, altura {grande.obtener_altura(grande.raiz)}, "
+          f"mediana {grande.k_esimo(len(grande) // 2)}")
+
+    n = 20000
+    print(f"\nAVL vs bisect ({n} operaciones mixtas):")
+    comparar_avl_bisect(n)
+    print()
+
+    print("=== 5. Árbol N-ario (Árbol General) ===")
+
+    # Ejemplo
+    print("Creando árbol n-ario:")
+    arbol_nario = ArbolNario(1)
+    nodo2 = NodoNario(2)
+    nodo3 = NodoNario(3)
+    nodo4 = NodoNario(4)
+    nodo5 = NodoNario(5)
+    nodo6 = NodoNario(6)
+
+    arbol_nario.raiz.agregar_hijo(nodo2)
+    arbol_nario.raiz.agregar_hijo(nodo3)
+    nodo2.agregar_hijo(nodo4)
+    nodo2.agregar_hijo(nodo5)
+    nodo3.agregar_hijo(nodo6)
+
+    print("Estructura: 1 -> [2, 3], 2 -> [4, 5], 3 -> [6]")
+    print(f"Recorrido en profundidad (DFS): {arbol_nario.recorrido_profundidad()}")
+    print(f"Recorrido en anchura (BFS): {arbol_nario.recorrido_anchura()}")
+    print()
+
+    print("=== 6. Operaciones Comunes ===")
+
+    # Ejemplo
+    print("Operaciones comunes:")
+    arbol_ops = ArbolBST()
+    valores = [50, 30, 70, 20, 40, 60, 80]
+    for valor in valores:
+        arbol_ops.insertar(valor)
+
+    print(f"Número de hojas: {contar_hojas(arbol_ops)}")
+    print(f"Suma de valores: {sumar_valores(arbol_ops)}")
+    print(f"Altura: {arbol_ops.altura()}")
+    print(f"Tamaño: {arbol_ops.tamaño()}")
+    print()
+
+    print("=== 7. Árbol B+ en Disco ===")
+
+    # Ejemplo: índice en un archivo temporal con páginas chicas
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "indice.bmas")
+        with ArbolBMas(ruta, tamanio_pagina=256, tipo_dato="q") as indice:
+            for clave in [50, 30, 70, 20, 40, 60, 80, 30]:
+                indice.insertar(clave, clave * 100)  # dato: p. ej. posición del registro
+            print(f"Inorden: {indice.recorrido_inorden()}")
+            print(f"Buscar 40: {indice.buscar(40)}, dato de 70: {indice.obtener(70)}")
+            print(f"Rango [30, 60]: {list(indice.iter_rango(30, 60, con_datos=True))}")
+        with ArbolBMas(ruta) as indice:  # Al reabrir el índice sigue ahí
+            print(f"Reabierto: {indice!r}")
+
+        claves = range(0, 2000000, 2)
+        with ArbolBMas.desde_ordenados(ruta, claves) as indice:
+            print(f"Carga masiva de {len(claves)} claves: {indice!r}")
+            print(f"Buscar 123456: {indice.buscar(123456)}, buscar 123457: {indice.buscar(123457)}")
+    print()
+
+    print("=== 8. Resumen de Tipos de Árboles ===")
+    print("""
 Tipos de Árboles:
 
 1. ÁRBOL BINARIO:
@@ -500,9 +1402,15 @@ Tipos de Árboles:
    - BST auto-balanceado
    - Altura de subárboles difiere máximo en 1
    - Operaciones: O(log n) garantizado
+   - Con tamaños de subárbol: k-ésimo y rango en O(log n)
    - Uso: Cuando se necesita garantía de rendimiento
 
-4. ÁRBOL N-ARIO:
+4. ÁRBOL B+ (EN DISCO):
+   - Muchas claves por página; las hojas están enlazadas
+   - Búsqueda: O(log_B n) páginas; rangos recorriendo hojas
+   - Uso: Índices más grandes que la memoria (bases de datos)
+
+5. ÁRBOL N-ARIO:
    - Cada nodo puede tener múltiples hijos
    - Uso: Representar jerarquías (archivos, organizaciones)
 
@@ -511,6 +1419,8 @@ Recorridos:
 - Inorden: Izquierda -> Raíz -> Derecha (ordena en BST)
 - Postorden: Izquierda -> Derecha -> Raíz
 - Por niveles (BFS): Nivel por nivel
+- Todos son iterativos (pila explícita o Morris con O(1) de memoria)
+  y están disponibles como generadores perezosos (iter_*)
 
 Aplicaciones:
 - Búsqueda y ordenamiento
@@ -519,3 +1429,7 @@ Aplicaciones:
 - Bases de datos (índices)
 - Compresión (Huffman)
 """)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,27 @@
 # Archivo: 38_grafos.py
 # Descripción: Estructuras de datos - Grafos
 
+from array import array
 from collections import deque, defaultdict
+from itertools import count
+import heapq
+import io
+import json
+import mmap
+import operator
+import os
+import random
+import struct
+import tempfile
+import warnings
+
+from algoritmos import cargar_modulo
+from algoritmos.benchmark import medir
 
-print("=== Estructuras de Datos: Grafos ===\n")
 
 # =============================================================================
 # 1. GRAFO USANDO LISTA DE ADYACENCIA
 # =============================================================================
-print("=== 1. Grafo con Lista de Adyacencia ===")
 
 class GrafoListaAdyacencia:
     """Grafo implementado con lista de adyacencia."""
@@ -88,26 +101,10 @@ class GrafoListaAdyacencia:
         
         return resultado
 
-# Ejemplo
-print("Creando grafo no dirigido:")
-grafo = GrafoListaAdyacencia(dirigido=False)
-grafo.agregar_arista('A', 'B')
-grafo.agregar_arista('A', 'C')
-grafo.agregar_arista('B', 'D')
-grafo.agregar_arista('C', 'D')
-grafo.agregar_arista('D', 'E')
-
-print("Grafo (lista de adyacencia):")
-grafo.imprimir_grafo()
-print(f"\nBFS desde 'A': {grafo.bfs('A')}")
-print(f"DFS desde 'A': {grafo.dfs('A')}")
-print(f"DFS iterativo desde 'A': {grafo.dfs_iterativo('A')}")
-print()
 
 # =============================================================================
 # 2. GRAFO CON MATRIZ DE ADYACENCIA
 # =============================================================================
-print("=== 2. Grafo con Matriz de Adyacencia ===")
 
 class GrafoMatrizAdyacencia:
     """Grafo implementado con matriz de adyacencia."""
@@ -165,23 +162,10 @@ class GrafoMatrizAdyacencia:
                 vecinos.append((self.indices[j], self.matriz[i][j]))
         return vecinos
 
-# Ejemplo
-print("Creando grafo con matriz de adyacencia:")
-grafo_matriz = GrafoMatrizAdyacencia(5, dirigido=False)
-grafo_matriz.agregar_arista('A', 'B', 1)
-grafo_matriz.agregar_arista('A', 'C', 1)
-grafo_matriz.agregar_arista('B', 'D', 1)
-grafo_matriz.agregar_arista('C', 'D', 1)
-grafo_matriz.agregar_arista('D', 'E', 1)
-
-grafo_matriz.imprimir_matriz()
-print(f"Vecinos de 'A': {grafo_matriz.obtener_vecinos('A')}")
-print()
 
 # =============================================================================
 # 3. ALGORITMOS DE BÚSQUEDA
 # =============================================================================
-print("=== 3. Algoritmos de Búsqueda ===")
 
 class GrafoCompleto(GrafoListaAdyacencia):
     """Grafo con algoritmos completos."""
@@ -242,82 +226,307 @@ class GrafoCompleto(GrafoListaAdyacencia):
         
         return componentes
 
-# Ejemplo
-print("Búsqueda de caminos:")
-grafo_caminos = GrafoCompleto(dirigido=False)
-grafo_caminos.agregar_arista('A', 'B')
-grafo_caminos.agregar_arista('A', 'C')
-grafo_caminos.agregar_arista('B', 'D')
-grafo_caminos.agregar_arista('C', 'D')
-grafo_caminos.agregar_arista('D', 'E')
-
-camino = grafo_caminos.buscar_camino('A', 'E')
-print(f"Camino de A a E: {camino}")
-
-todos_caminos = grafo_caminos.todos_los_caminos('A', 'D')
-print(f"Todos los caminos de A a D: {todos_caminos}")
-
-componentes = grafo_caminos.componentes_conexas()
-print(f"Componentes conexas: {componentes}")
-print()
 
 # =============================================================================
 # 4. ALGORITMO DE DIJKSTRA (CAMINO MÁS CORTO)
 # =============================================================================
-print("=== 4. Algoritmo de Dijkstra (Camino Más Corto) ===")
+
+def _dijkstra_heap(grafo, origenes, destino=None):
+    """
+    Motor de Dijkstra con cola de prioridad (heapq) y borrado perezoso:
+    en lugar de actualizar la prioridad de un nodo se inserta una entrada
+    nueva y las obsoletas se descartan al extraerlas.
+    
+    - origenes: iterable de nodos de partida (todos con distancia 0).
+    - destino: si se indica, la búsqueda termina al fijar su distancia.
+    
+    Retorna (distancias, predecesores) solo para los nodos con distancia
+    definitiva, en el orden en que se fijaron.
+    Complejidad: O((V + E) log V)
+    """
+    distancias = {}
+    predecesores = {}
+    tentativas = {}
+    contador = count()  # Desempate: evita comparar nodos de tipos distintos
+    heap = []
+    
+    for origen in origenes:
+        tentativas[origen] = 0
+        predecesores[origen] = None
+        heap.append((0, next(contador), origen))
+    heapq.heapify(heap)
+    
+    heappop, heappush = heapq.heappop, heapq.heappush
+    obtener_vecinos = grafo.obtener_vecinos
+    infinito = float('inf')
+    
+    while heap:
+        distancia, _, nodo = heappop(heap)
+        if nodo in distancias:
+            continue  # Entrada obsoleta
+        
+        distancias[nodo] = distancia
+        if nodo == destino:
+            break
+        
+        for vecino, peso in obtener_vecinos(nodo):
+            nueva_distancia = distancia + peso
+            if nueva_distancia < tentativas.get(vecino, infinito) and vecino not in distancias:
+                tentativas[vecino] = nueva_distancia
+                predecesores[vecino] = nodo
+                heappush(heap, (nueva_distancia, next(contador), vecino))
+    
+    # Solo se conservan los predecesores de nodos con distancia definitiva
+    predecesores = {nodo: predecesores[nodo] for nodo in distancias}
+    return distancias, predecesores
 
 def dijkstra(grafo, inicio):
     """
     Algoritmo de Dijkstra para encontrar el camino más corto.
+    Retorna la distancia desde inicio a cada nodo (inf si no es alcanzable).
+    Complejidad: O((V + E) log V) usando heapq
     """
-    distancias = {nodo: float('inf') for nodo in grafo.obtener_nodos()}
+    definitivas, _ = _dijkstra_heap(grafo, [inicio])
+    distancias = {nodo: definitivas.get(nodo, float('inf')) for nodo in grafo.obtener_nodos()}
     distancias[inicio] = 0
-    visitados = set()
+    return distancias
+
+def reconstruir_camino(predecesores, destino):
+    """
+    Reconstruye el camino hasta destino siguiendo los predecesores.
+    Retorna None si destino no fue alcanzado.
+    """
+    if destino not in predecesores:
+        return None
     
-    # Cola de prioridad simple (podría usar heapq para eficiencia)
-    while len(visitados) < len(distancias):
-        # Encontrar nodo no visitado con menor distancia
-        nodo_actual = None
-        min_distancia = float('inf')
-        
-        for nodo, distancia in distancias.items():
-            if nodo not in visitados and distancia < min_distancia:
-                min_distancia = distancia
-                nodo_actual = nodo
+    camino = []
+    nodo = destino
+    while nodo is not None:
+        camino.append(nodo)
+        nodo = predecesores[nodo]
+    
+    camino.reverse()
+    return camino
+
+def dijkstra_camino(grafo, inicio, destino):
+    """
+    Camino más corto entre dos nodos con parada temprana: la búsqueda
+    termina en cuanto se fija la distancia de destino.
+    Retorna (distancia, camino) o (inf, None) si no hay camino.
+    """
+    distancias, predecesores = _dijkstra_heap(grafo, [inicio], destino)
+    if destino not in distancias:
+        return float('inf'), None
+    return distancias[destino], reconstruir_camino(predecesores, destino)
+
+def dijkstra_multiorigen(grafo, origenes):
+    """
+    Dijkstra desde varios orígenes a la vez (una sola pasada).
+    Útil para preguntas como "¿cuál es la sucursal más cercana a cada nodo?".
+    
+    Retorna (distancias, origen_mas_cercano, predecesores) para los nodos
+    alcanzables desde algún origen.
+    """
+    distancias, predecesores = _dijkstra_heap(grafo, origenes)
+    
+    # Los nodos se fijan después de su predecesor, así que basta una pasada
+    origen_mas_cercano = {}
+    for nodo in distancias:
+        padre = predecesores[nodo]
+        origen_mas_cercano[nodo] = nodo if padre is None else origen_mas_cercano[padre]
+    
+    return distancias, origen_mas_cercano, predecesores
+
+
+# ---- Búsquedas punto a punto: A* y bidireccionales ----
+# Todas retornan (distancia, camino, expandidos), donde 'expandidos' es la
+# cantidad de nodos cuyos vecinos se recorrieron; comparándolo con
+# len(distancias) de dijkstra_camino se mide cuánto trabajo se ahorra.
+
+def _coordenadas_a_puntos(coordenadas):
+    """Convierte {nodo: (x, y)} en {nodo: Punto} de 50_geometria_computacional."""
+    Punto = cargar_modulo("geometria").Punto
+    return {nodo: Punto(x, y) for nodo, (x, y) in coordenadas.items()}
+
+def heuristica_euclidiana(coordenadas, factor=1):
+    """
+    Heurística para A*: distancia euclidiana (Punto.distancia_euclidiana)
+    entre las coordenadas del nodo y las del destino, multiplicada por
+    'factor' (el costo mínimo por unidad de distancia). Es admisible si
+    ninguna arista cuesta menos que factor * su longitud.
+    """
+    puntos = _coordenadas_a_puntos(coordenadas)
+    return lambda nodo, destino: factor * puntos[nodo].distancia_euclidiana(puntos[destino])
+
+def heuristica_manhattan(coordenadas, factor=1):
+    """
+    Heurística para A*: distancia Manhattan (Punto.distancia_manhattan).
+    Admisible en rejillas con movimientos horizontales y verticales.
+    """
+    puntos = _coordenadas_a_puntos(coordenadas)
+    return lambda nodo, destino: factor * puntos[nodo].distancia_manhattan(puntos[destino])
+
+def a_estrella(grafo, inicio, destino, heuristica=None):
+    """
+    Búsqueda A*: como Dijkstra, pero la prioridad de un nodo es
+    g (distancia desde inicio) + h (estimación hasta destino), así que la
+    búsqueda avanza hacia el destino en lugar de en círculos.
+    
+    - heuristica(nodo, destino): debe ser admisible (no sobreestimar) para
+      que el camino sea óptimo; None equivale a h = 0 (Dijkstra).
+    
+    Si la heurística no es consistente un nodo puede reabrirse: las
+    entradas del heap guardan la g con la que se insertaron y las que
+    quedaron viejas se descartan al extraerlas.
+    Retorna (distancia, camino, expandidos); (inf, None, expandidos) si no hay camino.
+    """
+    if heuristica is None:
+        heuristica = lambda nodo, destino: 0
+    g = {inicio: 0}
+    predecesores = {inicio: None}
+    contador = count()
+    heap = [(heuristica(inicio, destino), next(contador), 0, inicio)]
+    heappop, heappush = heapq.heappop, heapq.heappush
+    obtener_vecinos = grafo.obtener_vecinos
+    infinito = float('inf')
+    expandidos = 0
+    
+    while heap:
+        _, _, distancia, nodo = heappop(heap)
+        if distancia > g[nodo]:
+            continue  # Entrada obsoleta
+        if nodo == destino:
+            return distancia, reconstruir_camino(predecesores, destino), expandidos
+        expandidos += 1
         
-        if nodo_actual is None:
+        for vecino, peso in obtener_vecinos(nodo):
+            nueva_distancia = distancia + peso
+            if nueva_distancia < g.get(vecino, infinito):
+                g[vecino] = nueva_distancia
+                predecesores[vecino] = nodo
+                heappush(heap, (nueva_distancia + heuristica(vecino, destino),
+                                next(contador), nueva_distancia, vecino))
+    
+    return infinito, None, expandidos
+
+def grafo_invertido(grafo):
+    """
+    Retorna un GrafoListaAdyacencia dirigido con todas las aristas al revés.
+    Las búsquedas bidireccionales lo necesitan en grafos dirigidos; si se
+    hacen muchas consultas conviene construirlo una vez y pasarlo.
+    """
+    invertido = GrafoListaAdyacencia(dirigido=True)
+    for nodo in grafo.obtener_nodos():
+        for vecino, peso in grafo.obtener_vecinos(nodo):
+            invertido.agregar_arista(vecino, nodo, peso)
+    return invertido
+
+def _vecinos_hacia_atras(grafo, invertido):
+    """Función de vecinos para la búsqueda que parte del destino."""
+    if not getattr(grafo, "dirigido", False):
+        return grafo.obtener_vecinos
+    if invertido is None:
+        invertido = grafo_invertido(grafo)
+    return invertido.obtener_vecinos
+
+def _unir_caminos(predecesores, sucesores, encuentro):
+    """Camino inicio -> encuentro (predecesores) + encuentro -> destino (sucesores)."""
+    camino = reconstruir_camino(predecesores, encuentro)
+    nodo = sucesores[encuentro]
+    while nodo is not None:
+        camino.append(nodo)
+        nodo = sucesores[nodo]
+    return camino
+
+def dijkstra_bidireccional(grafo, inicio, destino, invertido=None):
+    """
+    Dijkstra bidireccional: una búsqueda desde inicio y otra desde destino
+    (sobre las aristas invertidas) que se turnan; cada vez se avanza el
+    lado cuyo próximo nodo está más cerca. Cada arista que toca un nodo
+    alcanzado por el otro lado propone un camino, y se termina cuando
+    la suma de los dos mínimos de los heaps ya no puede mejorarlo.
+    Cada lado explora un radio de ~d/2: en grafos tipo rejilla o carreteras
+    se expanden muchos menos nodos que con Dijkstra desde un solo lado.
+    
+    Retorna (distancia, camino, expandidos); (inf, None, expandidos) si no hay camino.
+    """
+    if inicio == destino:
+        return 0, [inicio], 0
+    contador = count()
+    vecinos = (grafo.obtener_vecinos, _vecinos_hacia_atras(grafo, invertido))
+    distancias = ({inicio: 0}, {destino: 0})
+    padres = ({inicio: None}, {destino: None})
+    fijados = (set(), set())
+    heaps = ([(0, next(contador), inicio)], [(0, next(contador), destino)])
+    heappop, heappush = heapq.heappop, heapq.heappush
+    infinito = float('inf')
+    mejor, encuentro = infinito, None
+    expandidos = 0
+    
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= mejor:
             break
+        lado = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        distancia, _, nodo = heappop(heaps[lado])
+        if nodo in fijados[lado]:
+            continue
+        fijados[lado].add(nodo)
+        expandidos += 1
         
-        visitados.add(nodo_actual)
-        
-        # Actualizar distancias de vecinos
-        for vecino, peso in grafo.obtener_vecinos(nodo_actual):
-            if vecino not in visitados:
-                nueva_distancia = distancias[nodo_actual] + peso
-                if nueva_distancia < distancias[vecino]:
-                    distancias[vecino] = nueva_distancia
+        propias, otras = distancias[lado], distancias[1 - lado]
+        for vecino, peso in vecinos[lado](nodo):
+            nueva_distancia = distancia + peso
+            if nueva_distancia < propias.get(vecino, infinito):
+                propias[vecino] = nueva_distancia
+                padres[lado][vecino] = nodo
+                heappush(heaps[lado], (nueva_distancia, next(contador), vecino))
+            if vecino in otras and propias[vecino] + otras[vecino] < mejor:
+                mejor, encuentro = propias[vecino] + otras[vecino], vecino
     
-    return distancias
+    if encuentro is None:
+        return infinito, None, expandidos
+    return mejor, _unir_caminos(padres[0], padres[1], encuentro), expandidos
+
+def bfs_bidireccional(grafo, inicio, destino, invertido=None):
+    """
+    BFS bidireccional para grafos sin pesos (cuenta aristas): en cada paso
+    se expande un nivel completo de la frontera más chica; el primer nodo
+    que ya había visto el otro lado da un camino mínimo. Con factor de
+    ramificación b se visitan ~2·b^(d/2) nodos en lugar de b^d.
+    
+    Retorna (distancia, camino, expandidos); (inf, None, expandidos) si no hay camino.
+    """
+    if inicio == destino:
+        return 0, [inicio], 0
+    vecinos = (grafo.obtener_vecinos, _vecinos_hacia_atras(grafo, invertido))
+    padres = ({inicio: None}, {destino: None})
+    fronteras = ([inicio], [destino])
+    niveles = [0, 0]
+    expandidos = 0
+    
+    while fronteras[0] and fronteras[1]:
+        lado = 0 if len(fronteras[0]) <= len(fronteras[1]) else 1
+        propios, otros = padres[lado], padres[1 - lado]
+        siguiente = []
+        for nodo in fronteras[lado]:
+            expandidos += 1
+            for vecino, _ in vecinos[lado](nodo):
+                if vecino in propios:
+                    continue
+                propios[vecino] = nodo
+                if vecino in otros:
+                    distancia = niveles[0] + niveles[1] + 1
+                    return distancia, _unir_caminos(padres[0], padres[1], vecino), expandidos
+                siguiente.append(vecino)
+        fronteras = (siguiente, fronteras[1]) if lado == 0 else (fronteras[0], siguiente)
+        niveles[lado] += 1
+    
+    return float('inf'), None, expandidos
 
-# Ejemplo
-print("Grafo con pesos:")
-grafo_pesos = GrafoListaAdyacencia(dirigido=False)
-grafo_pesos.agregar_arista('A', 'B', 4)
-grafo_pesos.agregar_arista('A', 'C', 2)
-grafo_pesos.agregar_arista('B', 'C', 1)
-grafo_pesos.agregar_arista('B', 'D', 5)
-grafo_pesos.agregar_arista('C', 'D', 8)
-grafo_pesos.agregar_arista('C', 'E', 10)
-grafo_pesos.agregar_arista('D', 'E', 2)
-
-distancias = dijkstra(grafo_pesos, 'A')
-print(f"Distancias más cortas desde 'A': {distancias}")
-print()
 
 # =============================================================================
 # 5. DETECCIÓN DE CICLOS
 # =============================================================================
-print("=== 5. Detección de Ciclos ===")
 
 def tiene_ciclo(grafo, dirigido=True):
     """Detecta si el grafo tiene ciclos."""
@@ -371,25 +580,10 @@ def _tiene_ciclo_dirigido(grafo):
                 return True
     return False
 
-# Ejemplo
-print("Detección de ciclos:")
-grafo_ciclo = GrafoListaAdyacencia(dirigido=False)
-grafo_ciclo.agregar_arista('A', 'B')
-grafo_ciclo.agregar_arista('B', 'C')
-grafo_ciclo.agregar_arista('C', 'A')  # Forma un ciclo
-
-print(f"Grafo con ciclo: {tiene_ciclo(grafo_ciclo, dirigido=False)}")
-
-grafo_sin_ciclo = GrafoListaAdyacencia(dirigido=False)
-grafo_sin_ciclo.agregar_arista('A', 'B')
-grafo_sin_ciclo.agregar_arista('B', 'C')
-print(f"Grafo sin ciclo: {tiene_ciclo(grafo_sin_ciclo, dirigido=False)}")
-print()
 
 # =============================================================================
 # 6. ORDENAMIENTO TOPOLÓGICO
 # =============================================================================
-print("=== 6. Ordenamiento Topológico ===")
 
 def ordenamiento_topologico(grafo):
     """Ordenamiento topológico para grafos dirigidos acíclicos (DAG)."""
@@ -420,62 +614,30 @@ def ordenamiento_topologico(grafo):
     
     return resultado
 
-# Ejemplo
-print("Ordenamiento topológico (DAG):")
-grafo_dag = GrafoListaAdyacencia(dirigido=True)
-grafo_dag.agregar_arista('A', 'B')
-grafo_dag.agregar_arista('A', 'C')
-grafo_dag.agregar_arista('B', 'D')
-grafo_dag.agregar_arista('C', 'D')
-grafo_dag.agregar_arista('D', 'E')
-
-orden = ordenamiento_topologico(grafo_dag)
-print(f"Orden topológico: {orden}")
-print()
 
 # =============================================================================
 # 7. GRAFO PONDERADO COMPLETO
 # =============================================================================
-print("=== 7. Grafo Ponderado Completo ===")
 
 class GrafoPonderado(GrafoListaAdyacencia):
     """Grafo con operaciones avanzadas para grafos ponderados."""
     
-    def camino_minimo(self, inicio, destino):
-        """Encuentra el camino mínimo usando Dijkstra mejorado."""
-        distancias = {nodo: float('inf') for nodo in self.obtener_nodos()}
-        distancias[inicio] = 0
-        padres = {}
-        visitados = set()
-        
-        while len(visitados) < len(distancias):
-            nodo_actual = min((n for n in distancias.items() 
-                              if n[0] not in visitados), key=lambda x: x[1])[0]
-            
-            if distancias[nodo_actual] == float('inf'):
-                break
-            
-            visitados.add(nodo_actual)
-            
-            for vecino, peso in self.obtener_vecinos(nodo_actual):
-                if vecino not in visitados:
-                    nueva_distancia = distancias[nodo_actual] + peso
-                    if nueva_distancia < distancias[vecino]:
-                        distancias[vecino] = nueva_distancia
-                        padres[vecino] = nodo_actual
-        
-        # Reconstruir camino
-        if destino not in padres and inicio != destino:
-            return None
-        
-        camino = []
-        nodo = destino
-        while nodo is not None:
-            camino.append(nodo)
-            nodo = padres.get(nodo)
-        
-        camino.reverse()
-        return camino if camino[0] == inicio else None
+    def camino_minimo(self, inicio, destino, metodo="dijkstra", heuristica=None):
+        """
+        Encuentra el camino mínimo (None si no hay) con parada temprana.
+        - metodo="dijkstra": Dijkstra con heap desde inicio.
+        - metodo="a_estrella": A* con heuristica(nodo, destino).
+        - metodo="bidireccional": Dijkstra desde ambos extremos.
+        """
+        if metodo == "dijkstra":
+            _, camino = dijkstra_camino(self, inicio, destino)
+        elif metodo == "a_estrella":
+            _, camino, _ = a_estrella(self, inicio, destino, heuristica)
+        elif metodo == "bidireccional":
+            _, camino, _ = dijkstra_bidireccional(self, inicio, destino)
+        else:
+            raise ValueError(f"Método desconocido: {metodo!r}")
+        return camino
     
     def arbol_expansion_minima(self):
         """Algoritmo de Prim para árbol de expansión mínima."""
@@ -503,27 +665,1009 @@ class GrafoPonderado(GrafoListaAdyacencia):
         
         return aristas_mst
 
-# Ejemplo
-print("Grafo ponderado:")
-grafo_pond = GrafoPonderado(dirigido=False)
-grafo_pond.agregar_arista('A', 'B', 4)
-grafo_pond.agregar_arista('A', 'C', 2)
-grafo_pond.agregar_arista('B', 'C', 1)
-grafo_pond.agregar_arista('B', 'D', 5)
-grafo_pond.agregar_arista('C', 'D', 8)
 
-camino_min = grafo_pond.camino_minimo('A', 'D')
-print(f"Camino mínimo de A a D: {camino_min}")
+# =============================================================================
+# 8. GRAFO EN FORMATO CSR (Compressed Sparse Row)
+# =============================================================================
+
+def _etiquetas_desde_json(valor):
+    """JSON guarda las tuplas como listas: se restauran (las etiquetas deben ser hashables)."""
+    if isinstance(valor, list):
+        return tuple(_etiquetas_desde_json(v) for v in valor)
+    if isinstance(valor, dict):
+        raise ValueError("Etiqueta no válida")
+    return valor
+
+class _VistaCSR:
+    """
+    Vista de solo lectura que imita el defaultdict(list) de
+    GrafoListaAdyacencia (nodo -> [(vecino, peso), ...]) sin guardar una
+    tupla por arista: las listas se generan al pedir cada nodo.
+    """
+    
+    def __init__(self, csr):
+        self._csr = csr
+    
+    def __getitem__(self, nodo):
+        csr = self._csr
+        i = csr._indice(nodo)
+        if i is None:
+            return []  # Igual que defaultdict, pero sin insertar el nodo
+        
+        inicio, fin = csr.offsets[i], csr.offsets[i + 1]
+        vecinos = csr.vecinos[inicio:fin]
+        pesos = csr.pesos[inicio:fin]
+        if csr.etiquetas is not None:
+            etiquetas = csr.etiquetas
+            return [(etiquetas[v], p) for v, p in zip(vecinos, pesos)]
+        return list(zip(vecinos, pesos))
+    
+    def __contains__(self, nodo):
+        return self._csr._indice(nodo) is not None
+    
+    def __iter__(self):
+        return iter(self.keys())
+    
+    def __len__(self):
+        return self._csr.num_nodos
+    
+    def keys(self):
+        csr = self._csr
+        return csr.etiquetas if csr.etiquetas is not None else range(csr.num_nodos)
+
+
+class _AristasCSR:
+    """
+    Vista iterable de las aristas de un GrafoCSR como (origen, destino, peso)
+    o (origen, destino), los formatos de lista de aristas de
+    43_grafos_avanzados. Las tuplas se generan al recorrerla; se puede
+    recorrer varias veces.
+    """
+    
+    def __init__(self, csr, con_pesos=True):
+        self._csr = csr
+        self._con_pesos = con_pesos
+    
+    def __iter__(self):
+        csr = self._csr
+        offsets, vecinos, pesos = csr.offsets, csr.vecinos, csr.pesos
+        etiquetas = csr.etiquetas
+        for u in range(csr.num_nodos):
+            origen = etiquetas[u] if etiquetas is not None else u
+            for k in range(offsets[u], offsets[u + 1]):
+                destino = etiquetas[vecinos[k]] if etiquetas is not None else vecinos[k]
+                yield (origen, destino, pesos[k]) if self._con_pesos else (origen, destino)
+    
+    def __len__(self):
+        return self._csr.num_aristas
+
+
+def _bloques_lista_aristas(ruta, separador=None, comentarios=("#", "%"), saltar_filas=0,
+                           tamanio_bloque=1 << 24):
+    """
+    Lee un archivo de lista de aristas por bloques de ~tamanio_bloque bytes
+    (cortados en el último salto de línea) y retorna un generador de
+    arreglos estructurados de NumPy con campos 'u', 'v' y 'p'. Cada bloque
+    lo interpreta np.loadtxt en C: no se crea una tupla por arista.
+    
+    separador: None detecta ',' o tabulador en la primera línea de datos
+    (si no hay ninguno, se separa por espacios). La tercera columna, si
+    existe, es el peso.
+    """
+    import numpy as np
+    
+    tipo = None
+    with open(ruta, "rb") as archivo:
+        for _ in range(saltar_filas):
+            archivo.readline()
+        resto = b""
+        while True:
+            bloque = archivo.read(tamanio_bloque)
+            datos = resto + bloque
+            if bloque:
+                corte = datos.rfind(b"\n") + 1
+                datos, resto = datos[:corte], datos[corte:]
+            else:
+                resto = b""
+            
+            if tipo is None:
+                primera = next((linea for linea in datos.decode().splitlines()
+                                if linea.strip() and not linea.lstrip().startswith(comentarios)), None)
+                if primera is not None:
+                    if separador is None:
+                        separador = "," if "," in primera else "\t" if "\t" in primera else None
+                    columnas = len(primera.split(separador))
+                    if columnas < 2:
+                        raise ValueError(f"Se esperaban al menos dos columnas: {primera!r}")
+                    tipo = [("u", "i8"), ("v", "i8")] + ([("p", "f8")] if columnas > 2 else [])
+            
+            if tipo is not None and datos.strip():
+                with warnings.catch_warnings():
+                    # Un bloque con solo comentarios no es un error
+                    warnings.simplefilter("ignore", UserWarning)
+                    tabla = np.loadtxt(io.BytesIO(datos), dtype=tipo, delimiter=separador,
+                                       comments=comentarios, usecols=range(len(tipo)), ndmin=1)
+                if len(tabla):
+                    yield tabla
+            if not bloque:
+                return
+
+
+class GrafoCSR:
+    """
+    Grafo inmutable en formato CSR (Compressed Sparse Row).
+    
+    Tres arreglos contiguos reemplazan al diccionario de listas de tuplas:
+    - offsets[i] .. offsets[i+1]: rango de las aristas que salen del nodo i
+    - vecinos: destino de cada arista (int32, 4 bytes)
+    - pesos: peso de cada arista (float64, 8 bytes)
+    
+    Cada arista ocupa ~12 bytes frente a los cientos de bytes de una tupla
+    dentro de una lista de Python. Los grafos no dirigidos guardan cada
+    arista en ambos sentidos.
+    
+    Los nodos internos son enteros 0..V-1; opcionalmente se conservan las
+    etiquetas originales. Expone la misma interfaz de lectura que
+    GrafoListaAdyacencia (grafo, obtener_vecinos, obtener_nodos), así que
+    bfs, dfs_iterativo, componentes_conexas, dijkstra, etc. funcionan sin
+    cambios.
+    """
+    
+    def __init__(self, offsets, vecinos, pesos, dirigido=False, etiquetas=None):
+        """
+        Crea el grafo a partir de arreglos array.array ya construidos
+        ('q', 'i', 'd') o de memoryviews con esos formatos (cargar()).
+        Normalmente se usa desde_aristas(), desde_grafo() o desde_archivo().
+        """
+        if len(vecinos) != len(pesos) or len(offsets) == 0 or offsets[-1] != len(vecinos):
+            raise ValueError("Arreglos CSR inconsistentes")
+        if etiquetas is not None and len(etiquetas) != len(offsets) - 1:
+            raise ValueError("Debe haber una etiqueta por nodo")
+        
+        self.offsets = offsets
+        self.vecinos = vecinos
+        self.pesos = pesos
+        self.dirigido = dirigido
+        self.etiquetas = etiquetas
+        self._indices = (
+            {etiqueta: i for i, etiqueta in enumerate(etiquetas)}
+            if etiquetas is not None else None
+        )
+        self.grafo = _VistaCSR(self)
+    
+    @classmethod
+    def desde_aristas(cls, aristas, num_nodos=None, dirigido=False):
+        """
+        Construye el grafo desde un iterable de (origen, destino) o
+        (origen, destino, peso) con nodos enteros 0..V-1.
+        Complejidad: O(V + E), con dos pasadas (conteo y colocación).
+        """
+        origenes = array('q')
+        destinos = array('q')
+        pesos = array('d')
+        for arista in aristas:
+            u, v = arista[0], arista[1]
+            peso = arista[2] if len(arista) > 2 else 1
+            origenes.append(u)
+            destinos.append(v)
+            pesos.append(peso)
+            if not dirigido:
+                # Mismo orden de vecinos que GrafoListaAdyacencia.agregar_arista
+                origenes.append(v)
+                destinos.append(u)
+                pesos.append(peso)
+        
+        if num_nodos is None:
+            num_nodos = max(max(origenes, default=-1), max(destinos, default=-1)) + 1
+        if origenes and (min(min(origenes), min(destinos)) < 0
+                         or max(max(origenes), max(destinos)) >= num_nodos):
+            raise ValueError(f"Los nodos deben ser enteros entre 0 y {num_nodos - 1}")
+        
+        # Pasada 1: grado de salida de cada nodo -> offsets (suma acumulada)
+        offsets = array('q', bytes(8 * (num_nodos + 1)))
+        for u in origenes:
+            offsets[u + 1] += 1
+        for i in range(num_nodos):
+            offsets[i + 1] += offsets[i]
+        
+        # Pasada 2: colocar cada arista en su posición (counting sort estable)
+        posicion = array('q', offsets)
+        vecinos_csr = array('i', bytes(4 * len(destinos)))
+        pesos_csr = array('d', bytes(8 * len(pesos)))
+        for u, v, peso in zip(origenes, destinos, pesos):
+            k = posicion[u]
+            vecinos_csr[k] = v
+            pesos_csr[k] = peso
+            posicion[u] = k + 1
+        
+        return cls(offsets, vecinos_csr, pesos_csr, dirigido=dirigido)
+    
+    @classmethod
+    def desde_arrays(cls, origenes, destinos, pesos=None, num_nodos=None, dirigido=False):
+        """
+        Versión vectorizada de desde_aristas() para arreglos de NumPy:
+        ordena por origen con argsort estable y calcula los offsets con
+        bincount + cumsum.
+        """
+        import numpy as np
+        
+        origenes = np.asarray(origenes, dtype=np.int64)
+        destinos = np.asarray(destinos, dtype=np.int64)
+        pesos = (np.ones(len(origenes)) if pesos is None
+                 else np.asarray(pesos, dtype=np.float64))
+        
+        if not dirigido:
+            # Intercala (u, v) y (v, u) como lo hace desde_aristas()
+            origenes, destinos = (np.column_stack([origenes, destinos]).ravel(),
+                                  np.column_stack([destinos, origenes]).ravel())
+            pesos = np.repeat(pesos, 2)
+        
+        if num_nodos is None:
+            num_nodos = int(max(origenes.max(initial=-1), destinos.max(initial=-1))) + 1
+        if len(origenes) and (min(origenes.min(), destinos.min()) < 0
+                              or max(origenes.max(), destinos.max()) >= num_nodos):
+            raise ValueError(f"Los nodos deben ser enteros entre 0 y {num_nodos - 1}")
+        
+        orden = np.argsort(origenes, kind="stable")
+        offsets = np.zeros(num_nodos + 1, dtype=np.int64)
+        np.cumsum(np.bincount(origenes, minlength=num_nodos), out=offsets[1:])
+        
+        # Se guardan como array.array para que el grafo no dependa de NumPy
+        return cls(array('q', offsets.tobytes()),
+                   array('i', destinos[orden].astype(np.int32).tobytes()),
+                   array('d', pesos[orden].tobytes()),
+                   dirigido=dirigido)
+    
+    @classmethod
+    def desde_grafo(cls, grafo):
+        """
+        Convierte un GrafoListaAdyacencia (con cualquier tipo de etiqueta)
+        a CSR, conservando el orden de los vecinos.
+        """
+        etiquetas = grafo.obtener_nodos()
+        indices = {etiqueta: i for i, etiqueta in enumerate(etiquetas)}
+        con_aristas = len(etiquetas)
+        
+        offsets = array('q', [0])
+        vecinos = array('i')
+        pesos = array('d')
+        for etiqueta in etiquetas[:con_aristas]:
+            for vecino, peso in grafo.grafo[etiqueta]:
+                if vecino not in indices:
+                    # Nodo que solo aparece como destino (grafos dirigidos)
+                    indices[vecino] = len(etiquetas)
+                    etiquetas.append(vecino)
+                vecinos.append(indices[vecino])
+                pesos.append(peso)
+            offsets.append(len(vecinos))
+        
+        # Los nodos añadidos al final no tienen aristas salientes
+        offsets.extend([len(vecinos)] * (len(etiquetas) - con_aristas))
+        return cls(offsets, vecinos, pesos, dirigido=grafo.dirigido, etiquetas=etiquetas)
+    
+    @classmethod
+    def desde_archivo(cls, ruta, separador=None, dirigido=False, num_nodos=None,
+                      saltar_filas=0, comentarios=("#", "%"), tamanio_bloque=1 << 24):
+        """
+        Construye el grafo leyendo un archivo de lista de aristas (CSV, TSV
+        o separado por espacios), una arista "origen destino [peso]" por
+        línea, con nodos enteros 0..V-1. Ignora líneas de comentario.
+        
+        El archivo se procesa por bloques: cada bloque queda en arreglos
+        int32/float64 compactos (sin una tupla por arista) y al final se
+        arma el CSR con desde_arrays().
+        """
+        import numpy as np
+        
+        origenes, destinos, pesos = [], [], []
+        for tabla in _bloques_lista_aristas(ruta, separador, comentarios, saltar_filas, tamanio_bloque):
+            u, v = tabla["u"], tabla["v"]
+            if min(u.min(), v.min()) < 0 or max(u.max(), v.max()) > np.iinfo(np.int32).max:
+                raise ValueError("Los nodos deben ser enteros entre 0 y 2³¹ - 1")
+            origenes.append(u.astype(np.int32))
+            destinos.append(v.astype(np.int32))
+            if "p" in tabla.dtype.names:
+                pesos.append(tabla["p"])
+        
+        if not origenes:
+            return cls.desde_arrays([], [], num_nodos=num_nodos or 0, dirigido=dirigido)
+        return cls.desde_arrays(np.concatenate(origenes), np.concatenate(destinos),
+                                np.concatenate(pesos) if pesos else None,
+                                num_nodos=num_nodos, dirigido=dirigido)
+    
+    def _indice(self, nodo):
+        """Índice interno de un nodo, o None si no pertenece al grafo."""
+        if self._indices is not None:
+            return self._indices.get(nodo)
+        try:
+            i = operator.index(nodo)  # Acepta también enteros de NumPy
+        except TypeError:
+            return None
+        return i if 0 <= i < self.num_nodos else None
+    
+    @property
+    def num_nodos(self):
+        return len(self.offsets) - 1
+    
+    @property
+    def num_aristas(self):
+        """Aristas almacenadas (las no dirigidas cuentan dos veces)."""
+        return len(self.vecinos)
+    
+    def agregar_arista(self, origen, destino, peso=1):
+        """El formato CSR es inmutable: construir con desde_aristas()."""
+        raise TypeError("GrafoCSR es inmutable; usa GrafoCSR.desde_aristas()")
+    
+    def obtener_vecinos(self, nodo):
+        """Obtiene los vecinos de un nodo como [(vecino, peso), ...]."""
+        return self.grafo[nodo]
+    
+    def obtener_nodos(self):
+        """Obtiene todos los nodos del grafo."""
+        return list(self.grafo.keys())
+    
+    def grado(self, nodo):
+        """Número de aristas que salen de un nodo."""
+        i = self._indice(nodo)
+        return 0 if i is None else self.offsets[i + 1] - self.offsets[i]
+    
+    def memoria_bytes(self):
+        """Bytes ocupados por los arreglos CSR (sin contar etiquetas)."""
+        return sum(memoryview(a).nbytes for a in (self.offsets, self.vecinos, self.pesos))
+    
+    def a_numpy(self):
+        """
+        Retorna (offsets, vecinos, pesos) como arreglos de NumPy que
+        comparten memoria con el grafo (sin copiar).
+        """
+        import numpy as np
+        return (np.frombuffer(self.offsets, dtype=np.int64),
+                np.frombuffer(self.vecinos, dtype=np.int32),
+                np.frombuffer(self.pesos, dtype=np.float64))
+    
+    def aristas(self, con_pesos=True):
+        """
+        Aristas como (origen, destino, peso), o (origen, destino) si
+        con_pesos=False. Se puede recorrer varias veces, así que sirve como
+        lista de aristas para los algoritmos de 43_grafos_avanzados.
+        """
+        return _AristasCSR(self, con_pesos)
+    
+    # -------------------------------------------------------------------------
+    # Formato binario: cabecera + offsets + vecinos + pesos (+ etiquetas)
+    # -------------------------------------------------------------------------
+    
+    _CABECERA = struct.Struct("<4sHHqqqq")
+    _MAGICO = b"GCSR"
+    _VERSION = 1
+    _ALINEACION = 64
+    
+    @classmethod
+    def _posiciones(cls, num_nodos, num_aristas):
+        """Inicio de cada arreglo en el archivo, alineado a 64 bytes."""
+        alinear = lambda x: -(-x // cls._ALINEACION) * cls._ALINEACION
+        offsets = alinear(cls._CABECERA.size)
+        vecinos = alinear(offsets + 8 * (num_nodos + 1))
+        pesos = alinear(vecinos + 4 * num_aristas)
+        return offsets, vecinos, pesos, pesos + 8 * num_aristas
+    
+    def guardar(self, ruta):
+        """
+        Guarda el grafo en un archivo binario: los tres arreglos CSR se
+        escriben tal cual están en memoria (sin texto ni conversión), de
+        modo que cargar() los puede mapear directamente.
+        Las etiquetas, si las hay, se guardan al final como una lista JSON
+        (UTF-8): solo datos, así que cargar un archivo ajeno no ejecuta
+        código. Se admiten números, cadenas, None y tuplas de ellos.
+        """
+        etiquetas = b""
+        if self.etiquetas is not None:
+            try:
+                etiquetas = json.dumps(list(self.etiquetas), ensure_ascii=False,
+                                       allow_nan=False).encode("utf-8")
+            except (TypeError, ValueError) as e:
+                raise ValueError("Las etiquetas deben ser números finitos, cadenas, "
+                                 "None o tuplas de ellos") from e
+        posiciones = self._posiciones(self.num_nodos, self.num_aristas)
+        with open(ruta, "wb") as archivo:
+            archivo.write(self._CABECERA.pack(self._MAGICO, self._VERSION, int(self.dirigido),
+                                              self.num_nodos, self.num_aristas,
+                                              posiciones[-1], len(etiquetas)))
+            for inicio, datos in zip(posiciones, (self.offsets, self.vecinos, self.pesos)):
+                archivo.write(bytes(inicio - archivo.tell()))
+                archivo.write(memoryview(datos).cast("B"))
+            archivo.write(etiquetas)
+    
+    @classmethod
+    def cargar(cls, ruta, mapear=True):
+        """
+        Carga un grafo guardado con guardar().
+        
+        - mapear=True: los arreglos son vistas (memoryview) sobre un mmap de
+          solo lectura; la carga no lee las aristas, así que tarda lo mismo
+          con mil o con cincuenta millones. El sistema operativo trae las
+          páginas a medida que se usan y a_numpy() no copia nada.
+        - mapear=False: lee el archivo completo a arreglos array.array.
+        """
+        with open(ruta, "rb") as archivo:
+            cabecera = archivo.read(cls._CABECERA.size)
+            if len(cabecera) < cls._CABECERA.size:
+                raise ValueError(f"'{ruta}' no es un grafo GrafoCSR válido")
+            magico, version, dirigido, num_nodos, num_aristas, inicio_etiquetas, largo_etiquetas = \
+                cls._CABECERA.unpack(cabecera)
+            if magico != cls._MAGICO or version != cls._VERSION:
+                raise ValueError(f"'{ruta}' no es un grafo GrafoCSR válido")
+            posiciones = cls._posiciones(num_nodos, num_aristas)
+            if os.fstat(archivo.fileno()).st_size != inicio_etiquetas + largo_etiquetas:
+                raise ValueError(f"'{ruta}' está incompleto o dañado")
+            
+            etiquetas = None
+            if largo_etiquetas:
+                archivo.seek(inicio_etiquetas)
+                try:
+                    datos = json.loads(archivo.read(largo_etiquetas))
+                    if not isinstance(datos, list):
+                        raise ValueError("Se esperaba una lista de etiquetas")
+                    etiquetas = [_etiquetas_desde_json(e) for e in datos]
+                except ValueError as e:  # Incluye JSON y UTF-8 inválidos
+                    raise ValueError(f"'{ruta}' tiene etiquetas dañadas") from e
+            
+            # Cada arreglo ocupa exactamente sus bytes (sin el relleno de alineación)
+            tramos = [(inicio, inicio + tamanio * largo, tipo) for inicio, tamanio, largo, tipo in
+                      zip(posiciones, (8, 4, 8), (num_nodos + 1, num_aristas, num_aristas), "qid")]
+            if mapear:
+                mapa = memoryview(mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ))
+                arreglos = [mapa[inicio:fin].cast(tipo) for inicio, fin, tipo in tramos]
+            else:
+                arreglos = []
+                for inicio, fin, tipo in tramos:
+                    archivo.seek(inicio)
+                    arreglo = array(tipo)
+                    arreglo.frombytes(archivo.read(fin - inicio))
+                    arreglos.append(arreglo)
+        
+        return cls(*arreglos, dirigido=bool(dirigido), etiquetas=etiquetas)
+    
+    # Los algoritmos de las otras representaciones funcionan sin cambios
+    # porque solo usan self.grafo[nodo] y la iteración sobre self.grafo
+    imprimir_grafo = GrafoListaAdyacencia.imprimir_grafo
+    bfs = GrafoListaAdyacencia.bfs
+    dfs = GrafoListaAdyacencia.dfs
+    dfs_iterativo = GrafoListaAdyacencia.dfs_iterativo
+    buscar_camino = GrafoCompleto.buscar_camino
+    todos_los_caminos = GrafoCompleto.todos_los_caminos
+    componentes_conexas = GrafoCompleto.componentes_conexas
+
+
+# =============================================================================
+# 9. BFS POR NIVELES Y COMPONENTES CONEXAS (GRAFOS GRANDES)
+# =============================================================================
+
+# Tamaño de frontera a partir del cual conviene repartirla entre procesos
+UMBRAL_FRONTERA_PARALELA = 1 << 17
+
+def _aristas_de_frontera(offsets, vecinos, frontera):
+    """
+    Retorna (destinos, origenes) de todas las aristas que salen de los
+    nodos de la frontera, sin bucles de Python: cada arista se ubica como
+    offsets[nodo] + su desplazamiento dentro del bloque de ese nodo.
+    """
+    import numpy as np
+    
+    inicios = offsets[frontera]
+    grados = offsets[frontera + 1] - inicios
+    total = int(grados.sum())
+    desplazamientos = np.arange(total) - np.repeat(np.cumsum(grados) - grados, grados)
+    return vecinos[np.repeat(inicios, grados) + desplazamientos], np.repeat(frontera, grados)
+
+def _sin_repetidos(nodos, origenes, marca):
+    """
+    Deja una aparición de cada nodo sin ordenar: cada posición escribe su
+    índice en marca[nodo] y sobrevive la que quedó escrita.
+    """
+    import numpy as np
+    
+    posiciones = np.arange(len(nodos))
+    marca[nodos] = posiciones
+    ganadores = marca[nodos] == posiciones
+    return nodos[ganadores], origenes[ganadores]
+
+def _expandir_frontera(offsets, vecinos, niveles, frontera, marca):
+    """Nodos nuevos (aún sin nivel) alcanzados desde la frontera y su padre."""
+    destinos, origenes = _aristas_de_frontera(offsets, vecinos, frontera)
+    libres = niveles[destinos] < 0
+    return _sin_repetidos(destinos[libres], origenes[libres], marca)
+
+# Estado de cada proceso hijo: vistas sobre la memoria compartida
+_TRABAJADOR_BFS = {}
+
+def _iniciar_trabajador_bfs(bloques):
+    """
+    Inicializador de los procesos hijos: se conecta una sola vez a los
+    bloques de memoria compartida (offsets, vecinos, niveles).
+    """
+    import numpy as np
+    from multiprocessing import shared_memory
+    
+    for nombre, (nombre_memoria, tipo, tamanio) in bloques.items():
+        memoria = shared_memory.SharedMemory(name=nombre_memoria)
+        _TRABAJADOR_BFS[nombre + "_memoria"] = memoria
+        _TRABAJADOR_BFS[nombre] = np.ndarray(tamanio, dtype=tipo, buffer=memoria.buf)
+    _TRABAJADOR_BFS["marca"] = np.empty(len(_TRABAJADOR_BFS["niveles"]), dtype=np.int64)
+
+def _expandir_en_trabajador(frontera):
+    """Se ejecuta en un proceso hijo: expande un trozo de la frontera."""
+    t = _TRABAJADOR_BFS
+    return _expandir_frontera(t["offsets"], t["vecinos"], t["niveles"], frontera, t["marca"])
+
+def bfs_por_niveles(grafo, inicio, procesos=1, umbral_paralelo=UMBRAL_FRONTERA_PARALELA,
+                    con_padres=False):
+    """
+    BFS sincronizado por niveles sobre un GrafoCSR con NumPy.
+    
+    En lugar de una cola de nodos, cada nivel es un arreglo (la frontera):
+    se juntan todas sus aristas con operaciones vectorizadas, se descartan
+    los destinos ya visitados y los repetidos, y eso es la frontera
+    siguiente. El trabajo por nivel es O(aristas de la frontera) en C.
+    
+    - procesos > 1: las fronteras de al menos 'umbral_paralelo' nodos se
+      reparten entre procesos que leen el grafo y los niveles desde
+      memoria compartida (sin copiar el grafo a cada proceso).
+    - con_padres: además retorna el padre de cada nodo en el árbol BFS.
+    
+    Retorna niveles (int32, -1 si no es alcanzable) indexados por el
+    índice interno del nodo, o (niveles, padres).
+    Complejidad: O(V + E)
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+    import numpy as np
+    
+    origen = grafo._indice(inicio)
+    if origen is None:
+        raise ValueError(f"El nodo {inicio!r} no pertenece al grafo")
+    offsets, vecinos, _ = grafo.a_numpy()
+    n = grafo.num_nodos
+    procesos = procesos or os.cpu_count() or 1
+    
+    memorias = []
+    ejecutor = None
+    try:
+        if procesos > 1:
+            # Grafo y niveles en memoria compartida; el padre escribe los
+            # niveles solo entre un nivel y el siguiente (sin carreras)
+            bloques = {}
+            for nombre, datos in (("offsets", offsets), ("vecinos", vecinos),
+                                  ("niveles", np.full(n, -1, dtype=np.int32))):
+                memoria = shared_memory.SharedMemory(create=True, size=max(datos.nbytes, 1))
+                memorias.append(memoria)
+                compartido = np.ndarray(datos.shape, dtype=datos.dtype, buffer=memoria.buf)
+                compartido[:] = datos
+                bloques[nombre] = (memoria.name, datos.dtype.str, len(datos))
+                if nombre == "niveles":
+                    niveles = compartido
+                else:
+                    del compartido
+        else:
+            niveles = np.full(n, -1, dtype=np.int32)
+        padres = np.full(n, -1, dtype=np.int64) if con_padres else None
+        marca = np.empty(n, dtype=np.int64)
+        
+        frontera = np.array([origen], dtype=np.int64)
+        niveles[origen] = 0
+        nivel = 0
+        while len(frontera):
+            if procesos > 1 and len(frontera) >= umbral_paralelo:
+                if ejecutor is None:
+                    ejecutor = ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_trabajador_bfs,
+                                                   initargs=(bloques,))
+                trozos = np.array_split(frontera, procesos)
+                resultados = list(ejecutor.map(_expandir_en_trabajador, trozos))
+                # Un nodo puede llegar desde trozos distintos: quitar repetidos otra vez
+                nuevos, origenes = _sin_repetidos(np.concatenate([r[0] for r in resultados]),
+                                                  np.concatenate([r[1] for r in resultados]), marca)
+            else:
+                nuevos, origenes = _expandir_frontera(offsets, vecinos, niveles, frontera, marca)
+            nivel += 1
+            niveles[nuevos] = nivel
+            if con_padres:
+                padres[nuevos] = origenes
+            frontera = nuevos
+        
+        niveles = niveles.copy() if memorias else niveles
+        return (niveles, padres) if con_padres else niveles
+    finally:
+        if ejecutor is not None:
+            ejecutor.shutdown()
+        compartido = niveles = None
+        for memoria in memorias:
+            memoria.close()
+            memoria.unlink()
+
+def componentes_union_find(grafo=None, origenes=None, destinos=None, num_nodos=None):
+    """
+    Componentes conexas con union-find vectorizado sobre una lista de
+    aristas (arreglos origenes/destinos) o sobre un GrafoCSR. Las aristas
+    se toman sin dirección (componentes débilmente conexas si es dirigido).
+    
+    Cada ronda hace lo mismo que unir() en UnionFind, pero para todas las
+    aristas a la vez:
+    1. Enganche: la raíz mayor de cada arista apunta a la menor
+       (np.minimum.at resuelve varias propuestas para la misma raíz).
+    2. Compresión: padre = padre[padre] hasta que todos apunten a su raíz.
+    3. Se descartan las aristas cuyos extremos ya comparten raíz.
+    Termina cuando no queda ninguna arista entre componentes distintas.
+    
+    Retorna (num_componentes, etiquetas): etiquetas[v] es el menor nodo
+    de la componente de v.
+    """
+    import numpy as np
+    
+    if grafo is not None:
+        offsets, vecinos, _ = grafo.a_numpy()
+        num_nodos = grafo.num_nodos
+        origenes = np.repeat(np.arange(num_nodos, dtype=np.int64), np.diff(offsets))
+        destinos = vecinos.astype(np.int64)
+    else:
+        origenes = np.asarray(origenes, dtype=np.int64)
+        destinos = np.asarray(destinos, dtype=np.int64)
+        if num_nodos is None:
+            num_nodos = int(max(origenes.max(initial=-1), destinos.max(initial=-1))) + 1
+    
+    padre = np.arange(num_nodos, dtype=np.int64)
+    while len(origenes):
+        raices_u, raices_v = padre[origenes], padre[destinos]
+        distintas = raices_u != raices_v
+        if not distintas.any():
+            break
+        origenes, destinos = origenes[distintas], destinos[distintas]
+        raices_u, raices_v = raices_u[distintas], raices_v[distintas]
+        np.minimum.at(padre, np.maximum(raices_u, raices_v), np.minimum(raices_u, raices_v))
+        while True:
+            abuelos = padre[padre]
+            if np.array_equal(abuelos, padre):
+                break
+            padre = abuelos
+    
+    return int(np.count_nonzero(padre == np.arange(num_nodos))), padre
+
+def _aristas_aleatorias(n, semilla=42):
+    """Aristas al azar (~10 por nodo) entre n nodos como arreglos de NumPy."""
+    import numpy as np
+    
+    azar = np.random.default_rng(semilla)
+    return azar.integers(0, n, 10 * n), azar.integers(0, n, 10 * n), n
+
+def _csr_aleatorio(n):
+    """GrafoCSR no dirigido con ~10 aristas por nodo."""
+    origenes, destinos, _ = _aristas_aleatorias(n)
+    return GrafoCSR.desde_arrays(origenes, destinos, num_nodos=n)
+
+def _componentes_con_bfs(origenes, destinos, n):
+    """Referencia: componentes_conexas() (un bfs() de Python por componente)."""
+    return len(GrafoCSR.desde_arrays(origenes, destinos, num_nodos=n).componentes_conexas())
+
+def _componentes_con_union_find(origenes, destinos, n):
+    """Referencia: UnionFind de 48_estructuras_avanzadas, arista por arista."""
+    union_find = cargar_modulo("estructuras_avanzadas").UnionFind(n)
+    for u, v in zip(origenes.tolist(), destinos.tolist()):
+        union_find.unir(u, v)
+    return union_find.num_componentes
 
-mst = grafo_pond.arbol_expansion_minima()
-print(f"Árbol de expansión mínima: {mst}")
-print()
 
 # =============================================================================
-# 8. COMPARACIÓN Y RESUMEN
+# 10. COMPARACIÓN Y RESUMEN
 # =============================================================================
-print("=== 8. Resumen de Representaciones de Grafos ===")
-print("""
+
+def generar_rejilla(ancho, alto, obstaculos=0.2, semilla=42, despejar=()):
+    """
+    Rejilla ancho x alto de 4 vecinos con una fracción de celdas bloqueadas,
+    como un mapa de un juego o un plano. Aristas de peso 1 entre celdas
+    libres vecinas. Las esquinas y las celdas de 'despejar' siempre quedan
+    libres. Retorna (GrafoPonderado, coordenadas {nodo: (x, y)}); los nodos
+    son las tuplas (x, y).
+    """
+    azar = random.Random(semilla)
+    libres = {(x, y) for x in range(ancho) for y in range(alto) if azar.random() >= obstaculos}
+    libres.update({(0, 0), (ancho - 1, alto - 1)}, despejar)
+    grafo = GrafoPonderado(dirigido=False)
+    for x, y in sorted(libres):
+        for vecino in ((x + 1, y), (x, y + 1)):
+            if vecino in libres:
+                grafo.agregar_arista((x, y), vecino, 1)
+    return grafo, {nodo: nodo for nodo in libres}
+
+def comparar_caminos_punto_a_punto(grafo, inicio, destino, coordenadas=None):
+    """
+    Compara Dijkstra, A* (euclidiana y Manhattan si hay coordenadas) y las
+    búsquedas bidireccionales en una consulta inicio -> destino.
+    Imprime tiempo, nodos expandidos y ahorro respecto de Dijkstra.
+    Retorna {nombre: (segundos, expandidos, distancia)}.
+    """
+    def _dijkstra(grafo, inicio, destino):
+        distancias, predecesores = _dijkstra_heap(grafo, [inicio], destino)
+        if destino not in distancias:
+            return float('inf'), None, len(distancias)
+        return distancias[destino], reconstruir_camino(predecesores, destino), len(distancias)
+    
+    busquedas = {"Dijkstra": _dijkstra}
+    if coordenadas is not None:
+        euclidiana = heuristica_euclidiana(coordenadas)
+        manhattan = heuristica_manhattan(coordenadas)
+        busquedas["A* euclidiana"] = lambda g, a, b: a_estrella(g, a, b, euclidiana)
+        busquedas["A* Manhattan"] = lambda g, a, b: a_estrella(g, a, b, manhattan)
+    busquedas["Dijkstra bidireccional"] = dijkstra_bidireccional
+    busquedas["BFS bidireccional (sin pesos)"] = bfs_bidireccional
+    
+    resultados = {}
+    print(f"  {'Búsqueda':30s} {'tiempo':>10s} {'expandidos':>11s} {'distancia':>10s}")
+    for nombre, busqueda in busquedas.items():
+        resumen, (distancia, _, expandidos) = medir(busqueda, preparar=lambda: (grafo, inicio, destino),
+                                                    repeticiones=3, calentamiento=0)
+        segundos = resumen["mediana_ns"] / 1e9
+        resultados[nombre] = (segundos, expandidos, distancia)
+        base = resultados["Dijkstra"][1]
+        print(f"  {nombre:30s} {segundos * 1000:8.2f}ms {expandidos:11d} {distancia:>10} "
+              f"({base / max(expandidos, 1):.1f}x menos nodos)")
+    return resultados
+
+def _rejilla_consulta(lado):
+    """Rejilla, heurísticas ya construidas y una consulta entre dos puntos interiores."""
+    inicio, destino = (lado // 4, lado // 2), (3 * lado // 4, lado // 2)
+    grafo, coordenadas = generar_rejilla(lado, lado, despejar=(inicio, destino))
+    heuristicas = {"euclidiana": heuristica_euclidiana(coordenadas),
+                   "manhattan": heuristica_manhattan(coordenadas)}
+    return grafo, heuristicas, inicio, destino
+
+def _a_estrella_con(nombre):
+    return lambda grafo, heuristicas, inicio, destino: a_estrella(
+        grafo, inicio, destino, heuristicas[nombre])[0]
+
+
+# Familia para el sistema de benchmarks (python -m algoritmos.benchmark)
+# n es el lado de la rejilla (n² nodos)
+BENCHMARKS = {
+    "camino_punto_a_punto": {
+        "implementaciones": {
+            "dijkstra": lambda grafo, heuristicas, inicio, destino: dijkstra_camino(grafo, inicio, destino)[0],
+            "a_estrella_euclidiana": _a_estrella_con("euclidiana"),
+            "a_estrella_manhattan": _a_estrella_con("manhattan"),
+            "dijkstra_bidireccional": lambda grafo, heuristicas, inicio, destino:
+                dijkstra_bidireccional(grafo, inicio, destino)[0],
+            "bfs_bidireccional": lambda grafo, heuristicas, inicio, destino:
+                bfs_bidireccional(grafo, inicio, destino)[0],
+        },
+        "entrada": _rejilla_consulta,
+        "tamanios": [50, 200, 500],
+        "verificar": lambda distancia, grafo, heuristicas, inicio, destino:
+            distancia == dijkstra_camino(grafo, inicio, destino)[0],
+    },
+    # n es el número de nodos (~10 aristas por nodo)
+    "bfs_grafo_grande": {
+        "implementaciones": {
+            "bfs_cola": lambda grafo: len(grafo.bfs(0)),
+            "bfs_por_niveles": lambda grafo: int((bfs_por_niveles(grafo, 0) >= 0).sum()),
+        },
+        "entrada": lambda n: (_csr_aleatorio(n),),
+        "tamanios": [10000, 100000, 1000000],
+        "limites": {"bfs_cola": 100000},
+        "verificar": lambda alcanzados, grafo: alcanzados == len(grafo.bfs(0)),
+    },
+    "componentes_conexas": {
+        "implementaciones": {
+            "bfs_por_componente": _componentes_con_bfs,
+            "union_find": _componentes_con_union_find,
+            "union_find_numpy": lambda origenes, destinos, n:
+                componentes_union_find(origenes=origenes, destinos=destinos, num_nodos=n)[0],
+        },
+        "entrada": _aristas_aleatorias,
+        "tamanios": [10000, 100000, 1000000],
+        "limites": {"bfs_por_componente": 100000, "union_find": 100000},
+        "verificar": lambda componentes, origenes, destinos, n:
+            componentes == _componentes_con_union_find(origenes, destinos, n),
+    },
+}
+
+
+def main():
+    """Ejecuta los ejemplos y comparaciones del módulo."""
+    print("=== Estructuras de Datos: Grafos ===\n")
+
+    print("=== 1. Grafo con Lista de Adyacencia ===")
+
+    # Ejemplo
+    print("Creando grafo no dirigido:")
+    grafo = GrafoListaAdyacencia(dirigido=False)
+    grafo.agregar_arista('A', 'B')
+    grafo.agregar_arista('A', 'C')
+    grafo.agregar_arista('B', 'D')
+    grafo.agregar_arista('C', 'D')
+    grafo.agregar_arista('D', 'E')
+
+    print("Grafo (lista de adyacencia):")
+    grafo.imprimir_grafo()
+    print(f"\nBFS desde 'A': {grafo.bfs('A')}")
+    print(f"DFS desde 'A': {grafo.dfs('A')}")
+    print(f"DFS iterativo desde 'A': {grafo.dfs_iterativo('A')}")
+    print()
+
+    print("=== 2. Grafo con Matriz de Adyacencia ===")
+
+    # Ejemplo
+    print("Creando grafo con matriz de adyacencia:")
+    grafo_matriz = GrafoMatrizAdyacencia(5, dirigido=False)
+    grafo_matriz.agregar_arista('A', 'B', 1)
+    grafo_matriz.agregar_arista('A', 'C', 1)
+    grafo_matriz.agregar_arista('B', 'D', 1)
+    grafo_matriz.agregar_arista('C', 'D', 1)
+    grafo_matriz.agregar_arista('D', 'E', 1)
+
+    grafo_matriz.imprimir_matriz()
+    print(f"Vecinos de 'A': {grafo_matriz.obtener_vecinos('A')}")
+    print()
+
+    print("=== 3. Algoritmos de Búsqueda ===")
+
+    # Ejemplo
+    print("Búsqueda de caminos:")
+    grafo_caminos = GrafoCompleto(dirigido=False)
+    grafo_caminos.agregar_arista('A', 'B')
+    grafo_caminos.agregar_arista('A', 'C')
+    grafo_caminos.agregar_arista('B', 'D')
+    grafo_caminos.agregar_arista('C', 'D')
+    grafo_caminos.agregar_arista('D', 'E')
+
+    camino = grafo_caminos.buscar_camino('A', 'E')
+    print(f"Camino de A a E: {camino}")
+
+    todos_caminos = grafo_caminos.todos_los_caminos('A', 'D')
+    print(f"Todos los caminos de A a D: {todos_caminos}")
+
+    componentes = grafo_caminos.componentes_conexas()
+    print(f"Componentes conexas: {componentes}")
+    print()
+
+    print("=== 4. Algoritmo de Dijkstra (Camino Más Corto) ===")
+
+    # Ejemplo
+    print("Grafo con pesos:")
+    grafo_pesos = GrafoListaAdyacencia(dirigido=False)
+    grafo_pesos.agregar_arista('A', 'B', 4)
+    grafo_pesos.agregar_arista('A', 'C', 2)
+    grafo_pesos.agregar_arista('B', 'C', 1)
+    grafo_pesos.agregar_arista('B', 'D', 5)
+    grafo_pesos.agregar_arista('C', 'D', 8)
+    grafo_pesos.agregar_arista('C', 'E', 10)
+    grafo_pesos.agregar_arista('D', 'E', 2)
+
+    distancias = dijkstra(grafo_pesos, 'A')
+    print(f"Distancias más cortas desde 'A': {distancias}")
+    
+    distancia, camino = dijkstra_camino(grafo_pesos, 'A', 'E')
+    print(f"Camino más corto de A a E: {camino} (distancia {distancia})")
+    
+    _, cercano, _ = dijkstra_multiorigen(grafo_pesos, ['A', 'E'])
+    print(f"Origen más cercano (A o E) para cada nodo: {cercano}")
+    print()
+
+    print("=== 5. Detección de Ciclos ===")
+
+    # Ejemplo
+    print("Detección de ciclos:")
+    grafo_ciclo = GrafoListaAdyacencia(dirigido=False)
+    grafo_ciclo.agregar_arista('A', 'B')
+    grafo_ciclo.agregar_arista('B', 'C')
+    grafo_ciclo.agregar_arista('C', 'A')  # Forma un ciclo
+
+    print(f"Grafo con ciclo: {tiene_ciclo(grafo_ciclo, dirigido=False)}")
+
+    grafo_sin_ciclo = GrafoListaAdyacencia(dirigido=False)
+    grafo_sin_ciclo.agregar_arista('A', 'B')
+    grafo_sin_ciclo.agregar_arista('B', 'C')
+    print(f"Grafo sin ciclo: {tiene_ciclo(grafo_sin_ciclo, dirigido=False)}")
+    print()
+
+    print("=== 6. Ordenamiento Topológico ===")
+
+    # Ejemplo
+    print("Ordenamiento topológico (DAG):")
+    grafo_dag = GrafoListaAdyacencia(dirigido=True)
+    grafo_dag.agregar_arista('A', 'B')
+    grafo_dag.agregar_arista('A', 'C')
+    grafo_dag.agregar_arista('B', 'D')
+    grafo_dag.agregar_arista('C', 'D')
+    grafo_dag.agregar_arista('D', 'E')
+
+    orden = ordenamiento_topologico(grafo_dag)
+    print(f"Orden topológico: {orden}")
+    print()
+
+    print("=== 7. Grafo Ponderado Completo ===")
+
+    # Ejemplo
+    print("Grafo ponderado:")
+    grafo_pond = GrafoPonderado(dirigido=False)
+    grafo_pond.agregar_arista('A', 'B', 4)
+    grafo_pond.agregar_arista('A', 'C', 2)
+    grafo_pond.agregar_arista('B', 'C', 1)
+    grafo_pond.agregar_arista('B', 'D', 5)
+    grafo_pond.agregar_arista('C', 'D', 8)
+
+    camino_min = grafo_pond.camino_minimo('A', 'D')
+    print(f"Camino mínimo de A a D: {camino_min}")
+
+    mst = grafo_pond.arbol_expansion_minima()
+    print(f"Árbol de expansión mínima: {mst}")
+
+    print(f"Camino mínimo bidireccional de A a D: {grafo_pond.camino_minimo('A', 'D', metodo='bidireccional')}")
+    lado = 150
+    inicio, destino = (lado // 4, lado // 2), (3 * lado // 4, lado // 2)
+    rejilla, coordenadas = generar_rejilla(lado, lado, despejar=(inicio, destino))
+    manhattan = heuristica_manhattan(coordenadas)
+    print(f"Rejilla {lado}x{lado} con obstáculos, A* Manhattan de (0, 0) a ({lado - 1}, {lado - 1}): "
+          f"{len(rejilla.camino_minimo((0, 0), (lado - 1, lado - 1), 'a_estrella', manhattan)) - 1} pasos")
+    print("Búsquedas punto a punto en la rejilla:")
+    comparar_caminos_punto_a_punto(rejilla, inicio, destino, coordenadas)
+    print()
+
+    print("=== 8. Grafo en Formato CSR ===")
+
+    # Ejemplo: mismas aristas que en la sección 3, ahora en arreglos contiguos
+    grafo_csr = GrafoCSR.desde_grafo(grafo_caminos)
+    print(f"Nodos: {grafo_csr.obtener_nodos()}, aristas almacenadas: {grafo_csr.num_aristas}")
+    print(f"BFS desde 'A': {grafo_csr.bfs('A')}")
+    print(f"DFS iterativo desde 'A': {grafo_csr.dfs_iterativo('A')}")
+    print(f"Componentes conexas: {grafo_csr.componentes_conexas()}")
+    
+    csr_pesos = GrafoCSR.desde_aristas([(0, 1, 4), (0, 2, 2), (1, 2, 1), (1, 3, 5), (2, 3, 8)])
+    print(f"Dijkstra sobre CSR desde 0: {dijkstra(csr_pesos, 0)}")
+    
+    aristas = [(i, (i * 7 + 1) % 10000, 1.0) for i in range(10000)]
+    grande = GrafoCSR.desde_aristas(aristas, dirigido=True)
+    print(f"Memoria CSR: {grande.memoria_bytes() / grande.num_aristas:.1f} bytes por arista")
+    
+    # Lista de aristas en texto -> CSR por bloques -> formato binario mapeable
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_texto = os.path.join(directorio, "aristas.tsv")
+        with open(ruta_texto, "w") as archivo:
+            archivo.write("# origen\tdestino\tpeso\n")
+            for u, v, peso in aristas:
+                archivo.write(f"{u}\t{v}\t{peso}\n")
+        desde_texto = GrafoCSR.desde_archivo(ruta_texto, dirigido=True)
+        ruta_binaria = os.path.join(directorio, "grafo.gcsr")
+        desde_texto.guardar(ruta_binaria)
+        resumen, cargado = medir(GrafoCSR.cargar, preparar=lambda: (ruta_binaria,),
+                                 repeticiones=3, calentamiento=0)
+        print(f"Cargado desde texto: {desde_texto.num_aristas} aristas; "
+              f"binario ({os.path.getsize(ruta_binaria)} bytes) mapeado en "
+              f"{resumen['mediana_ns'] / 1e3:.0f} µs, BFS desde 0 visita {len(cargado.bfs(0))} nodos")
+        del cargado
+    print()
+
+    print("=== 9. BFS por Niveles y Componentes (Grafos Grandes) ===")
+
+    # Ejemplo: el mismo grafo CSR de arriba, ahora con operaciones por nivel
+    niveles, padres = bfs_por_niveles(grafo_csr, 'A', con_padres=True)
+    etiquetas = grafo_csr.etiquetas
+    print(f"Niveles BFS desde 'A': {dict(zip(etiquetas, niveles.tolist()))}")
+    print(f"Padre de 'E' en el árbol BFS: {etiquetas[padres[etiquetas.index('E')]]}")
+    
+    num, etiquetas_uf = componentes_union_find(origenes=[0, 1, 3, 5], destinos=[1, 2, 4, 5],
+                                               num_nodos=7)
+    print(f"Union-find sobre aristas 0-1, 1-2, 3-4, 5-5 (7 nodos): {num} componentes, "
+          f"etiquetas {etiquetas_uf.tolist()}")
+    
+    n = 200000
+    grande = _csr_aleatorio(n)
+    for nombre, funcion in (("bfs() con cola", lambda: len(grande.bfs(0))),
+                            ("bfs_por_niveles", lambda: int((bfs_por_niveles(grande, 0) >= 0).sum())),
+                            ("componentes_union_find", lambda: componentes_union_find(grande)[0])):
+        resumen, resultado = medir(funcion, repeticiones=1, calentamiento=0)
+        print(f"  {nombre:24s} {resumen['mediana_ns'] / 1e6:9.1f} ms -> {resultado}")
+    print()
+
+    print("=== 10. Resumen de Representaciones de Grafos ===")
+    print("""
 REPRESENTACIONES DE GRAFOS:
 
 1. LISTA DE ADYACENCIA:
@@ -538,24 +1682,39 @@ REPRESENTACIONES DE GRAFOS:
    - Complejidad: O(V²) espacio, O(1) verificar arista
    - Uso: Grafos densos (muchas aristas)
 
+3. CSR (Compressed Sparse Row):
+   - Ventajas: Arreglos contiguos, ~12 bytes por arista, recorridos rápidos
+   - Desventajas: Inmutable (se construye una vez desde una lista de aristas)
+   - Complejidad: O(V + E) espacio, O(grado) vecinos de un nodo
+   - Uso: Grafos grandes de solo lectura (millones de aristas)
+   - desde_archivo() lee listas de aristas por bloques; guardar()/cargar()
+     usan un formato binario que se mapea en memoria sin volver a parsear
+
 ALGORITMOS PRINCIPALES:
 
 1. BFS (Breadth First Search):
    - Complejidad: O(V + E)
    - Usa cola
    - Encuentra camino más corto en grafos no ponderados
+   - Por niveles (NumPy): la frontera completa se expande de una vez sobre CSR
 
 2. DFS (Depth First Search):
    - Complejidad: O(V + E)
    - Usa pila (recursivo o iterativo)
    - Detecta ciclos, componentes conexas
+   - Componentes en grafos grandes: union-find vectorizado sobre la lista de aristas
 
 3. Dijkstra:
    - Complejidad: O((V + E) log V) con heap
    - Encuentra camino más corto en grafos ponderados
    - Requiere pesos no negativos
 
-4. Ordenamiento Topológico:
+4. A* y búsquedas bidireccionales:
+   - Consultas punto a punto con parada temprana
+   - A*: prioridad g + h con una heurística admisible (euclidiana, Manhattan)
+   - Bidireccional: dos búsquedas de radio ~d/2 que se encuentran en el medio
+
+5. Ordenamiento Topológico:
    - Complejidad: O(V + E)
    - Solo para DAG (grafos dirigidos acíclicos)
    - Usado en scheduling, compilación
@@ -568,3 +1727,7 @@ APLICACIONES:
 - Compiladores
 - Scheduling de tareas
 """)
+
+
+if __name__ == "__main__":
+    main()
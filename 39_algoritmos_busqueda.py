@@ -1,15 +1,19 @@
 # Archivo: 39_algoritmos_busqueda.py
 # Descripción: Algoritmos de búsqueda - Búsqueda lineal, binaria, y en strings
 
-import time
+from array import array
+from bisect import bisect_left
+import mmap
+import os
 import random
+import tempfile
+
+from algoritmos.benchmark import medir
 
-print("=== Algoritmos de Búsqueda ===\n")
 
 # =============================================================================
 # 1. BÚSQUEDA LINEAL (Linear Search)
 # =============================================================================
-print("=== 1. BÚSQUEDA LINEAL (Linear Search) ===")
 
 def busqueda_lineal(lista, objetivo):
     """
@@ -34,12 +38,6 @@ def busqueda_lineal_optimizada(lista, objetivo):
             return -1
     return -1
 
-# Ejemplo
-lista_ejemplo = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3]
-print(f"Lista: {lista_ejemplo}")
-resultado = busqueda_lineal(lista_ejemplo, 5)
-print(f"Búsqueda lineal de 5: índice {resultado}")
-print(f"Elemento encontrado: {lista_ejemplo[resultado] if resultado != -1 else 'No encontrado'}")
 
 # Búsqueda de todas las ocurrencias
 def busqueda_lineal_todas(lista, objetivo):
@@ -50,13 +48,10 @@ def busqueda_lineal_todas(lista, objetivo):
             indices.append(indice)
     return indices
 
-print(f"Todas las ocurrencias de 5: {busqueda_lineal_todas(lista_ejemplo, 5)}")
-print()
 
 # =============================================================================
 # 2. BÚSQUEDA BINARIA (Binary Search)
 # =============================================================================
-print("=== 2. BÚSQUEDA BINARIA (Binary Search) ===")
 
 def busqueda_binaria(lista, objetivo):
     """
@@ -142,19 +137,10 @@ def busqueda_binaria_ultima_ocurrencia(lista, objetivo):
     
     return resultado
 
-# Ejemplo
-lista_ordenada = sorted([3, 1, 4, 1, 5, 9, 2, 6, 5, 3])
-print(f"Lista ordenada: {lista_ordenada}")
-resultado = busqueda_binaria(lista_ordenada, 5)
-print(f"Búsqueda binaria de 5: índice {resultado}")
-print(f"Primera ocurrencia de 5: {busqueda_binaria_primera_ocurrencia(lista_ordenada, 5)}")
-print(f"Última ocurrencia de 5: {busqueda_binaria_ultima_ocurrencia(lista_ordenada, 5)}")
-print()
 
 # =============================================================================
 # 3. BÚSQUEDA EN STRINGS
 # =============================================================================
-print("=== 3. BÚSQUEDA EN STRINGS ===")
 
 def busqueda_bruta_texto(texto, patron):
     """
@@ -198,20 +184,10 @@ def busqueda_bruta_todas(texto, patron):
     
     return ocurrencias
 
-# Ejemplo
-texto = "abracadabra"
-patron = "abra"
-print(f"Texto: '{texto}'")
-print(f"Patrón: '{patron}'")
-resultado = busqueda_bruta_texto(texto, patron)
-print(f"Primera ocurrencia: índice {resultado}")
-print(f"Todas las ocurrencias: {busqueda_bruta_todas(texto, patron)}")
-print()
 
 # =============================================================================
 # 4. ALGORITMO KMP (Knuth-Morris-Pratt)
 # =============================================================================
-print("=== 4. ALGORITMO KMP (Knuth-Morris-Pratt) ===")
 
 def construir_tabla_lps(patron):
     """
@@ -302,20 +278,10 @@ def kmp_busqueda_todas(texto, patron):
     
     return ocurrencias
 
-# Ejemplo
-texto_kmp = "ABABDABACDABABCABCABAB"
-patron_kmp = "ABABCABAB"
-print(f"Texto: '{texto_kmp}'")
-print(f"Patrón: '{patron_kmp}'")
-resultado_kmp = kmp_busqueda(texto_kmp, patron_kmp)
-print(f"KMP - Primera ocurrencia: índice {resultado_kmp}")
-print(f"KMP - Todas las ocurrencias: {kmp_busqueda_todas(texto_kmp, patron_kmp)}")
-print()
 
 # =============================================================================
 # 5. COMPARACIÓN DE EFICIENCIA
 # =============================================================================
-print("=== 5. COMPARACIÓN DE EFICIENCIA ===")
 
 def comparar_busquedas_lista(lista, objetivo, ordenada=False):
     """Compara búsqueda lineal vs binaria."""
@@ -324,16 +290,16 @@ def comparar_busquedas_lista(lista, objetivo, ordenada=False):
     
     print(f"\nBuscando {objetivo} en lista de {len(lista)} elementos ({'ordenada' if ordenada else 'no ordenada'}):")
     
+    argumentos = lambda: (lista, objetivo)
+    
     # Búsqueda lineal
-    inicio = time.time()
-    resultado_lineal = busqueda_lineal(lista, objetivo)
-    tiempo_lineal = time.time() - inicio
+    resumen, resultado_lineal = medir(busqueda_lineal, argumentos)
+    tiempo_lineal = resumen["mediana_ns"] / 1e9
     
     # Búsqueda binaria (solo si está ordenada)
     if ordenada:
-        inicio = time.time()
-        resultado_binaria = busqueda_binaria(lista, objetivo)
-        tiempo_binaria = time.time() - inicio
+        resumen, resultado_binaria = medir(busqueda_binaria, argumentos)
+        tiempo_binaria = resumen["mediana_ns"] / 1e9
         
         print(f"  Búsqueda lineal: {tiempo_lineal*1000:.4f} ms (índice: {resultado_lineal})")
         print(f"  Búsqueda binaria: {tiempo_binaria*1000:.4f} ms (índice: {resultado_binaria})")
@@ -342,44 +308,30 @@ def comparar_busquedas_lista(lista, objetivo, ordenada=False):
         print(f"  Búsqueda lineal: {tiempo_lineal*1000:.4f} ms (índice: {resultado_lineal})")
         print(f"  (Búsqueda binaria requiere lista ordenada)")
 
-# Comparación con diferentes tamaños
-for tamaño in [100, 1000, 10000]:
-    lista_grande = list(range(tamaño))
-    objetivo = tamaño // 2
-    comparar_busquedas_lista(lista_grande, objetivo, ordenada=True)
-
-print()
 
 def comparar_busquedas_texto(texto, patron):
     """Compara búsqueda bruta vs KMP."""
     print(f"\nBuscando '{patron}' en texto de {len(texto)} caracteres:")
     
+    argumentos = lambda: (texto, patron)
+    
     # Fuerza bruta
-    inicio = time.time()
-    resultado_bruta = busqueda_bruta_texto(texto, patron)
-    tiempo_bruta = time.time() - inicio
+    resumen, resultado_bruta = medir(busqueda_bruta_texto, argumentos)
+    tiempo_bruta = resumen["mediana_ns"] / 1e9
     
     # KMP
-    inicio = time.time()
-    resultado_kmp = kmp_busqueda(texto, patron)
-    tiempo_kmp = time.time() - inicio
+    resumen, resultado_kmp = medir(kmp_busqueda, argumentos)
+    tiempo_kmp = resumen["mediana_ns"] / 1e9
     
     print(f"  Fuerza bruta: {tiempo_bruta*1000:.4f} ms (índice: {resultado_bruta})")
     print(f"  KMP: {tiempo_kmp*1000:.4f} ms (índice: {resultado_kmp})")
     if tiempo_kmp > 0:
         print(f"  Mejora: {tiempo_bruta/tiempo_kmp:.2f}x más rápido")
 
-# Comparación con texto largo
-texto_largo = "AB" * 1000 + "CD" * 1000
-patron_largo = "ABCD" * 10
-comparar_busquedas_texto(texto_largo, patron_largo)
-
-print()
 
 # =============================================================================
 # 6. BÚSQUEDA EN LISTA ORDENADA (funciones útiles)
 # =============================================================================
-print("=== 6. FUNCIONES ÚTILES PARA LISTAS ORDENADAS ===")
 
 def encontrar_posicion_insercion(lista, objetivo):
     """
@@ -410,16 +362,512 @@ def contar_ocurrencias(lista_ordenada, objetivo):
     ultima = busqueda_binaria_ultima_ocurrencia(lista_ordenada, objetivo)
     return ultima - primera + 1
 
-# Ejemplo
-lista_con_duplicados = [1, 2, 2, 2, 3, 3, 4, 5, 5, 5, 5, 6]
-print(f"Lista: {lista_con_duplicados}")
-print(f"Posición para insertar 3: {encontrar_posicion_insercion(lista_con_duplicados, 3)}")
-print(f"Cantidad de 5s: {contar_ocurrencias(lista_con_duplicados, 5)}")
-print()
 
-# Resumen
-print("=== RESUMEN ===")
-print("""
+# =============================================================================
+# 7. BÚSQUEDA POR LOTES CON NUMPY
+# =============================================================================
+
+# A partir de este tamaño (arreglo y consultas) conviene ordenar las consultas:
+# búsquedas consecutivas tocan zonas cercanas del arreglo y aprovechan la caché
+UMBRAL_ORDENAR_CONSULTAS = 1 << 16
+
+def _posiciones_lote(arreglo, objetivos, lado):
+    """
+    np.searchsorted para todas las consultas a la vez. Con muchas consultas
+    sobre un arreglo grande se ordenan primero y luego se devuelven las
+    posiciones en el orden original.
+    Retorna (arreglo, objetivos, posiciones) como arreglos de NumPy.
+    """
+    import numpy as np
+    
+    arreglo = np.asarray(arreglo)
+    objetivos = np.asarray(objetivos)
+    if arreglo.ndim != 1:
+        raise ValueError("El arreglo ordenado debe ser unidimensional")
+    
+    planos = objetivos.ravel()
+    if (len(arreglo) >= UMBRAL_ORDENAR_CONSULTAS and len(planos) >= UMBRAL_ORDENAR_CONSULTAS
+            and not np.all(planos[:-1] <= planos[1:])):
+        orden = np.argsort(planos, kind="stable")
+        posiciones = np.empty(len(planos), dtype=np.intp)
+        posiciones[orden] = np.searchsorted(arreglo, planos[orden], side=lado)
+        posiciones = posiciones.reshape(objetivos.shape)
+    else:
+        posiciones = np.searchsorted(arreglo, objetivos, side=lado)
+    return arreglo, objetivos, posiciones
+
+def _coinciden(arreglo, objetivos, posiciones):
+    """True donde arreglo[posicion] existe y es igual al objetivo."""
+    import numpy as np
+    
+    if len(arreglo) == 0:
+        return np.zeros(np.shape(posiciones), dtype=bool)
+    dentro = posiciones < len(arreglo)
+    return dentro & (arreglo[np.where(dentro, posiciones, 0)] == objetivos)
+
+def posicion_insercion_lote(arreglo, objetivos, lado="izquierda"):
+    """
+    Versión por lotes de encontrar_posicion_insercion(): una posición de
+    inserción por objetivo. lado="derecha" equivale a bisect_right.
+    Complejidad: O(m log n) en C para m consultas
+    """
+    if lado not in ("izquierda", "derecha"):
+        raise ValueError("lado debe ser 'izquierda' o 'derecha'")
+    return _posiciones_lote(arreglo, objetivos, "left" if lado == "izquierda" else "right")[2]
+
+def primera_ocurrencia_lote(arreglo, objetivos):
+    """
+    Versión por lotes de busqueda_binaria_primera_ocurrencia(): índice de
+    la primera ocurrencia de cada objetivo, o -1 si no está.
+    """
+    import numpy as np
+    
+    arreglo, objetivos, posiciones = _posiciones_lote(arreglo, objetivos, "left")
+    return np.where(_coinciden(arreglo, objetivos, posiciones), posiciones, -1)
+
+def ultima_ocurrencia_lote(arreglo, objetivos):
+    """
+    Versión por lotes de busqueda_binaria_ultima_ocurrencia(): índice de
+    la última ocurrencia de cada objetivo, o -1 si no está.
+    """
+    import numpy as np
+    
+    arreglo, objetivos, posiciones = _posiciones_lote(arreglo, objetivos, "right")
+    posiciones -= 1
+    encontrados = (posiciones >= 0) & _coinciden(arreglo, objetivos, np.maximum(posiciones, 0))
+    return np.where(encontrados, posiciones, -1)
+
+def contar_ocurrencias_lote(arreglo, objetivos):
+    """
+    Versión por lotes de contar_ocurrencias(): la diferencia entre la
+    posición de inserción por la derecha y por la izquierda.
+    """
+    arreglo, objetivos, izquierda = _posiciones_lote(arreglo, objetivos, "left")
+    return _posiciones_lote(arreglo, objetivos, "right")[2] - izquierda
+
+# Con lista ordenada, la búsqueda binaria por lotes retorna la primera ocurrencia
+busqueda_binaria_lote = primera_ocurrencia_lote
+
+
+# =============================================================================
+# 8. BÚSQUEDA POR INTERPOLACIÓN Y EXPONENCIAL
+# =============================================================================
+
+def busqueda_interpolacion(lista, objetivo):
+    """
+    Búsqueda por interpolación: en vez de mirar el medio, estima dónde
+    debería estar el objetivo suponiendo que los valores crecen de forma
+    pareja entre lista[izquierda] y lista[derecha].
+    Complejidad: O(log log n) con valores uniformes; O(n) en el peor caso
+    REQUIERE lista ordenada de números
+    """
+    izquierda = 0
+    derecha = len(lista) - 1
+    
+    while izquierda <= derecha and lista[izquierda] <= objetivo <= lista[derecha]:
+        if lista[derecha] == lista[izquierda]:
+            return izquierda  # Todo el rango vale lo mismo (y es el objetivo)
+        
+        posicion = izquierda + int((objetivo - lista[izquierda]) * (derecha - izquierda)
+                                   // (lista[derecha] - lista[izquierda]))
+        if lista[posicion] == objetivo:
+            return posicion
+        elif lista[posicion] < objetivo:
+            izquierda = posicion + 1
+        else:
+            derecha = posicion - 1
+    
+    return -1
+
+def busqueda_exponencial(lista, objetivo):
+    """
+    Búsqueda exponencial (galloping): duplica el límite 1, 2, 4, 8, ...
+    hasta pasar al objetivo y luego hace búsqueda binaria solo en el último
+    tramo. No usa len(), así que sirve para secuencias no acotadas (basta
+    con que lista[i] lance IndexError al salirse del final).
+    Retorna la primera ocurrencia o -1.
+    Complejidad: O(log i), donde i es la posición del objetivo
+    """
+    # Galope: buscar un límite con lista[limite] >= objetivo
+    anterior = -1
+    limite = 0
+    while True:
+        try:
+            valor = lista[limite]
+        except IndexError:
+            break
+        if valor >= objetivo:
+            break
+        anterior = limite
+        limite = 2 * limite + 1
+    
+    # Búsqueda binaria de la primera posición >= objetivo en (anterior, limite]
+    izquierda, derecha = anterior + 1, limite
+    while izquierda < derecha:
+        medio = (izquierda + derecha) // 2
+        try:
+            menor = lista[medio] < objetivo
+        except IndexError:
+            menor = False  # Más allá del final: tratar como "mayor"
+        if menor:
+            izquierda = medio + 1
+        else:
+            derecha = medio
+    
+    try:
+        return izquierda if lista[izquierda] == objetivo else -1
+    except IndexError:
+        return -1
+
+
+# =============================================================================
+# 9. KMP SOBRE ARCHIVOS (mmap y bloques)
+# =============================================================================
+
+def _patron_en_bytes(patron):
+    """Los archivos se recorren como bytes: los patrones str se codifican en UTF-8."""
+    if isinstance(patron, str):
+        patron = patron.encode("utf-8")
+    if not patron:
+        raise ValueError("El patrón no puede ser vacío")
+    return bytes(patron)
+
+def _kmp_buffer(buffer, inicio, fin, patron, lps, j, desplazamiento):
+    """
+    Avanza el autómata de KMP sobre buffer[inicio:fin] (bytes o mmap, sin
+    copiarlo) partiendo del estado j (caracteres del patrón ya reconocidos).
+    Genera la posición absoluta (desplazamiento + índice) de cada
+    ocurrencia y retorna el estado final, para continuar en el bloque
+    siguiente.
+    
+    Mientras j == 0 ningún carácter anterior sirve, así que se salta hasta
+    la próxima ocurrencia completa con buffer.find() (en C); el paso
+    carácter a carácter de KMP solo corre dentro de coincidencias parciales.
+    """
+    m = len(patron)
+    i = inicio
+    while i < fin:
+        if j == 0:
+            posicion = buffer.find(patron, i, fin)
+            if posicion >= 0:
+                yield desplazamiento + posicion
+                i = posicion + m
+                j = lps[m - 1]
+                continue
+            # Sin ocurrencias completas: solo los últimos m - 1 caracteres
+            # pueden dejar una coincidencia parcial para el bloque siguiente
+            i = max(i, fin - m + 1)
+            if i >= fin:
+                break
+        
+        caracter = buffer[i]
+        while j > 0 and caracter != patron[j]:
+            j = lps[j - 1]
+        if caracter == patron[j]:
+            j += 1
+            if j == m:
+                yield desplazamiento + i - m + 1
+                j = lps[m - 1]
+        i += 1
+    return j
+
+def kmp_busqueda_bloques(bloques, patron):
+    """
+    KMP en flujo: recorre un iterable de bloques de bytes (lecturas de un
+    archivo, de un socket, ...) y genera las posiciones de las ocurrencias
+    a medida que aparecen. El estado del autómata pasa de un bloque al
+    siguiente, así que se encuentran las ocurrencias partidas entre bloques.
+    """
+    patron = _patron_en_bytes(patron)
+    lps = construir_tabla_lps(patron)
+    j = 0
+    desplazamiento = 0
+    for bloque in bloques:
+        j = yield from _kmp_buffer(bloque, 0, len(bloque), patron, lps, j, desplazamiento)
+        desplazamiento += len(bloque)
+
+def kmp_busqueda_archivo(ruta, patron, tamanio_bloque=None):
+    """
+    Busca un patrón en un archivo sin cargarlo en memoria y genera los
+    desplazamientos en bytes de cada ocurrencia a medida que los encuentra.
+    
+    - tamanio_bloque=None: el archivo se mapea con mmap y KMP lo recorre
+      directamente; el sistema operativo trae las páginas según se leen.
+    - tamanio_bloque=n: se lee de a n bytes (sirve también para archivos
+      que no se pueden mapear, como tuberías).
+    """
+    patron = _patron_en_bytes(patron)
+    with open(ruta, "rb") as archivo:
+        if tamanio_bloque is not None:
+            yield from kmp_busqueda_bloques(iter(lambda: archivo.read(tamanio_bloque), b""), patron)
+            return
+        
+        tamanio = os.fstat(archivo.fileno()).st_size
+        if tamanio == 0:
+            return  # mmap no admite archivos vacíos
+        with mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            yield from _kmp_buffer(mapa, 0, tamanio, patron, construir_tabla_lps(patron), 0, 0)
+
+def _kmp_en_rango(ruta, patron, inicio, fin):
+    """
+    Se ejecuta en un proceso hijo: ocurrencias que EMPIEZAN en [inicio, fin).
+    Lee hasta fin + m - 1 para completar las que cruzan el límite; las que
+    empiezan antes de 'inicio' son del rango anterior.
+    """
+    lps = construir_tabla_lps(patron)
+    with open(ruta, "rb") as archivo, mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        limite = min(fin + len(patron) - 1, len(mapa))
+        return array('q', _kmp_buffer(mapa, inicio, limite, patron, lps, 0, 0))
+
+def kmp_busqueda_archivo_paralelo(ruta, patron, procesos=None):
+    """
+    Versión para archivos de varios GB: divide el archivo en un rango por
+    proceso y cada uno lo recorre con su propio mmap. Cada rango se lee
+    con m - 1 bytes de solapamiento para no perder las ocurrencias que
+    cruzan de un rango al siguiente.
+    Genera los desplazamientos en orden, rango por rango.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    patron = _patron_en_bytes(patron)
+    procesos = procesos or os.cpu_count() or 1
+    tamanio = os.path.getsize(ruta)
+    if tamanio == 0:
+        return
+    
+    paso = -(-tamanio // procesos)
+    limites = list(range(0, tamanio, paso)) + [tamanio]
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        tareas = [ejecutor.submit(_kmp_en_rango, ruta, patron, inicio, fin)
+                  for inicio, fin in zip(limites, limites[1:])]
+        for tarea in tareas:
+            yield from tarea.result()
+
+
+
+def _lista_y_objetivo(n):
+    """Lista ordenada de n elementos y un objetivo aleatorio presente en ella."""
+    lista = sorted(random.sample(range(n * 10), n))
+    return lista, random.choice(lista)
+
+
+def _lote_de_consultas(n):
+    """Lista ordenada de n elementos (también como arreglo) y n consultas al azar."""
+    import numpy as np
+    
+    lista = sorted(random.sample(range(n * 10), n))
+    consultas = np.array([random.randrange(n * 10) for _ in range(n)])
+    return lista, np.array(lista), consultas
+
+def _consultas_una_a_una(funcion):
+    """Aplica una búsqueda escalar a cada consulta del lote."""
+    return lambda lista, arreglo, consultas: [funcion(lista, x) for x in consultas.tolist()]
+
+def _primera_con_bisect(lista, objetivo):
+    """Primera ocurrencia con bisect_left (la búsqueda binaria en C de la biblioteca estándar)."""
+    i = bisect_left(lista, objetivo)
+    return i if i < len(lista) and lista[i] == objetivo else -1
+
+def _verificar_lote(posiciones, lista, arreglo, consultas):
+    """Compara las primeras 1000 respuestas con la búsqueda escalar."""
+    muestra = consultas[:1000].tolist()
+    return [int(p) for p in posiciones[:1000]] == [busqueda_binaria_primera_ocurrencia(lista, x)
+                                                   for x in muestra]
+
+
+# Familias para el sistema de benchmarks (python -m algoritmos.benchmark)
+BENCHMARKS = {
+    "busqueda_lista": {
+        "implementaciones": {
+            "busqueda_lineal": busqueda_lineal,
+            "busqueda_lineal_optimizada": busqueda_lineal_optimizada,
+            "busqueda_binaria": busqueda_binaria,
+            "busqueda_binaria_recursiva": busqueda_binaria_recursiva,
+            "busqueda_binaria_primera_ocurrencia": busqueda_binaria_primera_ocurrencia,
+        },
+        "entrada": _lista_y_objetivo,
+        "tamanios": [1000, 100000, 1000000],
+        "verificar": lambda indice, lista, objetivo: lista[indice] == objetivo,
+    },
+    "busqueda_uniforme": {
+        "implementaciones": {
+            "busqueda_binaria": busqueda_binaria,
+            "busqueda_interpolacion": busqueda_interpolacion,
+            "busqueda_exponencial": busqueda_exponencial,
+        },
+        "entrada": _lista_y_objetivo,
+        "tamanios": [1000, 100000, 1000000],
+        "verificar": lambda indice, lista, objetivo: lista[indice] == objetivo,
+    },
+    "busqueda_lote": {
+        "implementaciones": {
+            "busqueda_binaria_primera_ocurrencia": _consultas_una_a_una(busqueda_binaria_primera_ocurrencia),
+            "bisect_left": _consultas_una_a_una(_primera_con_bisect),
+            "busqueda_binaria_lote": lambda lista, arreglo, consultas:
+                busqueda_binaria_lote(arreglo, consultas),
+        },
+        "entrada": _lote_de_consultas,
+        "tamanios": [1000, 100000, 1000000],
+        "limites": {"busqueda_binaria_primera_ocurrencia": 100000, "bisect_left": 100000},
+        "verificar": _verificar_lote,
+    },
+    "busqueda_texto": {
+        "implementaciones": {
+            "busqueda_bruta_texto": busqueda_bruta_texto,
+            "kmp_busqueda": kmp_busqueda,
+        },
+        "entrada": lambda n: ("AB" * n + "ABCD", "AB" * 10 + "ABCD"),
+        "tamanios": [1000, 10000, 100000],
+        "verificar": lambda indice, texto, patron: texto[indice:indice + len(patron)] == patron,
+    },
+}
+
+
+def main():
+    """Ejecuta los ejemplos y comparaciones del módulo."""
+    print("=== Algoritmos de Búsqueda ===\n")
+
+    print("=== 1. BÚSQUEDA LINEAL (Linear Search) ===")
+
+    # Ejemplo
+    lista_ejemplo = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3]
+    print(f"Lista: {lista_ejemplo}")
+    resultado = busqueda_lineal(lista_ejemplo, 5)
+    print(f"Búsqueda lineal de 5: índice {resultado}")
+    print(f"Elemento encontrado: {lista_ejemplo[resultado] if resultado != -1 else 'No encontrado'}")
+
+    print(f"Todas las ocurrencias de 5: {busqueda_lineal_todas(lista_ejemplo, 5)}")
+    print()
+
+    print("=== 2. BÚSQUEDA BINARIA (Binary Search) ===")
+
+    # Ejemplo
+    lista_ordenada = sorted([3, 1, 4, 1, 5, 9, 2, 6, 5, 3])
+    print(f"Lista ordenada: {lista_ordenada}")
+    resultado = busqueda_binaria(lista_ordenada, 5)
+    print(f"Búsqueda binaria de 5: índice {resultado}")
+    print(f"Primera ocurrencia de 5: {busqueda_binaria_primera_ocurrencia(lista_ordenada, 5)}")
+    print(f"Última ocurrencia de 5: {busqueda_binaria_ultima_ocurrencia(lista_ordenada, 5)}")
+    print()
+
+    print("=== 3. BÚSQUEDA EN STRINGS ===")
+
+    # Ejemplo
+    texto = "abracadabra"
+    patron = "abra"
+    print(f"Texto: '{texto}'")
+    print(f"Patrón: '{patron}'")
+    resultado = busqueda_bruta_texto(texto, patron)
+    print(f"Primera ocurrencia: índice {resultado}")
+    print(f"Todas las ocurrencias: {busqueda_bruta_todas(texto, patron)}")
+    print()
+
+    print("=== 4. ALGORITMO KMP (Knuth-Morris-Pratt) ===")
+
+    # Ejemplo
+    texto_kmp = "ABABDABACDABABCABCABAB"
+    patron_kmp = "ABABCABAB"
+    print(f"Texto: '{texto_kmp}'")
+    print(f"Patrón: '{patron_kmp}'")
+    resultado_kmp = kmp_busqueda(texto_kmp, patron_kmp)
+    print(f"KMP - Primera ocurrencia: índice {resultado_kmp}")
+    print(f"KMP - Todas las ocurrencias: {kmp_busqueda_todas(texto_kmp, patron_kmp)}")
+    print()
+
+    print("=== 5. COMPARACIÓN DE EFICIENCIA ===")
+
+    # Comparación con diferentes tamaños
+    for tamaño in [100, 1000, 10000]:
+        lista_grande = list(range(tamaño))
+        objetivo = tamaño // 2
+        comparar_busquedas_lista(lista_grande, objetivo, ordenada=True)
+
+    print()
+
+    # Comparación con texto largo
+    texto_largo = "AB" * 1000 + "CD" * 1000
+    patron_largo = "ABCD" * 10
+    comparar_busquedas_texto(texto_largo, patron_largo)
+
+    print()
+
+    print("=== 6. FUNCIONES ÚTILES PARA LISTAS ORDENADAS ===")
+
+    # Ejemplo
+    lista_con_duplicados = [1, 2, 2, 2, 3, 3, 4, 5, 5, 5, 5, 6]
+    print(f"Lista: {lista_con_duplicados}")
+    print(f"Posición para insertar 3: {encontrar_posicion_insercion(lista_con_duplicados, 3)}")
+    print(f"Cantidad de 5s: {contar_ocurrencias(lista_con_duplicados, 5)}")
+    print()
+
+    print("=== 7. BÚSQUEDA POR LOTES CON NUMPY ===")
+
+    # Ejemplo: todas las consultas en una sola llamada
+    consultas = [0, 2, 3, 5, 7]
+    print(f"Consultas: {consultas}")
+    print(f"Primera ocurrencia: {primera_ocurrencia_lote(lista_con_duplicados, consultas).tolist()}")
+    print(f"Última ocurrencia: {ultima_ocurrencia_lote(lista_con_duplicados, consultas).tolist()}")
+    print(f"Cantidad: {contar_ocurrencias_lote(lista_con_duplicados, consultas).tolist()}")
+    print(f"Posición de inserción: {posicion_insercion_lote(lista_con_duplicados, consultas).tolist()}")
+    
+    lista, arreglo, consultas = _lote_de_consultas(200000)
+    for nombre, funcion in (("una a una (busqueda_binaria_primera_ocurrencia)",
+                             _consultas_una_a_una(busqueda_binaria_primera_ocurrencia)),
+                            ("busqueda_binaria_lote", lambda lista, arreglo, consultas:
+                             busqueda_binaria_lote(arreglo, consultas))):
+        resumen, _ = medir(funcion, lambda: (lista, arreglo, consultas), repeticiones=1, calentamiento=0)
+        print(f"  {len(consultas)} consultas, {nombre}: {resumen['mediana_ns'] / 1e6:.1f} ms")
+    print()
+
+    print("=== 8. BÚSQUEDA POR INTERPOLACIÓN Y EXPONENCIAL ===")
+
+    # Ejemplo
+    uniforme = list(range(0, 1000, 7))
+    print(f"Lista uniforme 0, 7, 14, ..., {uniforme[-1]}")
+    print(f"Interpolación de 693: índice {busqueda_interpolacion(uniforme, 693)}")
+    print(f"Exponencial de 693: índice {busqueda_exponencial(uniforme, 693)}")
+    
+    class Cuadrados:
+        """Secuencia sin fin: cuadrados[i] = i²."""
+        def __getitem__(self, i):
+            return i * i
+    
+    print(f"Exponencial en la secuencia no acotada de cuadrados, 10⁸: índice "
+          f"{busqueda_exponencial(Cuadrados(), 10 ** 8)}")
+    print()
+
+    print("=== 9. KMP SOBRE ARCHIVOS (mmap y bloques) ===")
+
+    # Ejemplo: un log de ~6 MB con una sola línea de error en el medio
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "servicio.log")
+        linea = b"2026-10-18 INFO servicio=pagos latencia=12ms usuario=1234\n"
+        with open(ruta, "wb") as archivo:
+            archivo.write(linea * 50000)
+            archivo.write(b"2026-10-18 ERROR servicio=pagos fallo critico\n")
+            archivo.write(linea * 50000)
+        print(f"Archivo de {os.path.getsize(ruta) / 1e6:.1f} MB")
+        
+        def cargando_todo(ruta, patron):
+            with open(ruta, encoding="utf-8") as archivo:
+                return kmp_busqueda_todas(archivo.read(), patron)
+        
+        for nombre, funcion in (("leyendo todo a un str", cargando_todo),
+                                ("mmap", lambda ruta, patron: list(kmp_busqueda_archivo(ruta, patron))),
+                                ("bloques de 1 MB", lambda ruta, patron:
+                                    list(kmp_busqueda_archivo(ruta, patron, tamanio_bloque=1 << 20))),
+                                ("2 procesos", lambda ruta, patron:
+                                    list(kmp_busqueda_archivo_paralelo(ruta, patron, procesos=2)))):
+            resumen, posiciones = medir(funcion, lambda: (ruta, "fallo critico"), repeticiones=1, calentamiento=0)
+            print(f"  {nombre:22s} {resumen['mediana_ns'] / 1e6:9.1f} ms -> {posiciones}")
+    
+    # En flujo: el patrón queda partido entre dos bloques
+    print(f"Bloques [b'xxABA', b'BAByy']: {list(kmp_busqueda_bloques([b'xxABA', b'BAByy'], 'ABAB'))}")
+    print()
+
+    # Resumen
+    print("=== RESUMEN ===")
+    print("""
 Algoritmos de búsqueda implementados:
 
 1. Búsqueda Lineal (O(n)):
@@ -440,8 +888,24 @@ Algoritmos de búsqueda implementados:
    - Posición de inserción
    - Conteo de ocurrencias en lista ordenada
 
+5. Búsqueda por lotes (NumPy):
+   - Millones de consultas en una llamada a searchsorted
+   - Variantes: primera/última ocurrencia, conteo, posición de inserción
+
+6. Interpolación (O(log log n) con datos uniformes) y exponencial
+   (O(log i), para secuencias no acotadas)
+
+7. KMP sobre archivos:
+   - mmap o bloques de bytes, con el estado del autómata entre bloques
+   - Posiciones en bytes generadas a medida que aparecen
+   - Versión paralela: un rango por proceso con m - 1 bytes de solapamiento
+
 Recomendaciones:
 - Usar búsqueda lineal para listas pequeñas (< 100 elementos)
 - Usar búsqueda binaria para listas grandes y ordenadas
 - Usar KMP para búsquedas repetidas de patrones en texto largo
 """)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,40 @@
 # Archivo: 40_tablas_hash.py
 # Descripción: Estructuras de datos - Tablas Hash (Hash Tables)
 
-print("=== Estructuras de Datos: Tablas Hash ===\n")
+import gc
+import random
+import time
+from array import array
+
+from algoritmos.benchmark import medir, resumir
 
 # =============================================================================
 # 1. TABLA HASH BÁSICA (Hash Table)
 # =============================================================================
-print("=== 1. Tabla Hash Básica ===")
 
 class TablaHash:
-    """Implementación básica de una tabla hash usando listas (chaining)."""
+    """
+    Implementación básica de una tabla hash usando listas (chaining).
+
+    Al superar el factor de carga 0.75 la capacidad se duplica. Con
+    incremental=True (por defecto) no se rehashea todo de golpe: se conservan
+    la tabla vieja y la nueva, y cada operación migra unos pocos buckets
+    hasta terminar, así ninguna operación paga el costo completo.
+    Los buckets se crean al primer uso (None = bucket vacío).
+    """
     
-    def __init__(self, capacidad=16):
+    # Buckets viejos que migra cada operación. Con 2 o más la migración
+    # termina antes de que la tabla nueva necesite crecer otra vez.
+    MIGRAR_POR_OPERACION = 8
+    
+    def __init__(self, capacidad=16, incremental=True):
         """Inicializa la tabla hash con una capacidad predeterminada."""
         self.capacidad = capacidad
-        self.tabla = [[] for _ in range(capacidad)]
+        self.tabla = [None] * capacidad
         self.tamaño = 0
+        self.incremental = incremental
+        self._tabla_vieja = None  # Tabla en migración (o None)
+        self._migrados = 0        # Buckets viejos ya movidos a self.tabla
     
     def _hash(self, clave):
         """
@@ -24,19 +43,43 @@ class TablaHash:
         """
         return hash(clave) % self.capacidad
     
+    def _ubicar(self, clave):
+        """
+        Retorna (tabla, índice) del bucket donde vive o viviría la clave:
+        la tabla vieja si su bucket aún no se migró, o la nueva.
+        """
+        vieja = self._tabla_vieja
+        if vieja is not None:
+            indice = hash(clave) % len(vieja)
+            if indice >= self._migrados:
+                return vieja, indice
+        return self.tabla, self._hash(clave)
+    
+    def _bucket(self, clave):
+        """Bucket de la clave (una tupla vacía si aún no existe)."""
+        if self._tabla_vieja is not None:
+            self._migrar(self.MIGRAR_POR_OPERACION)
+        tabla, indice = self._ubicar(clave)
+        return tabla[indice] or ()
+    
     def insertar(self, clave, valor):
         """Inserta un par clave-valor en la tabla hash."""
-        indice = self._hash(clave)
-        bucket = self.tabla[indice]
-        
-        # Buscar si la clave ya existe
-        for i, (k, v) in enumerate(bucket):
-            if k == clave:
-                bucket[i] = (clave, valor)  # Actualizar valor existente
-                return
+        if self._tabla_vieja is not None:
+            self._migrar(self.MIGRAR_POR_OPERACION)
+        tabla, indice = self._ubicar(clave)
+        bucket = tabla[indice]
         
-        # Si no existe, agregar nuevo
-        bucket.append((clave, valor))
+        if bucket is None:
+            tabla[indice] = [(clave, valor)]
+        else:
+            # Buscar si la clave ya existe
+            for i, (k, v) in enumerate(bucket):
+                if k == clave:
+                    bucket[i] = (clave, valor)  # Actualizar valor existente
+                    return
+            
+            # Si no existe, agregar nuevo
+            bucket.append((clave, valor))
         self.tamaño += 1
         
         # Redimensionar si la carga es alta (factor de carga > 0.75)
@@ -45,10 +88,7 @@ class TablaHash:
     
     def obtener(self, clave, valor_por_defecto=None):
         """Obtiene el valor asociado a una clave."""
-        indice = self._hash(clave)
-        bucket = self.tabla[indice]
-        
-        for k, v in bucket:
+        for k, v in self._bucket(clave):
             if k == clave:
                 return v
         
@@ -56,8 +96,7 @@ class TablaHash:
     
     def eliminar(self, clave):
         """Elimina un par clave-valor de la tabla hash."""
-        indice = self._hash(clave)
-        bucket = self.tabla[indice]
+        bucket = self._bucket(clave)
         
         for i, (k, v) in enumerate(bucket):
             if k == clave:
@@ -69,66 +108,81 @@ class TablaHash:
     
     def existe(self, clave):
         """Verifica si una clave existe en la tabla hash."""
-        indice = self._hash(clave)
-        bucket = self.tabla[indice]
-        
-        for k, v in bucket:
+        for k, v in self._bucket(clave):
             if k == clave:
                 return True
         
         return False
     
     def _redimensionar(self):
-        """Redimensiona la tabla hash cuando está demasiado cargada."""
-        vieja_tabla = self.tabla
+        """
+        Duplica la capacidad. En modo incremental solo crea la tabla nueva
+        y deja que _migrar() mueva los buckets viejos de a poco; si no,
+        los mueve todos ahora.
+        """
+        if self._tabla_vieja is not None:
+            self._migrar(len(self._tabla_vieja))  # Terminar la migración previa
+        
+        self._tabla_vieja = self.tabla
+        self._migrados = 0
         self.capacidad *= 2
-        self.tabla = [[] for _ in range(self.capacidad)]
-        self.tamaño = 0
+        self.tabla = [None] * self.capacidad
+        
+        if not self.incremental:
+            self._migrar(len(self._tabla_vieja))
+    
+    def _migrar(self, cantidad):
+        """Mueve hasta 'cantidad' buckets de la tabla vieja a la nueva."""
+        vieja, tabla, capacidad = self._tabla_vieja, self.tabla, self.capacidad
+        inicio = self._migrados
+        fin = min(inicio + cantidad, len(vieja))
+        
+        for i in range(inicio, fin):
+            bucket = vieja[i]
+            if bucket:
+                for par in bucket:
+                    indice = hash(par[0]) % capacidad
+                    if tabla[indice] is None:
+                        tabla[indice] = [par]
+                    else:
+                        tabla[indice].append(par)
+            vieja[i] = None  # Liberar el bucket viejo de inmediato
         
-        # Reinsertar todos los elementos
-        for bucket in vieja_tabla:
-            for clave, valor in bucket:
-                self.insertar(clave, valor)
+        self._migrados = fin
+        if fin == len(vieja):
+            self._tabla_vieja = None
+    
+    def migrando(self):
+        """Indica si hay una migración incremental en curso."""
+        return self._tabla_vieja is not None
     
     def obtener_todos(self):
         """Obtiene todos los pares clave-valor."""
         elementos = []
+        if self._tabla_vieja is not None:
+            for bucket in self._tabla_vieja[self._migrados:]:
+                if bucket:
+                    elementos.extend(bucket)
         for bucket in self.tabla:
-            elementos.extend(bucket)
+            if bucket:
+                elementos.extend(bucket)
         return elementos
     
     def mostrar(self):
         """Muestra el contenido de la tabla hash."""
         print(f"Tabla Hash (capacidad: {self.capacidad}, tamaño: {self.tamaño}):")
+        if self._tabla_vieja is not None:
+            print(f"  (migrando: {self._migrados}/{len(self._tabla_vieja)} buckets viejos movidos)")
+            for i in range(self._migrados, len(self._tabla_vieja)):
+                if self._tabla_vieja[i]:
+                    print(f"  vieja[{i}]: {self._tabla_vieja[i]}")
         for i, bucket in enumerate(self.tabla):
             if bucket:
                 print(f"  [{i}]: {bucket}")
 
-# Ejemplo
-print("Creando tabla hash:")
-hash_table = TablaHash(capacidad=8)
-
-# Insertar elementos
-hash_table.insertar("nombre", "Juan")
-hash_table.insertar("edad", 25)
-hash_table.insertar("ciudad", "Bogotá")
-hash_table.insertar("profesion", "Ingeniero")
-
-hash_table.mostrar()
-print(f"\nObtener 'edad': {hash_table.obtener('edad')}")
-print(f"Existe 'ciudad': {hash_table.existe('ciudad')}")
-print(f"Existe 'pais': {hash_table.existe('pais')}")
-
-# Eliminar
-hash_table.eliminar("profesion")
-print(f"\nDespués de eliminar 'profesion':")
-hash_table.mostrar()
-print()
-
 # =============================================================================
 # 2. FUNCIONES HASH PERSONALIZADAS
 # =============================================================================
-print("=== 2. Funciones Hash Personalizadas ===")
 
 def hash_simple(clave, capacidad):
     """Función hash simple para strings (suma de códigos ASCII)."""
@@ -149,27 +203,10 @@ def hash_division(clave, capacidad):
     """Función hash por división (módulo)."""
     return hash(clave) % capacidad
 
-# Ejemplo
-claves = ["apple", "banana", "cherry", "date", "elderberry"]
-capacidad = 10
-
-print(f"Claves: {claves}")
-print("\nDistribución con diferentes funciones hash:")
-print("  Índice | Hash Simple | Hash DJB2 | Hash División")
-print("  " + "-" * 50)
-
-for clave in claves:
-    idx1 = hash_simple(clave, capacidad)
-    idx2 = hash_djb2(clave, capacidad)
-    idx3 = hash_division(clave, capacidad)
-    print(f"  {clave:10s} | {idx1:11d} | {idx2:9d} | {idx3:14d}")
-
-print()
 
 # =============================================================================
 # 3. MANEJO DE COLISIONES
 # =============================================================================
-print("=== 3. Manejo de Colisiones ===")
 
 class TablaHashOpenAddressing:
     """
@@ -257,27 +294,194 @@ class TablaHashOpenAddressing:
                 else:
                     print(f"  [{i}]: {elemento}")
 
-# Ejemplo
-print("Tabla Hash con Open Addressing (Linear Probing):")
-hash_open = TablaHashOpenAddressing(capacidad=8)
 
-hash_open.insertar("a", 1)
-hash_open.insertar("b", 2)
-hash_open.insertar("c", 3)
-hash_open.insertar("d", 4)
+class TablaHashRobinHood:
+    """
+    Tabla hash con direccionamiento abierto y hashing Robin Hood.
+
+    Cada posición guarda la distancia de sondeo de su elemento (cuántos
+    lugares está desplazado de su índice ideal). Al insertar, si el elemento
+    que viaja está más lejos de su índice que el que ocupa la posición, se
+    intercambian ("robarle al rico"): así las distancias quedan parejas y
+    una búsqueda puede detenerse en cuanto encuentra una distancia menor que
+    la suya. Al eliminar se desplazan hacia atrás los elementos siguientes
+    (backward shift), de modo que no hacen falta marcadores DELETED.
+
+    Claves, valores, hashes y distancias viven en arreglos paralelos
+    prealocados; la capacidad es siempre una potencia de 2 y el índice
+    ideal sale de los bits altos de hash * constante de Fibonacci, para que
+    claves enteras con los mismos bits bajos no se amontonen.
+    """
 
-hash_open.mostrar()
-print(f"\nObtener 'b': {hash_open.obtener('b')}")
+    _FIBONACCI = 0x9E3779B97F4A7C15  # 2**64 / razón áurea
+    _MASCARA_64 = (1 << 64) - 1
+
+    def __init__(self, capacidad=16, factor_carga_max=0.8):
+        if not 0 < factor_carga_max < 1:
+            raise ValueError("factor_carga_max debe estar entre 0 y 1")
+        self.factor_carga_max = factor_carga_max
+        self.tamaño = 0
+        self._reservar(max(2, capacidad))
+
+    def _reservar(self, capacidad):
+        """Crea arreglos vacíos con la potencia de 2 >= capacidad."""
+        self.capacidad = 1 << (capacidad - 1).bit_length()
+        self._mascara = self.capacidad - 1
+        self._corrimiento = 64 - (self.capacidad.bit_length() - 1)
+        self._limite = int(self.capacidad * self.factor_carga_max)
+        self._claves = [None] * self.capacidad
+        self._valores = [None] * self.capacidad
+        self._hashes = array('q', [0]) * self.capacidad
+        self._distancias = array('i', [-1]) * self.capacidad  # -1 = libre
+
+    def _indice(self, h):
+        """Índice ideal de un hash (hashing de Fibonacci)."""
+        return ((h * self._FIBONACCI) & self._MASCARA_64) >> self._corrimiento
+
+    def _buscar(self, clave):
+        """Retorna la posición de la clave o -1 si no está."""
+        h = hash(clave)
+        mascara = self._mascara
+        claves, hashes, distancias = self._claves, self._hashes, self._distancias
+        i = ((h * self._FIBONACCI) & self._MASCARA_64) >> self._corrimiento
+        d = 0
+        # Corte temprano: si la distancia guardada es menor que la recorrida,
+        # la clave habría desplazado a ese elemento al insertarse
+        while distancias[i] >= d:
+            if hashes[i] == h and claves[i] == clave:
+                return i
+            i = (i + 1) & mascara
+            d += 1
+        return -1
+
+    def _colocar(self, i, d, h, clave, valor):
+        """Coloca un elemento ausente desde la posición i con distancia d."""
+        mascara = self._mascara
+        claves, valores = self._claves, self._valores
+        hashes, distancias = self._hashes, self._distancias
+        while True:
+            di = distancias[i]
+            if di < d:
+                if di == -1:
+                    claves[i], valores[i], hashes[i], distancias[i] = clave, valor, h, d
+                    return
+                # Robin Hood: el que está más cerca de su índice cede el lugar
+                clave, claves[i] = claves[i], clave
+                valor, valores[i] = valores[i], valor
+                h, hashes[i] = hashes[i], h
+                d, distancias[i] = di, d
+            i = (i + 1) & mascara
+            d += 1
+
+    def insertar(self, clave, valor):
+        """Inserta o actualiza un par clave-valor."""
+        if self.tamaño >= self._limite:
+            self._redimensionar()
+
+        h = hash(clave)
+        mascara = self._mascara
+        claves, hashes, distancias = self._claves, self._hashes, self._distancias
+        i = ((h * self._FIBONACCI) & self._MASCARA_64) >> self._corrimiento
+        d = 0
+        while True:
+            di = distancias[i]
+            if di < d:
+                break  # Posición libre o más cercana: la clave no está
+            if hashes[i] == h and claves[i] == clave:
+                self._valores[i] = valor  # Actualizar valor existente
+                return
+            i = (i + 1) & mascara
+            d += 1
+
+        self.tamaño += 1
+        if di == -1:
+            claves[i], self._valores[i], hashes[i], distancias[i] = clave, valor, h, d
+        else:
+            self._colocar(i, d, h, clave, valor)
+
+    def obtener(self, clave, valor_por_defecto=None):
+        """Obtiene el valor asociado a una clave."""
+        i = self._buscar(clave)
+        return self._valores[i] if i >= 0 else valor_por_defecto
+
+    def existe(self, clave):
+        """Verifica si una clave existe en la tabla."""
+        return self._buscar(clave) >= 0
+
+    def eliminar(self, clave):
+        """Elimina una clave desplazando hacia atrás a sus sucesores."""
+        i = self._buscar(clave)
+        if i < 0:
+            return False
+
+        mascara = self._mascara
+        claves, valores = self._claves, self._valores
+        hashes, distancias = self._hashes, self._distancias
+        j = (i + 1) & mascara
+        # Cada sucesor desplazado se acerca un lugar a su índice ideal
+        while distancias[j] > 0:
+            claves[i], valores[i], hashes[i] = claves[j], valores[j], hashes[j]
+            distancias[i] = distancias[j] - 1
+            i = j
+            j = (j + 1) & mascara
+
+        claves[i] = valores[i] = None
+        distancias[i] = -1
+        self.tamaño -= 1
+        return True
+
+    def _redimensionar(self):
+        """Duplica la capacidad reutilizando los hashes guardados."""
+        claves, valores = self._claves, self._valores
+        hashes, distancias = self._hashes, self._distancias
+        self._reservar(self.capacidad * 2)
+
+        indice, colocar = self._indice, self._colocar
+        for i in range(len(claves)):
+            if distancias[i] != -1:
+                h = hashes[i]
+                colocar(indice(h), 0, h, claves[i], valores[i])
+
+    def histograma_sondeos(self):
+        """
+        Cuenta cuántos elementos hay a cada distancia de su índice ideal.
+        histograma[d] = elementos encontrados tras d sondeos extra.
+        """
+        histograma = []
+        for d in self._distancias:
+            if d != -1:
+                if d >= len(histograma):
+                    histograma.extend([0] * (d + 1 - len(histograma)))
+                histograma[d] += 1
+        return histograma
+
+    def estadisticas_sondeo(self):
+        """Resumen de longitudes de sondeo para ajustar el factor de carga."""
+        histograma = self.histograma_sondeos()
+        total = sum(d * cantidad for d, cantidad in enumerate(histograma))
+        return {
+            "factor_carga": self.tamaño / self.capacidad,
+            "sondeo_medio": total / self.tamaño if self.tamaño else 0.0,
+            "sondeo_maximo": len(histograma) - 1,
+            "histograma": histograma,
+        }
+
+    def obtener_todos(self):
+        """Obtiene todos los pares clave-valor."""
+        return [(self._claves[i], self._valores[i])
+                for i in range(self.capacidad) if self._distancias[i] != -1]
+
+    def mostrar(self):
+        """Muestra el contenido de la tabla con la distancia de cada elemento."""
+        print(f"Tabla Hash Robin Hood (capacidad: {self.capacidad}, tamaño: {self.tamaño}):")
+        for i in range(self.capacidad):
+            if self._distancias[i] != -1:
+                print(f"  [{i}]: {(self._claves[i], self._valores[i])} (distancia {self._distancias[i]})")
 
-hash_open.eliminar("b")
-print(f"\nDespués de eliminar 'b':")
-hash_open.mostrar()
-print()
 
 # =============================================================================
 # 4. APLICACIONES PRÁCTICAS
 # =============================================================================
-print("=== 4. Aplicaciones Prácticas ===")
 
 def contar_frecuencias(lista):
     """Cuenta la frecuencia de elementos usando tabla hash."""
@@ -289,17 +493,6 @@ def contar_frecuencias(lista):
     
     return frecuencias
 
-# Ejemplo: contar palabras
-texto = "el gato come pescado el gato duerme el perro juega"
-palabras = texto.split()
-frecuencias = contar_frecuencias(palabras)
-
-print(f"Texto: '{texto}'")
-print("\nFrecuencias de palabras:")
-for palabra, frecuencia in frecuencias.obtener_todos():
-    print(f"  '{palabra}': {frecuencia}")
-
-print()
 
 def encontrar_duplicados(lista):
     """Encuentra elementos duplicados usando tabla hash."""
@@ -315,11 +508,6 @@ def encontrar_duplicados(lista):
     
     return duplicados
 
-# Ejemplo
-lista_numeros = [1, 2, 3, 2, 4, 3, 5, 6, 5, 5]
-print(f"Lista: {lista_numeros}")
-print(f"Elementos duplicados: {encontrar_duplicados(lista_numeros)}")
-print()
 
 def dos_sumas(lista, objetivo):
     """
@@ -336,51 +524,48 @@ def dos_sumas(lista, objetivo):
     
     return None
 
-# Ejemplo
-lista_suma = [2, 7, 11, 15]
-objetivo = 9
-print(f"Lista: {lista_suma}, Objetivo: {objetivo}")
-resultado = dos_sumas(lista_suma, objetivo)
-if resultado:
-    print(f"Índices que suman {objetivo}: {resultado} ({lista_suma[resultado[0]]} + {lista_suma[resultado[1]]})")
-else:
-    print("No se encontraron dos números que sumen el objetivo")
-print()
 
 # =============================================================================
 # 5. COMPARACIÓN CON DICCIONARIO DE PYTHON
 # =============================================================================
-print("=== 5. Comparación con dict() de Python ===")
 
-import time
+def _insertar_todas(tabla, claves):
+    """Inserta cada clave con su posición como valor. Retorna la tabla."""
+    for i, clave in enumerate(claves):
+        tabla.insertar(clave, i)
+    return tabla
+
+def _obtener_todas(tabla, claves):
+    """Consulta todas las claves. Retorna la lista de valores."""
+    return [tabla.obtener(clave) for clave in claves]
+
+def _insertar_todas_dict(tabla, claves):
+    """Equivalente de _insertar_todas para dict()."""
+    for i, clave in enumerate(claves):
+        tabla[clave] = i
+    return tabla
+
+def _obtener_todas_dict(tabla, claves):
+    """Equivalente de _obtener_todas para dict()."""
+    return [tabla[clave] for clave in claves]
 
 def comparar_operaciones(cantidad=10000):
     """Compara nuestra implementación con dict() de Python."""
     print(f"\nComparación con {cantidad} operaciones:")
+    claves = [f"clave_{i}" for i in range(cantidad)]
     
-    # Nuestra implementación
-    mi_hash = TablaHash(capacidad=100)
-    inicio = time.time()
-    for i in range(cantidad):
-        mi_hash.insertar(f"clave_{i}", i)
-    tiempo_insertar_mio = time.time() - inicio
+    def tiempo(funcion, preparar):
+        resumen, resultado = medir(funcion, preparar, repeticiones=3)
+        return resumen["mediana_ns"] / 1e9, resultado
     
-    inicio = time.time()
-    for i in range(cantidad):
-        mi_hash.obtener(f"clave_{i}")
-    tiempo_obtener_mio = time.time() - inicio
+    # Nuestra implementación
+    tiempo_insertar_mio, mi_hash = tiempo(
+        _insertar_todas, lambda: (TablaHash(capacidad=100), claves))
+    tiempo_obtener_mio, _ = tiempo(_obtener_todas, lambda: (mi_hash, claves))
     
     # dict() de Python
-    py_dict = {}
-    inicio = time.time()
-    for i in range(cantidad):
-        py_dict[f"clave_{i}"] = i
-    tiempo_insertar_py = time.time() - inicio
-    
-    inicio = time.time()
-    for i in range(cantidad):
-        _ = py_dict[f"clave_{i}"]
-    tiempo_obtener_py = time.time() - inicio
+    tiempo_insertar_py, py_dict = tiempo(_insertar_todas_dict, lambda: ({}, claves))
+    tiempo_obtener_py, _ = tiempo(_obtener_todas_dict, lambda: (py_dict, claves))
     
     print(f"  Insertar:")
     print(f"    Nuestra: {tiempo_insertar_mio*1000:.2f} ms")
@@ -395,31 +580,326 @@ def comparar_operaciones(cantidad=10000):
     print("\n  Nota: dict() de Python está optimizado en C y es mucho más rápido.")
     print("  Nuestra implementación es para fines educativos.")
 
-comparar_operaciones(1000)
 
-print()
+# =============================================================================
+# 6. LATENCIA POR OPERACIÓN (REDIMENSIONAMIENTO INCREMENTAL)
+# =============================================================================
 
-# Resumen
-print("=== RESUMEN ===")
-print("""
+def medir_latencias(tabla, claves):
+    """
+    Mide cada operación por separado con perf_counter_ns: inserta todas las
+    claves (con su posición como valor), luego las consulta y luego las
+    elimina. Retorna {operación: resumen} con mediana, p95, p99 y máximo
+    en nanosegundos (ver algoritmos.benchmark.resumir).
+    
+    Como timeit, desactiva el recolector de basura durante la medición:
+    sus pasadas completas son picos propios que ocultarían los de la tabla.
+    """
+    reloj = time.perf_counter_ns
+    insertar, obtener, eliminar = [], [], []
+    
+    gc_activo = gc.isenabled()
+    gc.disable()
+    try:
+        for i, clave in enumerate(claves):
+            inicio = reloj()
+            tabla.insertar(clave, i)
+            insertar.append(reloj() - inicio)
+        for clave in claves:
+            inicio = reloj()
+            tabla.obtener(clave)
+            obtener.append(reloj() - inicio)
+        for clave in claves:
+            inicio = reloj()
+            tabla.eliminar(clave)
+            eliminar.append(reloj() - inicio)
+    finally:
+        if gc_activo:
+            gc.enable()
+    
+    return {
+        "insertar": resumir(insertar),
+        "obtener": resumir(obtener),
+        "eliminar": resumir(eliminar),
+    }
+
+def comparar_redimensionamiento(cantidad=200000):
+    """
+    Compara la latencia de TablaHash redimensionando todo de golpe contra
+    la migración incremental. La mejora está en el máximo: rehashear la
+    tabla completa en una sola inserción produce picos que la migración
+    incremental reparte. A cambio el p99 empeora, porque muchas inserciones
+    cargan con una parte de la migración.
+    """
+    claves = _claves_aleatorias(cantidad)
+    modos = {"completo": False, "incremental": True}
+    
+    print(f"\nLatencia con {cantidad} claves (µs; máximo en ms):")
+    print(f"  {'Modo':<12} {'Operación':<10} {'mediana':>8} {'p99':>8} {'máximo':>9}")
+    resultados = {}
+    for nombre, incremental in modos.items():
+        resultados[nombre] = medir_latencias(TablaHash(incremental=incremental), claves)
+        for operacion, resumen in resultados[nombre].items():
+            print(f"  {nombre:<12} {operacion:<10} {resumen['mediana_ns'] / 1e3:>8.2f} "
+                  f"{resumen['p99_ns'] / 1e3:>8.2f} {resumen['max_ns'] / 1e6:>9.2f}")
+    return resultados
+
+
+def _carga_tabla_hash(claves):
+    """Inserta y consulta todas las claves en una TablaHash (chaining)."""
+    return _obtener_todas(_insertar_todas(TablaHash(capacidad=100), claves), claves)
+
+def _carga_tabla_hash_completa(claves):
+    """Como _carga_tabla_hash pero redimensionando toda la tabla de golpe."""
+    return _obtener_todas(_insertar_todas(TablaHash(capacidad=100, incremental=False), claves), claves)
+
+def _carga_open_addressing(claves):
+    """Inserta y consulta todas las claves en una TablaHashOpenAddressing."""
+    return _obtener_todas(_insertar_todas(TablaHashOpenAddressing(capacidad=100), claves), claves)
+
+def _carga_robin_hood(claves):
+    """Inserta y consulta todas las claves en una TablaHashRobinHood."""
+    return _obtener_todas(_insertar_todas(TablaHashRobinHood(capacidad=100), claves), claves)
+
+def _carga_dict(claves):
+    """Inserta y consulta todas las claves en un dict() de Python."""
+    return _obtener_todas_dict(_insertar_todas_dict({}, claves), claves)
+
+
+def _claves_aleatorias(n, semilla=42):
+    """Claves enteras aleatorias de 62 bits, sin repetir."""
+    rnd = random.Random(semilla)
+    return list({rnd.getrandbits(62) for _ in range(n)})
+
+def _insertar_eliminar_obtener(tabla, claves):
+    """Inserta todo, elimina las claves en posición impar y consulta todo."""
+    _insertar_todas(tabla, claves)
+    for clave in claves[1::2]:
+        tabla.eliminar(clave)
+    return [tabla.obtener(clave) for clave in claves]
+
+def _mixta_robin_hood(claves):
+    return _insertar_eliminar_obtener(TablaHashRobinHood(capacidad=100), claves)
+
+def _mixta_tabla_hash(claves):
+    return _insertar_eliminar_obtener(TablaHash(capacidad=100), claves)
+
+def _mixta_open_addressing(claves):
+    return _insertar_eliminar_obtener(TablaHashOpenAddressing(capacidad=100), claves)
+
+def _mixta_dict(claves):
+    tabla = _insertar_todas_dict({}, claves)
+    for clave in claves[1::2]:
+        del tabla[clave]
+    return [tabla.get(clave) for clave in claves]
+
+def _verificar_mixta(valores, claves):
+    """Las claves en posición par conservan su índice; las impares no están."""
+    return valores == [i if i % 2 == 0 else None for i in range(len(claves))]
+
+
+# Familia para el sistema de benchmarks (python -m algoritmos.benchmark)
+BENCHMARKS = {
+    "tablas_hash": {
+        "implementaciones": {
+            "TablaHash": _carga_tabla_hash,
+            "TablaHash_redimension_completa": _carga_tabla_hash_completa,
+            "TablaHashOpenAddressing": _carga_open_addressing,
+            "TablaHashRobinHood": _carga_robin_hood,
+            "dict": _carga_dict,
+        },
+        "entrada": lambda n: ([f"clave_{i}" for i in range(n)],),
+        "tamanios": [1000, 10000, 100000],
+        "verificar": lambda valores, claves: valores == list(range(len(claves))),
+    },
+    # Inserciones, eliminaciones y consultas (aciertos y fallos) intercaladas:
+    # aquí es donde los marcadores DELETED del linear probing se acumulan
+    "tablas_hash_eliminacion": {
+        "implementaciones": {
+            "TablaHashRobinHood": _mixta_robin_hood,
+            "TablaHash": _mixta_tabla_hash,
+            "TablaHashOpenAddressing": _mixta_open_addressing,
+            "dict": _mixta_dict,
+        },
+        "entrada": lambda n: (_claves_aleatorias(n),),
+        "tamanios": [10000, 1000000, 10000000],
+        # Con 10**7 claves, las tuplas y buckets de TablaHash superan los 5 GB
+        "limites": {"TablaHash": 1000000, "TablaHashOpenAddressing": 1000000},
+        "verificar": _verificar_mixta,
+    },
+}
+
+
+def main():
+    """Ejecuta los ejemplos y comparaciones del módulo."""
+    print("=== Estructuras de Datos: Tablas Hash ===\n")
+
+    print("=== 1. Tabla Hash Básica ===")
+
+    # Ejemplo
+    print("Creando tabla hash:")
+    hash_table = TablaHash(capacidad=8)
+
+    # Insertar elementos
+    hash_table.insertar("nombre", "Juan")
+    hash_table.insertar("edad", 25)
+    hash_table.insertar("ciudad", "Bogotá")
+    hash_table.insertar("profesion", "Ingeniero")
+
+    hash_table.mostrar()
+    print(f"\nObtener 'edad': {hash_table.obtener('edad')}")
+    print(f"Existe 'ciudad': {hash_table.existe('ciudad')}")
+    print(f"Existe 'pais': {hash_table.existe('pais')}")
+
+    # Eliminar
+    hash_table.eliminar("profesion")
+    print(f"\nDespués de eliminar 'profesion':")
+    hash_table.mostrar()
+    print()
+
+    print("=== 2. Funciones Hash Personalizadas ===")
+
+    # Ejemplo
+    claves = ["apple", "banana", "cherry", "date", "elderberry"]
+    capacidad = 10
+
+    print(f"Claves: {claves}")
+    print("\nDistribución con diferentes funciones hash:")
+    print("  Índice | Hash Simple | Hash DJB2 | Hash División")
+    print("  " + "-" * 50)
+
+    for clave in claves:
+        idx1 = hash_simple(clave, capacidad)
+        idx2 = hash_djb2(clave, capacidad)
+        idx3 = hash_division(clave, capacidad)
+        print(f"  {clave:10s} | {idx1:11d} | {idx2:9d} | {idx3:14d}")
+
+    print()
+
+    print("=== 3. Manejo de Colisiones ===")
+
+    # Ejemplo
+    print("Tabla Hash con Open Addressing (Linear Probing):")
+    hash_open = TablaHashOpenAddressing(capacidad=8)
+
+    hash_open.insertar("a", 1)
+    hash_open.insertar("b", 2)
+    hash_open.insertar("c", 3)
+    hash_open.insertar("d", 4)
+
+    hash_open.mostrar()
+    print(f"\nObtener 'b': {hash_open.obtener('b')}")
+
+    hash_open.eliminar("b")
+    print(f"\nDespués de eliminar 'b':")
+    hash_open.mostrar()
+    print()
+
+    print("Tabla Hash Robin Hood (distancias de sondeo + backward shift):")
+    hash_rh = TablaHashRobinHood(capacidad=8)
+
+    for i, clave in enumerate(["a", "b", "c", "d", "e"]):
+        hash_rh.insertar(clave, i + 1)
+
+    hash_rh.mostrar()
+    hash_rh.eliminar("b")
+    print("\nDespués de eliminar 'b' (sin marcadores DELETED):")
+    hash_rh.mostrar()
+
+    print("\nHistograma de sondeos según el factor de carga (capacidad 32768):")
+    claves_rh = _claves_aleatorias(32768)
+    for factor in (0.5, 0.8, 0.95):
+        tabla = TablaHashRobinHood(capacidad=32768, factor_carga_max=0.99)
+        _insertar_todas(tabla, claves_rh[:int(32768 * factor)])
+        estadisticas = tabla.estadisticas_sondeo()
+        print(f"  carga {estadisticas['factor_carga']:.2f}: "
+              f"medio {estadisticas['sondeo_medio']:.2f}, "
+              f"máximo {estadisticas['sondeo_maximo']}, "
+              f"histograma {estadisticas['histograma'][:6]}...")
+    print()
+
+    print("=== 4. Aplicaciones Prácticas ===")
+
+    # Ejemplo: contar palabras
+    texto = "el gato come pescado el gato duerme el perro juega"
+    palabras = texto.split()
+    frecuencias = contar_frecuencias(palabras)
+
+    print(f"Texto: '{texto}'")
+    print("\nFrecuencias de palabras:")
+    for palabra, frecuencia in frecuencias.obtener_todos():
+        print(f"  '{palabra}': {frecuencia}")
+
+    print()
+
+    # Ejemplo
+    lista_numeros = [1, 2, 3, 2, 4, 3, 5, 6, 5, 5]
+    print(f"Lista: {lista_numeros}")
+    print(f"Elementos duplicados: {encontrar_duplicados(lista_numeros)}")
+    print()
+
+    # Ejemplo
+    lista_suma = [2, 7, 11, 15]
+    objetivo = 9
+    print(f"Lista: {lista_suma}, Objetivo: {objetivo}")
+    resultado = dos_sumas(lista_suma, objetivo)
+    if resultado:
+        print(f"Índices que suman {objetivo}: {resultado} ({lista_suma[resultado[0]]} + {lista_suma[resultado[1]]})")
+    else:
+        print("No se encontraron dos números que sumen el objetivo")
+    print()
+
+    print("=== 5. Comparación con dict() de Python ===")
+
+    comparar_operaciones(1000)
+
+    print()
+
+    print("=== 6. Redimensionamiento Incremental y Latencia Máxima ===")
+
+    tabla_migrando = TablaHash(capacidad=4)
+    for i, clave in enumerate(["a", "b", "c", "d"]):
+        tabla_migrando.insertar(clave, i + 1)
+    print("Después de superar el factor de carga (la migración sigue en curso):")
+    tabla_migrando.mostrar()
+    print(f"\nObtener 'c' durante la migración: {tabla_migrando.obtener('c')}")
+    tabla_migrando.mostrar()
+
+    comparar_redimensionamiento(100000)
+
+    print()
+
+    # Resumen
+    print("=== RESUMEN ===")
+    print("""
 Tablas Hash implementadas:
 
 1. Tabla Hash con Chaining (listas enlazadas):
    - Cada bucket es una lista
    - Maneja colisiones agregando elementos a la lista
    - Redimensiona automáticamente cuando está cargada
+   - Migración incremental: cada operación mueve unos pocos buckets de
+     la tabla vieja a la nueva, en lugar de rehashear todo de una vez
+   - medir_latencias() reporta mediana, p99 y máximo por operación
 
 2. Tabla Hash con Open Addressing (Linear Probing):
    - Los elementos se almacenan directamente en la tabla
    - Las colisiones se resuelven buscando el siguiente espacio disponible
    - Usa marcador DELETED para elementos eliminados
 
-3. Funciones Hash:
+3. Tabla Hash Robin Hood:
+   - Guarda la distancia de sondeo de cada elemento en arreglos paralelos
+   - Al insertar, el elemento más lejano de su índice toma el lugar
+   - Las búsquedas terminan en cuanto la distancia guardada es menor
+   - Elimina desplazando hacia atrás (sin marcadores DELETED)
+   - histograma_sondeos() ayuda a elegir el factor de carga
+
+4. Funciones Hash:
    - Hash simple: suma de códigos ASCII
    - Hash DJB2: algoritmo popular para strings
    - Hash por división: módulo (usado por defecto)
 
-4. Aplicaciones:
+5. Aplicaciones:
    - Conteo de frecuencias
    - Detección de duplicados
    - Búsqueda eficiente (O(1) promedio)
@@ -433,3 +913,7 @@ Complejidad:
 Nota: En Python, usar dict() para aplicaciones reales.
 Esta implementación es para entender cómo funcionan las tablas hash.
 """)
+
+
+if __name__ == "__main__":
+    main()
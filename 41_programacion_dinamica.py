@@ -4,12 +4,10 @@
 from functools import lru_cache
 import time
 
-print("=== Programación Dinámica ===\n")
 
 # =============================================================================
 # 1. PROBLEMA DE LA MOCHILA (Knapsack Problem)
 # =============================================================================
-print("=== 1. Problema de la Mochila (0/1 Knapsack) ===")
 
 def mochila_recursivo(pesos, valores, capacidad, n):
     """
@@ -76,46 +74,10 @@ def mochila_programacion_dinamica(pesos, valores, capacidad):
     
     return dp[capacidad]
 
-# Ejemplo
-pesos = [1, 3, 4, 5]
-valores = [1, 4, 5, 7]
-capacidad = 7
-
-print(f"Pesos: {pesos}")
-print(f"Valores: {valores}")
-print(f"Capacidad: {capacidad}")
-
-# Solución con DP (más eficiente)
-valor_maximo = mochila_programacion_dinamica(pesos, valores, capacidad)
-print(f"\nValor máximo (DP): {valor_maximo}")
-
-# Comparación de tiempos
-print("\nComparación de métodos:")
-n_pequeño = len(pesos)
-pesos_peq = pesos
-valores_peq = valores
-
-inicio = time.time()
-resultado_rec = mochila_recursivo(pesos_peq, valores_peq, capacidad, n_pequeño)
-tiempo_rec = time.time() - inicio
-
-inicio = time.time()
-resultado_memo = mochila_memoizacion(pesos_peq, valores_peq, capacidad)
-tiempo_memo = time.time() - inicio
-
-inicio = time.time()
-resultado_dp = mochila_programacion_dinamica(pesos_peq, valores_peq, capacidad)
-tiempo_dp = time.time() - inicio
-
-print(f"  Recursivo: {tiempo_rec*1000:.4f} ms (valor: {resultado_rec})")
-print(f"  Memoización: {tiempo_memo*1000:.4f} ms (valor: {resultado_memo})")
-print(f"  Programación Dinámica: {tiempo_dp*1000:.4f} ms (valor: {resultado_dp})")
-print()
 
 # =============================================================================
 # 2. SUBsecuencia Común Más Larga (LCS - Longest Common Subsequence)
 # =============================================================================
-print("=== 2. Subsecuencia Común Más Larga (LCS) ===")
 
 def lcs_recursivo(X, Y, m, n):
     """Solución recursiva naive."""
@@ -174,22 +136,10 @@ def lcs_obtener_subsecuencia(X, Y):
     
     return ''.join(reversed(lcs))
 
-# Ejemplo
-X = "ABCDGH"
-Y = "AEDFHR"
-print(f"String 1: '{X}'")
-print(f"String 2: '{Y}'")
-
-longitud = lcs_programacion_dinamica(X, Y)
-subsecuencia = lcs_obtener_subsecuencia(X, Y)
-print(f"Longitud de LCS: {longitud}")
-print(f"LCS: '{subsecuencia}'")
-print()
 
 # =============================================================================
 # 3. CAMINO MÍNIMO EN GRID
 # =============================================================================
-print("=== 3. Camino Mínimo en Grid ===")
 
 def camino_minimo_grid(grid):
     """
@@ -214,24 +164,10 @@ def camino_minimo_grid(grid):
     
     return dp[m-1][n-1]
 
-# Ejemplo
-grid = [
-    [1, 3, 1],
-    [1, 5, 1],
-    [4, 2, 1]
-]
-print("Grid:")
-for fila in grid:
-    print(f"  {fila}")
-
-suma_minima = camino_minimo_grid(grid)
-print(f"\nSuma mínima del camino: {suma_minima}")
-print()
 
 # =============================================================================
 # 4. NÚMEROS DE FIBONACCI (comparación con memoización)
 # =============================================================================
-print("=== 4. Fibonacci con Programación Dinámica ===")
 
 @lru_cache(maxsize=None)
 def fibonacci_memo(n):
@@ -250,26 +186,10 @@ def fibonacci_dp(n):
         a, b = b, a + b
     return b
 
-# Ejemplo
-n_fib = 30
-print(f"Fibonacci({n_fib}):")
-
-inicio = time.time()
-resultado_memo = fibonacci_memo(n_fib)
-tiempo_memo = time.time() - inicio
-
-inicio = time.time()
-resultado_dp = fibonacci_dp(n_fib)
-tiempo_dp = time.time() - inicio
-
-print(f"  Con memoización: {resultado_memo} ({tiempo_memo*1000:.4f} ms)")
-print(f"  Con DP: {resultado_dp} ({tiempo_dp*1000:.4f} ms)")
-print()
 
 # =============================================================================
 # 5. COIN CHANGE (Cambio de Monedas)
 # =============================================================================
-print("=== 5. Problema del Cambio de Monedas ===")
 
 def coin_change_cantidad_minima(monedas, cantidad):
     """
@@ -299,23 +219,10 @@ def coin_change_numero_formas(monedas, cantidad):
     
     return dp[cantidad]
 
-# Ejemplo
-monedas = [1, 3, 4]
-cantidad = 6
-print(f"Monedas: {monedas}")
-print(f"Cantidad objetivo: {cantidad}")
-
-min_monedas = coin_change_cantidad_minima(monedas, cantidad)
-num_formas = coin_change_numero_formas(monedas, cantidad)
-
-print(f"Cantidad mínima de monedas: {min_monedas}")
-print(f"Número de formas de formar {cantidad}: {num_formas}")
-print()
 
 # =============================================================================
 # 6. LONGEST INCREASING SUBSEQUENCE (LIS)
 # =============================================================================
-print("=== 6. Subsecuencia Creciente Más Larga (LIS) ===")
 
 def lis_programacion_dinamica(nums):
     """
@@ -362,20 +269,128 @@ def lis_binaria(nums):
     
     return len(tails)
 
-# Ejemplo
-nums_lis = [10, 9, 2, 5, 3, 7, 101, 18]
-print(f"Lista: {nums_lis}")
 
-lis_dp = lis_programacion_dinamica(nums_lis)
-lis_bin = lis_binaria(nums_lis)
+def main():
+    """Ejecuta los ejemplos y comparaciones del módulo."""
+    print("=== Programación Dinámica ===\n")
+
+    print("=== 1. Problema de la Mochila (0/1 Knapsack) ===")
+
+    # Ejemplo
+    pesos = [1, 3, 4, 5]
+    valores = [1, 4, 5, 7]
+    capacidad = 7
+
+    print(f"Pesos: {pesos}")
+    print(f"Valores: {valores}")
+    print(f"Capacidad: {capacidad}")
+
+    # Solución con DP (más eficiente)
+    valor_maximo = mochila_programacion_dinamica(pesos, valores, capacidad)
+    print(f"\nValor máximo (DP): {valor_maximo}")
+
+    # Comparación de tiempos
+    print("\nComparación de métodos:")
+    n_pequeño = len(pesos)
+    pesos_peq = pesos
+    valores_peq = valores
 
-print(f"LIS (DP O(n²)): {lis_dp}")
-print(f"LIS (Binaria O(n log n)): {lis_bin}")
-print()
+    inicio = time.time()
+    resultado_rec = mochila_recursivo(pesos_peq, valores_peq, capacidad, n_pequeño)
+    tiempo_rec = time.time() - inicio
 
-# Resumen
-print("=== RESUMEN ===")
-print("""
+    inicio = time.time()
+    resultado_memo = mochila_memoizacion(pesos_peq, valores_peq, capacidad)
+    tiempo_memo = time.time() - inicio
+
+    inicio = time.time()
+    resultado_dp = mochila_programacion_dinamica(pesos_peq, valores_peq, capacidad)
+    tiempo_dp = time.time() - inicio
+
+    print(f"  Recursivo: {tiempo_rec*1000:.4f} ms (valor: {resultado_rec})")
+    print(f"  Memoización: {tiempo_memo*1000:.4f} ms (valor: {resultado_memo})")
+    print(f"  Programación Dinámica: {tiempo_dp*1000:.4f} ms (valor: {resultado_dp})")
+    print()
+
+    print("=== 2. Subsecuencia Común Más Larga (LCS) ===")
+
+    # Ejemplo
+    X = "ABCDGH"
+    Y = "AEDFHR"
+    print(f"String 1: '{X}'")
+    print(f"String 2: '{Y}'")
+
+    longitud = lcs_programacion_dinamica(X, Y)
+    subsecuencia = lcs_obtener_subsecuencia(X, Y)
+    print(f"Longitud de LCS: {longitud}")
+    print(f"LCS: '{subsecuencia}'")
+    print()
+
+    print("=== 3. Camino Mínimo en Grid ===")
+
+    # Ejemplo
+    grid = [
+        [1, 3, 1],
+        [1, 5, 1],
+        [4, 2, 1]
+    ]
+    print("Grid:")
+    for fila in grid:
+        print(f"  {fila}")
+
+    suma_minima = camino_minimo_grid(grid)
+    print(f"\nSuma mínima del camino: {suma_minima}")
+    print()
+
+    print("=== 4. Fibonacci con Programación Dinámica ===")
+
+    # Ejemplo
+    n_fib = 30
+    print(f"Fibonacci({n_fib}):")
+
+    inicio = time.time()
+    resultado_memo = fibonacci_memo(n_fib)
+    tiempo_memo = time.time() - inicio
+
+    inicio = time.time()
+    resultado_dp = fibonacci_dp(n_fib)
+    tiempo_dp = time.time() - inicio
+
+    print(f"  Con memoización: {resultado_memo} ({tiempo_memo*1000:.4f} ms)")
+    print(f"  Con DP: {resultado_dp} ({tiempo_dp*1000:.4f} ms)")
+    print()
+
+    print("=== 5. Problema del Cambio de Monedas ===")
+
+    # Ejemplo
+    monedas = [1, 3, 4]
+    cantidad = 6
+    print(f"Monedas: {monedas}")
+    print(f"Cantidad objetivo: {cantidad}")
+
+    min_monedas = coin_change_cantidad_minima(monedas, cantidad)
+    num_formas = coin_change_numero_formas(monedas, cantidad)
+
+    print(f"Cantidad mínima de monedas: {min_monedas}")
+    print(f"Número de formas de formar {cantidad}: {num_formas}")
+    print()
+
+    print("=== 6. Subsecuencia Creciente Más Larga (LIS) ===")
+
+    # Ejemplo
+    nums_lis = [10, 9, 2, 5, 3, 7, 101, 18]
+    print(f"Lista: {nums_lis}")
+
+    lis_dp = lis_programacion_dinamica(nums_lis)
+    lis_bin = lis_binaria(nums_lis)
+
+    print(f"LIS (DP O(n²)): {lis_dp}")
+    print(f"LIS (Binaria O(n log n)): {lis_bin}")
+    print()
+
+    # Resumen
+    print("=== RESUMEN ===")
+    print("""
 Problemas de Programación Dinámica implementados:
 
 1. Problema de la Mochila (0/1 Knapsack):
@@ -417,3 +432,7 @@ Cuándo usar DP:
 - Problemas de optimización
 - Problemas de conteo/permutaciones
 """)
+
+
+if __name__ == "__main__":
+    main()
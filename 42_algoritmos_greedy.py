@@ -1,12 +1,9 @@
 # Archivo: 42_algoritmos_greedy.py
 # Descripción: Algoritmos Greedy (Voraces)
 
-print("=== Algoritmos Greedy (Voraces) ===\n")
-
 # =============================================================================
 # 1. PROBLEMA DE LA MOCHILA FRACCIONARIA (Fractional Knapsack)
 # =============================================================================
-print("=== 1. Problema de la Mochila Fraccionaria ===")
 
 def mochila_fraccionaria(pesos, valores, capacidad):
     """
@@ -41,26 +38,10 @@ def mochila_fraccionaria(pesos, valores, capacidad):
     
     return valor_total, solucion
 
-# Ejemplo
-pesos_mochila = [10, 20, 30]
-valores_mochila = [60, 100, 120]
-capacidad_mochila = 50
-
-print(f"Pesos: {pesos_mochila}")
-print(f"Valores: {valores_mochila}")
-print(f"Capacidad: {capacidad_mochila}")
-
-valor_optimo, solucion = mochila_fraccionaria(pesos_mochila, valores_mochila, capacidad_mochila)
-print(f"\nValor máximo: {valor_optimo}")
-print("Solución (índice, fracción):")
-for indice, fraccion in solucion:
-    print(f"  Item {indice}: {fraccion*100:.1f}% (peso: {pesos_mochila[indice]*fraccion:.1f}, valor: {valores_mochila[indice]*fraccion:.1f})")
-print()
 
 # =============================================================================
 # 2. ACTIVITY SELECTION PROBLEM (Selección de Actividades)
 # =============================================================================
-print("=== 2. Problema de Selección de Actividades ===")
 
 def seleccion_actividades(inicios, fines):
     """
@@ -84,25 +65,10 @@ def seleccion_actividades(inicios, fines):
     
     return seleccionadas
 
-# Ejemplo
-inicios = [1, 3, 0, 5, 8, 5]
-fines = [2, 4, 6, 7, 9, 9]
-
-print(f"Actividades:")
-for i, (inicio, fin) in enumerate(zip(inicios, fines)):
-    print(f"  Actividad {i}: [{inicio}, {fin}]")
-
-seleccionadas = seleccion_actividades(inicios, fines)
-print(f"\nNúmero máximo de actividades: {len(seleccionadas)}")
-print(f"Actividades seleccionadas: {seleccionadas}")
-for indice in seleccionadas:
-    print(f"  Actividad {indice}: [{inicios[indice]}, {fines[indice]}]")
-print()
 
 # =============================================================================
 # 3. MINIMUM SPANNING TREE - ALGORITMO DE KRUSKAL (Greedy)
 # =============================================================================
-print("=== 3. Algoritmo de Kruskal (MST) ===")
 
 class UnionFind:
     """Estructura de datos Union-Find para Kruskal."""
@@ -157,30 +123,10 @@ def kruskal(nodos, aristas):
     
     return mst, peso_total
 
-# Ejemplo
-nodos_kruskal = 4
-aristas_kruskal = [
-    (0, 1, 10),
-    (0, 2, 6),
-    (0, 3, 5),
-    (1, 3, 15),
-    (2, 3, 4)
-]
-
-print(f"Grafo con {nodos_kruskal} nodos y {len(aristas_kruskal)} aristas:")
-for u, v, peso in aristas_kruskal:
-    print(f"  {u} --{peso}-- {v}")
-
-mst, peso_total = kruskal(nodos_kruskal, aristas_kruskal)
-print(f"\nMinimum Spanning Tree (peso total: {peso_total}):")
-for u, v, peso in mst:
-    print(f"  {u} --{peso}-- {v}")
-print()
 
 # =============================================================================
 # 4. HUFFMAN CODING (Codificación de Huffman - Greedy)
 # =============================================================================
-print("=== 4. Codificación de Huffman ===")
 
 import heapq
 
@@ -255,25 +201,10 @@ def codificar_huffman(texto):
     
     return codigos, texto_codificado
 
-# Ejemplo
-texto_huffman = "hello world"
-print(f"Texto original: '{texto_huffman}'")
-
-codigos, texto_cod = codificar_huffman(texto_huffman)
-print("\nCódigos de Huffman:")
-for caracter, codigo in sorted(codigos.items()):
-    print(f"  '{caracter}': {codigo}")
-
-print(f"\nTexto codificado: {texto_cod}")
-print(f"Longitud original: {len(texto_huffman) * 8} bits (ASCII)")
-print(f"Longitud codificada: {len(texto_cod)} bits")
-print(f"Compresión: {len(texto_cod) / (len(texto_huffman) * 8) * 100:.1f}%")
-print()
 
 # =============================================================================
 # 5. COIN CHANGE GREEDY (Cambio de Monedas Greedy)
 # =============================================================================
-print("=== 5. Cambio de Monedas (Algoritmo Greedy) ===")
 
 def cambio_monedas_greedy(monedas, cantidad):
     """
@@ -299,38 +230,10 @@ def cambio_monedas_greedy(monedas, cantidad):
     
     return cambio, cantidad_restante
 
-# Ejemplo con sistema canónico
-monedas_canonicas = [1, 5, 10, 25, 50, 100]  # Sistema como USD
-cantidad_cambio = 287
-
-print(f"Monedas disponibles: {monedas_canonicas}")
-print(f"Cantidad a cambiar: {cantidad_cambio}")
-
-cambio, resto = cambio_monedas_greedy(monedas_canonicas, cantidad_cambio)
-print(f"\nCambio (moneda, cantidad):")
-total = 0
-for moneda, cantidad in cambio:
-    print(f"  {moneda}: {cantidad} moneda(s)")
-    total += moneda * cantidad
-
-print(f"Total: {total}")
-if resto > 0:
-    print(f"Resto no cambiado: {resto}")
-
-# Ejemplo donde greedy falla
-print("\n⚠️  Ejemplo donde Greedy NO funciona óptimamente:")
-monedas_no_canonicas = [1, 3, 4]
-cantidad_falla = 6
-cambio_greedy, _ = cambio_monedas_greedy(monedas_no_canonicas, cantidad_falla)
-print(f"Monedas: {monedas_no_canonicas}, Cantidad: {cantidad_falla}")
-print(f"Greedy da: {sum(m*c for m, c in cambio_greedy)} monedas")
-print(f"Óptimo sería: 2 monedas (3+3), pero greedy da: {sum(c for _, c in cambio_greedy)} monedas")
-print()
 
 # =============================================================================
 # 6. INTERVAL SCHEDULING (Programación de Intervalos)
 # =============================================================================
-print("=== 6. Programación de Intervalos con Pesos ===")
 
 def interval_scheduling_pesos(intervals):
     """
@@ -375,31 +278,142 @@ def interval_scheduling_pesos(intervals):
     seleccionados.reverse()
     return seleccionados, pesos_acumulados[-1] if pesos_acumulados else 0
 
-# Ejemplo
-intervalos_pesos = [
-    (1, 4, 3),
-    (3, 5, 4),
-    (0, 6, 2),
-    (5, 7, 1),
-    (8, 9, 5),
-    (5, 9, 2)
-]
-
-print("Intervalos (inicio, fin, peso):")
-for i, (ini, fin, peso) in enumerate(intervalos_pesos):
-    print(f"  Intervalo {i}: [{ini}, {fin}] peso={peso}")
-
-seleccionados, peso_total = interval_scheduling_pesos(intervalos_pesos)
-print(f"\nIntervalos seleccionados: {seleccionados}")
-print(f"Peso total: {peso_total}")
-for indice in seleccionados:
-    ini, fin, peso = intervalos_pesos[indice]
-    print(f"  Intervalo {indice}: [{ini}, {fin}] peso={peso}")
-print()
-
-# Resumen
-print("=== RESUMEN ===")
-print("""
+
+def main():
+    """Ejecuta los ejemplos y comparaciones del módulo."""
+    print("=== Algoritmos Greedy (Voraces) ===\n")
+
+    print("=== 1. Problema de la Mochila Fraccionaria ===")
+
+    # Ejemplo
+    pesos_mochila = [10, 20, 30]
+    valores_mochila = [60, 100, 120]
+    capacidad_mochila = 50
+
+    print(f"Pesos: {pesos_mochila}")
+    print(f"Valores: {valores_mochila}")
+    print(f"Capacidad: {capacidad_mochila}")
+
+    valor_optimo, solucion = mochila_fraccionaria(pesos_mochila, valores_mochila, capacidad_mochila)
+    print(f"\nValor máximo: {valor_optimo}")
+    print("Solución (índice, fracción):")
+    for indice, fraccion in solucion:
+        print(f"  Item {indice}: {fraccion*100:.1f}% (peso: {pesos_mochila[indice]*fraccion:.1f}, valor: {valores_mochila[indice]*fraccion:.1f})")
+    print()
+
+    print("=== 2. Problema de Selección de Actividades ===")
+
+    # Ejemplo
+    inicios = [1, 3, 0, 5, 8, 5]
+    fines = [2, 4, 6, 7, 9, 9]
+
+    print(f"Actividades:")
+    for i, (inicio, fin) in enumerate(zip(inicios, fines)):
+        print(f"  Actividad {i}: [{inicio}, {fin}]")
+
+    seleccionadas = seleccion_actividades(inicios, fines)
+    print(f"\nNúmero máximo de actividades: {len(seleccionadas)}")
+    print(f"Actividades seleccionadas: {seleccionadas}")
+    for indice in seleccionadas:
+        print(f"  Actividad {indice}: [{inicios[indice]}, {fines[indice]}]")
+    print()
+
+    print("=== 3. Algoritmo de Kruskal (MST) ===")
+
+    # Ejemplo
+    nodos_kruskal = 4
+    aristas_kruskal = [
+        (0, 1, 10),
+        (0, 2, 6),
+        (0, 3, 5),
+        (1, 3, 15),
+        (2, 3, 4)
+    ]
+
+    print(f"Grafo con {nodos_kruskal} nodos y {len(aristas_kruskal)} aristas:")
+    for u, v, peso in aristas_kruskal:
+        print(f"  {u} --{peso}-- {v}")
+
+    mst, peso_total = kruskal(nodos_kruskal, aristas_kruskal)
+    print(f"\nMinimum Spanning Tree (peso total: {peso_total}):")
+    for u, v, peso in mst:
+        print(f"  {u} --{peso}-- {v}")
+    print()
+
+    print("=== 4. Codificación de Huffman ===")
+
+    # Ejemplo
+    texto_huffman = "hello world"
+    print(f"Texto original: '{texto_huffman}'")
+
+    codigos, texto_cod = codificar_huffman(texto_huffman)
+    print("\nCódigos de Huffman:")
+    for caracter, codigo in sorted(codigos.items()):
+        print(f"  '{caracter}': {codigo}")
+
+    print(f"\nTexto codificado: {texto_cod}")
+    print(f"Longitud original: {len(texto_huffman) * 8} bits (ASCII)")
+    print(f"Longitud codificada: {len(texto_cod)} bits")
+    print(f"Compresión: {len(texto_cod) / (len(texto_huffman) * 8) * 100:.1f}%")
+    print()
+
+    print("=== 5. Cambio de Monedas (Algoritmo Greedy) ===")
+
+    # Ejemplo con sistema canónico
+    monedas_canonicas = [1, 5, 10, 25, 50, 100]  # Sistema como USD
+    cantidad_cambio = 287
+
+    print(f"Monedas disponibles: {monedas_canonicas}")
+    print(f"Cantidad a cambiar: {cantidad_cambio}")
+
+    cambio, resto = cambio_monedas_greedy(monedas_canonicas, cantidad_cambio)
+    print(f"\nCambio (moneda, cantidad):")
+    total = 0
+    for moneda, cantidad in cambio:
+        print(f"  {moneda}: {cantidad} moneda(s)")
+        total += moneda * cantidad
+
+    print(f"Total: {total}")
+    if resto > 0:
+        print(f"Resto no cambiado: {resto}")
+
+    # Ejemplo donde greedy falla
+    print("\n⚠️  Ejemplo donde Greedy NO funciona óptimamente:")
+    monedas_no_canonicas = [1, 3, 4]
+    cantidad_falla = 6
+    cambio_greedy, _ = cambio_monedas_greedy(monedas_no_canonicas, cantidad_falla)
+    print(f"Monedas: {monedas_no_canonicas}, Cantidad: {cantidad_falla}")
+    print(f"Greedy da: {sum(m*c for m, c in cambio_greedy)} monedas")
+    print(f"Óptimo sería: 2 monedas (3+3), pero greedy da: {sum(c for _, c in cambio_greedy)} monedas")
+    print()
+
+    print("=== 6. Programación de Intervalos con Pesos ===")
+
+    # Ejemplo
+    intervalos_pesos = [
+        (1, 4, 3),
+        (3, 5, 4),
+        (0, 6, 2),
+        (5, 7, 1),
+        (8, 9, 5),
+        (5, 9, 2)
+    ]
+
+    print("Intervalos (inicio, fin, peso):")
+    for i, (ini, fin, peso) in enumerate(intervalos_pesos):
+        print(f"  Intervalo {i}: [{ini}, {fin}] peso={peso}")
+
+    seleccionados, peso_total = interval_scheduling_pesos(intervalos_pesos)
+    print(f"\nIntervalos seleccionados: {seleccionados}")
+    print(f"Peso total: {peso_total}")
+    for indice in seleccionados:
+        ini, fin, peso = intervalos_pesos[indice]
+        print(f"  Intervalo {indice}: [{ini}, {fin}] peso={peso}")
+    print()
+
+    # Resumen
+    print("=== RESUMEN ===")
+    print("""
 Algoritmos Greedy implementados:
 
 1. Mochila Fraccionaria:
@@ -437,3 +451,7 @@ Características de Algoritmos Greedy:
 - Eficientes pero no siempre óptimos
 - Funcionan bien para problemas con estructura greedy (subestructura óptima)
 """)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,20 @@
 # Archivo: 43_grafos_avanzados.py
 # Descripción: Algoritmos Avanzados de Grafos
 
-from collections import deque, defaultdict
+from array import array
+from collections import deque
+import heapq
+import os
+import random
 import sys
+import tempfile
+
+from algoritmos import cargar_modulo
 
-print("=== Algoritmos Avanzados de Grafos ===\n")
 
 # =============================================================================
 # 1. ALGORITMO DE FLOYD-WARSHALL (Todos los Caminos Más Cortos)
 # =============================================================================
-print("=== 1. Algoritmo de Floyd-Warshall ===")
 
 def floyd_warshall(grafo, num_nodos):
     """
@@ -17,76 +22,214 @@ def floyd_warshall(grafo, num_nodos):
     Funciona con pesos negativos (pero no ciclos negativos).
     Complejidad: O(V³) donde V es el número de nodos
     """
+    inf = float('inf')
+    
     # Inicializar matriz de distancias
-    dist = [[float('inf')] * num_nodos for _ in range(num_nodos)]
+    dist = [[inf] * num_nodos for _ in range(num_nodos)]
     
     # Distancia de un nodo a sí mismo es 0
     for i in range(num_nodos):
         dist[i][i] = 0
     
-    # Distancias iniciales de las aristas
+    # Distancias iniciales de las aristas (con aristas paralelas gana la menor)
     for u, v, peso in grafo:
-        dist[u][v] = peso
+        dist[u][v] = min(dist[u][v], peso)
     
-    # Floyd-Warshall: actualizar distancias considerando cada nodo como intermedio
+    # Floyd-Warshall: actualizar distancias considerando cada nodo como intermedio.
+    # Se actualiza una fila completa por iteración con zip() en vez de
+    # indexar dist[i][j] elemento a elemento.
     for k in range(num_nodos):
+        fila_k = dist[k]
         for i in range(num_nodos):
-            for j in range(num_nodos):
-                if dist[i][k] != float('inf') and dist[k][j] != float('inf'):
-                    dist[i][j] = min(dist[i][j], dist[i][k] + dist[k][j])
+            d_ik = dist[i][k]
+            if d_ik == inf:
+                continue
+            dist[i] = [d if d <= d_ik + d_kj else d_ik + d_kj
+                       for d, d_kj in zip(dist[i], fila_k)]
     
     return dist
 
-# Ejemplo
-nodos_fw = 4
-grafo_fw = [
-    (0, 1, 5),
-    (0, 3, 10),
-    (1, 2, 3),
-    (2, 3, 1),
-    (3, 1, 2)
-]
-
-print(f"Grafo dirigido con {nodos_fw} nodos:")
-for u, v, peso in grafo_fw:
-    print(f"  {u} --{peso}--> {v}")
-
-distancias = floyd_warshall(grafo_fw, nodos_fw)
-
-print("\nMatriz de distancias más cortas (Floyd-Warshall):")
-print("    ", end="")
-for j in range(nodos_fw):
-    print(f"{j:6d}", end="")
-print()
-for i in range(nodos_fw):
-    print(f"{i}: ", end="")
-    for j in range(nodos_fw):
-        if distancias[i][j] == float('inf'):
-            print("   INF", end="")
-        else:
-            print(f"{distancias[i][j]:6.1f}", end="")
-    print()
-print()
+
+def _matrices_floyd_warshall(grafo, num_nodos, con_siguiente):
+    """
+    Construye la matriz inicial de distancias (float64) y, si se pide, las
+    matrices de siguiente salto (-1 donde no hay camino) y de número de
+    aristas de cada camino.
+    """
+    import numpy as np
+    
+    dist = np.full((num_nodos, num_nodos), np.inf)
+    aristas = np.asarray(list(grafo), dtype=np.float64).reshape(-1, 3)
+    u = aristas[:, 0].astype(np.intp)
+    v = aristas[:, 1].astype(np.intp)
+    np.minimum.at(dist, (u, v), aristas[:, 2])
+    
+    diagonal = np.arange(num_nodos)
+    dist[diagonal, diagonal] = np.minimum(dist[diagonal, diagonal], 0)
+    
+    if not con_siguiente:
+        return dist, None
+    
+    siguiente = np.full((num_nodos, num_nodos), -1, dtype=np.intp)
+    siguiente[u, v] = v
+    siguiente[diagonal, diagonal] = diagonal
+    
+    # Sin camino: num_nodos + 1 aristas, más que cualquier camino simple
+    saltos = np.full((num_nodos, num_nodos), num_nodos + 1, dtype=np.intp)
+    saltos[u, v] = 1
+    saltos[diagonal, diagonal] = 0
+    return dist, (siguiente, saltos)
+
+
+def _relajar_bloque(dist, caminos, filas, columnas, pivotes):
+    """
+    Aplica los pivotes k del rango 'pivotes' sobre el bloque
+    dist[filas, columnas] (slices, así que se modifica en el lugar):
+    bloque = min(bloque, dist[filas, k] + dist[k, columnas])
+    
+    Con caminos = (siguiente, saltos), a igual distancia se prefiere el
+    camino con menos aristas; así los ciclos de peso cero no pueden
+    formar bucles en la matriz de siguiente salto, ni siquiera con el
+    orden de pivotes de la versión por bloques.
+    """
+    import numpy as np
+    
+    bloque = dist[filas, columnas]
+    if caminos is None:
+        candidato = np.empty(bloque.shape)  # Se reutiliza en cada pivote
+        for k in range(pivotes.start, pivotes.stop):
+            np.add(dist[filas, k, None], dist[k, columnas], out=candidato)
+            np.minimum(bloque, candidato, out=bloque)
+        return
+    
+    siguiente, saltos = caminos
+    bloque_siguiente = siguiente[filas, columnas]
+    bloque_saltos = saltos[filas, columnas]
+    for k in range(pivotes.start, pivotes.stop):
+        candidato = dist[filas, k, None] + dist[k, columnas]
+        saltos_candidato = saltos[filas, k, None] + saltos[k, columnas]
+        mejora = (candidato < bloque) | ((candidato == bloque) & (saltos_candidato < bloque_saltos))
+        np.copyto(bloque, candidato, where=mejora)
+        np.copyto(bloque_saltos, saltos_candidato, where=mejora)
+        np.copyto(bloque_siguiente, siguiente[filas, k, None], where=mejora)
+
+
+def floyd_warshall_numpy(grafo, num_nodos, con_siguiente=False, bloque=None):
+    """
+    Floyd-Warshall vectorizado con NumPy.
+    
+    - Sin bloque: una actualización min-plus por pivote k sobre toda la
+      matriz (dist = min(dist, dist[:, k] + dist[k, :])), es decir V
+      operaciones vectorizadas en lugar de V³ iteraciones de Python.
+    - Con bloque=b: versión por bloques b x b (diagonal, fila/columna del
+      pivote y resto) para que cada actualización trabaje sobre un bloque
+      que cabe en caché; conviene para matrices mayores que la caché L2.
+    - con_siguiente: calcula también la matriz de siguiente salto para
+      reconstruir caminos con reconstruir_camino_fw().
+    
+    Retorna (dist, siguiente, ciclo_negativo), donde dist es un arreglo
+    V x V de float64, siguiente es None si no se pidió y ciclo_negativo
+    indica si algún nodo tiene distancia negativa a sí mismo.
+    Complejidad: O(V³) operaciones, O(V²) memoria
+    """
+    import numpy as np
+    
+    dist, caminos = _matrices_floyd_warshall(grafo, num_nodos, con_siguiente)
+    
+    if bloque is None or bloque >= num_nodos:
+        todo = slice(0, num_nodos)
+        _relajar_bloque(dist, caminos, todo, todo, todo)
+    else:
+        rangos = [slice(i, min(i + bloque, num_nodos)) for i in range(0, num_nodos, bloque)]
+        for pivotes in rangos:
+            # Fase 1: bloque diagonal; fase 2: su fila y su columna;
+            # fase 3: el resto, que ya puede usar la fila/columna finales
+            _relajar_bloque(dist, caminos, pivotes, pivotes, pivotes)
+            for otro in rangos:
+                if otro != pivotes:
+                    _relajar_bloque(dist, caminos, pivotes, otro, pivotes)
+                    _relajar_bloque(dist, caminos, otro, pivotes, pivotes)
+            for filas in rangos:
+                if filas == pivotes:
+                    continue
+                for columnas in rangos:
+                    if columnas != pivotes:
+                        _relajar_bloque(dist, caminos, filas, columnas, pivotes)
+    
+    ciclo_negativo = bool((np.diagonal(dist) < 0).any())
+    siguiente = caminos[0] if caminos is not None else None
+    return dist, siguiente, ciclo_negativo
+
+
+def reconstruir_camino_fw(siguiente, origen, destino):
+    """
+    Reconstruye el camino origen -> destino a partir de la matriz de
+    siguiente salto. Retorna la lista de nodos o None si no hay camino.
+    """
+    if siguiente[origen][destino] == -1:
+        return None
+    
+    camino = [origen]
+    actual = origen
+    while actual != destino:
+        actual = int(siguiente[actual][destino])
+        camino.append(actual)
+        if len(camino) > len(siguiente):
+            return None  # El camino atraviesa un ciclo negativo
+    return camino
+
 
 # =============================================================================
 # 2. ALGORITMO DE BELLMAN-FORD
 # =============================================================================
-print("=== 2. Algoritmo de Bellman-Ford ===")
+
+def _adyacencia(grafo, num_nodos, transpuesto=False):
+    """
+    Lista de adyacencia compacta de una lista de aristas dirigidas, armada
+    con GrafoCSR.desde_aristas() de 38_grafos.py: los vecinos de u son
+    vecinos[offsets[u]:offsets[u + 1]], en el mismo orden en que aparecen
+    las aristas, y sus pesos (1 si la arista no trae) están en las mismas
+    posiciones. Tres arreglos reemplazan al defaultdict(list).
+    Los pesos van en una lista y no en el array('d') del GrafoCSR, para que
+    los enteros y las fracciones sigan siendo exactos.
+    Con transpuesto=True invierte cada arista. Retorna (offsets, vecinos, pesos).
+    """
+    grafo = list(grafo)
+    if transpuesto:
+        grafo = [(arista[1], arista[0]) for arista in grafo]
+    csr = cargar_modulo("grafos").GrafoCSR.desde_aristas(
+        ((arista[0], arista[1]) for arista in grafo), num_nodos=num_nodos, dirigido=True)
+    
+    # Misma colocación estable que desde_aristas(): la k-ésima arista de u
+    # va en offsets[u] + k
+    pesos = [1] * len(csr.vecinos)
+    posicion = list(csr.offsets)
+    for arista in grafo:
+        u = arista[0]
+        if len(arista) > 2:
+            pesos[posicion[u]] = arista[2]
+        posicion[u] += 1
+    return csr.offsets, csr.vecinos, pesos
 
 def bellman_ford(grafo, num_nodos, origen):
     """
     Encuentra los caminos más cortos desde un nodo origen.
     Funciona con pesos negativos y detecta ciclos negativos.
+    Termina antes si una pasada completa no mejora ninguna distancia.
     Complejidad: O(V * E) donde V=nodos, E=aristas
     """
     distancias = [float('inf')] * num_nodos
     distancias[origen] = 0
     
-    # Relajar todas las aristas V-1 veces
+    # Relajar todas las aristas hasta V-1 veces
     for _ in range(num_nodos - 1):
+        cambio = False
         for u, v, peso in grafo:
             if distancias[u] != float('inf') and distancias[u] + peso < distancias[v]:
                 distancias[v] = distancias[u] + peso
+                cambio = True
+        if not cambio:
+            return distancias, False  # Ya convergió: no puede haber ciclo negativo alcanzable
     
     # Verificar ciclos negativos
     ciclo_negativo = False
@@ -97,176 +240,236 @@ def bellman_ford(grafo, num_nodos, origen):
     
     return distancias, ciclo_negativo
 
-# Ejemplo
-nodos_bf = 5
-grafo_bf = [
-    (0, 1, -1),
-    (0, 2, 4),
-    (1, 2, 3),
-    (1, 3, 2),
-    (1, 4, 2),
-    (3, 2, 5),
-    (3, 1, 1),
-    (4, 3, -3)
-]
-
-print(f"Grafo dirigido con {nodos_bf} nodos (puede tener pesos negativos):")
-for u, v, peso in grafo_bf:
-    print(f"  {u} --{peso}--> {v}")
-
-origen_bf = 0
-distancias_bf, ciclo = bellman_ford(grafo_bf, nodos_bf, origen_bf)
-
-print(f"\nDistancias más cortas desde nodo {origen_bf}:")
-if ciclo:
-    print("  ⚠️  ADVERTENCIA: Se detectó un ciclo negativo!")
-else:
-    for i, dist in enumerate(distancias_bf):
-        if dist == float('inf'):
-            print(f"  Nodo {i}: INFINITO")
-        else:
-            print(f"  Nodo {i}: {dist}")
-print()
+def _spfa(offsets, vecinos, pesos, num_nodos, distancias, cola, max_entradas):
+    """
+    Núcleo de SPFA sobre la adyacencia en arreglos. 'distancias' trae los
+    valores iniciales y 'cola' los nodos desde los que se empieza a relajar.
+    Modifica distancias en su lugar y retorna True si hay un ciclo negativo,
+    es decir, si algún nodo entra a la cola más de max_entradas veces.
+    """
+    en_cola = bytearray(num_nodos)
+    entradas = array('q', [0]) * num_nodos  # Veces que cada nodo entró a la cola
+    for nodo in cola:
+        en_cola[nodo] = 1
+        entradas[nodo] = 1
+    
+    while cola:
+        u = cola.popleft()
+        en_cola[u] = 0
+        distancia_u = distancias[u]
+        for k in range(offsets[u], offsets[u + 1]):
+            v = vecinos[k]
+            nueva = distancia_u + pesos[k]
+            if nueva < distancias[v]:
+                distancias[v] = nueva
+                if not en_cola[v]:
+                    # Sin ciclos negativos un nodo entra a la cola a lo sumo
+                    # una vez por cada "ronda" de Bellman-Ford
+                    entradas[v] += 1
+                    if entradas[v] > max_entradas:
+                        return True
+                    en_cola[v] = 1
+                    cola.append(v)
+    return False
+
+def spfa(grafo, num_nodos, origen):
+    """
+    Bellman-Ford con cola (SPFA, Shortest Path Faster Algorithm).
+    
+    En lugar de relajar todas las aristas en cada pasada, solo se revisan
+    las aristas de los nodos cuya distancia cambió; cuando la cola se vacía
+    ninguna distancia puede mejorar y el algoritmo termina. Un nodo que
+    entra V veces a la cola indica un ciclo negativo alcanzable.
+    
+    Misma interfaz y resultado que bellman_ford(): (distancias, ciclo_negativo).
+    Complejidad: O(V * E) en el peor caso; en la práctica cerca de O(E)
+    """
+    offsets, vecinos, pesos = _adyacencia(grafo, num_nodos)
+    distancias = [float('inf')] * num_nodos
+    distancias[origen] = 0
+    ciclo_negativo = _spfa(offsets, vecinos, pesos, num_nodos, distancias, deque([origen]),
+                           max_entradas=num_nodos - 1)
+    return distancias, ciclo_negativo
+
+def _dijkstra_arrays(offsets, vecinos, pesos, num_nodos, origen):
+    """
+    Dijkstra con heap sobre la adyacencia en arreglos (pesos >= 0).
+    
+    Es el mismo borrado perezoso que _dijkstra_heap() de 38_grafos.py, pero
+    especializado para nodos 0..V-1: estado en listas indexadas en lugar de
+    diccionarios, sin contador de desempate ni una tupla por arista, y sin
+    predecesores. johnson() lo llama V veces, así que el motor general sobre
+    un GrafoCSR sería bastante más lento (ver la familia todos_los_pares).
+    """
+    inf = float('inf')
+    distancias = [inf] * num_nodos
+    distancias[origen] = 0
+    heap = [(0, origen)]
+    while heap:
+        distancia_u, u = heapq.heappop(heap)
+        if distancia_u > distancias[u]:
+            continue  # Entrada obsoleta
+        for k in range(offsets[u], offsets[u + 1]):
+            v = vecinos[k]
+            nueva = distancia_u + pesos[k]
+            if nueva < distancias[v]:
+                distancias[v] = nueva
+                heapq.heappush(heap, (nueva, v))
+    return distancias
+
+def johnson(grafo, num_nodos, origenes=None):
+    """
+    Caminos más cortos entre todos los pares con el algoritmo de Johnson,
+    para grafos dispersos con pesos negativos (sin ciclos negativos).
+    
+    1. Potenciales h: SPFA desde un nodo virtual unido a todos con peso 0
+       (equivale a empezar con h = 0 y todos los nodos en la cola).
+    2. Repesado, una sola vez: w'(u, v) = w(u, v) + h[u] - h[v] >= 0.
+    3. Un Dijkstra con heap por origen sobre los pesos w'; al final
+       d(u, v) = d'(u, v) - h[u] + h[v].
+    
+    origenes: filas a calcular (por defecto todas). Retorna la matriz de
+    distancias como lista de filas, en el orden de 'origenes', o None si
+    hay un ciclo negativo.
+    Complejidad: O(V * E log V), frente a O(V³) de Floyd-Warshall
+    """
+    offsets, vecinos, pesos = _adyacencia(grafo, num_nodos)
+    
+    # Paso 1: potenciales (el nodo virtual da V + 1 nodos en total)
+    potencial = [0] * num_nodos
+    if _spfa(offsets, vecinos, pesos, num_nodos, potencial, deque(range(num_nodos)),
+             max_entradas=num_nodos):
+        return None  # Ciclo negativo
+    
+    # Paso 2: repesar cada arista una vez (en una lista, para no perder exactitud)
+    repesados = list(pesos)
+    for u in range(num_nodos):
+        h_u = potencial[u]
+        for k in range(offsets[u], offsets[u + 1]):
+            repesados[k] += h_u - potencial[vecinos[k]]
+    
+    # Paso 3: Dijkstra desde cada origen y deshacer el repesado
+    inf = float('inf')
+    filas = []
+    for origen in (range(num_nodos) if origenes is None else origenes):
+        distancias = _dijkstra_arrays(offsets, vecinos, repesados, num_nodos, origen)
+        h_origen = potencial[origen]
+        filas.append([d - h_origen + h_v if d != inf else inf
+                      for d, h_v in zip(distancias, potencial)])
+    return filas
+
 
 # =============================================================================
 # 3. TOPOLOGICAL SORT (Ordenamiento Topológico)
 # =============================================================================
-print("=== 3. Ordenamiento Topológico ===")
 
-def topological_sort_kahn(grafo, num_nodos):
+def _dfs_postorden(offsets, vecinos, num_nodos, detectar_ciclos=False):
     """
-    Ordenamiento topológico usando algoritmo de Kahn (BFS-based).
+    DFS iterativo desde cada nodo no visitado (en orden 0..V-1). Retorna el
+    arreglo de nodos en postorden (orden en que terminan), o None si
+    detectar_ciclos=True y aparece una arista hacia un nodo en la pila.
+    
+    En lugar de la recursión, cada nodo de la pila recuerda en siguiente[]
+    cuál es su próxima arista por revisar, así que la profundidad del
+    grafo no está limitada por sys.getrecursionlimit().
+    """
+    estado = bytearray(num_nodos)  # 0 = sin visitar, 1 = en la pila, 2 = terminado
+    siguiente = offsets[:num_nodos]
+    postorden = array('q')
+    pila = array('q')
+    
+    for raiz in range(num_nodos):
+        if estado[raiz]:
+            continue
+        estado[raiz] = 1
+        pila.append(raiz)
+        while pila:
+            nodo = pila[-1]
+            k = siguiente[nodo]
+            if k < offsets[nodo + 1]:
+                siguiente[nodo] = k + 1
+                vecino = vecinos[k]
+                if estado[vecino] == 0:
+                    estado[vecino] = 1
+                    pila.append(vecino)
+                elif estado[vecino] == 1 and detectar_ciclos:
+                    return None
+            else:
+                pila.pop()
+                estado[nodo] = 2
+                postorden.append(nodo)
+    
+    return postorden
+
+def topological_sort_kahn_iter(grafo, num_nodos):
+    """
+    Kahn como generador: entrega cada nodo en cuanto queda sin
+    dependencias, sin esperar a tener el orden completo. La cola es el
+    propio arreglo de nodos listos, leído con un índice de cabeza.
+    Si al terminar quedan nodos sin entregar, hay un ciclo: ValueError.
     Complejidad: O(V + E)
     """
-    # Calcular grados de entrada
-    grados_entrada = [0] * num_nodos
-    lista_adyacencia = defaultdict(list)
+    offsets, vecinos, _ = _adyacencia(grafo, num_nodos)
     
-    for u, v in grafo:
-        lista_adyacencia[u].append(v)
+    grados_entrada = array('q', [0]) * num_nodos
+    for v in vecinos:
         grados_entrada[v] += 1
     
-    # Cola de nodos sin dependencias
-    cola = deque([i for i in range(num_nodos) if grados_entrada[i] == 0])
-    orden = []
-    
-    while cola:
-        nodo = cola.popleft()
-        orden.append(nodo)
+    listos = array('q', (i for i in range(num_nodos) if grados_entrada[i] == 0))
+    cabeza = 0
+    while cabeza < len(listos):
+        nodo = listos[cabeza]
+        cabeza += 1
+        yield nodo
         
-        for vecino in lista_adyacencia[nodo]:
+        for k in range(offsets[nodo], offsets[nodo + 1]):
+            vecino = vecinos[k]
             grados_entrada[vecino] -= 1
             if grados_entrada[vecino] == 0:
-                cola.append(vecino)
+                listos.append(vecino)
     
-    # Si no se procesaron todos los nodos, hay un ciclo
-    if len(orden) != num_nodos:
+    if len(listos) != num_nodos:
+        raise ValueError(f"El grafo tiene un ciclo: {num_nodos - len(listos)} nodos no se pudieron ordenar")
+
+def topological_sort_kahn(grafo, num_nodos):
+    """
+    Ordenamiento topológico usando algoritmo de Kahn (BFS-based).
+    Retorna None si hay un ciclo.
+    Complejidad: O(V + E)
+    """
+    orden = array('q')
+    try:
+        orden.extend(topological_sort_kahn_iter(grafo, num_nodos))
+    except ValueError:
         return None  # Ciclo detectado
-    
-    return orden
+    return orden.tolist()
 
 def topological_sort_dfs(grafo, num_nodos):
     """
-    Ordenamiento topológico usando DFS.
+    Ordenamiento topológico usando DFS (iterativo): el postorden al revés.
+    Retorna None si hay un ciclo.
     Complejidad: O(V + E)
     """
-    lista_adyacencia = defaultdict(list)
-    for u, v in grafo:
-        lista_adyacencia[u].append(v)
-    
-    visitados = [False] * num_nodos
-    pila_recursion = [False] * num_nodos
-    resultado = []
-    ciclo_detectado = False
-    
-    def dfs(nodo):
-        nonlocal ciclo_detectado
-        if pila_recursion[nodo]:
-            ciclo_detectado = True
-            return
-        if visitados[nodo]:
-            return
-        
-        visitados[nodo] = True
-        pila_recursion[nodo] = True
-        
-        for vecino in lista_adyacencia[nodo]:
-            dfs(vecino)
-        
-        pila_recursion[nodo] = False
-        resultado.append(nodo)
-    
-    for i in range(num_nodos):
-        if not visitados[i]:
-            dfs(i)
-    
-    if ciclo_detectado:
+    offsets, vecinos, _ = _adyacencia(grafo, num_nodos)
+    postorden = _dfs_postorden(offsets, vecinos, num_nodos, detectar_ciclos=True)
+    if postorden is None:
         return None
     
-    resultado.reverse()
-    return resultado
-
-# Ejemplo
-nodos_top = 6
-grafo_top = [
-    (5, 2),
-    (5, 0),
-    (4, 0),
-    (4, 1),
-    (2, 3),
-    (3, 1)
-]
-
-print(f"Grafo dirigido acíclico (DAG) con {nodos_top} nodos:")
-for u, v in grafo_top:
-    print(f"  {u} --> {v}")
+    postorden.reverse()
+    return postorden.tolist()
 
-orden_kahn = topological_sort_kahn(grafo_top, nodos_top)
-orden_dfs = topological_sort_dfs(grafo_top, nodos_top)
-
-print(f"\nOrdenamiento topológico (Kahn): {orden_kahn}")
-print(f"Ordenamiento topológico (DFS): {orden_dfs}")
-print()
 
 # =============================================================================
 # 4. DETECCIÓN DE CICLOS (Cycle Detection)
 # =============================================================================
-print("=== 4. Detección de Ciclos en Grafos ===")
 
 def detectar_ciclo_dfs(grafo, num_nodos):
     """
-    Detecta si hay un ciclo en un grafo dirigido usando DFS.
+    Detecta si hay un ciclo en un grafo dirigido usando DFS (iterativo):
+    hay ciclo si alguna arista llega a un nodo que sigue en la pila.
     """
-    lista_adyacencia = defaultdict(list)
-    for u, v in grafo:
-        lista_adyacencia[u].append(v)
-    
-    visitados = [False] * num_nodos
-    pila_recursion = [False] * num_nodos
-    ciclo_encontrado = False
-    
-    def dfs(nodo):
-        nonlocal ciclo_encontrado
-        if pila_recursion[nodo]:
-            ciclo_encontrado = True
-            return
-        if visitados[nodo]:
-            return
-        
-        visitados[nodo] = True
-        pila_recursion[nodo] = True
-        
-        for vecino in lista_adyacencia[nodo]:
-            if not ciclo_encontrado:
-                dfs(vecino)
-        
-        pila_recursion[nodo] = False
-    
-    for i in range(num_nodos):
-        if not visitados[i] and not ciclo_encontrado:
-            dfs(i)
-    
-    return ciclo_encontrado
+    offsets, vecinos, _ = _adyacencia(grafo, num_nodos)
+    return _dfs_postorden(offsets, vecinos, num_nodos, detectar_ciclos=True) is None
 
 def detectar_ciclo_union_find(grafo, num_nodos):
     """
@@ -297,145 +500,520 @@ def detectar_ciclo_union_find(grafo, num_nodos):
     
     return False
 
-# Ejemplo
-grafo_con_ciclo = [
-    (0, 1),
-    (1, 2),
-    (2, 0)
-]
-
-grafo_sin_ciclo = [
-    (0, 1),
-    (1, 2),
-    (2, 3)
-]
-
-print("Grafo con ciclo (0->1->2->0):")
-ciclo1 = detectar_ciclo_dfs(grafo_con_ciclo, 3)
-print(f"  Ciclo detectado: {ciclo1}")
-
-print("\nGrafo sin ciclo (0->1->2->3):")
-ciclo2 = detectar_ciclo_dfs(grafo_sin_ciclo, 4)
-print(f"  Ciclo detectado: {ciclo2}")
-
-# Union-Find para grafo no dirigido
-grafo_no_dirigido_ciclo = [
-    (0, 1),
-    (1, 2),
-    (2, 0)
-]
-print("\nGrafo no dirigido con ciclo:")
-ciclo3 = detectar_ciclo_union_find(grafo_no_dirigido_ciclo, 3)
-print(f"  Ciclo detectado (Union-Find): {ciclo3}")
-print()
 
 # =============================================================================
-# 5. STRONGLY CONNECTED COMPONENTS (Kosaraju's Algorithm)
+# 5. STRONGLY CONNECTED COMPONENTS (Kosaraju y Tarjan)
 # =============================================================================
-print("=== 5. Componentes Fuertemente Conexos (Kosaraju) ===")
 
 def kosaraju_scc(grafo, num_nodos):
     """
     Encuentra las componentes fuertemente conexas usando algoritmo de Kosaraju.
+    Dos DFS iterativos: uno sobre el grafo para el orden de finalización y
+    otro sobre el transpuesto, en orden inverso de finalización.
     Complejidad: O(V + E)
     """
     # Construir grafo y grafo transpuesto
-    lista_adyacencia = defaultdict(list)
-    lista_adyacencia_transpuesto = defaultdict(list)
-    
-    for u, v in grafo:
-        lista_adyacencia[u].append(v)
-        lista_adyacencia_transpuesto[v].append(u)
+    offsets, vecinos, _ = _adyacencia(grafo, num_nodos)
+    offsets_t, vecinos_t, _ = _adyacencia(grafo, num_nodos, transpuesto=True)
     
     # Paso 1: DFS en grafo original para obtener orden de finalización
-    visitados = [False] * num_nodos
-    pila = []
-    
-    def dfs1(nodo):
-        visitados[nodo] = True
-        for vecino in lista_adyacencia[nodo]:
-            if not visitados[vecino]:
-                dfs1(vecino)
-        pila.append(nodo)
-    
-    for i in range(num_nodos):
-        if not visitados[i]:
-            dfs1(i)
+    pila = _dfs_postorden(offsets, vecinos, num_nodos)
     
     # Paso 2: DFS en grafo transpuesto en orden inverso
-    visitados = [False] * num_nodos
+    visitados = bytearray(num_nodos)
     componentes = []
-    
-    def dfs2(nodo, componente):
-        visitados[nodo] = True
-        componente.append(nodo)
-        for vecino in lista_adyacencia_transpuesto[nodo]:
-            if not visitados[vecino]:
-                dfs2(vecino, componente)
+    siguiente = offsets_t[:num_nodos]
+    recorrido = array('q')
     
     while pila:
-        nodo = pila.pop()
-        if not visitados[nodo]:
-            componente = []
-            dfs2(nodo, componente)
-            componentes.append(componente)
+        raiz = pila.pop()
+        if visitados[raiz]:
+            continue
+        visitados[raiz] = 1
+        componente = [raiz]
+        recorrido.append(raiz)
+        while recorrido:
+            nodo = recorrido[-1]
+            k = siguiente[nodo]
+            if k < offsets_t[nodo + 1]:
+                siguiente[nodo] = k + 1
+                vecino = vecinos_t[k]
+                if not visitados[vecino]:
+                    visitados[vecino] = 1
+                    componente.append(vecino)
+                    recorrido.append(vecino)
+            else:
+                recorrido.pop()
+        componentes.append(componente)
     
     return componentes
 
-# Ejemplo
-nodos_scc = 8
-grafo_scc = [
-    (0, 1),
-    (1, 2),
-    (2, 0),
-    (1, 3),
-    (3, 4),
-    (4, 5),
-    (5, 3),
-    (6, 5),
-    (6, 7),
-    (7, 6)
-]
-
-print(f"Grafo dirigido con {nodos_scc} nodos:")
-for u, v in grafo_scc:
-    print(f"  {u} --> {v}")
-
-sccs = kosaraju_scc(grafo_scc, nodos_scc)
-print(f"\nComponentes fuertemente conexas (SCC): {len(sccs)}")
-for i, componente in enumerate(sccs):
-    print(f"  SCC {i+1}: {componente}")
-print()
-
-# Resumen
-print("=== RESUMEN ===")
-print("""
+def tarjan_scc(grafo, num_nodos, etiquetas=False):
+    """
+    Componentes fuertemente conexas con el algoritmo de Tarjan: un solo
+    DFS (iterativo) y sin construir el grafo transpuesto.
+    
+    Cada nodo recibe un índice de descubrimiento y un valor 'bajo' (el menor
+    índice alcanzable desde su subárbol sin salir de la pila). Un nodo con
+    bajo == índice es la raíz de una componente: se desapila hasta él.
+    
+    Retorna la lista de componentes (en orden topológico inverso del grafo
+    de componentes) o, con etiquetas=True, (num_componentes, arreglo) con el
+    número de componente de cada nodo, que evita una lista por componente.
+    Complejidad: O(V + E)
+    """
+    offsets, vecinos, _ = _adyacencia(grafo, num_nodos)
+    
+    indice = array('q', [-1]) * num_nodos
+    bajo = array('q', [0]) * num_nodos
+    en_pila = bytearray(num_nodos)
+    siguiente = offsets[:num_nodos]
+    pila_dfs = array('q')
+    pila_scc = array('q')
+    componente_de = array('q', [-1]) * num_nodos if etiquetas else None
+    componentes = []
+    num_componentes = 0
+    contador = 0
+    
+    for raiz in range(num_nodos):
+        if indice[raiz] >= 0:
+            continue
+        indice[raiz] = bajo[raiz] = contador
+        contador += 1
+        pila_dfs.append(raiz)
+        pila_scc.append(raiz)
+        en_pila[raiz] = 1
+        
+        while pila_dfs:
+            nodo = pila_dfs[-1]
+            k = siguiente[nodo]
+            if k < offsets[nodo + 1]:
+                siguiente[nodo] = k + 1
+                vecino = vecinos[k]
+                if indice[vecino] < 0:
+                    # Arista de árbol: "llamada recursiva" sobre el vecino
+                    indice[vecino] = bajo[vecino] = contador
+                    contador += 1
+                    pila_dfs.append(vecino)
+                    pila_scc.append(vecino)
+                    en_pila[vecino] = 1
+                elif en_pila[vecino] and indice[vecino] < bajo[nodo]:
+                    bajo[nodo] = indice[vecino]
+                continue
+            
+            # Todas las aristas revisadas: "retorno" al padre
+            pila_dfs.pop()
+            if pila_dfs and bajo[nodo] < bajo[pila_dfs[-1]]:
+                bajo[pila_dfs[-1]] = bajo[nodo]
+            if bajo[nodo] == indice[nodo]:
+                componente = []
+                while True:
+                    miembro = pila_scc.pop()
+                    en_pila[miembro] = 0
+                    if etiquetas:
+                        componente_de[miembro] = num_componentes
+                    else:
+                        componente.append(miembro)
+                    if miembro == nodo:
+                        break
+                num_componentes += 1
+                if not etiquetas:
+                    componentes.append(componente)
+    
+    return (num_componentes, componente_de) if etiquetas else componentes
+
+
+# =============================================================================
+# 6. CARGA DE GRAFOS GRANDES DESDE ARCHIVO
+# =============================================================================
+
+def cargar_lista_aristas(ruta, con_pesos=True, binario=False, **opciones):
+    """
+    Carga un grafo dirigido desde archivo y lo retorna en el formato de
+    este módulo: (aristas, num_nodos).
+    
+    - Texto (CSV, TSV o por espacios): se lee por bloques con
+      GrafoCSR.desde_archivo(), sin una tupla por arista en memoria.
+    - binario=True: archivo guardado con GrafoCSR.guardar(); se mapea en
+      memoria en vez de volver a interpretar el texto.
+    
+    'aristas' genera (u, v, peso) o (u, v) al recorrerse y se puede recorrer
+    varias veces (Bellman-Ford la recorre V veces).
+    """
+    GrafoCSR = cargar_modulo("grafos").GrafoCSR
+    if binario:
+        grafo = GrafoCSR.cargar(ruta, **opciones)
+    else:
+        grafo = GrafoCSR.desde_archivo(ruta, dirigido=True, **opciones)
+    return grafo.aristas(con_pesos), grafo.num_nodos
+
+
+# =============================================================================
+# BENCHMARKS
+# =============================================================================
+
+def _grafo_aleatorio(num_nodos, aristas_por_nodo=4, semilla=42):
+    """Lista de aristas (u, v, peso) aleatoria con pesos positivos."""
+    rng = random.Random(semilla)
+    aristas = [(rng.randrange(num_nodos), rng.randrange(num_nodos), rng.randint(1, 100))
+               for _ in range(num_nodos * aristas_por_nodo)]
+    return aristas, num_nodos
+
+def _grafo_con_potenciales(num_nodos, aristas_por_nodo=4, semilla=42):
+    """
+    Lista de aristas con pesos negativos pero sin ciclos negativos:
+    w(u, v) = c + p[u] - p[v] con c > 0, así todo ciclo suma c > 0.
+    """
+    rng = random.Random(semilla)
+    potencial = [rng.randint(-100, 100) for _ in range(num_nodos)]
+    aristas = []
+    for _ in range(num_nodos * aristas_por_nodo):
+        u, v = rng.randrange(num_nodos), rng.randrange(num_nodos)
+        aristas.append((u, v, rng.randint(1, 100) + potencial[u] - potencial[v]))
+    return aristas, num_nodos
+
+def _floyd_warshall_matriz(grafo, num_nodos):
+    """floyd_warshall_numpy() devolviendo solo las distancias como listas."""
+    return floyd_warshall_numpy(grafo, num_nodos)[0].tolist()
+
+def _floyd_warshall_por_bloques(grafo, num_nodos):
+    """Igual que _floyd_warshall_matriz() pero con bloques de 256 x 256."""
+    return floyd_warshall_numpy(grafo, num_nodos, bloque=256)[0].tolist()
+
+def _cadena(num_nodos):
+    """Camino 0 -> 1 -> ... -> V-1: el peor caso de profundidad para un DFS."""
+    return [(i, i + 1) for i in range(num_nodos - 1)], num_nodos
+
+def _mismas_distancias(resultado, esperado):
+    """Igualdad exacta, también de tipos: 2 y 2.0 no cuentan como iguales."""
+    return resultado == esperado and all(
+        type(a) is type(b) for a, b in zip(resultado[0], esperado[0]))
+
+def _es_orden_topologico(orden, grafo, num_nodos):
+    posicion = [0] * num_nodos
+    for i, nodo in enumerate(orden):
+        posicion[nodo] = i
+    return len(orden) == num_nodos and all(posicion[u] < posicion[v] for u, v in grafo)
+
+
+# Familia para el sistema de benchmarks (python -m algoritmos.benchmark)
+BENCHMARKS = {
+    "floyd_warshall": {
+        "implementaciones": {
+            "floyd_warshall": floyd_warshall,
+            "floyd_warshall_numpy": _floyd_warshall_matriz,
+            "floyd_warshall_bloques": _floyd_warshall_por_bloques,
+        },
+        "entrada": _grafo_aleatorio,
+        "tamanios": [50, 200, 1000],
+        "limites": {"floyd_warshall": 200},
+        "verificar": lambda distancias, grafo, num_nodos:
+            distancias == _floyd_warshall_matriz(grafo, num_nodos),
+    },
+    "caminos_un_origen": {
+        "implementaciones": {
+            "bellman_ford": bellman_ford,
+            "spfa": spfa,
+        },
+        "entrada": lambda n: (*_grafo_con_potenciales(n), 0),
+        "tamanios": [1000, 10000, 100000],
+        "verificar": lambda resultado, grafo, num_nodos, origen:
+            _mismas_distancias(resultado, bellman_ford(grafo, num_nodos, origen)),
+    },
+    "todos_los_pares": {
+        "implementaciones": {
+            "floyd_warshall": floyd_warshall,
+            "floyd_warshall_numpy": _floyd_warshall_matriz,
+            "johnson": johnson,
+        },
+        "entrada": _grafo_con_potenciales,
+        "tamanios": [100, 300, 1000],
+        "limites": {"floyd_warshall": 300},
+        "verificar": lambda distancias, grafo, num_nodos:
+            distancias == johnson(grafo, num_nodos),
+    },
+    "componentes_fuertes": {
+        "implementaciones": {
+            "kosaraju": lambda grafo, num_nodos: len(kosaraju_scc(grafo, num_nodos)),
+            "tarjan": lambda grafo, num_nodos: len(tarjan_scc(grafo, num_nodos)),
+            "tarjan_etiquetas": lambda grafo, num_nodos: tarjan_scc(grafo, num_nodos, etiquetas=True)[0],
+        },
+        "entrada": lambda n: _grafo_aleatorio(n, aristas_por_nodo=1),
+        "tamanios": [10000, 100000, 1000000],
+        "verificar": lambda num_componentes, grafo, num_nodos:
+            num_componentes == len(kosaraju_scc(grafo, num_nodos)),
+    },
+    "orden_topologico": {
+        "implementaciones": {
+            "kahn": topological_sort_kahn,
+            "dfs": topological_sort_dfs,
+        },
+        "entrada": _cadena,
+        "tamanios": [10000, 100000, 1000000],
+        "verificar": _es_orden_topologico,
+    },
+}
+
+
+def main():
+    """Ejecuta los ejemplos y comparaciones del módulo."""
+    print("=== Algoritmos Avanzados de Grafos ===\n")
+
+    print("=== 1. Algoritmo de Floyd-Warshall ===")
+
+    # Ejemplo
+    nodos_fw = 4
+    grafo_fw = [
+        (0, 1, 5),
+        (0, 3, 10),
+        (1, 2, 3),
+        (2, 3, 1),
+        (3, 1, 2)
+    ]
+
+    print(f"Grafo dirigido con {nodos_fw} nodos:")
+    for u, v, peso in grafo_fw:
+        print(f"  {u} --{peso}--> {v}")
+
+    distancias = floyd_warshall(grafo_fw, nodos_fw)
+
+    print("\nMatriz de distancias más cortas (Floyd-Warshall):")
+    print("    ", end="")
+    for j in range(nodos_fw):
+        print(f"{j:6d}", end="")
+    print()
+    for i in range(nodos_fw):
+        print(f"{i}: ", end="")
+        for j in range(nodos_fw):
+            if distancias[i][j] == float('inf'):
+                print("   INF", end="")
+            else:
+                print(f"{distancias[i][j]:6.1f}", end="")
+        print()
+
+    # Versión vectorizada con matriz de siguiente salto (requiere NumPy)
+    try:
+        dist_np, siguiente, ciclo_negativo = floyd_warshall_numpy(
+            grafo_fw, nodos_fw, con_siguiente=True)
+    except ImportError:
+        print("\nNumPy no está instalado: se omite floyd_warshall_numpy()")
+    else:
+        print(f"\nfloyd_warshall_numpy coincide: {dist_np.tolist() == distancias}")
+        print(f"Camino más corto 0 -> 2: {reconstruir_camino_fw(siguiente, 0, 2)}")
+        print(f"¿Ciclo negativo?: {ciclo_negativo}")
+        _, _, ciclo_negativo = floyd_warshall_numpy([(0, 1, 1), (1, 0, -3)], 2)
+        print(f"¿Ciclo negativo en 0 <-> 1 (pesos 1 y -3)?: {ciclo_negativo}")
+    print()
+
+    print("=== 2. Algoritmo de Bellman-Ford ===")
+
+    # Ejemplo
+    nodos_bf = 5
+    grafo_bf = [
+        (0, 1, -1),
+        (0, 2, 4),
+        (1, 2, 3),
+        (1, 3, 2),
+        (1, 4, 2),
+        (3, 2, 5),
+        (3, 1, 1),
+        (4, 3, -3)
+    ]
+
+    print(f"Grafo dirigido con {nodos_bf} nodos (puede tener pesos negativos):")
+    for u, v, peso in grafo_bf:
+        print(f"  {u} --{peso}--> {v}")
+
+    origen_bf = 0
+    distancias_bf, ciclo_bf = bellman_ford(grafo_bf, nodos_bf, origen_bf)
+
+    print(f"\nDistancias más cortas desde nodo {origen_bf}:")
+    if ciclo_bf:
+        print("  ⚠️  ADVERTENCIA: Se detectó un ciclo negativo!")
+    else:
+        for i, dist in enumerate(distancias_bf):
+            if dist == float('inf'):
+                print(f"  Nodo {i}: INFINITO")
+            else:
+                print(f"  Nodo {i}: {dist}")
+    
+    distancias_spfa, ciclo = spfa(grafo_bf, nodos_bf, origen_bf)
+    print(f"\nSPFA (solo relaja nodos que cambiaron): {distancias_spfa}, ciclo negativo: {ciclo}")
+    print(f"¿SPFA da exactamente lo mismo que Bellman-Ford? "
+          f"{_mismas_distancias((distancias_spfa, ciclo), (distancias_bf, ciclo_bf))}")
+    print(f"SPFA con ciclo negativo 1 -> 2 -> 1: {spfa(grafo_bf + [(2, 1, -4)], nodos_bf, origen_bf)[1]}")
+    
+    print("\nJohnson (repesado + un Dijkstra por origen):")
+    for i, fila in enumerate(johnson(grafo_bf, nodos_bf)):
+        print(f"  {i}: {fila}")
+    print(f"Coincide con Floyd-Warshall: {johnson(grafo_bf, nodos_bf) == floyd_warshall(grafo_bf, nodos_bf)}")
+    print()
+
+    print("=== 3. Ordenamiento Topológico ===")
+
+    # Ejemplo
+    nodos_top = 6
+    grafo_top = [
+        (5, 2),
+        (5, 0),
+        (4, 0),
+        (4, 1),
+        (2, 3),
+        (3, 1)
+    ]
+
+    print(f"Grafo dirigido acíclico (DAG) con {nodos_top} nodos:")
+    for u, v in grafo_top:
+        print(f"  {u} --> {v}")
+
+    orden_kahn = topological_sort_kahn(grafo_top, nodos_top)
+    orden_dfs = topological_sort_dfs(grafo_top, nodos_top)
+
+    print(f"\nOrdenamiento topológico (Kahn): {orden_kahn}")
+    print(f"Ordenamiento topológico (DFS): {orden_dfs}")
+    
+    # Kahn como generador: cada nodo sale en cuanto queda sin dependencias
+    print("Kahn por demanda:", end="")
+    for nodo in topological_sort_kahn_iter(grafo_top, nodos_top):
+        print(f" {nodo}", end="")
+    print()
+    
+    # Los DFS son iterativos: una cadena de 10⁵ nodos no agota la recursión
+    cadena, nodos_cadena = _cadena(100000)
+    orden_cadena = topological_sort_dfs(cadena, nodos_cadena)
+    print(f"Cadena de {nodos_cadena} nodos (DFS iterativo): {orden_cadena[:3]} ... {orden_cadena[-2:]}")
+    print()
+
+    print("=== 4. Detección de Ciclos en Grafos ===")
+
+    # Ejemplo
+    grafo_con_ciclo = [
+        (0, 1),
+        (1, 2),
+        (2, 0)
+    ]
+
+    grafo_sin_ciclo = [
+        (0, 1),
+        (1, 2),
+        (2, 3)
+    ]
+
+    print("Grafo con ciclo (0->1->2->0):")
+    ciclo1 = detectar_ciclo_dfs(grafo_con_ciclo, 3)
+    print(f"  Ciclo detectado: {ciclo1}")
+
+    print("\nGrafo sin ciclo (0->1->2->3):")
+    ciclo2 = detectar_ciclo_dfs(grafo_sin_ciclo, 4)
+    print(f"  Ciclo detectado: {ciclo2}")
+
+    # Union-Find para grafo no dirigido
+    grafo_no_dirigido_ciclo = [
+        (0, 1),
+        (1, 2),
+        (2, 0)
+    ]
+    print("\nGrafo no dirigido con ciclo:")
+    ciclo3 = detectar_ciclo_union_find(grafo_no_dirigido_ciclo, 3)
+    print(f"  Ciclo detectado (Union-Find): {ciclo3}")
+    print()
+
+    print("=== 5. Componentes Fuertemente Conexos (Kosaraju y Tarjan) ===")
+
+    # Ejemplo
+    nodos_scc = 8
+    grafo_scc = [
+        (0, 1),
+        (1, 2),
+        (2, 0),
+        (1, 3),
+        (3, 4),
+        (4, 5),
+        (5, 3),
+        (6, 5),
+        (6, 7),
+        (7, 6)
+    ]
+
+    print(f"Grafo dirigido con {nodos_scc} nodos:")
+    for u, v in grafo_scc:
+        print(f"  {u} --> {v}")
+
+    sccs = kosaraju_scc(grafo_scc, nodos_scc)
+    print(f"\nComponentes fuertemente conexas (SCC): {len(sccs)}")
+    for i, componente in enumerate(sccs):
+        print(f"  SCC {i+1}: {componente}")
+    
+    print(f"\nTarjan (una sola pasada): {tarjan_scc(grafo_scc, nodos_scc)}")
+    num_componentes, componente_de = tarjan_scc(grafo_scc, nodos_scc, etiquetas=True)
+    print(f"Tarjan con etiquetas: {num_componentes} componentes, {componente_de.tolist()}")
+    num_componentes, _ = tarjan_scc(cadena + [(nodos_cadena - 1, 0)], nodos_cadena, etiquetas=True)
+    print(f"Cadena de {nodos_cadena} nodos cerrada en ciclo: {num_componentes} componente")
+    print()
+
+    print("=== 6. Carga de Grafos desde Archivo ===")
+
+    # Ejemplo: el mismo grafo de Kosaraju, ahora como lista de aristas en texto
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "scc.txt")
+        with open(ruta, "w") as archivo:
+            archivo.write("# origen destino\n")
+            archivo.writelines(f"{u} {v}\n" for u, v in grafo_scc)
+        aristas, num_nodos = cargar_lista_aristas(ruta, con_pesos=False)
+        print(f"Leído '{os.path.basename(ruta)}': {len(aristas)} aristas, {num_nodos} nodos")
+        print(f"SCC del grafo cargado: {kosaraju_scc(aristas, num_nodos)}")
+        
+        ruta_binaria = os.path.join(directorio, "bf.gcsr")
+        cargar_modulo("grafos").GrafoCSR.desde_arrays(
+            [u for u, _, _ in grafo_bf], [v for _, v, _ in grafo_bf],
+            [peso for _, _, peso in grafo_bf], dirigido=True).guardar(ruta_binaria)
+        aristas, num_nodos = cargar_lista_aristas(ruta_binaria, binario=True)
+        print(f"Bellman-Ford sobre el grafo binario mapeado: {bellman_ford(aristas, num_nodos, 0)[0]}")
+        del aristas
+    print()
+
+    # Resumen
+    print("=== RESUMEN ===")
+    print("""
 Algoritmos avanzados de grafos implementados:
 
 1. Floyd-Warshall:
    - Todos los caminos más cortos entre todos los pares
    - Complejidad: O(V³)
    - Funciona con pesos negativos (sin ciclos negativos)
+   - Versión NumPy: una actualización vectorizada por pivote, por bloques
+     para matrices grandes, con siguiente salto y detección de ciclos negativos
 
 2. Bellman-Ford:
    - Camino más corto desde un origen
    - Complejidad: O(V * E)
    - Detecta ciclos negativos
+   - Termina antes si una pasada no mejora ninguna distancia
+   - SPFA: cola con los nodos que cambiaron; ciclo negativo si un nodo
+     entra V veces a la cola
+   - Johnson: potenciales con SPFA, repesado a pesos >= 0 y un Dijkstra
+     por origen; O(V * E log V), para todos los pares en grafos dispersos
 
 3. Topological Sort:
    - Ordenamiento de nodos en DAG
-   - Algoritmos: Kahn (BFS) y DFS
+   - Algoritmos: Kahn (BFS, también como generador) y DFS iterativo
    - Complejidad: O(V + E)
 
 4. Detección de Ciclos:
-   - DFS para grafos dirigidos
+   - DFS iterativo para grafos dirigidos
    - Union-Find para grafos no dirigidos
    - Complejidad: O(V + E)
 
-5. Componentes Fuertemente Conexas (Kosaraju):
+5. Componentes Fuertemente Conexas (Kosaraju y Tarjan):
    - Encuentra SCC en grafo dirigido
+   - Kosaraju: dos DFS (grafo y transpuesto); Tarjan: un solo DFS
+   - DFS con pila explícita y arreglos: sin límite de recursión
    - Complejidad: O(V + E)
 
+6. Carga desde archivo:
+   - Listas de aristas CSV/TSV leídas por bloques a un GrafoCSR
+   - Formato binario mapeado en memoria: carga en milisegundos
+
 Aplicaciones:
 - Floyd-Warshall: Redes, routing
 - Bellman-Ford: Detección de ciclos negativos
@@ -443,3 +1021,7 @@ Aplicaciones:
 - Cycle Detection: Validación de grafos
 - SCC: Análisis de redes sociales, web crawling
 """)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,15 @@
 # Archivo: 44_algoritmos_strings.py
 # Descripción: Algoritmos Avanzados de Strings
 
-print("=== Algoritmos Avanzados de Strings ===\n")
+from array import array
+
+from algoritmos import cargar_modulo
+from algoritmos.benchmark import medir
+
 
 # =============================================================================
 # 1. ALGORITMO RABIN-KARP (String Matching)
 # =============================================================================
-print("=== 1. Algoritmo Rabin-Karp ===")
 
 def rabin_karp(texto, patron, base=256, primo=101):
     """
@@ -54,20 +57,10 @@ def rabin_karp(texto, patron, base=256, primo=101):
     
     return ocurrencias
 
-# Ejemplo
-texto_rk = "GEEKS FOR GEEKS"
-patron_rk = "GEEK"
-
-print(f"Texto: '{texto_rk}'")
-print(f"Patrón: '{patron_rk}'")
-ocurrencias_rk = rabin_karp(texto_rk, patron_rk)
-print(f"Ocurrencias (Rabin-Karp): {ocurrencias_rk}")
-print()
 
 # =============================================================================
 # 2. ALGORITMO Z-ALGORITHM (Z-Array)
 # =============================================================================
-print("=== 2. Algoritmo Z-Algorithm ===")
 
 def construir_z_array(cadena):
     """
@@ -119,26 +112,10 @@ def z_algorithm_busqueda(texto, patron):
     
     return ocurrencias
 
-# Ejemplo
-texto_z = "ABABDABACDABABCABCABAB"
-patron_z = "ABABCABAB"
-
-print(f"Texto: '{texto_z}'")
-print(f"Patrón: '{patron_z}'")
-ocurrencias_z = z_algorithm_busqueda(texto_z, patron_z)
-print(f"Ocurrencias (Z-Algorithm): {ocurrencias_z}")
-
-# Ejemplo de Z-array
-cadena_z = "aabxaabxcaabxaabxay"
-z_array = construir_z_array(cadena_z)
-print(f"\nCadena: '{cadena_z}'")
-print(f"Z-array: {z_array}")
-print()
 
 # =============================================================================
 # 3. LONGEST COMMON SUBSTRING (Subcadena Común Más Larga)
 # =============================================================================
-print("=== 3. Subcadena Común Más Larga ===")
 
 def longest_common_substring(X, Y):
     """
@@ -164,21 +141,10 @@ def longest_common_substring(X, Y):
     
     return longitud_maxima, subcadena
 
-# Ejemplo
-str1_lcs = "ABCDGH"
-str2_lcs = "ACDGHR"
-
-print(f"String 1: '{str1_lcs}'")
-print(f"String 2: '{str2_lcs}'")
-longitud, subcadena = longest_common_substring(str1_lcs, str2_lcs)
-print(f"Longitud: {longitud}")
-print(f"Subcadena: '{subcadena}'")
-print()
 
 # =============================================================================
 # 4. EDIT DISTANCE (Levenshtein Distance)
 # =============================================================================
-print("=== 4. Distancia de Edición (Levenshtein) ===")
 
 def edit_distance(str1, str2):
     """
@@ -209,21 +175,10 @@ def edit_distance(str1, str2):
     
     return dp[m][n]
 
-# Ejemplo
-palabra1 = "kitten"
-palabra2 = "sitting"
-
-print(f"Palabra 1: '{palabra1}'")
-print(f"Palabra 2: '{palabra2}'")
-distancia = edit_distance(palabra1, palabra2)
-print(f"Distancia de edición: {distancia}")
-print(f"Operaciones necesarias para convertir '{palabra1}' en '{palabra2}'")
-print()
 
 # =============================================================================
 # 5. LONGEST PALINDROMIC SUBSTRING (Subcadena Palindrómica Más Larga)
 # =============================================================================
-print("=== 5. Subcadena Palindrómica Más Larga ===")
 
 def longest_palindromic_substring(s):
     """
@@ -255,17 +210,10 @@ def longest_palindromic_substring(s):
     
     return subcadena_max
 
-# Ejemplo
-cadena_pal = "babad"
-print(f"Cadena: '{cadena_pal}'")
-palindromo_max = longest_palindromic_substring(cadena_pal)
-print(f"Subcadena palindrómica más larga: '{palindromo_max}'")
-print()
 
 # =============================================================================
 # 6. ANAGRAMAS Y PERMUTACIONES
 # =============================================================================
-print("=== 6. Anagramas y Permutaciones ===")
 
 def son_anagramas(str1, str2):
     """Verifica si dos strings son anagramas."""
@@ -296,27 +244,349 @@ def encontrar_permutaciones(s):
     
     return permutaciones
 
-# Ejemplo
-palabra1_anag = "listen"
-palabra2_anag = "silent"
-print(f"'{palabra1_anag}' y '{palabra2_anag}' son anagramas: {son_anagramas(palabra1_anag, palabra2_anag)}")
-
-lista_anagramas = ["eat", "tea", "tan", "ate", "nat", "bat"]
-print(f"\nLista: {lista_anagramas}")
-grupos = contar_anagramas(lista_anagramas)
-print("Grupos de anagramas:")
-for grupo in grupos.values():
-    print(f"  {grupo}")
-
-cadena_perm = "abc"
-print(f"\nPermutaciones de '{cadena_perm}':")
-permutaciones = encontrar_permutaciones(cadena_perm)
-print(f"  {permutaciones}")
-print()
-
-# Resumen
-print("=== RESUMEN ===")
-print("""
+
+# =============================================================================
+# 7. AHO-CORASICK (Búsqueda de Múltiples Patrones)
+# =============================================================================
+
+class AhoCorasick:
+    """
+    Autómata de Aho-Corasick: busca muchos patrones a la vez recorriendo
+    el texto una sola vez, en lugar de una pasada por patrón.
+    
+    Es un Trie de los patrones en el que cada estado tiene además un enlace
+    de fallo (el sufijo propio más largo que también es prefijo de algún
+    patrón, como la tabla LPS de KMP pero para todos los patrones). Aquí
+    los enlaces de fallo se pliegan en una tabla de transiciones completa,
+    así que cada carácter del texto cuesta una sola consulta.
+    
+    Todo se guarda en arreglos compactos (array), no en nodos con diccionarios:
+    - transiciones[estado * ancho + símbolo]: siguiente estado
+    - fallo[estado]: enlace de fallo
+    - patron_de[estado]: patrón que termina en el estado (-1 si ninguno)
+    - salida[estado]: siguiente estado por la cadena de fallos donde termina
+      un patrón (-1 si ninguno)
+    Los caracteres se numeran 0..σ-1 según aparecen en los patrones; el
+    símbolo σ representa cualquier carácter que no aparece en ninguno.
+    
+    Acepta patrones str (texto str) o bytes (texto bytes).
+    Complejidad: O(σ * L) para construir (L = largo total de los patrones),
+    O(n + ocurrencias) para buscar.
+    """
+    
+    def __init__(self, patrones):
+        self.patrones = list(dict.fromkeys(patrones))  # Sin repetidos, en orden
+        if not self.patrones:
+            raise ValueError("Se necesita al menos un patrón")
+        if any(len(patron) == 0 for patron in self.patrones):
+            raise ValueError("Los patrones no pueden ser vacíos")
+        tipos = {type(patron) for patron in self.patrones}
+        if len(tipos) != 1 or tipos.pop() not in (str, bytes):
+            raise ValueError("Los patrones deben ser todos str o todos bytes")
+        
+        # Alfabeto: solo los caracteres que aparecen en los patrones
+        self._simbolos = {}
+        for patron in self.patrones:
+            for caracter in patron:
+                self._simbolos.setdefault(caracter, len(self._simbolos))
+        ancho = self._ancho = len(self._simbolos) + 1
+        self.longitudes = array('i', (len(patron) for patron in self.patrones))
+        
+        # Paso 1: Trie en la tabla de transiciones (-1 = sin hijo)
+        transiciones = array('i', [-1]) * ancho
+        patron_de = array('i', [-1])
+        for indice, patron in enumerate(self.patrones):
+            estado = 0
+            for caracter in patron:
+                posicion = estado * ancho + self._simbolos[caracter]
+                if transiciones[posicion] < 0:
+                    transiciones[posicion] = len(patron_de)
+                    transiciones.extend(array('i', [-1]) * ancho)
+                    patron_de.append(-1)
+                estado = transiciones[posicion]
+            patron_de[estado] = indice
+        
+        # Paso 2: BFS por niveles para los enlaces de fallo y de salida;
+        # las transiciones que faltan se copian del estado de fallo
+        num_estados = len(patron_de)
+        fallo = array('i', [0]) * num_estados
+        salida = array('i', [-1]) * num_estados
+        for simbolo in range(ancho):
+            if transiciones[simbolo] < 0:
+                transiciones[simbolo] = 0
+        cola = array('i', (hijo for hijo in transiciones[:ancho] if hijo > 0))
+        cabeza = 0
+        while cabeza < len(cola):
+            estado = cola[cabeza]
+            cabeza += 1
+            base = estado * ancho
+            base_fallo = fallo[estado] * ancho
+            for simbolo in range(ancho):
+                hijo = transiciones[base + simbolo]
+                if hijo < 0:
+                    transiciones[base + simbolo] = transiciones[base_fallo + simbolo]
+                else:
+                    destino = transiciones[base_fallo + simbolo]
+                    fallo[hijo] = destino
+                    salida[hijo] = destino if patron_de[destino] >= 0 else salida[destino]
+                    cola.append(hijo)
+        
+        self._transiciones = transiciones
+        self.fallo = fallo
+        self.patron_de = patron_de
+        self.salida = salida
+        # Estados desde los que hay que reportar algo (consulta rápida al buscar)
+        self._reporta = bytearray(patron_de[e] >= 0 or salida[e] >= 0 for e in range(num_estados))
+    
+    @property
+    def num_estados(self):
+        return len(self.patron_de)
+    
+    def _escanear(self, texto, estado=0, desplazamiento=0):
+        """
+        Recorre el texto desde 'estado'. Retorna (coincidencias, estado_final)
+        con coincidencias [(inicio, indice_patron), ...]; los inicios se
+        cuentan a partir de 'desplazamiento'.
+        """
+        transiciones = self._transiciones
+        ancho = self._ancho
+        desconocido = ancho - 1
+        simbolos = self._simbolos
+        reporta = self._reporta
+        patron_de = self.patron_de
+        salida = self.salida
+        longitudes = self.longitudes
+        coincidencias = []
+        
+        for i, caracter in enumerate(texto):
+            estado = transiciones[estado * ancho + simbolos.get(caracter, desconocido)]
+            if reporta[estado]:
+                fin = desplazamiento + i + 1
+                actual = estado if patron_de[estado] >= 0 else salida[estado]
+                while actual >= 0:
+                    indice = patron_de[actual]
+                    coincidencias.append((fin - longitudes[indice], indice))
+                    actual = salida[actual]
+        
+        return coincidencias, estado
+    
+    def buscar(self, texto):
+        """
+        Todas las ocurrencias de todos los patrones en una sola pasada.
+        Retorna [(inicio, indice_patron), ...] ordenado por posición final
+        (y, con la misma posición final, del patrón más largo al más corto).
+        """
+        return self._escanear(texto)[0]
+    
+    def buscar_por_patron(self, texto):
+        """
+        Como buscar(), pero agrupado: {patron: [inicios]} con una lista
+        (quizá vacía) por patrón, igual a llamar kmp_busqueda_todas() con
+        cada patrón.
+        """
+        resultado = {patron: [] for patron in self.patrones}
+        for inicio, indice in sorted(self.buscar(texto)):
+            resultado[self.patrones[indice]].append(inicio)
+        return resultado
+    
+    def buscar_en_bloques(self, bloques):
+        """
+        Búsqueda en flujo: recibe un iterable de bloques del texto (líneas
+        de un log, trozos leídos de un archivo o de un socket, ...) y genera
+        (inicio, indice_patron) con posiciones absolutas a medida que
+        aparecen. El estado del autómata pasa de un bloque al siguiente, así
+        que se encuentran también los patrones partidos entre dos bloques.
+        """
+        estado = 0
+        desplazamiento = 0
+        for bloque in bloques:
+            coincidencias, estado = self._escanear(bloque, estado, desplazamiento)
+            desplazamiento += len(bloque)
+            yield from coincidencias
+    
+    def buscar_en_archivo(self, ruta, tamanio_bloque=1 << 20, codificacion="utf-8"):
+        """
+        buscar_en_bloques() sobre un archivo leído de a tamanio_bloque
+        caracteres (patrones str) o bytes (patrones bytes), sin cargarlo
+        entero en memoria.
+        """
+        if isinstance(self.patrones[0], bytes):
+            archivo = open(ruta, "rb")
+            vacio = b""
+        else:
+            archivo = open(ruta, "r", encoding=codificacion)
+            vacio = ""
+        with archivo:
+            yield from self.buscar_en_bloques(iter(lambda: archivo.read(tamanio_bloque), vacio))
+
+
+# =============================================================================
+# BENCHMARKS
+# =============================================================================
+
+def _log_y_palabras_clave(n, num_patrones=1000, semilla=42):
+    """
+    Texto tipo log de ~n caracteres y num_patrones palabras clave, algunas
+    presentes en el texto y otras no.
+    """
+    import random
+    
+    rng = random.Random(semilla)
+    letras = "abcdefghijklmnopqrstuvwxyz"
+    vocabulario = ["".join(rng.choice(letras) for _ in range(rng.randint(4, 10)))
+                   for _ in range(2 * num_patrones)]
+    palabras = []
+    largo = 0
+    while largo < n:
+        palabras.append(rng.choice(vocabulario))
+        largo += len(palabras[-1]) + 1
+    return " ".join(palabras), vocabulario[::2]
+
+def _una_pasada_por_patron(buscar):
+    """{patron: [inicios]} llamando a 'buscar(texto, patron)' una vez por patrón."""
+    return lambda texto, patrones: {patron: buscar(texto, patron) for patron in patrones}
+
+
+def _kmp_por_patron(texto, patrones):
+    """Lo que costaba antes: kmp_busqueda_todas() (39_algoritmos_busqueda) por patrón."""
+    return _una_pasada_por_patron(cargar_modulo("busqueda").kmp_busqueda_todas)(texto, patrones)
+
+
+# Familia para el sistema de benchmarks (python -m algoritmos.benchmark)
+# n es el largo del texto; siempre se buscan 1000 palabras clave
+BENCHMARKS = {
+    "multiples_patrones": {
+        "implementaciones": {
+            "kmp_por_patron": _kmp_por_patron,
+            "rabin_karp_por_patron": _una_pasada_por_patron(rabin_karp),
+            "aho_corasick": lambda texto, patrones: AhoCorasick(patrones).buscar_por_patron(texto),
+        },
+        "entrada": _log_y_palabras_clave,
+        "tamanios": [1000, 10000, 100000],
+        "limites": {"kmp_por_patron": 10000, "rabin_karp_por_patron": 10000},
+        "verificar": lambda resultado, texto, patrones:
+            resultado == _una_pasada_por_patron(z_algorithm_busqueda)(texto, patrones),
+    },
+}
+
+
+def main():
+    """Ejecuta los ejemplos y comparaciones del módulo."""
+    print("=== Algoritmos Avanzados de Strings ===\n")
+
+    print("=== 1. Algoritmo Rabin-Karp ===")
+
+    # Ejemplo
+    texto_rk = "GEEKS FOR GEEKS"
+    patron_rk = "GEEK"
+
+    print(f"Texto: '{texto_rk}'")
+    print(f"Patrón: '{patron_rk}'")
+    ocurrencias_rk = rabin_karp(texto_rk, patron_rk)
+    print(f"Ocurrencias (Rabin-Karp): {ocurrencias_rk}")
+    print()
+
+    print("=== 2. Algoritmo Z-Algorithm ===")
+
+    # Ejemplo
+    texto_z = "ABABDABACDABABCABCABAB"
+    patron_z = "ABABCABAB"
+
+    print(f"Texto: '{texto_z}'")
+    print(f"Patrón: '{patron_z}'")
+    ocurrencias_z = z_algorithm_busqueda(texto_z, patron_z)
+    print(f"Ocurrencias (Z-Algorithm): {ocurrencias_z}")
+
+    # Ejemplo de Z-array
+    cadena_z = "aabxaabxcaabxaabxay"
+    z_array = construir_z_array(cadena_z)
+    print(f"\nCadena: '{cadena_z}'")
+    print(f"Z-array: {z_array}")
+    print()
+
+    print("=== 3. Subcadena Común Más Larga ===")
+
+    # Ejemplo
+    str1_lcs = "ABCDGH"
+    str2_lcs = "ACDGHR"
+
+    print(f"String 1: '{str1_lcs}'")
+    print(f"String 2: '{str2_lcs}'")
+    longitud, subcadena = longest_common_substring(str1_lcs, str2_lcs)
+    print(f"Longitud: {longitud}")
+    print(f"Subcadena: '{subcadena}'")
+    print()
+
+    print("=== 4. Distancia de Edición (Levenshtein) ===")
+
+    # Ejemplo
+    palabra1 = "kitten"
+    palabra2 = "sitting"
+
+    print(f"Palabra 1: '{palabra1}'")
+    print(f"Palabra 2: '{palabra2}'")
+    distancia = edit_distance(palabra1, palabra2)
+    print(f"Distancia de edición: {distancia}")
+    print(f"Operaciones necesarias para convertir '{palabra1}' en '{palabra2}'")
+    print()
+
+    print("=== 5. Subcadena Palindrómica Más Larga ===")
+
+    # Ejemplo
+    cadena_pal = "babad"
+    print(f"Cadena: '{cadena_pal}'")
+    palindromo_max = longest_palindromic_substring(cadena_pal)
+    print(f"Subcadena palindrómica más larga: '{palindromo_max}'")
+    print()
+
+    print("=== 6. Anagramas y Permutaciones ===")
+
+    # Ejemplo
+    palabra1_anag = "listen"
+    palabra2_anag = "silent"
+    print(f"'{palabra1_anag}' y '{palabra2_anag}' son anagramas: {son_anagramas(palabra1_anag, palabra2_anag)}")
+
+    lista_anagramas = ["eat", "tea", "tan", "ate", "nat", "bat"]
+    print(f"\nLista: {lista_anagramas}")
+    grupos = contar_anagramas(lista_anagramas)
+    print("Grupos de anagramas:")
+    for grupo in grupos.values():
+        print(f"  {grupo}")
+
+    cadena_perm = "abc"
+    print(f"\nPermutaciones de '{cadena_perm}':")
+    permutaciones = encontrar_permutaciones(cadena_perm)
+    print(f"  {permutaciones}")
+    print()
+
+    print("=== 7. Aho-Corasick (Múltiples Patrones) ===")
+
+    # Ejemplo clásico: los patrones se solapan y comparten sufijos
+    patrones_ac = ["he", "she", "his", "hers"]
+    texto_ac = "ushers"
+    automata = AhoCorasick(patrones_ac)
+    print(f"Patrones: {patrones_ac}, texto: '{texto_ac}'")
+    print(f"Estados del autómata: {automata.num_estados}")
+    for inicio, indice in automata.buscar(texto_ac):
+        print(f"  '{automata.patrones[indice]}' en la posición {inicio}")
+    
+    # En flujo: "she" queda partido entre dos bloques
+    bloques = ["u", "sh", "ers his"]
+    print(f"Bloques {bloques}: {list(automata.buscar_en_bloques(bloques))}")
+    
+    texto_log, palabras_clave = _log_y_palabras_clave(20000)
+    print(f"\nBuscando {len(palabras_clave)} palabras clave en un log de {len(texto_log)} caracteres:")
+    for nombre, funcion in (("KMP, una pasada por patrón", _kmp_por_patron),
+                            ("Aho-Corasick, una sola pasada",
+                             lambda texto, patrones: AhoCorasick(patrones).buscar_por_patron(texto))):
+        resumen, encontrados = medir(funcion, lambda: (texto_log, palabras_clave), repeticiones=1, calentamiento=0)
+        print(f"  {nombre:30s} {resumen['mediana_ns'] / 1e6:8.1f} ms "
+              f"({sum(map(len, encontrados.values()))} ocurrencias)")
+    print()
+
+    # Resumen
+    print("=== RESUMEN ===")
+    print("""
 Algoritmos avanzados de strings implementados:
 
 1. Rabin-Karp:
@@ -347,9 +617,19 @@ Algoritmos avanzados de strings implementados:
    - Agrupación de anagramas
    - Generación de permutaciones
 
+7. Aho-Corasick:
+   - Muchos patrones en una sola pasada sobre el texto
+   - Trie + enlaces de fallo en arreglos compactos
+   - Búsqueda en flujo: el estado pasa de un bloque al siguiente
+   - Complejidad: O(n + ocurrencias) por búsqueda
+
 Aplicaciones:
 - Búsqueda de texto (grep, editores)
 - Corrección ortográfica
 - Comparación de secuencias biológicas
 - Análisis de texto y NLP
 """)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,9 @@
 # Archivo: 45_algoritmos_matematicos.py
 # Descripción: Algoritmos Matemáticos
 
-print("=== Algoritmos Matemáticos ===\n")
-
 # =============================================================================
 # 1. TRIÁNGULO DE PASCAL
 # =============================================================================
-print("=== 1. Triángulo de Pascal ===")
 
 def triangulo_pascal_filas(n):
     """
@@ -66,18 +63,10 @@ def triangulo_pascal_fila_n(n):
     
     return fila
 
-# Ejemplo
-print("Triángulo de Pascal (10 filas):")
-triangulo_pascal_imprimir(10)
-
-print(f"\nCoeficiente binomial C(5, 2) = {triangulo_pascal_coeficiente(5, 2)}")
-print(f"Fila 5 del Triángulo de Pascal: {triangulo_pascal_fila_n(5)}")
-print()
 
 # =============================================================================
 # 2. ALGORITMO DE EUCLIDES (Máximo Común Divisor)
 # =============================================================================
-print("=== 2. Algoritmo de Euclides (MCD) ===")
 
 def euclides_mcd(a, b):
     """
@@ -117,23 +106,10 @@ def euclides_extendido(a, b):
     
     return mcd, x, y
 
-# Ejemplo
-a_euclides = 48
-b_euclides = 18
-
-print(f"a = {a_euclides}, b = {b_euclides}")
-print(f"MCD (iterativo): {euclides_mcd(a_euclides, b_euclides)}")
-print(f"MCD (recursivo): {euclides_mcd_recursivo(a_euclides, b_euclides)}")
-print(f"MCM: {euclides_mcm(a_euclides, b_euclides)}")
-
-mcd_ext, x, y = euclides_extendido(a_euclides, b_euclides)
-print(f"Euclides extendido: {mcd_ext} = {a_euclides}*{x} + {b_euclides}*{y}")
-print()
 
 # =============================================================================
 # 3. CRIBA DE ERATÓSTENES (Números Primos)
 # =============================================================================
-print("=== 3. Criba de Eratóstenes ===")
 
 def criba_eratostenes(n):
     """
@@ -176,20 +152,10 @@ def es_primo_optimizado(n):
     
     return True
 
-# Ejemplo
-limite_criba = 50
-primos = criba_eratostenes(limite_criba)
-print(f"Números primos hasta {limite_criba}: {primos}")
-print(f"Total: {len(primos)} primos")
-
-numero_test = 97
-print(f"\n¿{numero_test} es primo? {es_primo_optimizado(numero_test)}")
-print()
 
 # =============================================================================
 # 4. EXPONENCIACIÓN MODULAR (Fast Exponentiation)
 # =============================================================================
-print("=== 4. Exponenciación Modular Rápida ===")
 
 def exponenciacion_modular(base, exponente, modulo):
     """
@@ -207,20 +173,10 @@ def exponenciacion_modular(base, exponente, modulo):
     
     return resultado
 
-# Ejemplo
-base_exp = 3
-exp_exp = 100
-mod_exp = 7
-
-resultado = exponenciacion_modular(base_exp, exp_exp, mod_exp)
-print(f"({base_exp}^{exp_exp}) mod {mod_exp} = {resultado}")
-print(f"Verificación: {pow(base_exp, exp_exp, mod_exp)} (función built-in)")
-print()
 
 # =============================================================================
 # 5. NÚMEROS DE FIBONACCI (Fórmula de Binet y Matriz)
 # =============================================================================
-print("=== 5. Números de Fibonacci (Métodos Matemáticos) ===")
 
 import math
 
@@ -260,17 +216,10 @@ def fibonacci_matriz(n):
     matriz_potencia = potencia_matriz_fib(matriz_base, n)
     return matriz_potencia[0][1]
 
-# Ejemplo
-n_fib_mate = 10
-print(f"Fibonacci({n_fib_mate}):")
-print(f"  Fórmula de Binet: {fibonacci_binet(n_fib_mate)}")
-print(f"  Matriz: {fibonacci_matriz(n_fib_mate)}")
-print()
 
 # =============================================================================
 # 6. FACTORIZACIÓN DE NÚMEROS
 # =============================================================================
-print("=== 6. Factorización de Números ===")
 
 def factorizar(n):
     """
@@ -308,22 +257,10 @@ def contar_divisores(n):
     
     return divisores
 
-# Ejemplo
-numero_factorizar = 60
-factores = factorizar(numero_factorizar)
-factores_uni = factores_unicos(numero_factorizar)
-divisores = contar_divisores(numero_factorizar)
-
-print(f"Número: {numero_factorizar}")
-print(f"Factores primos: {factores}")
-print(f"Factores únicos: {factores_uni}")
-print(f"Número de divisores: {divisores}")
-print()
 
 # =============================================================================
 # 7. CONVERSIÓN DE BASES NUMÉRICAS
 # =============================================================================
-print("=== 7. Conversión de Bases Numéricas ===")
 
 def convertir_base(n, base_destino, base_origen=10):
     """
@@ -354,17 +291,96 @@ def convertir_base(n, base_destino, base_origen=10):
     
     return ''.join(reversed(resultado))
 
-# Ejemplo
-numero_conv = 255
-print(f"Número en decimal: {numero_conv}")
-print(f"Binario: {convertir_base(numero_conv, 2)}")
-print(f"Octal: {convertir_base(numero_conv, 8)}")
-print(f"Hexadecimal: {convertir_base(numero_conv, 16)}")
-print()
-
-# Resumen
-print("=== RESUMEN ===")
-print("""
+
+def main():
+    """Ejecuta los ejemplos y comparaciones del módulo."""
+    print("=== Algoritmos Matemáticos ===\n")
+
+    print("=== 1. Triángulo de Pascal ===")
+
+    # Ejemplo
+    print("Triángulo de Pascal (10 filas):")
+    triangulo_pascal_imprimir(10)
+
+    print(f"\nCoeficiente binomial C(5, 2) = {triangulo_pascal_coeficiente(5, 2)}")
+    print(f"Fila 5 del Triángulo de Pascal: {triangulo_pascal_fila_n(5)}")
+    print()
+
+    print("=== 2. Algoritmo de Euclides (MCD) ===")
+
+    # Ejemplo
+    a_euclides = 48
+    b_euclides = 18
+
+    print(f"a = {a_euclides}, b = {b_euclides}")
+    print(f"MCD (iterativo): {euclides_mcd(a_euclides, b_euclides)}")
+    print(f"MCD (recursivo): {euclides_mcd_recursivo(a_euclides, b_euclides)}")
+    print(f"MCM: {euclides_mcm(a_euclides, b_euclides)}")
+
+    mcd_ext, x, y = euclides_extendido(a_euclides, b_euclides)
+    print(f"Euclides extendido: {mcd_ext} = {a_euclides}*{x} + {b_euclides}*{y}")
+    print()
+
+    print("=== 3. Criba de Eratóstenes ===")
+
+    # Ejemplo
+    limite_criba = 50
+    primos = criba_eratostenes(limite_criba)
+    print(f"Números primos hasta {limite_criba}: {primos}")
+    print(f"Total: {len(primos)} primos")
+
+    numero_test = 97
+    print(f"\n¿{numero_test} es primo? {es_primo_optimizado(numero_test)}")
+    print()
+
+    print("=== 4. Exponenciación Modular Rápida ===")
+
+    # Ejemplo
+    base_exp = 3
+    exp_exp = 100
+    mod_exp = 7
+
+    resultado = exponenciacion_modular(base_exp, exp_exp, mod_exp)
+    print(f"({base_exp}^{exp_exp}) mod {mod_exp} = {resultado}")
+    print(f"Verificación: {pow(base_exp, exp_exp, mod_exp)} (función built-in)")
+    print()
+
+    print("=== 5. Números de Fibonacci (Métodos Matemáticos) ===")
+
+    # Ejemplo
+    n_fib_mate = 10
+    print(f"Fibonacci({n_fib_mate}):")
+    print(f"  Fórmula de Binet: {fibonacci_binet(n_fib_mate)}")
+    print(f"  Matriz: {fibonacci_matriz(n_fib_mate)}")
+    print()
+
+    print("=== 6. Factorización de Números ===")
+
+    # Ejemplo
+    numero_factorizar = 60
+    factores = factorizar(numero_factorizar)
+    factores_uni = factores_unicos(numero_factorizar)
+    divisores = contar_divisores(numero_factorizar)
+
+    print(f"Número: {numero_factorizar}")
+    print(f"Factores primos: {factores}")
+    print(f"Factores únicos: {factores_uni}")
+    print(f"Número de divisores: {divisores}")
+    print()
+
+    print("=== 7. Conversión de Bases Numéricas ===")
+
+    # Ejemplo
+    numero_conv = 255
+    print(f"Número en decimal: {numero_conv}")
+    print(f"Binario: {convertir_base(numero_conv, 2)}")
+    print(f"Octal: {convertir_base(numero_conv, 8)}")
+    print(f"Hexadecimal: {convertir_base(numero_conv, 16)}")
+    print()
+
+    # Resumen
+    print("=== RESUMEN ===")
+    print("""
 Algoritmos matemáticos implementados:
 
 1. Triángulo de Pascal:
@@ -406,3 +422,7 @@ Aplicaciones:
 - Combinatoria
 - Álgebra computacional
 """)
+
+
+if __name__ == "__main__":
+    main()
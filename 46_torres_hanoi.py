@@ -4,12 +4,10 @@
 import time
 from typing import List, Tuple
 
-print("=== Torres de Hanoi ===\n")
 
 # =============================================================================
 # 1. TORRES DE HANOI - SOLUCIÓN RECURSIVA
 # =============================================================================
-print("=== 1. Torres de Hanoi (Recursivo) ===")
 
 class TorresHanoi:
     """Clase para representar y resolver el problema de las Torres de Hanoi."""
@@ -127,34 +125,15 @@ class TorresHanoi:
         """Retorna el número mínimo de movimientos requeridos (2^n - 1)."""
         return (1 << self.num_discos) - 1
 
-# Ejemplo con pocos discos
-print("Ejemplo: 3 discos")
-hanoi1 = TorresHanoi(3)
-hanoi1.mostrar_torres()
-print(f"\nNúmero mínimo de movimientos: {hanoi1.obtener_movimientos_minimos()}")
-print("\nResolviendo recursivamente:")
-hanoi1.resolver_recursivo(mostrar=False)
-hanoi1.mostrar_torres()
-print(f"Total de movimientos realizados: {hanoi1.contador_movimientos}")
-print()
 
 # =============================================================================
 # 2. DEMOSTRACIÓN PASO A PASO
 # =============================================================================
-print("=== 2. Demostración Paso a Paso (3 discos) ===")
 
-hanoi2 = TorresHanoi(3)
-hanoi2.mostrar_torres()
-print("\nIniciando solución paso a paso:\n")
-hanoi2.resolver_recursivo(mostrar=True)
-hanoi2.mostrar_torres()
-print(f"\nOK Problema resuelto en {hanoi2.contador_movimientos} movimientos")
-print()
 
 # =============================================================================
 # 3. ANÁLISIS DE COMPLEJIDAD
 # =============================================================================
-print("=== 3. Análisis de Complejidad ===")
 
 def analizar_complejidad_hanoi(max_discos=8):
     """Analiza la complejidad del problema de las Torres de Hanoi."""
@@ -166,13 +145,10 @@ def analizar_complejidad_hanoi(max_discos=8):
         movimientos = (1 << n) - 1  # 2^n - 1
         print(f"  {n:2d}   | {movimientos:19d} | 2^{n} - 1 = {movimientos}")
 
-analizar_complejidad_hanoi(8)
-print()
 
 # =============================================================================
 # 4. COMPARACIÓN RECURSIVO vs ITERATIVO
 # =============================================================================
-print("=== 4. Comparación: Recursivo vs Iterativo ===")
 
 def comparar_metodos(num_discos):
     """Compara los métodos recursivo e iterativo."""
@@ -194,15 +170,52 @@ def comparar_metodos(num_discos):
     print(f"  Iterativo: {tiempo_iter*1000:.4f} ms ({hanoi_iter.contador_movimientos} movimientos)")
     print(f"  Movimientos mínimos requeridos: {(1 << num_discos) - 1}")
 
-comparar_metodos(5)
-print()
 
 # =============================================================================
 # 5. HISTORIA Y APLICACIONES
 # =============================================================================
-print("=== 5. Información Adicional ===")
 
-print("""
+
+def main():
+    """Ejecuta los ejemplos y comparaciones del módulo."""
+    print("=== Torres de Hanoi ===\n")
+
+    print("=== 1. Torres de Hanoi (Recursivo) ===")
+
+    # Ejemplo con pocos discos
+    print("Ejemplo: 3 discos")
+    hanoi1 = TorresHanoi(3)
+    hanoi1.mostrar_torres()
+    print(f"\nNúmero mínimo de movimientos: {hanoi1.obtener_movimientos_minimos()}")
+    print("\nResolviendo recursivamente:")
+    hanoi1.resolver_recursivo(mostrar=False)
+    hanoi1.mostrar_torres()
+    print(f"Total de movimientos realizados: {hanoi1.contador_movimientos}")
+    print()
+
+    print("=== 2. Demostración Paso a Paso (3 discos) ===")
+
+    hanoi2 = TorresHanoi(3)
+    hanoi2.mostrar_torres()
+    print("\nIniciando solución paso a paso:\n")
+    hanoi2.resolver_recursivo(mostrar=True)
+    hanoi2.mostrar_torres()
+    print(f"\nOK Problema resuelto en {hanoi2.contador_movimientos} movimientos")
+    print()
+
+    print("=== 3. Análisis de Complejidad ===")
+
+    analizar_complejidad_hanoi(8)
+    print()
+
+    print("=== 4. Comparación: Recursivo vs Iterativo ===")
+
+    comparar_metodos(5)
+    print()
+
+    print("=== 5. Información Adicional ===")
+
+    print("""
 Historia del Problema de las Torres de Hanoi:
 
 El problema fue inventado por el matemático francés Édouard Lucas en 1883.
@@ -223,10 +236,9 @@ Aplicaciones:
 - Backup rotativo de datos
 - Puzzles y juegos
 """)
-
-# Resumen
-print("=== RESUMEN ===")
-print("""
+    # Resumen
+    print("=== RESUMEN ===")
+    print("""
 Torres de Hanoi implementado:
 
 1. Solución Recursiva:
@@ -252,3 +264,7 @@ Torres de Hanoi implementado:
 Este problema es fundamental en ciencias de la computación para
 entender recursión y análisis de complejidad algorítmica.
 """)
+
+
+if __name__ == "__main__":
+    main()
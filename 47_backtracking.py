@@ -1,12 +1,9 @@
 # Archivo: 47_backtracking.py
 # Descripción: Algoritmos de Backtracking
 
-print("=== Algoritmos de Backtracking ===\n")
-
 # =============================================================================
 # 1. PROBLEMA DE LAS N-REINAS
 # =============================================================================
-print("=== 1. Problema de las N-Reinas ===")
 
 def es_seguro(tablero, fila, col, n):
     """Verifica si es seguro colocar una reina en (fila, col)."""
@@ -66,21 +63,10 @@ def imprimir_tablero(tablero):
     for i, fila in enumerate(tablero):
         print(f"{i} " + " ".join("Q" if celda == 1 else "." for celda in fila))
 
-# Ejemplo
-n_reinas = 4
-print(f"Problema de las {n_reinas}-Reinas:")
-soluciones = resolver_n_reinas(n_reinas, encontrar_todas=True)
-print(f"\nNúmero de soluciones encontradas: {len(soluciones)}")
-
-if soluciones:
-    print("\nPrimera solución:")
-    imprimir_tablero(soluciones[0])
-print()
 
 # =============================================================================
 # 2. SOLUCIONADOR DE SUDOKU
 # =============================================================================
-print("=== 2. Solucionador de Sudoku ===")
 
 def es_valido_sudoku(tablero, fila, col, num):
     """Verifica si es válido colocar num en (fila, col)."""
@@ -155,33 +141,10 @@ def imprimir_sudoku(tablero):
             print(tablero[i][j] if tablero[i][j] != 0 else ".", end=" ")
         print()
 
-# Ejemplo
-sudoku_ejemplo = [
-    [5, 3, 0, 0, 7, 0, 0, 0, 0],
-    [6, 0, 0, 1, 9, 5, 0, 0, 0],
-    [0, 9, 8, 0, 0, 0, 0, 6, 0],
-    [8, 0, 0, 0, 6, 0, 0, 0, 3],
-    [4, 0, 0, 8, 0, 3, 0, 0, 1],
-    [7, 0, 0, 0, 2, 0, 0, 0, 6],
-    [0, 6, 0, 0, 0, 0, 2, 8, 0],
-    [0, 0, 0, 4, 1, 9, 0, 0, 5],
-    [0, 0, 0, 0, 8, 0, 0, 7, 9]
-]
-
-print("Sudoku original:")
-imprimir_sudoku(sudoku_ejemplo)
-
-if resolver_sudoku(sudoku_ejemplo):
-    print("\nSudoku resuelto:")
-    imprimir_sudoku(sudoku_ejemplo)
-else:
-    print("\nNo se encontró solución")
-print()
 
 # =============================================================================
 # 3. RESOLUCIÓN DE LABERINTOS
 # =============================================================================
-print("=== 3. Resolución de Laberintos ===")
 
 def resolver_laberinto(laberinto, inicio, destino):
     """
@@ -241,35 +204,10 @@ def imprimir_laberinto_con_camino(laberinto, camino):
     for i, fila in enumerate(solucion):
         print(f"{i % 10} " + "".join(fila))
 
-# Ejemplo
-laberinto = [
-    [0, 1, 0, 0, 0],
-    [0, 1, 0, 1, 0],
-    [0, 0, 0, 1, 0],
-    [1, 1, 0, 0, 0],
-    [0, 0, 0, 1, 0]
-]
-
-inicio = (0, 0)
-destino = (4, 4)
-
-print("Laberinto (0=camino, 1=pared):")
-for fila in laberinto:
-    print(f"  {fila}")
-
-camino = resolver_laberinto(laberinto, inicio, destino)
-
-if camino:
-    print(f"\nCamino encontrado ({len(camino)} pasos):")
-    imprimir_laberinto_con_camino(laberinto, camino)
-else:
-    print("\nNo se encontró camino")
-print()
 
 # =============================================================================
 # 4. GENERACIÓN DE PERMUTACIONES (Backtracking)
 # =============================================================================
-print("=== 4. Generación de Permutaciones (Backtracking) ===")
 
 def permutaciones_backtracking(elements):
     """Genera todas las permutaciones usando backtracking."""
@@ -295,19 +233,10 @@ def permutaciones_backtracking(elements):
     backtrack([], [False] * n)
     return resultado
 
-# Ejemplo
-elementos = [1, 2, 3]
-perms = permutaciones_backtracking(elementos)
-print(f"Permutaciones de {elementos}:")
-for i, perm in enumerate(perms, 1):
-    print(f"  {i}. {perm}")
-print(f"Total: {len(perms)} permutaciones")
-print()
 
 # =============================================================================
 # 5. GENERACIÓN DE COMBINACIONES (Backtracking)
 # =============================================================================
-print("=== 5. Generación de Combinaciones (Backtracking) ===")
 
 def combinaciones_backtracking(elements, k):
     """Genera todas las combinaciones de k elementos usando backtracking."""
@@ -330,20 +259,10 @@ def combinaciones_backtracking(elements, k):
     backtrack([], 0)
     return resultado
 
-# Ejemplo
-elementos_comb = ['A', 'B', 'C', 'D']
-k = 2
-combs = combinaciones_backtracking(elementos_comb, k)
-print(f"Combinaciones de {elementos_comb} tomando {k} elementos:")
-for i, comb in enumerate(combs, 1):
-    print(f"  {i}. {comb}")
-print(f"Total: {len(combs)} combinaciones (C({len(elementos_comb)}, {k}) = {len(combs)})")
-print()
 
 # =============================================================================
 # 6. SUBSET SUM (Suma de Subconjuntos)
 # =============================================================================
-print("=== 6. Problema de Suma de Subconjuntos (Subset Sum) ===")
 
 def subset_sum_backtracking(numeros, objetivo):
     """Encuentra un subconjunto que sume exactamente el objetivo."""
@@ -371,21 +290,116 @@ def subset_sum_backtracking(numeros, objetivo):
     backtrack([], 0, 0)
     return resultado
 
-# Ejemplo
-numeros_subset = [3, 34, 4, 12, 5, 2]
-objetivo_subset = 9
-soluciones_subset = subset_sum_backtracking(numeros_subset, objetivo_subset)
-
-print(f"Números: {numeros_subset}")
-print(f"Objetivo: {objetivo_subset}")
-print(f"Subconjuntos que suman {objetivo_subset}:")
-for sol in soluciones_subset:
-    print(f"  {sol} (suma = {sum(sol)})")
-print()
-
-# Resumen
-print("=== RESUMEN ===")
-print("""
+
+def main():
+    """Ejecuta los ejemplos y comparaciones del módulo."""
+    print("=== Algoritmos de Backtracking ===\n")
+
+    print("=== 1. Problema de las N-Reinas ===")
+
+    # Ejemplo
+    n_reinas = 4
+    print(f"Problema de las {n_reinas}-Reinas:")
+    soluciones = resolver_n_reinas(n_reinas, encontrar_todas=True)
+    print(f"\nNúmero de soluciones encontradas: {len(soluciones)}")
+
+    if soluciones:
+        print("\nPrimera solución:")
+        imprimir_tablero(soluciones[0])
+    print()
+
+    print("=== 2. Solucionador de Sudoku ===")
+
+    # Ejemplo
+    sudoku_ejemplo = [
+        [5, 3, 0, 0, 7, 0, 0, 0, 0],
+        [6, 0, 0, 1, 9, 5, 0, 0, 0],
+        [0, 9, 8, 0, 0, 0, 0, 6, 0],
+        [8, 0, 0, 0, 6, 0, 0, 0, 3],
+        [4, 0, 0, 8, 0, 3, 0, 0, 1],
+        [7, 0, 0, 0, 2, 0, 0, 0, 6],
+        [0, 6, 0, 0, 0, 0, 2, 8, 0],
+        [0, 0, 0, 4, 1, 9, 0, 0, 5],
+        [0, 0, 0, 0, 8, 0, 0, 7, 9]
+    ]
+
+    print("Sudoku original:")
+    imprimir_sudoku(sudoku_ejemplo)
+
+    if resolver_sudoku(sudoku_ejemplo):
+        print("\nSudoku resuelto:")
+        imprimir_sudoku(sudoku_ejemplo)
+    else:
+        print("\nNo se encontró solución")
+    print()
+
+    print("=== 3. Resolución de Laberintos ===")
+
+    # Ejemplo
+    laberinto = [
+        [0, 1, 0, 0, 0],
+        [0, 1, 0, 1, 0],
+        [0, 0, 0, 1, 0],
+        [1, 1, 0, 0, 0],
+        [0, 0, 0, 1, 0]
+    ]
+
+    inicio = (0, 0)
+    destino = (4, 4)
+
+    print("Laberinto (0=camino, 1=pared):")
+    for fila in laberinto:
+        print(f"  {fila}")
+
+    camino = resolver_laberinto(laberinto, inicio, destino)
+
+    if camino:
+        print(f"\nCamino encontrado ({len(camino)} pasos):")
+        imprimir_laberinto_con_camino(laberinto, camino)
+    else:
+        print("\nNo se encontró camino")
+    print()
+
+    print("=== 4. Generación de Permutaciones (Backtracking) ===")
+
+    # Ejemplo
+    elementos = [1, 2, 3]
+    perms = permutaciones_backtracking(elementos)
+    print(f"Permutaciones de {elementos}:")
+    for i, perm in enumerate(perms, 1):
+        print(f"  {i}. {perm}")
+    print(f"Total: {len(perms)} permutaciones")
+    print()
+
+    print("=== 5. Generación de Combinaciones (Backtracking) ===")
+
+    # Ejemplo
+    elementos_comb = ['A', 'B', 'C', 'D']
+    k = 2
+    combs = combinaciones_backtracking(elementos_comb, k)
+    print(f"Combinaciones de {elementos_comb} tomando {k} elementos:")
+    for i, comb in enumerate(combs, 1):
+        print(f"  {i}. {comb}")
+    print(f"Total: {len(combs)} combinaciones (C({len(elementos_comb)}, {k}) = {len(combs)})")
+    print()
+
+    print("=== 6. Problema de Suma de Subconjuntos (Subset Sum) ===")
+
+    # Ejemplo
+    numeros_subset = [3, 34, 4, 12, 5, 2]
+    objetivo_subset = 9
+    soluciones_subset = subset_sum_backtracking(numeros_subset, objetivo_subset)
+
+    print(f"Números: {numeros_subset}")
+    print(f"Objetivo: {objetivo_subset}")
+    print(f"Subconjuntos que suman {objetivo_subset}:")
+    for sol in soluciones_subset:
+        print(f"  {sol} (suma = {sum(sol)})")
+    print()
+
+    # Resumen
+    print("=== RESUMEN ===")
+    print("""
 Algoritmos de Backtracking implementados:
 
 1. Problema de las N-Reinas:
@@ -432,3 +446,7 @@ Cuándo usar Backtracking:
 - Puzzles y juegos
 - Optimización discreta
 """)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,9 @@
 # Archivo: 48_estructuras_avanzadas.py
 # Descripción: Estructuras de Datos Avanzadas
 
-print("=== Estructuras de Datos Avanzadas ===\n")
-
 # =============================================================================
 # 1. TRIE (ÁRBOL DE PREFIJOS)
 # =============================================================================
-print("=== 1. Trie (Árbol de Prefijos) ===")
 
 class NodoTrie:
     """Nodo para el árbol Trie."""
@@ -104,24 +101,10 @@ class Trie:
         
         _eliminar(self.raiz, palabra, 0)
 
-# Ejemplo
-trie = Trie()
-palabras = ["apple", "app", "apricot", "banana", "band", "bandana"]
-
-print("Insertando palabras:", palabras)
-for palabra in palabras:
-    trie.insertar(palabra)
-
-print(f"\n¿'apple' existe? {trie.buscar('apple')}")
-print(f"¿'apples' existe? {trie.buscar('apples')}")
-print(f"¿Existe prefijo 'app'? {trie.buscar_prefijo('app')}")
-print(f"Autocompletar 'ban': {trie.autocompletar('ban')}")
-print()
 
 # =============================================================================
 # 2. SEGMENT TREE
 # =============================================================================
-print("=== 2. Segment Tree ===")
 
 class SegmentTree:
     """
@@ -208,28 +191,10 @@ class SegmentTree:
             )
             indice //= 2
 
-# Ejemplo
-arr_seg = [1, 3, 5, 7, 9, 11]
-print(f"Array: {arr_seg}")
-
-# Segment Tree para suma
-seg_tree_sum = SegmentTree(arr_seg, sum)
-print(f"Suma [1, 4): {seg_tree_sum.consultar_rango(1, 4)}")
-print(f"Suma [0, 6): {seg_tree_sum.consultar_rango(0, 6)}")
-
-# Segment Tree para mínimo
-seg_tree_min = SegmentTree(arr_seg, min)
-print(f"Mínimo [1, 4): {seg_tree_min.consultar_rango(1, 4)}")
-
-# Actualizar
-seg_tree_sum.actualizar(2, 10)
-print(f"Después de actualizar índice 2 a 10: {seg_tree_sum.consultar_rango(0, 6)}")
-print()
 
 # =============================================================================
 # 3. FENWICK TREE (Binary Indexed Tree)
 # =============================================================================
-print("=== 3. Fenwick Tree (Binary Indexed Tree) ===")
 
 class FenwickTree:
     """
@@ -274,25 +239,10 @@ class FenwickTree:
             return self.consultar_prefijo(r)
         return self.consultar_prefijo(r) - self.consultar_prefijo(l - 1)
 
-# Ejemplo
-arr_fenwick = [2, 1, 1, 3, 2, 3, 4, 5, 6, 7, 8, 9]
-print(f"Array: {arr_fenwick}")
-
-fenwick = FenwickTree(arr_fenwick)
-print(f"Suma prefijo [0, 5]: {fenwick.consultar_prefijo(5)}")
-print(f"Suma rango [3, 7]: {fenwick.consultar_rango(3, 7)}")
-
-# Actualizar
-fenwick.actualizar(3, 6)  # Agregar 6 al índice 3
-print(f"Después de agregar 6 al índice 3:")
-print(f"  Nuevo valor en índice 3: {fenwick.consultar_rango(3, 3)}")
-print(f"  Suma prefijo [0, 5]: {fenwick.consultar_prefijo(5)}")
-print()
 
 # =============================================================================
 # 4. UNION-FIND MEJORADO
 # =============================================================================
-print("=== 4. Union-Find Mejorado ===")
 
 class UnionFind:
     """
@@ -350,24 +300,84 @@ class UnionFind:
             componentes[raiz].append(i)
         return componentes
 
-# Ejemplo
-uf = UnionFind(10)
-print("Uniendo elementos:")
-uniones = [(0, 1), (2, 3), (4, 5), (6, 7), (0, 2), (4, 6), (1, 3)]
 
-for x, y in uniones:
-    uf.unir(x, y)
-    print(f"  Unir {x} y {y}: Componentes = {uf.num_componentes}")
+def main():
+    """Ejecuta los ejemplos y comparaciones del módulo."""
+    print("=== Estructuras de Datos Avanzadas ===\n")
+
+    print("=== 1. Trie (Árbol de Prefijos) ===")
+
+    # Ejemplo
+    trie = Trie()
+    palabras = ["apple", "app", "apricot", "banana", "band", "bandana"]
+
+    print("Insertando palabras:", palabras)
+    for palabra in palabras:
+        trie.insertar(palabra)
+
+    print(f"\n¿'apple' existe? {trie.buscar('apple')}")
+    print(f"¿'apples' existe? {trie.buscar('apples')}")
+    print(f"¿Existe prefijo 'app'? {trie.buscar_prefijo('app')}")
+    print(f"Autocompletar 'ban': {trie.autocompletar('ban')}")
+    print()
+
+    print("=== 2. Segment Tree ===")
 
-print(f"\nNúmero de componentes: {uf.num_componentes}")
-print(f"¿0 y 3 en mismo conjunto? {uf.mismo_conjunto(0, 3)}")
-print(f"Tamaño de componente de 0: {uf.tamaño_componente(0)}")
-print(f"Componentes: {uf.obtener_componentes()}")
-print()
+    # Ejemplo
+    arr_seg = [1, 3, 5, 7, 9, 11]
+    print(f"Array: {arr_seg}")
 
-# Resumen
-print("=== RESUMEN ===")
-print("""
+    # Segment Tree para suma
+    seg_tree_sum = SegmentTree(arr_seg, sum)
+    print(f"Suma [1, 4): {seg_tree_sum.consultar_rango(1, 4)}")
+    print(f"Suma [0, 6): {seg_tree_sum.consultar_rango(0, 6)}")
+
+    # Segment Tree para mínimo
+    seg_tree_min = SegmentTree(arr_seg, min)
+    print(f"Mínimo [1, 4): {seg_tree_min.consultar_rango(1, 4)}")
+
+    # Actualizar
+    seg_tree_sum.actualizar(2, 10)
+    print(f"Después de actualizar índice 2 a 10: {seg_tree_sum.consultar_rango(0, 6)}")
+    print()
+
+    print("=== 3. Fenwick Tree (Binary Indexed Tree) ===")
+
+    # Ejemplo
+    arr_fenwick = [2, 1, 1, 3, 2, 3, 4, 5, 6, 7, 8, 9]
+    print(f"Array: {arr_fenwick}")
+
+    fenwick = FenwickTree(arr_fenwick)
+    print(f"Suma prefijo [0, 5]: {fenwick.consultar_prefijo(5)}")
+    print(f"Suma rango [3, 7]: {fenwick.consultar_rango(3, 7)}")
+
+    # Actualizar
+    fenwick.actualizar(3, 6)  # Agregar 6 al índice 3
+    print(f"Después de agregar 6 al índice 3:")
+    print(f"  Nuevo valor en índice 3: {fenwick.consultar_rango(3, 3)}")
+    print(f"  Suma prefijo [0, 5]: {fenwick.consultar_prefijo(5)}")
+    print()
+
+    print("=== 4. Union-Find Mejorado ===")
+
+    # Ejemplo
+    uf = UnionFind(10)
+    print("Uniendo elementos:")
+    uniones = [(0, 1), (2, 3), (4, 5), (6, 7), (0, 2), (4, 6), (1, 3)]
+
+    for x, y in uniones:
+        uf.unir(x, y)
+        print(f"  Unir {x} y {y}: Componentes = {uf.num_componentes}")
+
+    print(f"\nNúmero de componentes: {uf.num_componentes}")
+    print(f"¿0 y 3 en mismo conjunto? {uf.mismo_conjunto(0, 3)}")
+    print(f"Tamaño de componente de 0: {uf.tamaño_componente(0)}")
+    print(f"Componentes: {uf.obtener_componentes()}")
+    print()
+
+    # Resumen
+    print("=== RESUMEN ===")
+    print("""
 Estructuras de datos avanzadas implementadas:
 
 1. Trie (Árbol de Prefijos):
@@ -399,3 +409,7 @@ Complejidades:
 - Fenwick Tree: O(log n) consulta/actualización, O(n) espacio
 - Union-Find: O(α(n)) ≈ O(1) prácticamente
 """)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,14 +2,11 @@
 # Descripción: Algoritmos de Geometría Computacional
 
 import math
-import numpy as np
 
-print("=== Geometría Computacional ===\n")
 
 # =============================================================================
 # 1. DISTANCIA ENTRE PUNTOS
 # =============================================================================
-print("=== 1. Distancias entre Puntos ===")
 
 class Punto:
     """Representa un punto en 2D."""
@@ -36,21 +33,10 @@ def distancia_puntos(p1, p2):
     """Distancia euclidiana entre dos puntos."""
     return math.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2)
 
-# Ejemplo
-p1 = Punto(0, 0)
-p2 = Punto(3, 4)
-
-print(f"Punto 1: {p1}")
-print(f"Punto 2: {p2}")
-print(f"Distancia euclidiana: {p1.distancia_euclidiana(p2):.2f}")
-print(f"Distancia Manhattan: {p1.distancia_manhattan(p2)}")
-print(f"Distancia Chebyshev: {p1.distancia_chebyshev(p2)}")
-print()
 
 # =============================================================================
 # 2. ÁREA DE POLÍGONOS
 # =============================================================================
-print("=== 2. Área de Polígonos ===")
 
 def area_poligono_simple(puntos):
     """
@@ -73,20 +59,10 @@ def area_triangulo(p1, p2, p3):
     """Calcula el área de un triángulo usando fórmula del determinante."""
     return abs((p1[0]*(p2[1] - p3[1]) + p2[0]*(p3[1] - p1[1]) + p3[0]*(p1[1] - p2[1])) / 2.0)
 
-# Ejemplo
-triangulo = [(0, 0), (4, 0), (2, 3)]
-print(f"Triángulo: {triangulo}")
-print(f"Área: {area_triangulo(triangulo[0], triangulo[1], triangulo[2]):.2f}")
-
-poligono = [(0, 0), (4, 0), (4, 3), (0, 3)]  # Rectángulo
-print(f"\nPolígono (rectángulo): {poligono}")
-print(f"Área: {area_poligono_simple(poligono):.2f}")
-print()
 
 # =============================================================================
 # 3. CONVEX HULL (Graham Scan)
 # =============================================================================
-print("=== 3. Convex Hull (Graham Scan) ===")
 
 def orientacion(p, q, r):
     """
@@ -131,17 +107,10 @@ def graham_scan(puntos):
     
     return hull
 
-# Ejemplo
-puntos_hull = [(0, 3), (2, 2), (1, 1), (2, 1), (3, 0), (0, 0), (3, 3)]
-print(f"Puntos: {puntos_hull}")
-hull = graham_scan(puntos_hull)
-print(f"Convex Hull: {hull}")
-print()
 
 # =============================================================================
 # 4. INTERSECCIÓN DE LÍNEAS
 # =============================================================================
-print("=== 4. Intersección de Líneas ===")
 
 def interseccion_lineas(p1, p2, p3, p4):
     """
@@ -177,25 +146,10 @@ def interseccion_segmentos(p1, p2, p3, p4):
     
     return ccw(p1, p3, p4) != ccw(p2, p3, p4) and ccw(p1, p2, p3) != ccw(p1, p2, p4)
 
-# Ejemplo
-linea1_p1 = (0, 0)
-linea1_p2 = (2, 2)
-linea2_p1 = (0, 2)
-linea2_p2 = (2, 0)
-
-interseccion = interseccion_lineas(linea1_p1, linea1_p2, linea2_p1, linea2_p2)
-print(f"Línea 1: {linea1_p1} a {linea1_p2}")
-print(f"Línea 2: {linea2_p1} a {linea2_p2}")
-print(f"Intersección: {interseccion}")
-
-se_intersecan = interseccion_segmentos(linea1_p1, linea1_p2, linea2_p1, linea2_p2)
-print(f"¿Segmentos se intersecan? {se_intersecan}")
-print()
 
 # =============================================================================
 # 5. INTERSECCIÓN DE CÍRCULOS
 # =============================================================================
-print("=== 5. Intersección de Círculos ===")
 
 def interseccion_circulos(c1, r1, c2, r2):
     """
@@ -248,26 +202,10 @@ def interseccion_circulos(c1, r1, c2, r2):
     
     return [(x3, y3), (x4, y4)]
 
-# Ejemplo
-circulo1 = (0, 0)
-radio1 = 5
-circulo2 = (8, 0)
-radio2 = 3
-
-intersecciones = interseccion_circulos(circulo1, radio1, circulo2, radio2)
-print(f"Círculo 1: centro {circulo1}, radio {radio1}")
-print(f"Círculo 2: centro {circulo2}, radio {radio2}")
-print(f"Puntos de intersección: {intersecciones}")
-
-if intersecciones:
-    for i, punto in enumerate(intersecciones, 1):
-        print(f"  Punto {i}: ({punto[0]:.4f}, {punto[1]:.4f})")
-print()
 
 # =============================================================================
 # 6. PUNTO EN POLÍGONO
 # =============================================================================
-print("=== 6. Punto en Polígono (Ray Casting) ===")
 
 def punto_en_poligono(punto, poligono):
     """
@@ -290,19 +228,95 @@ def punto_en_poligono(punto, poligono):
     
     return dentro
 
-# Ejemplo
-poligono_test = [(0, 0), (4, 0), (4, 4), (0, 4)]  # Cuadrado
-punto_dentro = (2, 2)
-punto_fuera = (5, 5)
 
-print(f"Polígono: {poligono_test}")
-print(f"¿Punto {punto_dentro} está dentro? {punto_en_poligono(punto_dentro, poligono_test)}")
-print(f"¿Punto {punto_fuera} está dentro? {punto_en_poligono(punto_fuera, poligono_test)}")
-print()
+def main():
+    """Ejecuta los ejemplos y comparaciones del módulo."""
+    print("=== Geometría Computacional ===\n")
+
+    print("=== 1. Distancias entre Puntos ===")
+
+    # Ejemplo
+    p1 = Punto(0, 0)
+    p2 = Punto(3, 4)
+
+    print(f"Punto 1: {p1}")
+    print(f"Punto 2: {p2}")
+    print(f"Distancia euclidiana: {p1.distancia_euclidiana(p2):.2f}")
+    print(f"Distancia Manhattan: {p1.distancia_manhattan(p2)}")
+    print(f"Distancia Chebyshev: {p1.distancia_chebyshev(p2)}")
+    print()
+
+    print("=== 2. Área de Polígonos ===")
+
+    # Ejemplo
+    triangulo = [(0, 0), (4, 0), (2, 3)]
+    print(f"Triángulo: {triangulo}")
+    print(f"Área: {area_triangulo(triangulo[0], triangulo[1], triangulo[2]):.2f}")
+
+    poligono = [(0, 0), (4, 0), (4, 3), (0, 3)]  # Rectángulo
+    print(f"\nPolígono (rectángulo): {poligono}")
+    print(f"Área: {area_poligono_simple(poligono):.2f}")
+    print()
+
+    print("=== 3. Convex Hull (Graham Scan) ===")
+
+    # Ejemplo
+    puntos_hull = [(0, 3), (2, 2), (1, 1), (2, 1), (3, 0), (0, 0), (3, 3)]
+    print(f"Puntos: {puntos_hull}")
+    hull = graham_scan(puntos_hull)
+    print(f"Convex Hull: {hull}")
+    print()
 
-# Resumen
-print("=== RESUMEN ===")
-print("""
+    print("=== 4. Intersección de Líneas ===")
+
+    # Ejemplo
+    linea1_p1 = (0, 0)
+    linea1_p2 = (2, 2)
+    linea2_p1 = (0, 2)
+    linea2_p2 = (2, 0)
+
+    interseccion = interseccion_lineas(linea1_p1, linea1_p2, linea2_p1, linea2_p2)
+    print(f"Línea 1: {linea1_p1} a {linea1_p2}")
+    print(f"Línea 2: {linea2_p1} a {linea2_p2}")
+    print(f"Intersección: {interseccion}")
+
+    se_intersecan = interseccion_segmentos(linea1_p1, linea1_p2, linea2_p1, linea2_p2)
+    print(f"¿Segmentos se intersecan? {se_intersecan}")
+    print()
+
+    print("=== 5. Intersección de Círculos ===")
+
+    # Ejemplo
+    circulo1 = (0, 0)
+    radio1 = 5
+    circulo2 = (8, 0)
+    radio2 = 3
+
+    intersecciones = interseccion_circulos(circulo1, radio1, circulo2, radio2)
+    print(f"Círculo 1: centro {circulo1}, radio {radio1}")
+    print(f"Círculo 2: centro {circulo2}, radio {radio2}")
+    print(f"Puntos de intersección: {intersecciones}")
+
+    if intersecciones:
+        for i, punto in enumerate(intersecciones, 1):
+            print(f"  Punto {i}: ({punto[0]:.4f}, {punto[1]:.4f})")
+    print()
+
+    print("=== 6. Punto en Polígono (Ray Casting) ===")
+
+    # Ejemplo
+    poligono_test = [(0, 0), (4, 0), (4, 4), (0, 4)]  # Cuadrado
+    punto_dentro = (2, 2)
+    punto_fuera = (5, 5)
+
+    print(f"Polígono: {poligono_test}")
+    print(f"¿Punto {punto_dentro} está dentro? {punto_en_poligono(punto_dentro, poligono_test)}")
+    print(f"¿Punto {punto_fuera} está dentro? {punto_en_poligono(punto_fuera, poligono_test)}")
+    print()
+
+    # Resumen
+    print("=== RESUMEN ===")
+    print("""
 Algoritmos de Geometría Computacional implementados:
 
 1. Distancias entre Puntos:
@@ -343,3 +357,7 @@ Aplicaciones:
 - Detección de colisiones
 - Análisis espacial
 """)
+
+
+if __name__ == "__main__":
+    main()
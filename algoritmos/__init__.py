@@ -0,0 +1,215 @@
+# Archivo: algoritmos/__init__.py
+# Descripción: Capa de biblioteca importable sobre los módulos numerados
+#
+# Los archivos numerados (36_metodos_ordenamiento.py, 38_grafos.py, ...) no se
+# pueden importar con la sintaxis normal porque su nombre empieza con dígitos.
+# Este paquete los expone con nombres legibles y los carga de forma perezosa:
+# ningún módulo se ejecuta hasta que se pide uno de sus nombres, y al importarlo
+# no se imprime nada (las demostraciones viven en main() de cada archivo).
+#
+# Uso:
+#     from algoritmos import quick_sort, dijkstra, TablaHash
+#     from algoritmos import ordenamiento
+#     ordenamiento.merge_sort([3, 1, 2])
+
+import importlib.util
+import os
+import sys
+import threading
+
+_RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Alias legible -> archivo numerado (sin extensión)
+_MODULOS = {
+    "pila_cola": "24_pila_cola",
+    "goldbach": "26_conjetura_goldbach",
+    "factorial": "29_factorial",
+    "fibonacci": "30_fibonacci",
+    "potenciacion": "32_potenciacion",
+    "ordenamiento": "36_metodos_ordenamiento",
+    "arboles": "37_arboles",
+    "grafos": "38_grafos",
+    "busqueda": "39_algoritmos_busqueda",
+    "tablas_hash": "40_tablas_hash",
+    "programacion_dinamica": "41_programacion_dinamica",
+    "greedy": "42_algoritmos_greedy",
+    "grafos_avanzados": "43_grafos_avanzados",
+    "strings": "44_algoritmos_strings",
+    "matematicos": "45_algoritmos_matematicos",
+    "torres_hanoi": "46_torres_hanoi",
+    "backtracking": "47_backtracking",
+    "estructuras_avanzadas": "48_estructuras_avanzadas",
+    "geometria": "50_geometria_computacional",
+}
+
+# Nombres públicos que se pueden importar directamente desde el paquete.
+# Si un nombre existe en varios módulos, aquí se decide cuál es el canónico;
+# el resto sigue disponible a través del submódulo (p. ej. greedy.UnionFind).
+_EXPORTACIONES = {
+    "pila_cola": [
+        "Pila", "Cola", "PilaOptimizada", "ColaOptimizada",
+        "PilaAvanzada", "ColaAvanzada", "ColaCircular", "comparar_colas",
+        "ColaSincronizada", "PilaSincronizada", "ColaAsincrona", "PilaAsincrona",
+        "medir_productores_consumidores", "medir_productores_consumidores_async",
+        "comparar_colas_concurrentes", "ColaPersistente",
+    ],
+    "goldbach": [
+        "es_primo_original", "goldbach_original", "goldbach_optimizado",
+        "GoldbachCaché", "analizar_rango_goldbach", "verificar_conjetura_goldbach",
+    ],
+    "factorial": [
+        "factorial_recursivo", "factorial_iterativo", "factorial_math",
+        "factorial_seguro", "factorial_con_cache", "factorial_gamma",
+    ],
+    "fibonacci": [
+        "fibonacci_recursivo_naive", "fibonacci_recursivo_memo",
+        "fibonacci_iterativo", "fibonacci_generador", "fibonacci_lista",
+        "fibonacci_binet", "fibonacci_seguro",
+    ],
+    "potenciacion": [
+        "potenciacion_original", "potenciacion_operador", "potenciacion_segura",
+        "potenciacion_rapida", "potenciacion_rapida_iterativa",
+        "potenciacion_math", "potenciacion_modular",
+    ],
+    "ordenamiento": [
+        "esta_ordenada", "generar_lista_aleatoria", "bubble_sort",
+        "bubble_sort_optimizado", "selection_sort", "insertion_sort",
+        "merge_sort", "merge", "quick_sort", "quick_sort_inplace",
+        "particionar", "heap_sort", "heapify", "counting_sort",
+        "generar_lista_casi_ordenada", "ordenamiento_hibrido", "ordenamiento_externo",
+        "ordenamiento_paralelo", "comparar_ordenamiento_paralelo",
+        "radix_sort_numpy", "counting_sort_numpy",
+    ],
+    "arboles": [
+        "NodoArbol", "ArbolBinario", "ArbolRecorridos", "ArbolBST", "NodoAVL",
+        "ArbolAVL", "NodoNario", "ArbolNario", "contar_hojas", "sumar_valores",
+        "es_completo", "comparar_avl_bisect", "ArbolBMas",
+    ],
+    "grafos": [
+        "GrafoListaAdyacencia", "GrafoMatrizAdyacencia", "GrafoCompleto",
+        "dijkstra", "dijkstra_camino", "dijkstra_multiorigen",
+        "reconstruir_camino", "tiene_ciclo", "ordenamiento_topologico", "GrafoPonderado",
+        "GrafoCSR", "a_estrella", "heuristica_euclidiana", "heuristica_manhattan",
+        "dijkstra_bidireccional", "bfs_bidireccional", "grafo_invertido",
+        "generar_rejilla", "comparar_caminos_punto_a_punto",
+        "bfs_por_niveles", "componentes_union_find",
+    ],
+    "busqueda": [
+        "busqueda_lineal", "busqueda_lineal_optimizada", "busqueda_lineal_todas",
+        "busqueda_binaria", "busqueda_binaria_recursiva",
+        "busqueda_binaria_primera_ocurrencia", "busqueda_binaria_ultima_ocurrencia",
+        "busqueda_bruta_texto", "busqueda_bruta_todas", "construir_tabla_lps",
+        "kmp_busqueda", "kmp_busqueda_todas", "encontrar_posicion_insercion",
+        "contar_ocurrencias", "posicion_insercion_lote", "primera_ocurrencia_lote",
+        "ultima_ocurrencia_lote", "contar_ocurrencias_lote", "busqueda_binaria_lote",
+        "busqueda_interpolacion", "busqueda_exponencial", "kmp_busqueda_bloques",
+        "kmp_busqueda_archivo", "kmp_busqueda_archivo_paralelo",
+    ],
+    "tablas_hash": [
+        "TablaHash", "hash_simple", "hash_djb2", "hash_division",
+        "TablaHashOpenAddressing", "contar_frecuencias", "encontrar_duplicados",
+        "dos_sumas", "TablaHashRobinHood", "medir_latencias", "comparar_redimensionamiento",
+    ],
+    "programacion_dinamica": [
+        "mochila_recursivo", "mochila_memoizacion", "mochila_programacion_dinamica",
+        "lcs_recursivo", "lcs_programacion_dinamica", "lcs_obtener_subsecuencia",
+        "camino_minimo_grid", "fibonacci_memo", "fibonacci_dp",
+        "coin_change_cantidad_minima", "coin_change_numero_formas",
+        "lis_programacion_dinamica", "lis_binaria",
+    ],
+    "greedy": [
+        "mochila_fraccionaria", "seleccion_actividades", "kruskal",
+        "NodoHuffman", "construir_arbol_huffman", "generar_codigos_huffman",
+        "codificar_huffman", "cambio_monedas_greedy", "interval_scheduling_pesos",
+    ],
+    "grafos_avanzados": [
+        "floyd_warshall", "floyd_warshall_numpy", "reconstruir_camino_fw",
+        "bellman_ford", "spfa", "johnson", "topological_sort_kahn",
+        "topological_sort_dfs", "detectar_ciclo_dfs", "detectar_ciclo_union_find",
+        "kosaraju_scc", "cargar_lista_aristas", "tarjan_scc", "topological_sort_kahn_iter",
+    ],
+    "strings": [
+        "rabin_karp", "construir_z_array", "z_algorithm_busqueda",
+        "longest_common_substring", "edit_distance",
+        "longest_palindromic_substring", "son_anagramas", "contar_anagramas",
+        "encontrar_permutaciones", "AhoCorasick",
+    ],
+    "matematicos": [
+        "triangulo_pascal_filas", "triangulo_pascal_coeficiente",
+        "triangulo_pascal_fila_n", "euclides_mcd", "euclides_mcd_recursivo",
+        "euclides_mcm", "euclides_extendido", "criba_eratostenes",
+        "es_primo_optimizado", "exponenciacion_modular", "fibonacci_matriz",
+        "factorizar", "factores_unicos", "contar_divisores", "convertir_base",
+    ],
+    "torres_hanoi": [
+        "TorresHanoi",
+    ],
+    "backtracking": [
+        "es_seguro", "n_reinas_backtracking", "resolver_n_reinas",
+        "es_valido_sudoku", "resolver_sudoku", "resolver_laberinto",
+        "permutaciones_backtracking", "combinaciones_backtracking",
+        "subset_sum_backtracking",
+    ],
+    "estructuras_avanzadas": [
+        "NodoTrie", "Trie", "SegmentTree", "FenwickTree", "UnionFind",
+    ],
+    "geometria": [
+        "Punto", "distancia_puntos", "area_poligono_simple", "area_triangulo",
+        "orientacion", "graham_scan", "interseccion_lineas",
+        "interseccion_segmentos", "interseccion_circulos", "punto_en_poligono",
+    ],
+}
+
+_ORIGEN = {
+    nombre: alias
+    for alias, nombres in _EXPORTACIONES.items()
+    for nombre in nombres
+}
+
+__all__ = sorted(_MODULOS) + sorted(_ORIGEN)
+
+_candado = threading.Lock()
+
+
+def cargar_modulo(alias):
+    """
+    Carga (una sola vez) el archivo numerado asociado a un alias.
+    El módulo queda registrado en sys.modules con el nombre del archivo,
+    de modo que sus funciones se pueden serializar con pickle.
+    """
+    if alias not in _MODULOS:
+        raise ModuleNotFoundError(f"No existe el submódulo 'algoritmos.{alias}'")
+
+    archivo = _MODULOS[alias]
+    with _candado:
+        modulo = sys.modules.get(archivo)
+        if modulo is not None:
+            return modulo
+
+        ruta = os.path.join(_RAIZ, archivo + ".py")
+        spec = importlib.util.spec_from_file_location(archivo, ruta)
+        modulo = importlib.util.module_from_spec(spec)
+        sys.modules[archivo] = modulo
+        try:
+            spec.loader.exec_module(modulo)
+        except BaseException:
+            del sys.modules[archivo]
+            raise
+        return modulo
+
+
+def __getattr__(nombre):
+    """Resuelve submódulos y nombres exportados bajo demanda (PEP 562)."""
+    if nombre in _MODULOS:
+        valor = cargar_modulo(nombre)
+    elif nombre in _ORIGEN:
+        valor = getattr(cargar_modulo(_ORIGEN[nombre]), nombre)
+    else:
+        raise AttributeError(f"module 'algoritmos' has no attribute '{nombre}'")
+
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
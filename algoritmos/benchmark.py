@@ -0,0 +1,308 @@
+# Archivo: algoritmos/benchmark.py
+# Descripción: Sistema unificado de benchmarks para las familias de algoritmos
+#
+# Cada módulo numerado puede declarar un diccionario BENCHMARKS con sus
+# "familias" de implementaciones equivalentes (métodos de ordenamiento,
+# variantes de Fibonacci, ...). Este módulo las descubre, las mide con
+# time.perf_counter_ns (calentamiento + repeticiones) sobre un barrido de
+# tamaños de entrada y guarda los resultados en JSON para compararlos entre
+# ejecuciones y detectar regresiones.
+#
+# Formato de una familia:
+#     BENCHMARKS = {
+#         "ordenamiento": {
+#             "implementaciones": {"merge_sort": merge_sort, ...},
+#             "entrada": lambda n: (generar_lista_aleatoria(n),),  # argumentos
+#             "tamanios": [100, 1000],
+#             "limites": {"bubble_sort": 1000},    # opcional: n máximo
+#             "verificar": lambda resultado, *args: esta_ordenada(resultado),
+#         },
+#     }
+#
+# Uso desde la línea de comandos:
+#     python -m algoritmos.benchmark --listar
+#     python -m algoritmos.benchmark ordenamiento --salida base.json
+#     python -m algoritmos.benchmark ordenamiento --comparar base.json
+
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+import algoritmos
+
+VERSION_FORMATO = 1
+
+
+# =============================================================================
+# 1. MEDICIÓN
+# =============================================================================
+
+def resumir(muestras_ns):
+    """
+    Calcula estadísticas de una lista de tiempos en nanosegundos.
+    Retorna un diccionario con min, max, media, mediana, desviación, p95 y p99.
+    """
+    ordenadas = sorted(muestras_ns)
+    n = len(ordenadas)
+    indice_p95 = min(n - 1, math.ceil(0.95 * n) - 1)
+    indice_p99 = min(n - 1, math.ceil(0.99 * n) - 1)
+    return {
+        "repeticiones": n,
+        "min_ns": ordenadas[0],
+        "max_ns": ordenadas[-1],
+        "media_ns": statistics.fmean(ordenadas),
+        "mediana_ns": statistics.median(ordenadas),
+        "desviacion_ns": statistics.stdev(ordenadas) if n > 1 else 0.0,
+        "p95_ns": ordenadas[indice_p95],
+        "p99_ns": ordenadas[indice_p99],
+    }
+
+
+def medir(funcion, preparar=None, repeticiones=5, calentamiento=1, iteraciones=1):
+    """
+    Mide el tiempo de ejecución de una función con perf_counter_ns.
+
+    - preparar: función sin argumentos que retorna la tupla de argumentos.
+      Se llama antes de cada repetición y su costo no se mide (útil para
+      algoritmos que modifican la entrada).
+    - calentamiento: ejecuciones previas que no se registran.
+    - iteraciones: llamadas por repetición; el tiempo se divide entre ellas
+      para medir funciones muy rápidas.
+
+    Retorna (resumen, ultimo_resultado).
+    """
+    if repeticiones < 1 or iteraciones < 1:
+        raise ValueError("repeticiones e iteraciones deben ser >= 1")
+
+    reloj = time.perf_counter_ns
+    resultado = None
+
+    for _ in range(calentamiento):
+        args = preparar() if preparar else ()
+        resultado = funcion(*args)
+
+    muestras = []
+    for _ in range(repeticiones):
+        args = preparar() if preparar else ()
+        inicio = reloj()
+        for _ in range(iteraciones):
+            resultado = funcion(*args)
+        muestras.append((reloj() - inicio) / iteraciones)
+
+    return resumir(muestras), resultado
+
+
+# =============================================================================
+# 2. DESCUBRIMIENTO Y EJECUCIÓN DE FAMILIAS
+# =============================================================================
+
+def descubrir_familias(modulos=None):
+    """
+    Busca el diccionario BENCHMARKS en los módulos del paquete.
+    - modulos: lista de alias a inspeccionar (por defecto, todos).
+    Retorna {nombre_familia: especificación}, añadiendo la clave "modulo".
+    """
+    familias = {}
+    for alias in modulos or sorted(algoritmos._MODULOS):
+        modulo = algoritmos.cargar_modulo(alias)
+        for nombre, especificacion in getattr(modulo, "BENCHMARKS", {}).items():
+            if nombre in familias:
+                raise ValueError(f"Familia de benchmark duplicada: '{nombre}'")
+            familias[nombre] = dict(especificacion, modulo=alias)
+    return familias
+
+
+def ejecutar_familia(nombre, especificacion, tamanios=None, repeticiones=5,
+                     calentamiento=1, mostrar=True):
+    """
+    Ejecuta todas las implementaciones de una familia para cada tamaño.
+    La entrada se genera una vez por tamaño y se comparte entre
+    implementaciones; cada repetición recibe una copia fresca.
+    Retorna una lista de registros (uno por implementación y tamaño).
+    """
+    implementaciones = especificacion["implementaciones"]
+    generar = especificacion["entrada"]
+    limites = especificacion.get("limites", {})
+    verificar = especificacion.get("verificar")
+    registros = []
+
+    for n in tamanios or especificacion["tamanios"]:
+        try:
+            base = generar(n)
+        except Exception as e:
+            # Sin entrada no se mide este tamaño, pero sí los demás y las otras familias
+            if mostrar:
+                print(f"✗ {nombre:18s} {'(generar entrada)':28s} n={n:<8d} Error: {e!r}")
+            continue
+
+        def preparar():
+            return tuple(a.copy() if hasattr(a, "copy") else a for a in base)
+
+        for impl, funcion in implementaciones.items():
+            if n > limites.get(impl, n):
+                continue
+
+            try:
+                resumen, resultado = medir(funcion, preparar, repeticiones, calentamiento)
+            except Exception as e:
+                if mostrar:
+                    print(f"✗ {nombre:18s} {impl:28s} n={n:<8d} Error: {e!r}")
+                continue
+            try:
+                correcto = verificar(resultado, *preparar()) if verificar else None
+            except Exception as e:
+                # El tiempo medido sigue siendo válido: se registra como incorrecto
+                if mostrar:
+                    print(f"✗ {nombre:18s} {impl:28s} n={n:<8d} Error al verificar: {e!r}")
+                correcto = False
+
+            registro = {"familia": nombre, "implementacion": impl, "n": n}
+            registro.update(resumen)
+            registro["correcto"] = correcto
+            registros.append(registro)
+
+            if mostrar:
+                estado = {True: "✓", False: "✗", None: " "}[correcto]
+                print(f"{estado} {nombre:18s} {impl:28s} n={n:<8d} "
+                      f"mediana={resumen['mediana_ns'] / 1e6:10.4f} ms  "
+                      f"±{resumen['desviacion_ns'] / 1e6:.4f}")
+
+    return registros
+
+
+def ejecutar(familias=None, **opciones):
+    """Descubre y ejecuta las familias indicadas (o todas)."""
+    disponibles = descubrir_familias()
+    nombres = familias or sorted(disponibles)
+    desconocidas = [f for f in nombres if f not in disponibles]
+    if desconocidas:
+        raise KeyError(f"Familias desconocidas: {', '.join(desconocidas)}")
+
+    registros = []
+    for nombre in nombres:
+        registros.extend(ejecutar_familia(nombre, disponibles[nombre], **opciones))
+    return registros
+
+
+# =============================================================================
+# 3. PERSISTENCIA Y COMPARACIÓN DE RESULTADOS
+# =============================================================================
+
+def metadatos():
+    """Información del entorno que acompaña a cada archivo de resultados."""
+    return {
+        "version_formato": VERSION_FORMATO,
+        "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementacion": platform.python_implementation(),
+        "plataforma": platform.platform(),
+        "procesador": platform.processor() or platform.machine(),
+    }
+
+
+def guardar_resultados(registros, ruta):
+    """
+    Guarda los registros en JSON ordenado y con sangría para que dos
+    ejecuciones se puedan comparar con un diff de texto.
+    """
+    registros = sorted(registros, key=lambda r: (r["familia"], r["implementacion"], r["n"]))
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump({"metadatos": metadatos(), "resultados": registros},
+                  archivo, indent=2, sort_keys=True, ensure_ascii=False)
+        archivo.write("\n")
+
+
+def cargar_resultados(ruta):
+    """Carga un archivo generado por guardar_resultados()."""
+    with open(ruta, encoding="utf-8") as archivo:
+        datos = json.load(archivo)
+    if datos.get("metadatos", {}).get("version_formato") != VERSION_FORMATO:
+        raise ValueError(f"Formato de resultados no soportado: {ruta}")
+    return datos["resultados"]
+
+
+def comparar_resultados(anteriores, actuales, umbral=0.10, metrica="mediana_ns"):
+    """
+    Compara dos listas de registros por (familia, implementación, n).
+    Retorna una lista de diccionarios con el cambio relativo de la métrica;
+    "regresion" es True cuando el tiempo empeora más que el umbral.
+    """
+    indice = {(r["familia"], r["implementacion"], r["n"]): r for r in anteriores}
+    cambios = []
+    for registro in actuales:
+        clave = (registro["familia"], registro["implementacion"], registro["n"])
+        previo = indice.get(clave)
+        if previo is None or previo[metrica] == 0:
+            continue
+        cambio = registro[metrica] / previo[metrica] - 1
+        cambios.append({
+            "familia": clave[0],
+            "implementacion": clave[1],
+            "n": clave[2],
+            "anterior_ns": previo[metrica],
+            "actual_ns": registro[metrica],
+            "cambio": cambio,
+            "regresion": cambio > umbral,
+        })
+    return cambios
+
+
+def imprimir_comparacion(cambios):
+    """Imprime el resultado de comparar_resultados() como tabla."""
+    print(f"\n{'Familia':<18} {'Implementación':<28} {'n':>8} "
+          f"{'Anterior ms':>12} {'Actual ms':>12} {'Cambio':>9}")
+    print("-" * 92)
+    for c in cambios:
+        marca = "  ⚠️ regresión" if c["regresion"] else ""
+        print(f"{c['familia']:<18} {c['implementacion']:<28} {c['n']:>8} "
+              f"{c['anterior_ns'] / 1e6:>12.4f} {c['actual_ns'] / 1e6:>12.4f} "
+              f"{c['cambio']:>+8.1%}{marca}")
+
+
+# =============================================================================
+# 4. LÍNEA DE COMANDOS
+# =============================================================================
+
+def main(argv=None):
+    """Punto de entrada de `python -m algoritmos.benchmark`."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmarks de las familias de algoritmos")
+    parser.add_argument("familias", nargs="*", help="familias a ejecutar (por defecto, todas)")
+    parser.add_argument("--listar", action="store_true", help="muestra las familias disponibles")
+    parser.add_argument("--tamanios", type=int, nargs="+", help="sustituye el barrido de tamaños")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--calentamiento", type=int, default=1)
+    parser.add_argument("--salida", help="guarda los resultados en este archivo JSON")
+    parser.add_argument("--comparar", help="archivo JSON previo contra el cual comparar")
+    parser.add_argument("--umbral", type=float, default=0.10,
+                        help="cambio relativo considerado regresión (por defecto 0.10)")
+    args = parser.parse_args(argv)
+
+    if args.listar:
+        for nombre, especificacion in sorted(descubrir_familias().items()):
+            impls = ", ".join(especificacion["implementaciones"])
+            print(f"{nombre:<20} [{especificacion['modulo']}] {impls}")
+        return 0
+
+    registros = ejecutar(args.familias, tamanios=args.tamanios,
+                         repeticiones=args.repeticiones, calentamiento=args.calentamiento)
+
+    if args.salida:
+        guardar_resultados(registros, args.salida)
+        print(f"\nResultados guardados en {args.salida}")
+
+    if args.comparar:
+        cambios = comparar_resultados(cargar_resultados(args.comparar), registros, args.umbral)
+        imprimir_comparacion(cambios)
+        if any(c["regresion"] for c in cambios):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())